@@ -1,31 +1,52 @@
 import sys
 import os
-import numpy as np
-import pyvista as pv
-from pyvistaqt import QtInteractor, MainWindow
-import vtk
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
-                             QDockWidget, QHBoxLayout, QFrame, QMessageBox, QComboBox, QLabel)
-from PyQt5.QtCore import Qt
-
-# Интеграция FreeCAD (адаптируйте путь!)
-FREECAD_PATH = r"C:\Program Files\FreeCAD 1.0\bin"  # ← ВАЖНО: укажите ваш путь!
-if os.path.exists(FREECAD_PATH):
-    sys.path.append(FREECAD_PATH)
-    import FreeCAD
-    import Part
-else:
-    print("⚠️ FreeCAD не найден! Геометрия будет упрощённой.")
-    FreeCAD = None
+
+# Заставка показывается до импорта pyvista, vtk и pyvistaqt (большая часть
+# времени запуска); FreeCAD, pyOCCT и ifcopenshell загружаются только при
+# обращении к использующим их функциям (core.freecad_bridge, plugins)
+from gui import startup
+if __name__ == "__main__":
+    qt_app, splash = startup.show_splash(sys.argv)
+
+import numpy as np  # noqa: E402
+import pyvista as pv  # noqa: E402
+from pyvistaqt import QtInteractor, MainWindow  # noqa: E402
+from vtkmodules.vtkRenderingCore import vtkCellPicker  # noqa: E402
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,  # noqa: E402
+                             QDockWidget, QHBoxLayout, QFrame, QMessageBox, QComboBox, QLabel,
+                             QFileDialog, QCheckBox, QShortcut)
+from PyQt5.QtCore import Qt  # noqa: E402
+from PyQt5.QtGui import QKeySequence  # noqa: E402
+
+import plugins  # noqa: E402
 
 # Импорт наших инструментов
 try:
     from gui.foundation_tools import FoundationTools
+    from gui.stress_jobs import JobScheduler
+    from core import stress_engine, tracing
+    from core.foundation_store import FoundationTable
+    from core.spatial_index import SpatialIndex
+    from core.result_cache import ResultCache
+    from core.load_cases import LoadCases, LoadCaseResults, ENVELOPE_MAX, ENVELOPE_MIN
+    from viz.foundation_scene import FoundationPlacementError, FoundationScene, create_foundation, index_foundation
+    from viz.preview import InteractivePreview, FrameCoalescer
+    from viz.trace_overlay import TraceOverlay
+    from viz.ground_grid import GroundGrid
+    from viz.bim_scene import BimScene
+    from viz.bim_lod import BimLodManager
+    from bim.tessellation_cache import TessellationCache
 except ImportError as e:
     print(f"Ошибка импорта FoundationTools: {e}")
     print("Проверьте структуру папки gui и наличие файла foundation_tools.py")
     sys.exit(1)
 
+# Число фундаментов в одном задании фонового расчёта напряжений
+FOUNDATIONS_PER_JOB = 16
+
+# Переменная окружения: путь к файлу Chrome trace, который пишется при закрытии окна
+TRACE_ENV = "ENGINEERING_SUITE_TRACE"
+
 
 class EngineeringSuiteApp(MainWindow):
     def __init__(self, parent=None):
@@ -54,15 +75,72 @@ class EngineeringSuiteApp(MainWindow):
         self.creation_mode = None  # "foundation" или "guide_line"
         self.start_point = None
         self.end_point = None
-        self.temp_actor = None
+        self.last_screen_pos = None  # Последние обработанные экранная и привязанная позиции курсора
+        self.last_preview_pos = None
         self.guide_points = []
         self.guide_actors = []
-        self.foundations = []
+        self.guide_segments = []  # Все построенные отрезки вспомогательных линий (для файла проекта)
+        self.project = None  # Открытый файл проекта: сетки и результаты читаются из него по запросу
+        self.foundations = FoundationTable()  # Параметры фундаментов (колонки NumPy)
         self.grid_spacing = 0.5
+        self.snap_tolerance = 0.25  # Радиус привязки к углам фундаментов и вершинам линий, м
+        self.spatial_index = SpatialIndex(cell_size=2.0)
+        self.guide_vertex_count = 0
         self.scalar_bar_added = False  # Флаг для отслеживания добавления цветовой шкалы
-        self.grid_actor = None  # Актер для визуализации сетки
+        self.site_size = 20  # Размер площадки, м
+        self.ground_grid = GroundGrid(self.plotter, extent=self.site_size, spacing=self.grid_spacing)
         self.load_value = 100e3  # Начальное значение нагрузки (100 кН)
 
+        # Постоянные актёры предпросмотра и объединение событий мыши по кадрам
+        self.preview = InteractivePreview(self.plotter)
+        self.mouse_move_coalescer = FrameCoalescer(self.process_mouse_move)
+
+        # Трассировка обработчиков: F12 — оверлей с разбивкой последнего кадра;
+        # с переменной ENGINEERING_SUITE_TRACE трасса собирается с запуска
+        self.trace_overlay = TraceOverlay(self.plotter)
+        self.trace_path = os.environ.get(TRACE_ENV)
+        if self.trace_path:
+            tracing.enable()
+            self.trace_overlay.render_timer.attach()
+        QShortcut(QKeySequence("F12"), self, activated=self.toggle_trace_overlay)
+
+        # Объединённая сетка всех фундаментов (один актёр на сцене)
+        self.foundation_scene = FoundationScene(self.plotter)
+
+        # Фоновые расчёты напряжений
+        self.job_scheduler = JobScheduler(parent=self)
+        self.stress_batch = None
+        self.stress_batch_size = 0
+        self.stress_results = {}
+        self.stress_keys = {}
+
+        # Пакет расчётных случаев: все величины и типы нагрузки считаются сразу,
+        # переключение случая или огибающей не требует пересчёта
+        self.load_cases = LoadCases()
+        self.stress_cases = None
+        self.case_results = {}
+        self.case_selections = []
+
+        # Кеш результатов: при повторном применении пересчитываются только изменённые фундаменты
+        try:
+            self.stress_cache = ResultCache("foundation_stress", stress_engine.SOLVER_VERSION)
+        except OSError as e:
+            print(f"Дисковый кеш результатов недоступен ({e}), используется только память")
+            self.stress_cache = ResultCache("foundation_stress", stress_engine.SOLVER_VERSION, disk_dir=False)
+
+        # Импортированная BIM-модель (пакеты элементов) и фоновый импорт IFC.
+        # Сетки раскладываются по фрагментам с уровнями детализации и отсечением
+        # по камере; упрощённые уровни строятся в пуле расчётов
+        self.bim_lod = BimLodManager(self.plotter, scheduler=self.job_scheduler)
+        self.bim_lod.attach()
+        self.bim_scene = BimScene(self.plotter, lod=self.bim_lod)
+        self.ifc_import = None
+        try:
+            self.tessellation_cache = TessellationCache()
+        except OSError as e:
+            print(f"Кеш триангуляции IFC недоступен: {e}")
+            self.tessellation_cache = None
+
         # Добавление выбора типа нагрузки и ее величины
         self.add_load_controls()
 
@@ -71,6 +149,10 @@ class EngineeringSuiteApp(MainWindow):
         self.tools_widget.create_guide_btn.clicked.connect(self.set_guide_creation_mode)
         self.tools_widget.apply_btn.clicked.connect(self.apply_changes)
         self.tools_widget.snap_checkbox.stateChanged.connect(self.toggle_grid_visualization)
+        self.tools_widget.import_ifc_btn.clicked.connect(self.choose_ifc_file)
+        self.tools_widget.open_project_btn.clicked.connect(self.choose_project_to_open)
+        self.tools_widget.save_project_btn.clicked.connect(self.choose_project_to_save)
+        self.tools_widget.model_tree.storeys_changed.connect(self.on_storeys_changed)
 
         # Отладка инициализации
         print("Инициализация приложения...")
@@ -113,6 +195,14 @@ class EngineeringSuiteApp(MainWindow):
             self.load_value_combo.currentIndexChanged.connect(self.update_load_value)
             load_layout.addRow("Величина нагрузки:", self.load_value_combo)
 
+            # Все случаи нагрузки и выбор показываемого случая или огибающей
+            self.load_cases_checkbox = QCheckBox("Все случаи нагрузки")
+            load_layout.addRow(self.load_cases_checkbox)
+            self.load_case_combo = QComboBox()
+            self.load_case_combo.setEnabled(False)
+            self.load_case_combo.currentIndexChanged.connect(self.show_load_case)
+            load_layout.addRow("Показать:", self.load_case_combo)
+
             load_group.setLayout(load_layout)
             load_group.setObjectName("load_controls")
 
@@ -124,39 +214,15 @@ class EngineeringSuiteApp(MainWindow):
         """Обновление значения нагрузки при выборе из списка"""
         values = [50e3, 100e3, 200e3, 500e3, 1000e3]
         self.load_value = values[index]
-        print(f"Значение нагрузки обновлено: {self.load_value / 1000} кН")
 
     def toggle_grid_visualization(self, state):
         """Переключение видимости сетки в сцене"""
-        # Удаляем старую сетку, если она существует
-        if self.grid_actor:
-            try:
-                self.plotter.remove_actor(self.grid_actor)
-            except:
-                pass
-            self.grid_actor = None
-
-        # Добавляем сетку, если чекбокс включен
+        # Сетка строится один раз (с кешем по размеру и шагу), здесь меняется только видимость
         if state == Qt.Checked:
-            # Создаем сетку для визуализации
-            grid_size = 20
-            grid_lines = []
-
-            # Горизонтальные линии
-            for i in np.arange(-grid_size / 2, grid_size / 2 + self.grid_spacing, self.grid_spacing):
-                line = pv.Line([i, -grid_size / 2, 0.01], [i, grid_size / 2, 0.01])
-                grid_lines.append(line)
-
-            # Вертикальные линии
-            for i in np.arange(-grid_size / 2, grid_size / 2 + self.grid_spacing, self.grid_spacing):
-                line = pv.Line([-grid_size / 2, i, 0.01], [grid_size / 2, i, 0.01])
-                grid_lines.append(line)
-
-            # Объединяем все линии в одну сетку
-            grid_mesh = pv.MultiBlock(grid_lines).combine()
-            self.grid_actor = self.plotter.add_mesh(grid_mesh, color="gray", opacity=0.3, line_width=1)
+            self.ground_grid.show()
             print("Сетка отображается в сцене")
         else:
+            self.ground_grid.hide()
             print("Сетка скрыта")
 
     def setup_mouse_events(self):
@@ -164,7 +230,7 @@ class EngineeringSuiteApp(MainWindow):
         print("Настройка обработчиков событий мыши...")
 
         # Инициализация picker
-        self.plotter.picker = vtk.vtkCellPicker()
+        self.plotter.picker = vtkCellPicker()
         self.plotter.picker.SetTolerance(0.005)
 
         # Подключение обработчика кликов
@@ -185,7 +251,7 @@ class EngineeringSuiteApp(MainWindow):
         self.plotter.show_axes()
 
         # Создание базовой поверхности (земля)
-        ground = pv.Plane(center=(0, 0, 0), direction=(0, 0, 1), i_size=20, j_size=20)
+        ground = pv.Plane(center=(0, 0, 0), direction=(0, 0, 1), i_size=self.site_size, j_size=self.site_size)
         self.ground_actor = self.plotter.add_mesh(ground, color="green", opacity=0.3, show_edges=True)
         print("Базовая поверхность создана")
 
@@ -217,6 +283,11 @@ class EngineeringSuiteApp(MainWindow):
 
     def cancel_creation(self):
         """Отмена текущей операции создания"""
+        if self.stress_batch is not None and self.stress_batch.is_running():
+            self.stress_batch.cancel()
+        if self.ifc_import is not None and self.ifc_import.is_running():
+            self.ifc_import.cancel()
+
         print("Отмена операции создания")
         self.creation_mode = None
         self.start_point = None
@@ -226,52 +297,49 @@ class EngineeringSuiteApp(MainWindow):
         self.tools_widget.create_foundation_btn.setChecked(False)
         self.tools_widget.create_guide_btn.setChecked(False)
 
+    @tracing.traced("mouse_click")
     def on_mouse_click(self, position):
         """Обработчик клика мыши в 3D-сцене"""
-        print("\n=== Обнаружен клик мыши ===")
-        print(f"Текущий режим создания: {self.creation_mode}")
-
         if not self.creation_mode:
-            print("Не в режиме создания")
+            under_cursor = self.spatial_index.query_point(np.asarray(position)[:2])
+            if under_cursor:
+                self.statusBar().showMessage(f"Фундамент #{under_cursor[0] + 1}", 3000)
             return
 
         if not hasattr(self.plotter, 'picker') or self.plotter.picker is None:
             print("Picker не инициализирован")
             return
 
-        # Обработка позиции - в PyVistaQt 0.11.1 position содержит мировые координаты
-        print(f"Тип position: {type(position)}")
-        print(f"Значение position: {position}")
-
-        # Конвертируем в numpy array
+        # В PyVistaQt 0.11.1 position содержит мировые координаты
         world_pos = np.array(position)
-        print(f"Мировая позиция: {world_pos}")
 
         # Сбрасываем Z-координату на уровень земли для создания фундамента
         if self.creation_mode == "foundation":
             world_pos[2] = 0
 
-        # Привязка к сетке если включена
+        # Привязка к объектам или к сетке если включена
         if self.tools_widget.is_snap_enabled():
-            world_pos = np.round(world_pos / self.grid_spacing) * self.grid_spacing
-            print(f"Позиция после привязки к сетке: {world_pos}")
+            with tracing.span("snap"):
+                world_pos = self.snap_position(world_pos)
+
+        # После клика предпросмотр строится заново от новой опорной точки
+        self.last_preview_pos = None
 
         # Логика создания объектов
         if self.creation_mode == "foundation":
             if self.start_point is None:
                 self.start_point = world_pos
-                print(f"Установлена первая точка фундамента: {self.start_point}")
             else:
                 self.end_point = world_pos
-                print(f"Установлена вторая точка фундамента: {self.end_point}")
-                print("Создание фундамента...")
-                self.create_foundation()
+                with tracing.span("create_foundation"):
+                    self.create_foundation()
                 self.start_point = None
                 self.end_point = None
 
         elif self.creation_mode == "guide_line":
             self.guide_points.append(world_pos)
-            print(f"Добавлена точка линии: {world_pos}, всего точек: {len(self.guide_points)}")
+            self.spatial_index.insert_point(("guide", self.guide_vertex_count), world_pos[:2])
+            self.guide_vertex_count += 1
             if len(self.guide_points) > 1:
                 self.add_guide_line(self.guide_points[-2], self.guide_points[-1])
 
@@ -280,6 +348,15 @@ class EngineeringSuiteApp(MainWindow):
         if not self.creation_mode:
             return
 
+        # События объединяются: предпросмотр обновляется не чаще одного раза за кадр
+        self.mouse_move_coalescer.request()
+
+    @tracing.traced("mouse_move")
+    def process_mouse_move(self):
+        """Обработка последнего за кадр события движения мыши"""
+        if not self.creation_mode:
+            return
+
         try:
             # Получаем позицию мыши в экранных координатах
             interactor = self.plotter.iren
@@ -293,12 +370,18 @@ class EngineeringSuiteApp(MainWindow):
 
             x, y = screen_pos[:2]
 
+            # Курсор не сдвинулся на экране — пикинг и предпросмотр не нужны
+            if (x, y) == self.last_screen_pos:
+                return
+            self.last_screen_pos = (x, y)
+
             # Находим точку в 3D пространстве
-            renderer = self.plotter.renderer
-            self.plotter.picker.Pick(x, y, 0, renderer)
+            with tracing.span("pick"):
+                renderer = self.plotter.renderer
+                self.plotter.picker.Pick(x, y, 0, renderer)
 
-            # Получаем позицию в мировых координатах
-            world_pos = np.array(self.plotter.picker.GetPickPosition())
+                # Получаем позицию в мировых координатах
+                world_pos = np.array(self.plotter.picker.GetPickPosition())
 
             # Проверяем валидность координат
             if np.all(np.abs(world_pos) < 1e-6) or np.isnan(world_pos).any():
@@ -307,24 +390,38 @@ class EngineeringSuiteApp(MainWindow):
             # Сбрасываем Z-координату для движения по поверхности
             world_pos[2] = 0
 
-            # Привязка к сетке если включена
+            # Привязка к объектам или к сетке если включена
             if self.tools_widget.is_snap_enabled():
-                world_pos = np.round(world_pos / self.grid_spacing) * self.grid_spacing
+                with tracing.span("snap"):
+                    world_pos = self.snap_position(world_pos)
+
+            # Позиция после привязки не изменилась — предпросмотр актуален
+            if self.last_preview_pos is not None and np.array_equal(world_pos, self.last_preview_pos):
+                return
+            self.last_preview_pos = world_pos
 
-            # Обновление предпросмотра
-            if self.creation_mode == "foundation" and self.start_point is not None:
-                self.update_foundation_preview(world_pos)
+            # Обновление предпросмотра (рендер внутри замеряется отдельным интервалом)
+            with tracing.span("preview"):
+                if self.creation_mode == "foundation" and self.start_point is not None:
+                    self.update_foundation_preview(world_pos)
 
-            elif self.creation_mode == "guide_line" and self.guide_points:
-                self.update_guide_preview(world_pos)
+                elif self.creation_mode == "guide_line" and self.guide_points:
+                    self.update_guide_preview(world_pos)
 
         except Exception as e:
             print(f"Ошибка в обработчике движения мыши: {e}")
 
+    def snap_position(self, world_pos):
+        """Привязка к ближайшему углу фундамента или вершине линии, иначе к сетке"""
+        target = self.spatial_index.nearest_point(world_pos[:2], self.snap_tolerance)
+        if target is not None:
+            snapped = np.array(world_pos, dtype=float)
+            snapped[:2] = target[1]
+            return snapped
+        return np.round(world_pos / self.grid_spacing) * self.grid_spacing
+
     def update_foundation_preview(self, current_pos):
         """Обновление предпросмотра фундамента"""
-        self.clear_temp_objects()
-
         if self.start_point is None:
             return
 
@@ -336,54 +433,23 @@ class EngineeringSuiteApp(MainWindow):
         thickness = self.tools_widget.get_foundation_thickness()
 
         if width < 0.1 or length < 0.1:
+            self.preview.hide()
+            self.plotter.render()
             return
 
-        # Создание прямоугольного фундамента
-        foundation = pv.Cube(
-            center=((min_point[0] + max_point[0]) / 2,
-                    (min_point[1] + max_point[1]) / 2,
-                    min_point[2] + thickness / 2),
-            x_length=width,
-            y_length=length,
-            z_length=thickness
-        )
-
-        # Удаляем предыдущий временный актер, если он существует
-        if hasattr(self, 'temp_actor') and self.temp_actor is not None:
-            try:
-                self.plotter.remove_actor(self.temp_actor)
-            except:
-                pass
-
-        self.temp_actor = self.plotter.add_mesh(
-            foundation,
-            color="yellow",
-            opacity=0.7,
-            show_edges=True,
-            name="temp_foundation"
-        )
+        # Пересечение с существующими фундаментами подсвечивается красным
+        overlaps = self.spatial_index.query_box(min_point[:2], max_point[:2])
+
+        # Координаты постоянного актёра предпросмотра обновляются на месте
+        self.preview.show_foundation(min_point, max_point, thickness, overlaps=bool(overlaps))
+        self.plotter.render()
 
     def update_guide_preview(self, current_pos):
         """Обновление предпросмотра вспомогательной линии"""
-        self.clear_temp_objects()
-
-        # Отображение всех постоянных линий
-        for i, point in enumerate(self.guide_points):
-            if i > 0:
-                line = pv.Line(self.guide_points[i - 1], point)
-                self.plotter.add_mesh(line, color="blue", line_width=3, name=f"guide_{i}")
-
-        # Предпросмотр текущей линии
+        # Готовые линии уже добавлены в сцену в add_guide_line; здесь только текущий отрезок
         if self.guide_points:
-            line = pv.Line(self.guide_points[-1], current_pos)
-            # Удаляем предыдущий временный актер, если он существует
-            if hasattr(self, 'temp_actor') and self.temp_actor is not None:
-                try:
-                    self.plotter.remove_actor(self.temp_actor)
-                except:
-                    pass
-
-            self.temp_actor = self.plotter.add_mesh(line, color="cyan", line_width=2, style="wireframe")
+            self.preview.show_guide_segment(self.guide_points[-1], current_pos)
+            self.plotter.render()
 
     def create_foundation(self):
         """Создание постоянного фундамента"""
@@ -393,70 +459,24 @@ class EngineeringSuiteApp(MainWindow):
 
         self.clear_temp_objects()
 
-        min_point = np.minimum(self.start_point, self.end_point)
-        max_point = np.maximum(self.start_point, self.end_point)
-
-        width = max_point[0] - min_point[0]
-        length = max_point[1] - min_point[1]
-        thickness = self.tools_widget.get_foundation_thickness()
-
-        if width < 0.1 or length < 0.1:
-            print("Ошибка: слишком маленькие размеры фундамента")
-            QMessageBox.warning(self, "Ошибка", "Размеры фундамента слишком малы. Попробуйте выбрать большую область.")
+        load_type = self.load_type_combo.currentText()
+        try:
+            foundation_id = create_foundation(self.foundations, self.foundation_scene, self.spatial_index,
+                                              self.start_point, self.end_point,
+                                              self.tools_widget.get_foundation_thickness(),
+                                              self.load_value, load_type)
+        except FoundationPlacementError as error:
+            overlaps = f" (фундаменты {[i + 1 for i in error.overlaps]})" if error.overlaps else ""
+            print(f"Ошибка: {error}{overlaps}")
+            QMessageBox.warning(self, "Ошибка", str(error))
             return
 
-        foundation = pv.Cube(
-            center=((min_point[0] + max_point[0]) / 2,
-                    (min_point[1] + max_point[1]) / 2,
-                    min_point[2] + thickness / 2),
-            x_length=width,
-            y_length=length,
-            z_length=thickness
-        )
-
-        # Генерация начальной модели напряжений для визуализации
-        stress = np.zeros(foundation.n_points)
-
-        # Простая модель распределения напряжений
-        center = np.array([(min_point[0] + max_point[0]) / 2,
-                           (min_point[1] + max_point[1]) / 2,
-                           min_point[2] + thickness / 2])
-
-        points = foundation.points
-        for i, point in enumerate(points):
-            # Расстояние от центра фундамента
-            dist = np.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
-            # Простая модель напряжений: больше у краев, меньше в центре
-            stress[i] = 1e6 * (1 - np.exp(-dist / 2))
-
-        foundation["stress"] = stress
-
-        # Добавляем цветовую шкалу только при первом добавлении фундамента
-        if not self.foundations and not self.scalar_bar_added:
+        # Цветовая шкала добавляется только при первом добавлении фундамента
+        if not self.scalar_bar_added:
             self.plotter.add_scalar_bar(title="Напряжение (Па)", n_labels=4, interactive=True)
             self.scalar_bar_added = True
 
-        actor = self.plotter.add_mesh(
-            foundation,
-            scalars="stress",
-            cmap="coolwarm",
-            show_edges=True
-        )
-
-        # Сохранение информации о фундаменте
-        load_type = self.load_type_combo.currentText()
-        foundation_data = {
-            "actor": actor,
-            "geometry": foundation,
-            "position": ((min_point[0] + max_point[0]) / 2,
-                         (min_point[1] + max_point[1]) / 2,
-                         min_point[2] + thickness / 2),
-            "dimensions": (width, length, thickness),
-            "load_value": self.load_value,
-            "load_type": load_type
-        }
-
-        self.foundations.append(foundation_data)
+        width, length, thickness = self.foundations.dimensions[self.foundations.row(foundation_id)]
         print(f"Фундамент создан успешно. Размеры: {width:.2f}м x {length:.2f}м x {thickness:.2f}м")
         print(f"Тип нагрузки: {load_type}, Величина: {self.load_value / 1000:.1f} кН")
 
@@ -466,24 +486,16 @@ class EngineeringSuiteApp(MainWindow):
     def add_guide_line(self, start_point, end_point):
         """Добавление постоянной вспомогательной линии"""
         line = pv.Line(start_point, end_point)
-        self.plotter.add_mesh(line, color="blue", line_width=3)
-        print(f"Добавлена вспомогательная линия от {start_point} до {end_point}")
+        self.guide_actors.append(self.plotter.add_mesh(line, color="blue", line_width=3))
+        self.guide_segments.append((np.asarray(start_point, dtype=np.float64), np.asarray(end_point, dtype=np.float64)))
 
     def clear_temp_objects(self):
-        """Удаление временных объектов предпросмотра"""
-        if hasattr(self, 'temp_actor') and self.temp_actor is not None:
-            try:
-                # Проверяем, существует ли актер в сцене
-                if hasattr(self.plotter, 'renderer') and hasattr(self.plotter.renderer, 'has_actor'):
-                    if self.plotter.renderer.has_actor(self.temp_actor):
-                        self.plotter.remove_actor(self.temp_actor)
-                else:
-                    self.plotter.remove_actor(self.temp_actor)
-                print("Временные объекты удалены")
-            except Exception as e:
-                print(f"Ошибка при удалении временного объекта: {e}")
-            finally:
-                self.temp_actor = None
+        """Скрытие временных объектов предпросмотра"""
+        self.mouse_move_coalescer.cancel()
+        self.last_screen_pos = None
+        self.last_preview_pos = None
+        if self.preview.is_visible():
+            self.preview.hide()
 
     def apply_changes(self):
         """Применение изменений к созданной модели с реальным расчётом напряжений"""
@@ -491,162 +503,408 @@ class EngineeringSuiteApp(MainWindow):
             print("Нет фундаментов для применения")
             return
 
-        print("Применение изменений к фундаментам...")
-
-        # Сохраняем текущие настройки визуализации для каждого фундамента
-        visualization_settings = []
-        for foundation in self.foundations:
-            if hasattr(foundation["actor"], 'GetProperty'):
-                prop = foundation["actor"].GetProperty()
-                visualization_settings.append({
-                    'color': prop.GetColor(),
-                    'opacity': prop.GetOpacity(),
-                    'edge_visibility': prop.GetEdgeVisibility(),
-                    'edge_color': prop.GetEdgeColor()
-                })
-            else:
-                visualization_settings.append(None)
+        if self.stress_batch is not None and self.stress_batch.is_running():
+            print("Расчёт напряжений уже выполняется")
+            return
 
         # Добавляем цветовую шкалу, если её ещё нет
         if not self.scalar_bar_added:
             self.plotter.add_scalar_bar(title="Напряжение (Па)", n_labels=4, interactive=True)
             self.scalar_bar_added = True
 
-        # Обрабатываем напряжения для каждого фундамента
-        all_stresses = []
-        for i, foundation in enumerate(self.foundations):
-            print(f"Фундамент #{i + 1}, размеры: {foundation['dimensions']}")
-            print(f"Тип нагрузки: {foundation['load_type']}, Величина: {foundation['load_value'] / 1000:.1f} кН")
+        # Результаты неизменённых фундаментов берутся из кеша по хешу входных данных
+        # С пакетом случаев результат фундамента — стопка (случай, точка)
+        table = self.foundations
+        cases = self.load_cases if self.load_cases_checkbox.isChecked() else None
+        self.stress_cases = cases
+        self.stress_results = {}
+        self.stress_keys = {}
+        pending_rows = []
+        with tracing.span("cache_lookup", foundations=len(table)) as span:
+            for row, foundation_id in enumerate(table.ids.tolist()):
+                if cases is not None:
+                    key = stress_engine.load_case_cache_key(table.mesh(foundation_id).points, table.dimensions[row],
+                                                            table.positions[row], cases)
+                else:
+                    key = stress_engine.stress_cache_key(table.mesh(foundation_id).points, table.dimensions[row],
+                                                         table.positions[row], table.load_values[row],
+                                                         table.load_type_codes[row])
+                cached = self.stress_cache.get(key)
+                if cached is not None:
+                    self.stress_results[foundation_id] = cached
+                else:
+                    self.stress_keys[foundation_id] = key
+                    pending_rows.append(row)
+            span.annotate(cached=len(self.stress_results), pending=len(pending_rows))
+
+        self.stress_batch_size = len(self.foundations)
+        if not pending_rows:
+            self.stress_batch = None
+            self.on_stress_finished(None)
+            return
 
-            # Выполняем реальный расчёт напряжений
-            stress_results = self.calculate_foundation_stress(foundation)
+        # Расчёт идёт в рабочих потоках по группам фундаментов; в задания
+        # передаются копии входных данных, а не сами сетки и актёры
+        jobs = []
+        for start in range(0, len(pending_rows), FOUNDATIONS_PER_JOB):
+            rows = np.array(pending_rows[start:start + FOUNDATIONS_PER_JOB])
+            group_ids = tuple(table.ids[rows].tolist())
+            points = [np.array(table.mesh(foundation_id).points, dtype=np.float64) for foundation_id in group_ids]
+            if cases is not None:
+                jobs.append((group_ids, stress_engine.foundation_group_load_cases, (
+                    points, table.dimensions[rows], table.positions[rows], cases)))
+                continue
+            jobs.append((group_ids, stress_engine.foundation_group_stress, (
+                points,
+                table.dimensions[rows],
+                table.positions[rows],
+                table.load_values[rows],
+                table.load_type_codes[rows],
+            )))
+
+        self.stress_batch = self.job_scheduler.submit(jobs)
+        self.stress_batch.result_ready.connect(self.on_stress_partial_result)
+        self.stress_batch.progress.connect(self.on_stress_progress)
+        self.stress_batch.finished.connect(self.on_stress_finished)
+        self.stress_batch.cancelled.connect(self.on_stress_cancelled)
+        self.stress_batch.failed.connect(self.on_stress_failed)
 
-            # Обновляем данные в сетке
-            foundation["geometry"]["stress"] = stress_results
-            foundation["geometry"].set_active_scalars("stress")
+        self.tools_widget.apply_btn.setEnabled(False)
+        self.statusBar().showMessage("Расчёт напряжений... (Esc — отмена)")
+
+    def on_stress_partial_result(self, group_ids, group_stresses):
+        """Частичный результат: напряжения для группы фундаментов"""
+        for foundation_id, stress_results in zip(group_ids, group_stresses):
+            stress_results = self.stress_cache.put(self.stress_keys.pop(foundation_id), stress_results)
+            self.stress_results[foundation_id] = stress_results
+
+    def on_stress_progress(self, done, total):
+        """Отображение прогресса расчёта"""
+        self.statusBar().showMessage(f"Расчёт напряжений: {done}/{total} групп (Esc — отмена)")
+
+    def on_stress_cancelled(self):
+        """Расчёт отменён: сцена остаётся без изменений"""
+        print("Расчёт напряжений отменён")
+        self.statusBar().showMessage("Расчёт напряжений отменён", 3000)
+        self.tools_widget.apply_btn.setEnabled(True)
 
-            # Собираем все напряжения для общего диапазона
-            all_stresses.extend(stress_results.flatten())
+    def on_stress_failed(self, group_ids, message):
+        """Ошибка в рабочем потоке"""
+        print(f"Ошибка расчёта напряжений (фундаменты с #{group_ids[0] + 1}):\n{message}")
+        self.statusBar().showMessage("Ошибка расчёта напряжений", 3000)
+        self.tools_widget.apply_btn.setEnabled(True)
 
-            print(
-                f"Диапазон напряжений фундамента #{i + 1}: {np.min(stress_results):.2e} Па - {np.max(stress_results):.2e} Па")
+    def on_stress_finished(self, _results):
+        """Расчёт завершён: обновляем скаляры в GUI-потоке"""
+        # Фундаменты, удалённые во время расчёта, пропускаются
+        stresses = {foundation_id: stress_results for foundation_id, stress_results in self.stress_results.items()
+                    if foundation_id in self.foundations}
+        if self.stress_cases is not None:
+            self.case_results = {foundation_id: LoadCaseResults(self.stress_cases, {"stress": stack})
+                                 for foundation_id, stack in stresses.items()}
+            self.fill_load_case_combo(self.stress_cases)
+            self.show_load_case(self.load_case_combo.currentIndex())
+        else:
+            self.case_results = {}
+            self.load_case_combo.setEnabled(False)
+            self.show_stresses(stresses)
+
+        # Деактивация кнопки применения до следующих изменений
+        # (если во время расчёта появились новые фундаменты, кнопка остаётся активной)
+        self.tools_widget.apply_btn.setEnabled(len(self.foundations) != self.stress_batch_size)
+        self.statusBar().showMessage("Расчёт напряжений завершён", 3000)
+        print("Изменения применены. Расчёты напряжений выполнены для всех фундаментов.")
+
+    def fill_load_case_combo(self, cases):
+        """Список случаев пакета и огибающих; выбранный пункт сохраняется"""
+        selection = self.case_selections[self.load_case_combo.currentIndex()] \
+            if self.load_case_combo.currentIndex() >= 0 else ENVELOPE_MAX
+        self.case_selections = [ENVELOPE_MAX, ENVELOPE_MIN] + list(range(len(cases)))
+        self.load_case_combo.blockSignals(True)
+        self.load_case_combo.clear()
+        self.load_case_combo.addItems(["Огибающая max", "Огибающая min"] + cases.labels())
+        self.load_case_combo.setCurrentIndex(self.case_selections.index(selection)
+                                             if selection in self.case_selections else 0)
+        self.load_case_combo.blockSignals(False)
+        self.load_case_combo.setEnabled(True)
+
+    def show_load_case(self, index):
+        """Показ случая нагрузки или огибающей из уже посчитанного пакета"""
+        if not self.case_results:
+            self.load_project_case_results()
+        if index < 0 or not self.case_results:
+            return
+        selection = self.case_selections[index]
+        self.show_stresses({foundation_id: results.view("stress", selection)
+                            for foundation_id, results in self.case_results.items()
+                            if foundation_id in self.foundations})
+
+    @tracing.traced()
+    def show_stresses(self, stresses):
+        """Запись напряжений {id: массив} в сетки и в объединённый актёр"""
+        # Обновляем данные в сетках и скаляры объединённого актёра на месте
+        for foundation_id, stress_results in stresses.items():
+            geometry = self.foundations.mesh(foundation_id)
+            geometry["stress"] = stress_results
+            geometry.set_active_scalars("stress")
+        self.foundation_scene.update_stresses(stresses)
 
         # Определяем общий диапазон для всех фундаментов
-        if all_stresses:
-            min_stress = np.min(all_stresses)
-            max_stress = np.max(all_stresses)
+        stress_range = self.foundation_scene.stress_range()
+        if stress_range is not None:
+            min_stress, max_stress = stress_range
             print(f"Общий диапазон напряжений: {min_stress:.2e} Па - {max_stress:.2e} Па")
 
             # Обновляем диапазон цветовой шкалы для всей сцены
             self.plotter.update_scalar_bar_range([min_stress, max_stress])
 
-        # Удаляем и повторно добавляем все фундаменты для корректной визуализации
-        for i, foundation in enumerate(self.foundations):
-            # Удаляем старый актер
-            try:
-                self.plotter.remove_actor(foundation["actor"])
-            except Exception as e:
-                print(f"Ошибка при удалении актера фундамента #{i + 1}: {e}")
-
-            # Добавляем обновленную визуализацию с напряжениями
-            foundation["actor"] = self.plotter.add_mesh(
-                foundation["geometry"],
-                scalars="stress",
-                cmap="coolwarm",
-                show_edges=True
-            )
-
-            # Восстанавливаем настройки визуализации
-            if visualization_settings[i] and hasattr(foundation["actor"], 'GetProperty'):
-                prop = foundation["actor"].GetProperty()
-                settings = visualization_settings[i]
-                prop.SetColor(settings['color'])
-                prop.SetOpacity(settings['opacity'])
-                prop.SetEdgeVisibility(settings['edge_visibility'])
-                prop.SetEdgeColor(settings['edge_color'])
-
         # Принудительно обновляем рендерер
         self.plotter.render()
 
-        # Деактивация кнопки применения до следующих изменений
-        self.tools_widget.apply_btn.setEnabled(False)
-        print("Изменения применены. Расчёты напряжений выполнены для всех фундаментов.")
+    def choose_project_to_save(self):
+        """Выбор файла для сохранения проекта"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Сохранить проект", "", "Проект (*.esproj)")
+        if file_path:
+            self.save_project_file(file_path)
+
+    def choose_project_to_open(self):
+        """Выбор файла проекта"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Открыть проект", "", "Проект (*.esproj)")
+        if file_path:
+            self.open_project_file(file_path)
+
+    def save_project_file(self, file_path):
+        """Сохранение фундаментов, их сеток, напряжений и вспомогательных линий"""
+        # Всё, что ещё лежит только в открытом файле, читается в память: файл
+        # может перезаписываться этим же сохранением
+        self.release_project()
+        results = {"stress": {foundation_id: self.foundations.mesh(foundation_id)["stress"]
+                              for foundation_id in self.foundations
+                              if "stress" in self.foundations.mesh(foundation_id).point_data}}
+        load_cases = None
+        if self.case_results:
+            results["stress_cases"] = {foundation_id: case_results["stress"]
+                                       for foundation_id, case_results in self.case_results.items()}
+            load_cases = self.stress_cases
+        from core.project_file import save_project  # h5py загружается только для файлов проекта
+
+        try:
+            save_project(file_path, self.foundations, guide_segments=self.guide_segments, results=results,
+                         load_cases=load_cases)
+        except (OSError, ValueError) as e:
+            print(f"Ошибка сохранения проекта: {e}")
+            QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить проект:\n{e}")
+            return
+        print(f"Проект сохранён: {file_path}, фундаментов: {len(self.foundations)}")
+        self.statusBar().showMessage(f"Проект сохранён: {file_path}", 3000)
+
+    def open_project_file(self, file_path):
+        """
+        Открытие проекта: таблица параметров, общая сетка сцены и текущее поле
+        напряжений читаются сразу, сетки отдельных фундаментов и пакет
+        случаев нагрузки — при первом обращении.
+        """
+        if self.stress_batch is not None and self.stress_batch.is_running():
+            self.stress_batch.cancel()
+        from core.project_file import ProjectFile
+
+        try:
+            project = ProjectFile(file_path)
+        except (OSError, ValueError) as e:
+            print(f"Ошибка открытия проекта: {e}")
+            QMessageBox.warning(self, "Ошибка", f"Не удалось открыть проект:\n{e}")
+            return
+        if self.project is not None:
+            self.project.close()
+        self.project = project
+
+        self.clear_temp_objects()
+        self.foundations = project.foundations()
+        self.stress_results = {}
+        self.stress_keys = {}
+        self.case_results = {}
+        self.stress_cases = project.load_cases()
+        if self.stress_cases is not None:
+            self.fill_load_case_combo(self.stress_cases)
+        else:
+            self.load_case_combo.setEnabled(False)
+
+        stress = project.result_array("stress") if "stress" in project.result_names() else None
+        self.foundation_scene.load(stress=stress, **project.mesh_arrays())
+        if not self.scalar_bar_added and len(self.foundations):
+            self.plotter.add_scalar_bar(title="Напряжение (Па)", n_labels=4, interactive=True)
+            self.scalar_bar_added = True
+        stress_range = self.foundation_scene.stress_range()
+        if stress_range is not None:
+            self.plotter.update_scalar_bar_range(list(stress_range))
+
+        # Пространственный индекс: подошвы и их углы, вершины вспомогательных линий
+        self.spatial_index.clear()
+        for foundation_id, (low, high) in zip(self.foundations.ids.tolist(), self.foundations.bounding_boxes()):
+            index_foundation(self.spatial_index, foundation_id, low, high)
+        self.show_guide_segments(project.guide_segments)
+
+        self.tools_widget.apply_btn.setEnabled(bool(self.foundations))
+        self.plotter.reset_camera()
+        self.plotter.render()
+        print(f"Проект открыт: {file_path}, фундаментов: {len(self.foundations)}")
+        self.statusBar().showMessage(f"Проект открыт: {file_path}", 3000)
+
+    def show_guide_segments(self, segments):
+        """Замена вспомогательных линий сцены отрезками (G, 2, 3) одним актёром"""
+        for actor in self.guide_actors:
+            self.plotter.remove_actor(actor, render=False)
+        self.guide_actors = []
+        self.guide_segments = [(start, end) for start, end in segments]
+        self.guide_vertex_count = 0
+        if not len(segments):
+            return
+        points = np.asarray(segments, dtype=np.float64).reshape(-1, 3)
+        lines = np.column_stack((np.full(len(segments), 2), np.arange(0, len(points), 2),
+                                 np.arange(1, len(points), 2))).ravel()
+        self.guide_actors.append(self.plotter.add_mesh(pv.PolyData(points, lines=lines), color="blue",
+                                                       line_width=3))
+        for point in points:
+            self.spatial_index.insert_point(("guide", self.guide_vertex_count), point[:2])
+            self.guide_vertex_count += 1
+
+    def load_project_case_results(self):
+        """Пакет случаев нагрузки из открытого проекта — одним чтением при первом показе"""
+        if self.project is None or self.stress_cases is None or "stress_cases" not in self.project.result_names():
+            return
+        self.case_results = {foundation_id: LoadCaseResults(self.stress_cases, {"stress": stack})
+                             for foundation_id, stack in self.project.results("stress_cases").items()
+                             if foundation_id in self.foundations}
+
+    def release_project(self):
+        """Чтение в память всего, что ещё не загружено из файла проекта, и его закрытие"""
+        if self.project is None:
+            return
+        for foundation_id in self.foundations:
+            self.foundations.mesh(foundation_id)
+        if not self.case_results:
+            self.load_project_case_results()
+        self.foundations.mesh_loader = None
+        self.project.close()
+        self.project = None
+
+    def choose_ifc_file(self):
+        """Выбор IFC-файла для импорта"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Импорт IFC", "", "IFC (*.ifc)")
+        if file_path:
+            if not plugins.available("bim.ifc_import"):
+                # Без ifcopenshell модель открывается только из кеша триангуляции
+                print("ifcopenshell не установлен: импорт возможен только из кеша триангуляции")
+            self.import_ifc(file_path)
+
+    def import_ifc(self, file_path):
+        """Фоновый импорт IFC: сцена и дерево модели заполняются по мере готовности пакетов"""
+        if self.ifc_import is not None and self.ifc_import.is_running():
+            self.ifc_import.cancel()
+
+        from gui.ifc_import import IfcImport
+
+        print(f"Импорт IFC: {file_path}")
+        self.bim_scene.clear()
+        self.tools_widget.model_tree.clear()
+
+        # Повторяющиеся сетки (окна, колонны, типовые этажи) хранятся и загружаются один раз
+        self.ifc_import = IfcImport(file_path, pool=self.job_scheduler.pool, parent=self, instancing=True,
+                                    cache=self.tessellation_cache)
+        self.ifc_import.batch_ready.connect(self.on_ifc_batch)
+        self.ifc_import.progress.connect(self.on_ifc_progress)
+        self.ifc_import.finished.connect(self.on_ifc_finished)
+        self.ifc_import.cancelled.connect(self.on_ifc_cancelled)
+        self.ifc_import.failed.connect(self.on_ifc_failed)
+        self.ifc_import.start()
+        self.statusBar().showMessage("Импорт IFC... (Esc — отмена)")
+
+    def on_ifc_batch(self, model, batch):
+        """Пакет элементов готов: добавляем его в сцену и в дерево модели"""
+        first_batch = not len(self.bim_scene)
+        self.bim_scene.add_batch(model, batch)
+        self.tools_widget.model_tree.add_batch(batch)
+        if first_batch:
+            self.plotter.reset_camera()
+        else:
+            self.bim_lod.update()
+        self.plotter.render()
+
+    def on_storeys_changed(self, storeys):
+        """Фильтр этажей из дерева модели"""
+        self.bim_lod.set_storey_filter(storeys)
+        self.plotter.render()
+
+    def on_ifc_progress(self, count, percent):
+        self.statusBar().showMessage(f"Импорт IFC: {count} элементов, {percent}% (Esc — отмена)")
+
+    def on_ifc_finished(self, model):
+        print(f"Импорт IFC завершён: {len(model)} элементов, {model.n_triangles} треугольников, "
+              f"{len(model.materials)} материалов")
+        self.statusBar().showMessage(f"Импортировано элементов: {len(model)}", 3000)
+
+    def on_ifc_cancelled(self):
+        print("Импорт IFC отменён")
+        self.statusBar().showMessage("Импорт IFC отменён", 3000)
+
+    def on_ifc_failed(self, message):
+        print(f"Ошибка импорта IFC:\n{message}")
+        self.statusBar().showMessage("Ошибка импорта IFC", 3000)
+
+    def toggle_trace_overlay(self):
+        """F12: оверлей с разбивкой времени последнего кадра"""
+        if self.trace_overlay.is_visible():
+            self.trace_overlay.hide()
+            if self.trace_path:
+                self.trace_overlay.render_timer.attach()
+            else:
+                tracing.disable()
+        else:
+            self.trace_overlay.show()
+        self.plotter.render()
+
+    def closeEvent(self, event):
+        """Остановка фоновых расчётов перед закрытием окна"""
+        if self.ifc_import is not None:
+            self.ifc_import.cancel()
+        if self.project is not None:
+            self.project.close()
+        self.job_scheduler.cancel_all()
+        self.job_scheduler.wait()
+        if self.trace_path:
+            try:
+                tracing.export_chrome_trace(self.trace_path)
+                print(f"Трасса записана: {self.trace_path}")
+            except OSError as e:
+                print(f"Не удалось записать трассу: {e}")
+        super().closeEvent(event)
 
-    def calculate_foundation_stress(self, foundation):
+    def calculate_foundation_stress(self, foundation_id):
         """
         Расчёт напряжений в фундаменте с учетом типа нагрузки
         """
-        width, length, thickness = foundation["dimensions"]
-        points = foundation["geometry"].points
-        load_value = foundation["load_value"]
-        load_type = foundation["load_type"]
-
-        # Расчёт напряжений в точках
-        stress = np.zeros(len(points))
-
-        # Центр фундамента для расчёта
-        center = foundation["position"]
-
-        # Определяем тип распределения нагрузки
-        if load_type == "Равномерная":
-            # Равномерное распределение по площади
-            area = width * length
-            base_pressure = load_value / area
-
-            for j, point in enumerate(points):
-                # Для равномерной нагрузки напряжения одинаковы во всех точках, но добавляем небольшой градиент
-                # для лучшей визуализации
-                dist = np.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
-                # Небольшое снижение к краям
-                stress[j] = base_pressure * (1 - 0.1 * dist / max(width, length))
-
-        elif load_type == "Точечная в центре":
-            # Нагрузка приложена в центре
-            for j, point in enumerate(points):
-                dist = np.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
-                # Экспоненциальное снижение от центра
-                stress[j] = load_value * np.exp(-2 * dist / max(width, length)) / (
-                            np.pi * (max(width, length) / 4) ** 2)
-
-        elif load_type == "Точечная в углу":
-            # Нагрузка приложена в одном из углов
-            corner = [center[0] - width / 2, center[1] - length / 2, center[2]]
-            for j, point in enumerate(points):
-                dist = np.sqrt((point[0] - corner[0]) ** 2 + (point[1] - corner[1]) ** 2)
-                # Экспоненциальное снижение от угла
-                stress[j] = load_value * np.exp(-2 * dist / max(width, length)) / (
-                            np.pi * (max(width, length) / 4) ** 2)
-
-        elif load_type == "Линейная":
-            # Нагрузка распределена линейно (например, вдоль одной оси)
-            for j, point in enumerate(points):
-                # Нормализуем позицию вдоль оси X от -1 до 1
-                norm_x = (point[0] - center[0]) / (width / 2)
-                # Линейное распределение от минимального до максимального значения
-                factor = 0.5 + 0.5 * norm_x  # От 0 до 1
-                stress[j] = (load_value / (width * length)) * factor
-
-        # Добавляем учет глубины (напряжения снижаются по высоте)
-        for j, point in enumerate(points):
-            # Относительная высота (0 внизу, 1 вверху)
-            rel_height = (point[2] - (center[2] - thickness / 2)) / thickness
-            # Снижение напряжений к верху фундамента
-            stress[j] *= (1 - 0.3 * rel_height)
-
-        return stress
+        row = self.foundations.row(foundation_id)
+        return stress_engine.foundation_stress(self.foundations.mesh(foundation_id).points,
+                                               self.foundations.dimensions[row],
+                                               self.foundations.positions[row],
+                                               self.foundations.load_values[row],
+                                               self.foundations.load_type_codes[row])
 
 
 if __name__ == "__main__":
     print("Запуск Engineering Suite...")
     print(f"Текущая директория: {os.getcwd()}")
+    startup.mark("imports")
 
-    app = QApplication(sys.argv)
     window = EngineeringSuiteApp()
     window.show()
+    splash.finish(window)
+    startup.mark("window")
+    startup.report()
 
     print("Приложение запущено. Для создания фундамента:")
     print("1. Нажмите кнопку 'Создать фундамент' в правой панели")
     print("2. Кликните в сцене для первой точки")
     print("3. Переместите мышь и кликните для второй точки")
 
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(qt_app.exec_())
\ No newline at end of file
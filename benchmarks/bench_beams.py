@@ -0,0 +1,69 @@
+# benchmarks/bench_beams.py
+"""
+Пакетная генерация балок: каркас из N балок строится одной сеткой
+(BeamArray.to_polydata) и, для сравнения, по одной сетке на балку с
+последующим слиянием — так, как это делалось через Beam.create_3d_model.
+Затем для всех балок считаются сечения и напряжения (beam_analysis),
+и результаты переносятся на грани общей сетки.
+
+Запуск: python benchmarks/bench_beams.py [--beams N] [--single N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pyvista as pv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plugins.structural.beam import BeamArray  # noqa: E402
+from plugins.structural.beam_analysis import LOAD_CASES, analyze_beams, attach_beam_results  # noqa: E402
+
+
+def frame_structure(count, seed=0):
+    """Случайный каркас: начала и концы балок, сечения из сортамента"""
+    rng = np.random.default_rng(seed)
+    starts = rng.uniform(0, 100, (count, 3))
+    ends = starts + rng.uniform(-6, 6, (count, 3))
+    sections = rng.choice([0.2, 0.3, 0.4, 0.5], (count, 2))
+    return starts, ends, sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--beams", type=int, default=100_000)
+    parser.add_argument("--single", type=int, default=2_000, help="балок для построения по одной")
+    args = parser.parse_args()
+
+    starts, ends, sections = frame_structure(args.beams)
+    begin = time.perf_counter()
+    beams = BeamArray(starts, ends, sections=sections)
+    mesh = beams.to_polydata()
+    batch_time = time.perf_counter() - begin
+    print(f"Пакет: {len(beams)} балок, {mesh.n_cells} треугольников, {batch_time * 1e3:.1f} мс "
+          f"({batch_time / len(beams) * 1e6:.2f} мкс на балку)")
+
+    rng = np.random.default_rng(1)
+    begin = time.perf_counter()
+    results = analyze_beams(beams, rng.uniform(1e3, 5e4, len(beams)), rng.integers(0, len(LOAD_CASES), len(beams)))
+    analysis_time = time.perf_counter() - begin
+    begin = time.perf_counter()
+    attach_beam_results(mesh, results, ["bending_stress", "shear_stress", "deflection"])
+    attach_time = time.perf_counter() - begin
+    print(f"Сечения и напряжения: {analysis_time * 1e3:.1f} мс, перенос на сетку: {attach_time * 1e3:.1f} мс, "
+          f"макс. σ = {results['bending_stress'].max() / 1e6:.1f} МПа")
+
+    count = min(args.single, args.beams)
+    begin = time.perf_counter()
+    meshes = [BeamArray(starts[i:i + 1], ends[i:i + 1], sections=sections[i:i + 1]).to_polydata()
+              for i in range(count)]
+    merged = pv.merge(meshes)
+    single_time = time.perf_counter() - begin
+    print(f"По одной: {count} балок, {merged.n_cells} треугольников, {single_time * 1e3:.1f} мс "
+          f"({single_time / count * 1e6:.2f} мкс на балку)")
+
+
+if __name__ == "__main__":
+    main()
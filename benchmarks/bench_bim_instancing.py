@@ -0,0 +1,89 @@
+# benchmarks/bench_bim_instancing.py
+"""
+Дедупликация BIM-геометрии: синтетическая модель из N элементов, которые
+используют K уникальных сеток (окна, колонны, плиты), со случайным
+размещением. Сравнивается память и объём загрузки в видеопамять для
+сетки в мировых координатах и для уникальных сеток с экземплярами.
+
+Запуск: python benchmarks/bench_bim_instancing.py [--elements N] [--unique K]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pyvista as pv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bim.instancing import GeometryLibrary, instantiate, rigid_decomposition  # noqa: E402
+
+
+def synthetic_geometries(unique, seed=0):
+    """K уникальных сеток разной детализации (сферы разного разрешения)"""
+    rng = np.random.default_rng(seed)
+    geometries = []
+    for k in range(unique):
+        sphere = pv.Sphere(radius=0.5, theta_resolution=8 + k % 24, phi_resolution=8 + k % 16)
+        faces = sphere.faces.reshape(-1, 4)[:, 1:].astype(np.int32)
+        geometries.append((np.asarray(sphere.points, dtype=np.float64) * rng.uniform(0.5, 2.0, 3), faces,
+                           np.zeros(len(faces), dtype=np.int32)))
+    return geometries
+
+
+def random_placements(count, seed=0):
+    rng = np.random.default_rng(seed)
+    angles = rng.uniform(0, 2 * np.pi, count)
+    transforms = np.tile(np.eye(4), (count, 1, 1))
+    transforms[:, 0, 0] = transforms[:, 1, 1] = np.cos(angles)
+    transforms[:, 0, 1] = -np.sin(angles)
+    transforms[:, 1, 0] = np.sin(angles)
+    transforms[:, :3, 3] = rng.uniform(-500, 500, (count, 3))
+    return transforms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--elements", type=int, default=20_000)
+    parser.add_argument("--unique", type=int, default=200)
+    args = parser.parse_args()
+
+    geometries = synthetic_geometries(args.unique)
+    rng = np.random.default_rng(1)
+    geometry_of = rng.integers(0, args.unique, args.elements)
+    transforms = random_placements(args.elements)
+
+    # Регистрация элементов в библиотеке: повторы находятся по идентификатору представления
+    library = GeometryLibrary()
+    begin = time.perf_counter()
+    ids = np.array([library.add(*geometries[g], representation_id=f"rep{g}")[0] for g in geometry_of])
+    register_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    world_bytes = 0
+    world_triangles = 0
+    for geometry_id in np.unique(ids):
+        geometry = library[geometry_id]
+        points, faces = instantiate(geometry.vertices, geometry.faces, transforms[ids == geometry_id])
+        world_bytes += points.nbytes + faces.nbytes
+        world_triangles += len(faces)
+    merge_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    translations, quaternions, scales, exact = rigid_decomposition(transforms)
+    decompose_time = time.perf_counter() - begin
+    instance_bytes = translations.nbytes + quaternions.nbytes + scales.nbytes
+
+    print(f"Элементов: {args.elements}, уникальных сеток: {len(library)}")
+    print(f"регистрация в библиотеке:          {register_time * 1e3:9.1f} мс")
+    print(f"размножение в мировые координаты:  {merge_time * 1e3:9.1f} мс")
+    print(f"разложение размещений (глифы):     {decompose_time * 1e3:9.1f} мс, точных {int(exact.sum())}")
+    print(f"треугольников в мировых координатах: {world_triangles:>12}, {world_bytes / 2 ** 20:9.1f} МБ")
+    print(f"треугольников уникальных сеток:      "
+          f"{sum(g.n_triangles for g in library.geometries):>12}, "
+          f"{(library.nbytes + instance_bytes) / 2 ** 20:9.1f} МБ (вместе с данными экземпляров)")
+
+
+if __name__ == "__main__":
+    main()
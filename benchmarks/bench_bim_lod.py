@@ -0,0 +1,91 @@
+# benchmarks/bench_bim_lod.py
+"""
+Уровни детализации и отсечение BIM-сцены: синтетическая модель из этажей
+с элементами-сферами (по умолчанию около 1 млн треугольников) раскладывается
+по фрагментам, затем камера отдаляется от модели. Для каждого положения
+камеры измеряется время BimLodManager.update() и число треугольников,
+которые остаются в отрисовке.
+
+Запуск: python benchmarks/bench_bim_lod.py [--storeys S] [--elements N] [--resolution R]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pyvista as pv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from viz.bim_lod import BimLodManager  # noqa: E402
+
+
+def synthetic_model(storeys, elements, resolution, seed=0):
+    """Сетка модели с cell_data "element_index" и "color" и этажи элементов"""
+    rng = np.random.default_rng(seed)
+    sphere = pv.Sphere(radius=0.4, theta_resolution=resolution, phi_resolution=resolution)
+    vertices = np.asarray(sphere.points)
+    faces = sphere.faces.reshape(-1, 4)[:, 1:]
+
+    count = storeys * elements
+    side = int(np.ceil(np.sqrt(elements)))
+    offsets = np.column_stack((np.arange(count) % elements % side, np.arange(count) % elements // side,
+                               np.arange(count) // elements * 3.5)).astype(np.float64)
+    offsets[:, :2] *= 1.5
+
+    points = (vertices[np.newaxis] + offsets[:, np.newaxis]).reshape(-1, 3)
+    shifted = faces[np.newaxis] + (np.arange(count) * len(vertices))[:, np.newaxis, np.newaxis]
+    cells = np.empty((count * len(faces), 4), dtype=np.int64)
+    cells[:, 0] = 3
+    cells[:, 1:] = shifted.reshape(-1, 3)
+    mesh = pv.PolyData(points, cells.ravel())
+    mesh.cell_data["element_index"] = np.repeat(np.arange(count), len(faces))
+    mesh.cell_data["color"] = np.repeat(rng.integers(0, 255, (count, 3), dtype=np.uint8), len(faces), axis=0)
+    element_storeys = [f"Этаж {i // elements + 1}" for i in range(count)]
+    return mesh, element_storeys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--storeys", type=int, default=5)
+    parser.add_argument("--elements", type=int, default=500)
+    parser.add_argument("--resolution", type=int, default=16, help="разрешение сфер-элементов")
+    parser.add_argument("--chunk-size", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    mesh, storeys = synthetic_model(args.storeys, args.elements, args.resolution)
+    plotter = pv.Plotter(off_screen=True, window_size=(1280, 800))
+    lod = BimLodManager(plotter, chunk_size=args.chunk_size)
+
+    begin = time.perf_counter()
+    lod.add_mesh(mesh, storeys)
+    build_time = time.perf_counter() - begin
+    print(f"Элементов: {len(storeys)}, треугольников: {mesh.n_cells}, фрагментов: {len(lod)}")
+    print(f"раскладка по фрагментам и построение уровней: {build_time:.2f} с")
+
+    plotter.reset_camera()
+    camera = plotter.camera
+    focal = np.array(camera.focal_point)
+    direction = np.array(camera.position) - focal
+    print(f"{'удаление':>9} {'update, мс':>11} {'треугольников':>14} {'доля':>7}")
+    for factor in (0.2, 0.5, 1.0, 2.0, 5.0, 20.0):
+        camera.position = focal + direction * factor
+        times = []
+        for _ in range(args.repeat):
+            begin = time.perf_counter()
+            lod.update()
+            times.append(time.perf_counter() - begin)
+        triangles = lod.rendered_triangles()
+        print(f"{factor:>9.1f} {np.median(times) * 1e3:>11.2f} {triangles:>14} {triangles / mesh.n_cells:>7.1%}")
+
+    # Фильтр этажей: отображается только первый этаж
+    camera.position = focal + direction
+    lod.set_storey_filter({storeys[0]})
+    print(f"только {storeys[0]}: треугольников {lod.rendered_triangles()}")
+    plotter.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# benchmarks/bench_elastic_solver.py
+"""
+Встроенный упругий решатель (core.elastic_solver): проверка по
+аналитическим решениям и производительность.
+
+Проверка:
+  - компрессионное сжатие: давление на весь верх бруска с закреплёнными
+    по нормали боковыми гранями — σzz = -q, осадка q·H / M (точно);
+  - Буссинеск: давление на квадратную площадку на поверхности массива —
+    σz под центром сравнивается с формулой угловых точек (Ньюмарк).
+Производительность: сборка с подготовкой решателя и решение на сетках
+растущего размера (--dofs, по умолчанию до 1 млн неизвестных — нужно
+около 4 ГБ памяти).
+
+Запуск: python benchmarks/bench_elastic_solver.py [--dofs 10000 100000 ...] [--method auto|direct|cg]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.elastic_solver import (ElasticSolver, foundation_loads, grid_mesh, structured_box_mesh,  # noqa: E402
+                                 surface_forces, top_faces)
+from core.stress_calculator import isotropic_stiffness  # noqa: E402
+from core.stress_engine import LOAD_UNIFORM  # noqa: E402
+
+E, NU = 50e6, 0.3
+PRESSURE = 100e3
+
+
+def newmark_corner(b, l, z):
+    """Коэффициент влияния σz / q под углом прямоугольной площадки b x l на глубине z"""
+    m, n = b / z, l / z
+    s = m ** 2 + n ** 2 + 1
+    return (2 * m * n * np.sqrt(s) / (s + m ** 2 * n ** 2) * (s + 1) / s
+            + np.arctan2(2 * m * n * np.sqrt(s), s - m ** 2 * n ** 2)) / (4 * np.pi)
+
+
+def check_oedometer():
+    nodes, tetrahedra = structured_box_mesh((0, 2, 0, 2, -4, 0), (4, 4, 8))
+    solver = ElasticSolver(nodes, tetrahedra, elasticity=isotropic_stiffness(E, NU))
+    forces = foundation_loads(nodes, tetrahedra, np.zeros(len(tetrahedra), dtype=int), PRESSURE * 4, LOAD_UNIFORM)
+    displacements = solver.solve(forces)
+    stresses = solver.element_stresses(displacements)
+    modulus = E * (1 - NU) / ((1 + NU) * (1 - 2 * NU))
+    print("Компрессионное сжатие:")
+    print(f"  σzz: {stresses[:, 2].min() / 1e3:.4f} ... {stresses[:, 2].max() / 1e3:.4f} кПа "
+          f"(точно {-PRESSURE / 1e3:.4f})")
+    print(f"  осадка: {-displacements[:, 2].min() * 1e3:.5f} мм (точно {PRESSURE * 4 / modulus * 1e3:.5f})")
+
+
+def check_boussinesq(half_size=1.0, extent=12.0):
+    # Сгущение к площадке и к поверхности, крупные элементы у границ массива
+    plan = np.unique(np.concatenate((np.linspace(-half_size, half_size, 9),
+                                     np.sign(g := np.geomspace(half_size, extent, 10)) * g, -g)))
+    depth = -np.unique(np.concatenate((np.linspace(0, 2 * half_size, 9), np.geomspace(2 * half_size, extent, 12))))
+    nodes, tetrahedra = grid_mesh(plan, plan, depth[::-1])
+    solver = ElasticSolver(nodes, tetrahedra, elasticity=isotropic_stiffness(E, NU))
+
+    faces = top_faces(nodes, tetrahedra)
+    centers = nodes[faces].mean(axis=1)
+    loaded = np.all(np.abs(centers[:, :2]) <= half_size, axis=1)
+    stresses = solver.element_stresses(solver.solve(surface_forces(nodes, faces, PRESSURE * loaded)))
+
+    element_centers = nodes[tetrahedra].mean(axis=1)
+    print(f"Буссинеск (площадка {2 * half_size:.0f} x {2 * half_size:.0f} м, {solver.n_dofs} неизвестных):")
+    print(f"  {'z, м':>6} {'МКЭ, кПа':>10} {'Ньюмарк, кПа':>13} {'ошибка':>8}")
+    for z in (0.5, 1.0, 1.5, 2.0, 3.0, 4.0):
+        near = (np.linalg.norm(element_centers[:, :2], axis=1) < 0.3 * half_size) & \
+            (np.abs(element_centers[:, 2] + z) < 0.15 * max(z, 1.0))
+        computed = -stresses[near, 2].mean()
+        exact = 4 * PRESSURE * newmark_corner(half_size, half_size, z)
+        print(f"  {z:>6.1f} {computed / 1e3:>10.2f} {exact / 1e3:>13.2f} {(computed - exact) / exact:>8.1%}")
+
+
+def benchmark(dofs, method):
+    side = max(2, int(round((dofs / 3) ** (1 / 3))) - 1)
+    nodes, tetrahedra = structured_box_mesh((0, 10, 0, 10, -10, 0), (side, side, side))
+    elasticity = isotropic_stiffness(E, NU)
+    materials = np.zeros(len(tetrahedra), dtype=np.int64)
+
+    tracemalloc.start()
+    begin = time.perf_counter()
+    solver = ElasticSolver(nodes, tetrahedra, materials, elasticity, method=method)
+    setup_time = time.perf_counter() - begin
+    forces = foundation_loads(nodes, tetrahedra, materials, PRESSURE * 100, LOAD_UNIFORM)
+    begin = time.perf_counter()
+    solver.solve(forces)
+    solve_time = time.perf_counter() - begin
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    iterations = f", итераций {solver.iterations[-1]}" if solver.iterations else ""
+    print(f"{solver.n_dofs:>9} {len(tetrahedra):>9} {solver.method:>7} {setup_time:>17.2f} "
+          f"{solve_time:>8.2f} {peak / 2 ** 20:>9.0f}{iterations}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dofs", type=int, nargs="*", default=[10_000, 100_000, 300_000, 1_000_000])
+    parser.add_argument("--method", default="auto", choices=("auto", "direct", "cg"))
+    parser.add_argument("--skip-validation", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_validation:
+        check_oedometer()
+        check_boussinesq()
+
+    print(f"{'DOF':>9} {'элементов':>9} {'метод':>7} {'сборка/разложение':>17} {'решение':>8} {'пик, МБ':>9}")
+    for dofs in args.dofs:
+        benchmark(dofs, args.method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_foundation_mesher.py
+"""
+Сетки «фундамент + грунт» через Gmsh: N фундаментов K разных размеров
+строятся последовательно (один процесс) и пулом процессов, затем
+повторно — из кеша. Требуется пакет gmsh.
+
+Запуск: python benchmarks/bench_foundation_mesher.py [--foundations N] [--sizes K] [--workers W]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.foundation_mesher import FoundationMesher, build_foundation_mesh, mesh_options  # noqa: E402
+from core.result_cache import ResultCache  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--foundations", type=int, default=16)
+    parser.add_argument("--sizes", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sizes = np.column_stack((rng.uniform(1.5, 4.0, args.sizes), rng.uniform(1.5, 4.0, args.sizes),
+                             np.full(args.sizes, 0.6)))
+    dimensions = sizes[np.arange(args.foundations) % args.sizes]
+    positions = np.column_stack((np.arange(args.foundations) * 10.0, np.zeros(args.foundations),
+                                 dimensions[:, 2] / 2))
+
+    begin = time.perf_counter()
+    elements = [len(build_foundation_mesh(size, mesh_options(size))[1]) for size in sizes]
+    serial_time = time.perf_counter() - begin
+    print(f"Последовательно, {args.sizes} сеток: {serial_time:.2f} с, тетраэдров в среднем {np.mean(elements):.0f}")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResultCache("foundation_meshes", "bench", disk_dir=cache_dir)
+        mesher = FoundationMesher(max_workers=args.workers, cache=cache)
+        begin = time.perf_counter()
+        meshes = mesher.mesh_many(positions, dimensions)
+        pool_time = time.perf_counter() - begin
+        mesher.shutdown()
+        print(f"Пул ({mesher.max_workers} процессов), {len(meshes)} фундаментов "
+              f"({len({mesh.key for mesh in meshes})} уникальных): {pool_time:.2f} с")
+
+        mesher = FoundationMesher(cache=cache)
+        begin = time.perf_counter()
+        mesher.mesh_many(positions, dimensions)
+        cached_time = time.perf_counter() - begin
+        mesher.shutdown()
+        print(f"Из кеша: {cached_time * 1e3:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
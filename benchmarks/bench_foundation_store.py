@@ -0,0 +1,119 @@
+# benchmarks/bench_foundation_store.py
+"""
+Память и скорость core.foundation_store.FoundationTable в сравнении
+с прежним списком словарей self.foundations (по умолчанию 10 000 фундаментов).
+
+Запуск: python benchmarks/bench_foundation_store.py [--count N]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.foundation_store import FoundationTable  # noqa: E402
+from core.stress_engine import LOAD_TYPES  # noqa: E402
+
+
+def synthetic_foundations(count, seed=0):
+    """Случайные параметры фундаментов на площадке 1 км x 1 км"""
+    rng = np.random.default_rng(seed)
+    dimensions = np.column_stack((rng.uniform(0.5, 5, count), rng.uniform(0.5, 5, count),
+                                  rng.integers(1, 21, count) * 0.1))
+    positions = np.column_stack((rng.uniform(-500, 500, count), rng.uniform(-500, 500, count),
+                                 dimensions[:, 2] / 2))
+    load_values = rng.choice([50e3, 100e3, 200e3, 500e3, 1000e3], count)
+    load_types = [LOAD_TYPES[i] for i in rng.integers(0, len(LOAD_TYPES), count)]
+    return positions, dimensions, load_values, load_types
+
+
+def build_dicts(positions, dimensions, load_values, load_types):
+    return [{
+        "actor": None,
+        "geometry": None,
+        "position": tuple(positions[i]),
+        "dimensions": tuple(dimensions[i]),
+        "load_value": float(load_values[i]),
+        "load_type": load_types[i],
+    } for i in range(len(load_values))]
+
+
+def build_table(positions, dimensions, load_values, load_types):
+    table = FoundationTable()
+    table.add_many(positions, dimensions, load_values, load_types)
+    return table
+
+
+def measure_memory(build, *args):
+    tracemalloc.start()
+    result = build(*args)
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(func, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def dict_queries(foundations):
+    total_load = sum(f["load_value"] for f in foundations)
+    area = sum(f["dimensions"][0] * f["dimensions"][1] for f in foundations)
+    boxes = [(np.subtract(f["position"], np.divide(f["dimensions"], 2)),
+              np.add(f["position"], np.divide(f["dimensions"], 2))) for f in foundations]
+    return total_load, area, boxes
+
+
+def table_queries(table):
+    return table.total_load(), table.total_footprint_area(), table.bounding_boxes()
+
+
+def dict_bulk_update(foundations):
+    for f in foundations:
+        if f["load_type"] == "Линейная":
+            f["load_value"] = 200e3
+
+
+def table_bulk_update(table):
+    table.update(table.select(load_type="Линейная"), load_value=200e3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    data = synthetic_foundations(args.count)
+    foundations, dict_bytes = measure_memory(build_dicts, *data)
+    table, table_bytes = measure_memory(build_table, *data)
+
+    lookup_id = args.count // 2
+    rows = [
+        ("память, МБ", dict_bytes / 2 ** 20, table_bytes / 2 ** 20),
+        ("создание, мс", timed(lambda: build_dicts(*data), 3) * 1e3,
+         timed(lambda: build_table(*data), 3) * 1e3),
+        ("запросы (нагрузка, площадь, габариты), мс", timed(lambda: dict_queries(foundations), 5) * 1e3,
+         timed(lambda: table_queries(table)) * 1e3),
+        ("массовое обновление, мс", timed(lambda: dict_bulk_update(foundations)) * 1e3,
+         timed(lambda: table_bulk_update(table)) * 1e3),
+        ("поиск по номеру, мкс", timed(lambda: foundations[lookup_id], 1000) * 1e6,
+         timed(lambda: table.row(lookup_id), 1000) * 1e6),
+    ]
+
+    print(f"Фундаментов: {args.count}")
+    print(f"{'':<45} {'список словарей':>16} {'таблица':>10}")
+    for name, old, new in rows:
+        print(f"{name:<45} {old:>16.3f} {new:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_ifc_cache.py
+"""
+Открытие IFC-файла без кеша, с холодным кешем (триангуляция + запись)
+и с тёплым кешем (массивы отображаются в память, ifcopenshell не нужен).
+
+Запуск: python benchmarks/bench_ifc_cache.py building.ifc [--instancing]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bim import ifc_importer  # noqa: E402
+from bim.tessellation_cache import TessellationCache  # noqa: E402
+
+
+def timed_import(path, **kwargs):
+    begin = time.perf_counter()
+    model = ifc_importer.import_ifc_file(path, **kwargs)
+    return model, time.perf_counter() - begin
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("ifc_file")
+    parser.add_argument("--instancing", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3, help="число тёплых открытий")
+    args = parser.parse_args()
+
+    if ifc_importer.ifcopenshell is None:
+        print("Для холодного открытия требуется ifcopenshell")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TessellationCache(root=tmp)
+        model, plain = timed_import(args.ifc_file, instancing=args.instancing)
+        print(f"Элементов: {len(model)}, треугольников: {model.n_triangles}")
+        print(f"без кеша:          {plain:8.2f} с")
+
+        _model, cold = timed_import(args.ifc_file, instancing=args.instancing, cache=cache)
+        print(f"холодный кеш:      {cold:8.2f} с (запись {cache.size() / 2 ** 20:.1f} МБ)")
+
+        warm = min(timed_import(args.ifc_file, instancing=args.instancing, cache=cache)[1]
+                   for _ in range(args.repeat))
+        print(f"тёплый кеш:        {warm:8.2f} с (ускорение x{plain / warm:.1f})")
+
+
+if __name__ == "__main__":
+    main()
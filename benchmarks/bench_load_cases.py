@@ -0,0 +1,86 @@
+# benchmarks/bench_load_cases.py
+"""
+Пакет расчётных случаев (5 величин x 4 типа нагрузки = 20 случаев):
+поочерёдный расчёт каждого случая против пакетного — для аналитической
+модели напряжений (N фундаментов) и для встроенного упругого решателя
+(одна сетка «фундамент + грунт», одна сборка и разложение на все случаи).
+
+Запуск: python benchmarks/bench_load_cases.py [--foundations N] [--cells C]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pyvista as pv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import stress_engine  # noqa: E402
+from core.elastic_solver import run_elastic_analysis, run_elastic_load_cases, structured_box_mesh  # noqa: E402
+from core.load_cases import ENVELOPE_MAX, LoadCases  # noqa: E402
+
+SOIL = {"E": 50e6, "nu": 0.3}
+
+
+class _BoxMesh:
+    """Сетка массива в форме, которую принимают run_elastic_*"""
+
+    def __init__(self, cells):
+        self.nodes, self.tetrahedra = structured_box_mesh((-5, 5, -5, 5, -6, 0), (cells, cells, cells))
+        self.materials = np.zeros(len(self.tetrahedra), dtype=np.int64)
+        self.key = None
+
+
+def bench_analytic(cases, count):
+    cube = pv.Cube(x_length=2, y_length=3, z_length=0.5).triangulate().subdivide(2)
+    points_list = [np.asarray(cube.points) + (i * 5.0, 0, 0) for i in range(count)]
+    dimensions = np.tile((2.0, 3.0, 0.5), (count, 1))
+    positions = np.column_stack((np.arange(count) * 5.0, np.zeros(count), np.zeros(count)))
+
+    begin = time.perf_counter()
+    for value, code in zip(cases.load_values, cases.load_types):
+        stress_engine.foundation_group_stress(points_list, dimensions, positions, np.full(count, value),
+                                              np.full(count, code, dtype=np.int8))
+    loop_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    stacks = stress_engine.foundation_group_load_cases(points_list, dimensions, positions, cases)
+    batch_time = time.perf_counter() - begin
+    print(f"Аналитика, {count} фундаментов x {len(cases)} случаев: по случаям {loop_time * 1e3:.1f} мс, "
+          f"пакетом {batch_time * 1e3:.1f} мс (стопка {stacks[0].shape})")
+
+
+def bench_elastic(cases, cells):
+    mesh = _BoxMesh(cells)
+    begin = time.perf_counter()
+    for value, code in zip(cases.load_values, cases.load_types):
+        run_elastic_analysis(mesh, SOIL, value, int(code))
+    loop_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    results = run_elastic_load_cases(mesh, SOIL, cases)
+    batch_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    for selection in [ENVELOPE_MAX] + list(range(len(cases))):
+        results.view("von_mises", selection)
+    view_time = time.perf_counter() - begin
+    print(f"МКЭ, {mesh.nodes.size} неизвестных x {len(cases)} случаев: по случаям {loop_time:.2f} с, "
+          f"пакетом {batch_time:.2f} с; переключение всех случаев и огибающей {view_time * 1e3:.2f} мс")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--foundations", type=int, default=1000)
+    parser.add_argument("--cells", type=int, default=16, help="элементов по стороне массива грунта")
+    args = parser.parse_args()
+
+    cases = LoadCases()
+    bench_analytic(cases, args.foundations)
+    bench_elastic(cases, args.cells)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_med_reader.py
+"""
+Потоковое чтение MED-результатов: генерация синтетического MED-файла
+(узлы x шаги x компоненты) и замер времени и пиковой памяти
+core.med_reader.MedResultReader при поблочном проходе по полю.
+Генератор файла общий с тестами (core.med_synthetic).
+
+Запуск: python benchmarks/bench_med_reader.py [--nodes N] [--steps K]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.med_reader import MedResultReader  # noqa: E402
+from core.med_synthetic import STRESS_COMPONENTS, write_synthetic_med  # noqa: E402
+
+
+def measure(func):
+    tracemalloc.start()
+    begin = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - begin
+    _size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2_000_000)
+    parser.add_argument("--steps", type=int, default=3)
+    parser.add_argument("--chunk", type=int, default=250_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_synthetic_med(os.path.join(tmp, "synthetic.rmed"), args.nodes, args.steps)
+        size_mb = os.path.getsize(path) / 2 ** 20
+        print(f"Файл: {args.nodes} узлов x {args.steps} шагов x {len(STRESS_COMPONENTS)} компонент, "
+              f"{size_mb:.0f} МБ")
+
+        with MedResultReader(path) as reader:
+            field = reader.fields()[0]["name"]
+            (_, elapsed, peak) = measure(lambda: (reader.fields(), reader.steps(field)))
+            print(f"список полей и шагов:          {elapsed * 1e3:8.2f} мс, пик {peak / 2 ** 20:8.2f} МБ")
+
+            (view, elapsed, peak) = measure(lambda: reader.view(field, step=-1))
+            print(f"представление последнего шага: {elapsed * 1e3:8.2f} мс, пик {peak / 2 ** 20:8.2f} МБ, "
+                  f"форма {view.shape}")
+
+            (_, elapsed, peak) = measure(lambda: reader.reduce(field, step=-1, chunk_size=args.chunk))
+            print(f"min/max потоком по блокам:     {elapsed * 1e3:8.2f} мс, пик {peak / 2 ** 20:8.2f} МБ")
+
+            (_, elapsed, peak) = measure(lambda: reader.read(field, step=-1, components=["SIZZ"]))
+            print(f"чтение одной компоненты:       {elapsed * 1e3:8.2f} мс, пик {peak / 2 ** 20:8.2f} МБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_preview.py
+"""
+Время кадра предпросмотра фундамента на заданной траектории мыши:
+прежний способ (новый pv.Cube и add_mesh на каждое событие) против
+постоянного актёра viz.preview.InteractivePreview.
+
+Запускается без экрана (offscreen PyVista).
+Запуск: python benchmarks/bench_preview.py [--events N] [--foundations M]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pyvista as pv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from viz.foundation_scene import FoundationScene  # noqa: E402
+from viz.preview import InteractivePreview  # noqa: E402
+
+THICKNESS = 0.5
+
+
+def mouse_trajectory(events, grid_spacing=0.5):
+    """Спираль от точки (0, 0) с привязкой к сетке, как при рисовании фундамента"""
+    t = np.linspace(0, 6 * np.pi, events)
+    radius = 1 + 8 * t / t[-1]
+    points = np.column_stack((radius * np.cos(t), radius * np.sin(t), np.zeros(events)))
+    return np.round(points / grid_spacing) * grid_spacing
+
+
+def make_plotter(foundations):
+    """Сцена с M фундаментами в одном объединённом актёре"""
+    plotter = pv.Plotter(off_screen=True, window_size=(1200, 800))
+    plotter.add_mesh(pv.Plane(i_size=20, j_size=20), color="green", opacity=0.3)
+    scene = FoundationScene(plotter)
+    side = int(np.ceil(np.sqrt(max(foundations, 1))))
+    for i in range(foundations):
+        x, y = (i % side) * 3 - 20, (i // side) * 3 - 20
+        scene.add(i, pv.Cube(center=(x, y, THICKNESS / 2), x_length=2, y_length=2, z_length=THICKNESS))
+    plotter.show(auto_close=False)
+    return plotter
+
+
+def run_old(plotter, start, trajectory):
+    """Прежний update_foundation_preview: новая сетка и новый актёр на каждое событие"""
+    times = []
+    temp_actor = None
+    for current in trajectory:
+        begin = time.perf_counter()
+        if temp_actor is not None:
+            plotter.remove_actor(temp_actor)
+            temp_actor = None
+        low, high = np.minimum(start, current), np.maximum(start, current)
+        if high[0] - low[0] >= 0.1 and high[1] - low[1] >= 0.1:
+            cube = pv.Cube(center=((low[0] + high[0]) / 2, (low[1] + high[1]) / 2, THICKNESS / 2),
+                           x_length=high[0] - low[0], y_length=high[1] - low[1], z_length=THICKNESS)
+            temp_actor = plotter.add_mesh(cube, color="yellow", opacity=0.7, show_edges=True,
+                                          name="temp_foundation")
+        plotter.render()
+        times.append(time.perf_counter() - begin)
+    return np.array(times)
+
+
+def run_new(plotter, start, trajectory):
+    """Постоянный актёр: только запись координат и перерисовка; одинаковые позиции пропускаются"""
+    preview = InteractivePreview(plotter)
+    times = []
+    last = None
+    for current in trajectory:
+        begin = time.perf_counter()
+        if last is None or not np.array_equal(current, last):
+            last = current
+            low, high = np.minimum(start, current), np.maximum(start, current)
+            if high[0] - low[0] >= 0.1 and high[1] - low[1] >= 0.1:
+                preview.show_foundation(low, high, THICKNESS)
+            else:
+                preview.hide()
+            plotter.render()
+        times.append(time.perf_counter() - begin)
+    return np.array(times)
+
+
+def summary(times):
+    return (f"среднее {times.mean() * 1e3:7.3f} мс, p50 {np.percentile(times, 50) * 1e3:7.3f} мс, "
+            f"p95 {np.percentile(times, 95) * 1e3:7.3f} мс")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--foundations", type=int, default=500)
+    args = parser.parse_args()
+
+    trajectory = mouse_trajectory(args.events)
+    start = np.zeros(3)
+
+    plotter = make_plotter(args.foundations)
+    old = run_old(plotter, start, trajectory)
+    plotter.close()
+
+    plotter = make_plotter(args.foundations)
+    new = run_new(plotter, start, trajectory)
+    plotter.close()
+
+    print(f"Событий: {args.events}, фундаментов в сцене: {args.foundations}")
+    print(f"прежний предпросмотр:  {summary(old)}")
+    print(f"постоянный актёр:      {summary(new)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_project_file.py
+"""
+Файл проекта (core.project_file): сохранение N фундаментов с сетками,
+полем напряжений и пакетом из 20 случаев нагрузки, затем открытие —
+таблица параметров, общая сетка сцены, одна сетка по запросу и пакет
+случаев одним чтением. Требуется пакет h5py.
+
+Запуск: python benchmarks/bench_project_file.py [--foundations N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pyvista as pv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import stress_engine  # noqa: E402
+from core.foundation_store import FoundationTable  # noqa: E402
+from core.load_cases import LoadCases  # noqa: E402
+from core.project_file import ProjectFile, save_project  # noqa: E402
+
+
+def site(count, seed=0):
+    """Сетка фундаментов-кубов со случайными размерами, напряжения и пакет случаев"""
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(count)))
+    positions = np.column_stack((np.arange(count) % side * 5.0, np.arange(count) // side * 5.0,
+                                 np.full(count, 0.25)))
+    dimensions = np.column_stack((rng.uniform(1, 3, count), rng.uniform(1, 3, count), np.full(count, 0.5)))
+    # Сетки строятся так же, как в create_foundation
+    meshes = [pv.Cube(center=position, x_length=size[0], y_length=size[1], z_length=size[2])
+              for position, size in zip(positions.tolist(), dimensions.tolist())]
+
+    table = FoundationTable(capacity=count)
+    ids = table.add_many(positions, dimensions, np.full(count, 100e3), np.zeros(count, dtype=np.int8), meshes=meshes)
+    points = [np.asarray(mesh.points, dtype=np.float64) for mesh in meshes]
+    stresses = stress_engine.foundation_group_stress(points, dimensions, positions, table.load_values,
+                                                     table.load_type_codes)
+    cases = LoadCases()
+    stacks = stress_engine.foundation_group_load_cases(points, dimensions, positions, cases)
+    for mesh, stress in zip(meshes, stresses):
+        mesh["stress"] = stress
+    results = {"stress": dict(zip(ids.tolist(), stresses)), "stress_cases": dict(zip(ids.tolist(), stacks))}
+    return table, results, cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--foundations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    table, results, cases = site(args.foundations)
+    segments = np.random.default_rng(1).uniform(0, 100, (200, 2, 3))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.esproj")
+        begin = time.perf_counter()
+        save_project(path, table, guide_segments=segments, results=results, load_cases=cases)
+        save_time = time.perf_counter() - begin
+        print(f"Сохранение: {len(table)} фундаментов, {save_time:.2f} с, файл {os.path.getsize(path) / 2 ** 20:.1f} МБ")
+
+        begin = time.perf_counter()
+        project = ProjectFile(path)
+        opened = project.foundations()
+        open_time = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        arrays = project.mesh_arrays()
+        stress = project.result_array("stress")
+        scene_time = time.perf_counter() - begin
+
+        foundation_id = int(opened.ids[len(opened) // 2])
+        begin = time.perf_counter()
+        mesh = opened.mesh(foundation_id)
+        mesh_time = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        stacks = project.results("stress_cases")
+        cases_time = time.perf_counter() - begin
+        project.close()
+
+        assert np.allclose(mesh.points, table.mesh(foundation_id).points)
+        assert np.allclose(stacks[foundation_id], results["stress_cases"][foundation_id])
+        print(f"Открытие (таблица параметров): {open_time * 1e3:.1f} мс")
+        print(f"Общая сетка сцены и напряжения: {scene_time * 1e3:.1f} мс "
+              f"({len(arrays['points'])} точек, {len(stress)} значений)")
+        print(f"Сетка одного фундамента по запросу: {mesh_time * 1e3:.2f} мс")
+        print(f"Пакет {len(cases)} случаев всех фундаментов: {cases_time * 1e3:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_startup.py
+"""
+Отчёт о времени импорта при запуске (в стиле python -X importtime):
+модули верхнего уровня, отсортированные по суммарному времени, и
+проверка, что FreeCAD, pyOCCT, ifcopenshell и h5py не загружаются при
+импорте приложения.
+
+Запуск: python benchmarks/bench_startup.py [--module app] [--top 15] [--output report.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Пакеты, которые должны загружаться только по требованию
+DEFERRED = ("FreeCAD", "Part", "pyOCCT", "ifcopenshell", "h5py", "vtk")
+
+
+def import_times(module):
+    """[(имя, собственное время, суммарное время, вложенность)] в секундах"""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((name.strip(), int(self_us) * 1e-6, int(cumulative_us) * 1e-6, depth))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="JSON с отчётом")
+    args = parser.parse_args()
+
+    rows = import_times(args.module)
+    total = next(cumulative for name, _self, cumulative, depth in rows if name == args.module and depth == 0)
+    top_level = sorted((row for row in rows if row[3] == 1), key=lambda row: -row[2])[:args.top]
+    print(f"Импорт {args.module}: {total:.3f} с, модулей {len(rows)}")
+    for name, _self, cumulative, _depth in top_level:
+        print(f"  {name:<40} {cumulative * 1e3:8.1f} мс")
+
+    loaded = sorted({name.split(".")[0] for name, *_ in rows} & set(DEFERRED))
+    if loaded:
+        print(f"Загружены при запуске (должны быть отложены): {', '.join(loaded)}")
+    else:
+        print("Отложенные пакеты при запуске не загружаются")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"module": args.module, "total": total, "deferred_loaded": loaded,
+                       "modules": [{"name": name, "self": self_time, "cumulative": cumulative, "depth": depth}
+                                   for name, self_time, cumulative, depth in rows]}, f, ensure_ascii=False, indent=2)
+    if loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_stress_calculator.py
+"""
+Масштабирование core.stress_calculator.calculate_stress по числу потоков
+на случае из gui/main_window.py (1 000 000 строк деформаций).
+
+Запуск: python benchmarks/bench_stress_calculator.py [--rows N] [--repeat K]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import stress_calculator  # noqa: E402
+
+
+def thread_counts(max_threads):
+    """1, 2, 4, ... до max_threads включительно"""
+    counts = []
+    n = 1
+    while n < max_threads:
+        counts.append(n)
+        n *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def best_time(func, repeat):
+    """Минимальное время из repeat запусков"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    strain_data = np.random.uniform(0.001, 0.01, (args.rows, 6))
+    out = np.empty_like(strain_data)
+    E = 210e9  # Модуль Юнга для стали
+    nu = 0.3
+    stiffness = stress_calculator.isotropic_stiffness(E, nu)
+
+    print(f"Строк: {args.rows}, повторов: {args.repeat}")
+    print(f"{'потоки':>7} {'изотроп., мс':>13} {'ускорение':>10} {'анизотроп., мс':>15} {'ускорение':>10}")
+
+    base_iso = base_aniso = None
+    for threads in thread_counts(args.max_threads):
+        t_iso = best_time(lambda: stress_calculator.calculate_stress(
+            strain_data, E, nu, out=out, num_threads=threads), args.repeat)
+        t_aniso = best_time(lambda: stress_calculator.calculate_stress(
+            strain_data, E, stiffness=stiffness, out=out, num_threads=threads), args.repeat)
+        base_iso = base_iso or t_iso
+        base_aniso = base_aniso or t_aniso
+        print(f"{threads:>7} {t_iso * 1e3:>13.2f} {base_iso / t_iso:>10.2f} "
+              f"{t_aniso * 1e3:>15.2f} {base_aniso / t_aniso:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_tracing.py
+"""
+Стоимость трассировки (core.tracing): пустой with-блок, интервал при
+выключенной и включённой трассировке, декорированная функция — в пересчёте
+на один вызов.
+
+Запуск: python benchmarks/bench_tracing.py [--calls N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import tracing  # noqa: E402
+
+
+class _Empty:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def per_call(func, calls):
+    begin = time.perf_counter()
+    func(calls)
+    return (time.perf_counter() - begin) / calls
+
+
+def empty_blocks(calls):
+    empty = _Empty()
+    for _ in range(calls):
+        with empty:
+            pass
+
+
+def spans(calls):
+    for _ in range(calls):
+        with tracing.span("mouse_move"):
+            pass
+
+
+def nested_spans(calls):
+    for _ in range(calls):
+        with tracing.span("mouse_move"):
+            with tracing.span("pick"):
+                pass
+            with tracing.span("preview"):
+                pass
+
+
+@tracing.traced("handler")
+def _handler():
+    pass
+
+
+def traced_calls(calls):
+    for _ in range(calls):
+        _handler()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    baseline = per_call(empty_blocks, args.calls)
+    print(f"Пустой with-блок: {baseline * 1e9:.0f} нс")
+    for enabled in (False, True):
+        tracing.reset()
+        (tracing.enable if enabled else tracing.disable)()
+        state = "включена" if enabled else "выключена"
+        print(f"Трассировка {state}: интервал {per_call(spans, args.calls) * 1e9:.0f} нс, "
+              f"кадр из трёх интервалов {per_call(nested_spans, args.calls) * 1e9:.0f} нс, "
+              f"декорированный вызов {per_call(traced_calls, args.calls) * 1e9:.0f} нс")
+    tracing.disable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,463 @@
+# benchmarks/run_suite.py
+"""
+Набор замеров производительности: ядра напряжений, построение сцены и
+импорт модулей — на синтетических данных нескольких масштабов, без окна
+(PyVista offscreen). Для каждого случая записываются пропускная
+способность, процентили задержки и пиковая память в JSON; режим
+сравнения отмечает регрессии относительно сохранённой базы.
+
+Случаи:
+  foundation_stress       — calculate_foundation_stress по одному фундаменту, 1..10k фундаментов
+  foundation_group_stress — пакетный расчёт фоновых заданий, 1..10k фундаментов
+  stress_kernel           — core.stress_calculator.calculate_stress, 1e3..1e7 строк деформаций
+  grid_lines              — построение сетки привязки площадки с шагом 0.1..2 м
+  grid_toggle             — toggle_grid_visualization: включение сетки без готовой в кеше
+  create_foundation       — create_foundation в сцене из 1..10k фундаментов
+  import                  — импорт модулей в отдельном интерпретаторе
+  first_paint             — запуск app.py до первой отрисовки заставки (Qt offscreen)
+
+Пиковая память — по tracemalloc (массивы NumPy и объекты Python; память
+VTK не учитывается), замеряется отдельным прогоном, чтобы не искажать время.
+
+Запуск:
+  python benchmarks/run_suite.py --output base.json
+  python benchmarks/run_suite.py --compare base.json [--tolerance 0.2]
+  python benchmarks/run_suite.py --input new.json --compare base.json
+"""
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pyvista as pv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import stress_calculator, stress_engine  # noqa: E402
+from core.foundation_store import FoundationTable  # noqa: E402
+from core.spatial_index import SpatialIndex  # noqa: E402
+from viz import ground_grid  # noqa: E402
+from viz.foundation_scene import (FoundationPlacementError, FoundationScene, create_foundation,  # noqa: E402
+                                  index_foundation)
+
+pv.OFF_SCREEN = True
+
+FORMAT_VERSION = 1
+
+# Шаг расстановки синтетических фундаментов, м
+FOUNDATION_PITCH = 5.0
+
+
+def synthetic_foundations(count, seed=0):
+    """Фундаменты-кубы на регулярной сетке со случайными размерами и нагрузками"""
+    rng = np.random.default_rng(seed)
+    side = max(int(np.ceil(np.sqrt(count))), 1)
+    index = np.arange(count)
+    dimensions = np.column_stack((rng.uniform(1, 3, count), rng.uniform(1, 3, count), np.full(count, 0.5)))
+    positions = np.column_stack((index % side * FOUNDATION_PITCH, index // side * FOUNDATION_PITCH,
+                                 dimensions[:, 2] / 2))
+    load_values = rng.uniform(50e3, 500e3, count)
+    load_types = rng.integers(0, 4, count).astype(np.int8)
+    return positions, dimensions, load_values, load_types
+
+
+def cube_points(positions, dimensions):
+    """Точки сеток pv.Cube всех фундаментов (F, 8, 3) — без построения самих сеток"""
+    template = np.asarray(pv.Cube().points)
+    return template[np.newaxis] * dimensions[:, np.newaxis] + positions[:, np.newaxis]
+
+
+class Benchmark:
+    """
+    Один случай набора. prepare(scale) готовит данные и возвращает число
+    элементов, обрабатываемых одним run(); run() может вернуть собственное
+    время замера (иначе берётся время вызова).
+    """
+    name = ""
+    unit = ""
+    scales = ()
+    quick_scales = ()
+
+    def prepare(self, scale):
+        raise NotImplementedError
+
+    def run(self):
+        raise NotImplementedError
+
+    def peak_memory(self):
+        """Пик выделенной памяти за один run(), байт"""
+        tracemalloc.start()
+        try:
+            self.run()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def teardown(self):
+        pass
+
+
+class FoundationStressBench(Benchmark):
+    name = "foundation_stress"
+    unit = "foundations"
+    scales = (1, 100, 1000, 10_000)
+    quick_scales = (1, 100)
+
+    def prepare(self, scale):
+        positions, dimensions, self.load_values, self.load_types = synthetic_foundations(scale)
+        self.points = list(cube_points(positions, dimensions))
+        self.positions = positions
+        self.dimensions = dimensions
+        return scale
+
+    def run(self):
+        for points, dims, position, value, code in zip(self.points, self.dimensions, self.positions,
+                                                       self.load_values, self.load_types):
+            stress_engine.foundation_stress(points, dims, position, value, code)
+
+
+class FoundationGroupStressBench(FoundationStressBench):
+    name = "foundation_group_stress"
+
+    def run(self):
+        stress_engine.foundation_group_stress(self.points, self.dimensions, self.positions,
+                                              self.load_values, self.load_types)
+
+
+class StressKernelBench(Benchmark):
+    name = "stress_kernel"
+    unit = "rows"
+    scales = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+    quick_scales = (1_000, 100_000)
+
+    def prepare(self, scale):
+        self.strain = np.random.default_rng(0).normal(0, 1e-4, (scale, 6))
+        return scale
+
+    def run(self):
+        stress_calculator.calculate_stress(self.strain, 30e9, 0.2)
+
+    def teardown(self):
+        self.strain = None
+
+
+class GridLinesBench(Benchmark):
+    name = "grid_lines"
+    unit = "lines"
+    scales = (2.0, 1.0, 0.5, 0.2, 0.1)
+    quick_scales = (1.0, 0.1)
+
+    def __init__(self, site_size):
+        self.site_size = site_size
+
+    def prepare(self, scale):
+        self.spacing = scale
+        return 2 * (int(round(self.site_size / scale)) + 1)
+
+    def run(self):
+        ground_grid.grid_lines(self.site_size, self.spacing)
+
+
+class GridToggleBench(GridLinesBench):
+    """
+    Включение сетки без готовой сетки в кеше (первое включение или смена
+    шага) на плоттере offscreen; камера смотрит на участок 20 м, поэтому
+    уровень детализации остаётся близким к заданному шагу.
+    """
+    name = "grid_toggle"
+    unit = "toggles"
+
+    def prepare(self, scale):
+        self.plotter = pv.Plotter(off_screen=True, window_size=(1200, 800))
+        self.plotter.reset_camera(bounds=(-10.0, 10.0, -10.0, 10.0, 0.0, 0.0))
+        self.grid = ground_grid.GroundGrid(self.plotter, extent=self.site_size, spacing=scale)
+        return 1
+
+    def run(self):
+        self.grid.hide()
+        ground_grid._cache.clear()
+        self.grid.set_extent(self.site_size)
+        self.grid.show()
+
+    def teardown(self):
+        self.plotter.close()
+
+
+class CreateFoundationBench(Benchmark):
+    """
+    viz.foundation_scene.create_foundation — тот же путь, что у окна
+    приложения: проверка пересечений, pv.Cube, начальное поле напряжений,
+    запись в таблицу, объединённая сцена и пространственный индекс. Сцена
+    заранее заполняется scale - 1 фундаментами.
+    """
+    name = "create_foundation"
+    unit = "foundations"
+    scales = (1, 100, 1000, 10_000)
+    quick_scales = (1, 100)
+
+    def prepare(self, scale):
+        self.plotter = pv.Plotter(off_screen=True)
+        self.table = FoundationTable()
+        self.scene = FoundationScene(self.plotter)
+        self.index = SpatialIndex(cell_size=2.0)
+
+        count = scale - 1
+        positions, dimensions, load_values, load_types = synthetic_foundations(count)
+        if count:
+            ids = self.table.add_many(positions, dimensions, load_values, load_types)
+            template = pv.Cube()
+            faces = np.asarray(template.faces, dtype=np.int64).reshape(-1, 5)
+            faces = np.tile(faces, (count, 1))
+            faces[:, 1:] += (np.repeat(np.arange(count), template.n_cells) * template.n_points)[:, np.newaxis]
+            points = cube_points(positions, dimensions).reshape(-1, 3)
+            self.scene.load(ids, points, faces.ravel(),
+                            np.arange(count + 1) * template.n_points,
+                            np.arange(count + 1) * faces.shape[1] * template.n_cells,
+                            np.arange(count + 1) * template.n_cells,
+                            stress=stress_engine.batch_initial_stress(points, positions,
+                                                                      np.arange(count + 1) * template.n_points))
+            for foundation_id, position, dims in zip(ids.tolist(), positions, dimensions):
+                index_foundation(self.index, foundation_id, position - dims / 2, position + dims / 2)
+        # Новые фундаменты ставятся в следующий ряд за уже созданными
+        self.next_slot = count
+        self.row_y = (int(np.ceil(np.sqrt(max(count, 1)))) + 1) * FOUNDATION_PITCH
+        return 1
+
+    def run(self):
+        center = np.array([self.next_slot * FOUNDATION_PITCH, self.row_y, 0.0])
+        self.next_slot += 1
+        try:
+            create_foundation(self.table, self.scene, self.index, center - (1.0, 1.5, 0.0), center + (1.0, 1.5, 0.0),
+                              0.5, 100e3, "Равномерная")
+        except FoundationPlacementError:
+            raise RuntimeError("Синтетические фундаменты пересекаются") from None
+
+    def teardown(self):
+        self.plotter.close()
+
+
+_IMPORT_SCRIPT = """
+import sys, time, tracemalloc
+sys.path.insert(0, {root!r})
+if {trace}:
+    tracemalloc.start()
+begin = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - begin
+print("SUITE", elapsed, tracemalloc.get_traced_memory()[1] if {trace} else 0)
+"""
+
+
+class ImportBench(Benchmark):
+    """Время импорта модуля в новом интерпретаторе (без запуска самого Python)"""
+    name = "import"
+    unit = "imports"
+    scales = ("core", "core.stress_engine", "viz.foundation_scene", "viz.ground_grid", "app")
+    quick_scales = ("core", "app")
+
+    def prepare(self, scale):
+        self.module = scale
+        return 1
+
+    def _child(self, trace):
+        script = _IMPORT_SCRIPT.format(root=ROOT, module=self.module, trace=trace)
+        output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True,
+                                check=True).stdout
+        line = [line for line in output.splitlines() if line.startswith("SUITE ")][-1]
+        _, elapsed, peak = line.split()
+        return float(elapsed), int(peak)
+
+    def run(self):
+        return self._child(False)[0]
+
+    def peak_memory(self):
+        return self._child(True)[1]
+
+
+class FirstPaintBench(Benchmark):
+    """
+    Время от запуска python app.py до первой отрисовки заставки (вместе с
+    запуском интерпретатора), см. gui/startup.py. Пиковая память не замеряется.
+    """
+    name = "first_paint"
+    unit = "starts"
+    scales = ("app.py",)
+    quick_scales = ("app.py",)
+
+    def prepare(self, scale):
+        self.script = os.path.join(ROOT, scale)
+        self.env = dict(os.environ, ENGINEERING_SUITE_STARTUP_PROBE="1")
+        self.env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        return 1
+
+    def run(self):
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, self.script], cwd=ROOT, env=self.env, capture_output=True, check=True)
+        return time.perf_counter() - begin
+
+    def peak_memory(self):
+        return 0
+
+
+def all_benchmarks(site_size):
+    return [FoundationStressBench(), FoundationGroupStressBench(), StressKernelBench(),
+            GridLinesBench(site_size), GridToggleBench(site_size), CreateFoundationBench(), ImportBench(),
+            FirstPaintBench()]
+
+
+def measure(bench, scale, min_time, min_repeat, max_repeat):
+    """Замеры одного масштаба: прогрев, затем повторы в пределах min_time"""
+    items = bench.prepare(scale)
+    try:
+        bench.run()  # прогрев: кеши, первые выделения памяти, ленивые импорты
+        samples = []
+        total = 0.0
+        while len(samples) < max_repeat and (len(samples) < min_repeat or total < min_time):
+            begin = time.perf_counter()
+            elapsed = bench.run()
+            if elapsed is None:
+                elapsed = time.perf_counter() - begin
+            samples.append(elapsed)
+            total += elapsed
+        peak = bench.peak_memory()
+    finally:
+        bench.teardown()
+
+    samples = np.array(samples)
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        "case": bench.name,
+        "scale": scale,
+        "unit": bench.unit,
+        "items": items,
+        "repeat": len(samples),
+        "min": float(samples.min()),
+        "mean": float(samples.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "throughput": items / p50 if p50 > 0 else math.inf,
+        "peak_memory": int(peak),
+    }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "threads": stress_calculator.get_num_threads(),
+        "numpy": np.__version__,
+        "pyvista": pv.__version__,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def run_suite(cases=None, quick=False, site_size=1000.0, min_time=0.5, min_repeat=5, max_repeat=50):
+    results = []
+    for bench in all_benchmarks(site_size):
+        if cases and bench.name not in cases:
+            continue
+        for scale in (bench.quick_scales if quick else bench.scales):
+            result = measure(bench, scale, min_time, min_repeat, max_repeat)
+            results.append(result)
+            print(format_result(result))
+    return {"version": FORMAT_VERSION, "environment": environment(), "results": results}
+
+
+def format_duration(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} мкс"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} мс"
+    return f"{seconds:.2f} с"
+
+
+def format_result(result):
+    return (f"{result['case']:<24} {str(result['scale']):>20}  p50 {format_duration(result['p50']):>11}  "
+            f"p95 {format_duration(result['p95']):>11}  p99 {format_duration(result['p99']):>11}  "
+            f"{result['throughput']:.3g} {result['unit']}/с  пик {result['peak_memory'] / 2 ** 20:.1f} МБ  "
+            f"(x{result['repeat']})")
+
+
+def compare(current, baseline, tolerance=0.2, memory_tolerance=0.25, min_delta=5e-5, min_memory_delta=2 ** 20):
+    """
+    Сравнение с базой по медиане задержки и пиковой памяти. Регрессия —
+    рост больше чем на tolerance (доля) и больше абсолютного порога
+    (мелкие случаи иначе «краснеют» от шума). Возвращает список регрессий.
+    """
+    base = {(r["case"], str(r["scale"])): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["case"], str(result["scale"]))
+        reference = base.get(key)
+        if reference is None:
+            print(f"{key[0]:<24} {key[1]:>20}  нет в базе")
+            continue
+        ratio = result["p50"] / reference["p50"] if reference["p50"] > 0 else math.inf
+        memory_ratio = result["peak_memory"] / reference["peak_memory"] if reference["peak_memory"] > 0 else 1.0
+        slower = ratio > 1 + tolerance and result["p50"] - reference["p50"] > min_delta
+        heavier = (memory_ratio > 1 + memory_tolerance
+                   and result["peak_memory"] - reference["peak_memory"] > min_memory_delta)
+        if slower or heavier:
+            status = "РЕГРЕССИЯ"
+            regressions.append({"case": key[0], "scale": result["scale"], "time_ratio": ratio,
+                                "memory_ratio": memory_ratio})
+        elif ratio < 1 - tolerance:
+            status = "быстрее"
+        else:
+            status = "ок"
+        print(f"{key[0]:<24} {key[1]:>20}  p50 {format_duration(reference['p50']):>11} -> "
+              f"{format_duration(result['p50']):>11} (x{ratio:.2f})  память x{memory_ratio:.2f}  {status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="*", help="только указанные случаи")
+    parser.add_argument("--quick", action="store_true", help="по два малых масштаба на случай")
+    parser.add_argument("--site-size", type=float, default=1000.0, help="размер площадки для сетки привязки, м")
+    parser.add_argument("--min-time", type=float, default=0.5, help="суммарное время замеров масштаба, с")
+    parser.add_argument("--min-repeat", type=int, default=5)
+    parser.add_argument("--max-repeat", type=int, default=50)
+    parser.add_argument("--output", help="JSON с результатами")
+    parser.add_argument("--input", help="сравнить готовые результаты вместо нового прогона")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON базы для поиска регрессий")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="допустимый рост медианы задержки (доля)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="допустимый рост пиковой памяти (доля)")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args.cases, args.quick, args.site_size, args.min_time, args.min_repeat,
+                            args.max_repeat)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(current, f, ensure_ascii=False, indent=2)
+            print(f"Результаты записаны в {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != FORMAT_VERSION:
+            parser.error(f"{args.compare}: несовместимая версия формата")
+        regressions = compare(current, baseline, args.tolerance, args.memory_tolerance)
+        if regressions:
+            print(f"Регрессий: {len(regressions)}")
+            sys.exit(1)
+        print("Регрессий нет")
+
+
+if __name__ == "__main__":
+    main()
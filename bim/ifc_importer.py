@@ -1,28 +1,508 @@
 # bim/ifc_importer.py
-import ifcopenshell
-import ifcopenshell.geom
+"""
+Потоковый импорт IFC-файлов.
 
+Геометрия всех типов изделий (IfcProduct) триангулируется многопоточным
+итератором ifcopenshell.geom.iterator и сразу переводится в массивы NumPy
+(вершины, треугольники). Элементы собираются в пакеты ElementBatch
+фиксированного размера, которые отдаются генератором iter_ifc_batches
+или обратным вызовом import_ifc_file — сцена и дерево модели заполняются
+по мере импорта, не дожидаясь конца файла. Импорт можно отменить
+через threading.Event.
 
-def import_ifc_file(file_path):
-    """Импорт IFC-файла в внутреннюю структуру данных"""
-    model = ifcopenshell.open(file_path)
+С instancing=True геометрия триангулируется в локальных координатах
+элементов, повторяющиеся сетки хранятся один раз (bim.instancing), а
+элементы пакета несут номер уникальной сетки и матрицу размещения.
+"""
+import multiprocessing
 
-    # Извлечение стен
-    walls = model.by_type("IfcWall")
-    for wall in walls:
-        geometry = ifcopenshell.geom.create_shape(
-            ifcopenshell.geom.settings(),
-            wall
+import numpy as np
+
+from .instancing import GeometryLibrary, instantiate, _vtk_triangles
+
+# ifcopenshell загружается при первом импорте IFC (_require_ifcopenshell):
+# без него модуль импортируется быстро и работает с кешем триангуляции
+ifcopenshell = None
+
+DEFAULT_BATCH_SIZE = 500
+
+# Не отображаются: проёмы вычитаются из стен, помещения — объёмы воздуха
+DEFAULT_EXCLUDE_TYPES = ("IfcOpeningElement", "IfcSpace")
+
+NO_MATERIAL = -1
+DEFAULT_COLOR = (0.8, 0.8, 0.8, 1.0)
+
+
+def geometry_settings(world_coords=True):
+    """Настройки триангуляции: мировые координаты и материалы по умолчанию"""
+    _require_ifcopenshell()
+    settings = ifcopenshell.geom.settings()
+    settings.set("use-world-coords", world_coords)
+    settings.set("weld-vertices", True)
+    settings.set("apply-default-materials", True)
+    return settings
+
+
+class ElementBatch:
+    """
+    Пакет импортированных элементов в столбцовом виде.
+
+    Вершины и треугольники всех элементов пакета сцеплены; элемент i
+    занимает vertices[vertex_offsets[i]:vertex_offsets[i + 1]] и
+    faces[face_offsets[i]:face_offsets[i + 1]]. Индексы в faces —
+    номера вершин внутри пакета. face_materials ссылается на materials.
+
+    В пакетах с экземплярами (instanced) собственной геометрии нет:
+    элемент i — это уникальная сетка geometry_ids[i] с матрицей
+    transforms[i]; geometries — уникальные сетки, впервые встреченные
+    в этом пакете.
+    """
+
+    def __init__(self, step_ids, guids, types, names, storeys, vertices, faces,
+                 vertex_offsets, face_offsets, face_materials, materials, representation_ids=None,
+                 geometry_ids=None, transforms=None, geometries=()):
+        self.step_ids = step_ids
+        self.guids = guids
+        self.types = types
+        self.names = names
+        self.storeys = storeys
+        self.vertices = vertices
+        self.faces = faces
+        self.vertex_offsets = vertex_offsets
+        self.face_offsets = face_offsets
+        self.face_materials = face_materials
+        self.materials = materials
+        self.representation_ids = representation_ids
+        self.geometry_ids = geometry_ids
+        self.transforms = transforms
+        self.geometries = list(geometries)
+        self.first_index = 0  # номер первого элемента пакета в модели
+
+    def __len__(self):
+        return len(self.step_ids)
+
+    @property
+    def instanced(self):
+        return self.geometry_ids is not None
+
+    @property
+    def n_triangles(self):
+        return len(self.faces)
+
+    def element_indices(self):
+        """Номер элемента (в модели) для каждого треугольника"""
+        counts = np.diff(self.face_offsets)
+        return np.repeat(np.arange(self.first_index, self.first_index + len(self)), counts)
+
+    def to_polydata(self, geometries=None, elements=None):
+        """
+        Одна сетка PyVista на весь пакет с номером элемента и материала у каждой грани.
+        Для пакета с экземплярами нужны все уникальные сетки модели (geometries);
+        elements — необязательная маска элементов пакета.
+        """
+        import pyvista as pv
+
+        if not self.instanced:
+            mesh = pv.PolyData(self.vertices, _vtk_triangles(self.faces))
+            mesh.cell_data["element_index"] = self.element_indices()
+            mesh.cell_data["material"] = self.face_materials
+            return mesh
+
+        # Экземпляры размножаются группами по уникальной сетке
+        selected = np.arange(len(self)) if elements is None else np.flatnonzero(elements)
+        points, faces, element_index, materials = [], [], [], []
+        n_points = 0
+        for geometry_id in np.unique(self.geometry_ids[selected]):
+            members = selected[self.geometry_ids[selected] == geometry_id]
+            geometry = geometries[geometry_id]
+            group_points, group_faces = instantiate(geometry.vertices, geometry.faces, self.transforms[members])
+            points.append(group_points)
+            faces.append(group_faces + n_points)
+            element_index.append(np.repeat(self.first_index + members, geometry.n_triangles))
+            materials.append(np.tile(geometry.face_materials, len(members)))
+            n_points += len(group_points)
+        if not points:
+            return pv.PolyData()
+        mesh = pv.PolyData(np.concatenate(points), _vtk_triangles(np.concatenate(faces)))
+        mesh.cell_data["element_index"] = np.concatenate(element_index)
+        mesh.cell_data["material"] = np.concatenate(materials)
+        return mesh
+
+
+class BimModel:
+    """
+    Импортированная модель: свойства элементов (в порядке импорта),
+    общая таблица материалов и пакеты геометрии.
+    """
+
+    def __init__(self, file_path=None):
+        self.file_path = file_path
+        self.step_ids = []
+        self.guids = []
+        self.types = []
+        self.names = []
+        self.storeys = []
+        self.materials = []  # (имя, (r, g, b, a))
+        self.geometries = []  # уникальные сетки (импорт с экземплярами)
+        self.batches = []
+        self.cancelled = False
+        self._material_index = {}
+
+    def __len__(self):
+        return len(self.guids)
+
+    @property
+    def n_triangles(self):
+        """Число треугольников всех элементов (с учётом повторов)"""
+        total = 0
+        for batch in self.batches:
+            if batch.instanced:
+                counts = np.array([geometry.n_triangles for geometry in self.geometries], dtype=np.int64)
+                total += int(counts[batch.geometry_ids].sum())
+            else:
+                total += batch.n_triangles
+        return total
+
+    @property
+    def n_unique_triangles(self):
+        """Число реально хранимых треугольников"""
+        return sum(batch.n_triangles for batch in self.batches) + \
+            sum(geometry.n_triangles for geometry in self.geometries)
+
+    def instance_counts(self):
+        """Число элементов, использующих каждую уникальную сетку"""
+        ids = [batch.geometry_ids for batch in self.batches if batch.instanced]
+        if not ids:
+            return np.zeros(len(self.geometries), dtype=np.int64)
+        return np.bincount(np.concatenate(ids), minlength=len(self.geometries))
+
+    def add_batch(self, batch):
+        """Добавление пакета: номера материалов пакета переводятся в общую таблицу"""
+        batch.first_index = len(self.guids)
+        remap = np.array([self._material_id(material) for material in batch.materials] + [NO_MATERIAL],
+                         dtype=np.int32)
+        # NO_MATERIAL (-1) попадает на последний элемент remap и остаётся -1
+        batch.face_materials = remap[batch.face_materials]
+        for geometry in batch.geometries:
+            geometry.face_materials = remap[geometry.face_materials]
+        self.geometries.extend(batch.geometries)
+        batch.materials = self.materials
+        for name in ("step_ids", "guids", "types", "names", "storeys"):
+            getattr(self, name).extend(getattr(batch, name))
+        self.batches.append(batch)
+        return batch
+
+    def element(self, index):
+        return {
+            "step_id": self.step_ids[index],
+            "guid": self.guids[index],
+            "type": self.types[index],
+            "name": self.names[index],
+            "storey": self.storeys[index],
+        }
+
+    def tree(self):
+        """Дерево модели: {этаж: {тип IFC: [номера элементов]}}"""
+        tree = {}
+        for index, (storey, ifc_type) in enumerate(zip(self.storeys, self.types)):
+            tree.setdefault(storey, {}).setdefault(ifc_type, []).append(index)
+        return tree
+
+    def material_colors(self):
+        """Цвета материалов (n, 4) для раскраски по cell_data["material"]"""
+        if not self.materials:
+            return np.empty((0, 4))
+        return np.array([color for _name, color in self.materials])
+
+    def _material_id(self, material):
+        index = self._material_index.get(material)
+        if index is None:
+            index = len(self.materials)
+            self.materials.append(material)
+            self._material_index[material] = index
+        return index
+
+
+def iter_ifc_batches(file_or_model, batch_size=DEFAULT_BATCH_SIZE, settings=None, num_threads=None,
+                     include_types=None, exclude_types=DEFAULT_EXCLUDE_TYPES, cancel_event=None,
+                     on_progress=None, instancing=False, cache=None):
+    """
+    Генератор пакетов ElementBatch по мере триангуляции.
+
+    file_or_model — путь к IFC-файлу или открытая модель ifcopenshell;
+    include_types / exclude_types — имена типов IFC для фильтрации;
+    on_progress(число элементов, процент) вызывается после каждого пакета;
+    при установленном cancel_event генератор завершается досрочно;
+    instancing=True — повторяющиеся сетки хранятся один раз (см. ElementBatch);
+    cache — bim.tessellation_cache.TessellationCache: при повторном открытии
+    того же файла пакеты читаются с диска без ifcopenshell (только для пути
+    к файлу и настроек триангуляции по умолчанию).
+    """
+    options = dict(batch_size=batch_size, settings=settings, num_threads=num_threads,
+                   include_types=include_types, exclude_types=exclude_types, cancel_event=cancel_event,
+                   on_progress=on_progress, instancing=instancing)
+    if cache is None or settings is not None or not isinstance(file_or_model, str):
+        yield from _tessellate(file_or_model, **options)
+        return
+
+    key = cache.key(file_or_model, include_types=list(include_types or ()),
+                    exclude_types=list(exclude_types or ()), instancing=instancing)
+    cached = cache.load(key)
+    if cached is not None:
+        done = 0
+        for batch in cached:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            done += len(batch)
+            yield batch
+            if on_progress is not None:
+                on_progress(done, 100)
+        return
+
+    # Пакеты записываются в кеш до передачи потребителю (BimModel.add_batch их изменяет);
+    # запись публикуется, только если файл обработан целиком
+    writer = cache.writer(key)
+    try:
+        for batch in _tessellate(file_or_model, **options):
+            writer.add(batch)
+            yield batch
+        if cancel_event is None or not cancel_event.is_set():
+            writer.commit()
+            writer = None
+    finally:
+        if writer is not None:
+            writer.abort()
+
+
+def _tessellate(file_or_model, batch_size, settings, num_threads, include_types, exclude_types, cancel_event,
+                on_progress, instancing):
+    """Триангуляция итератором ifcopenshell (см. iter_ifc_batches)"""
+    _require_ifcopenshell()
+    model = ifcopenshell.open(file_or_model) if isinstance(file_or_model, str) else file_or_model
+    settings = settings or geometry_settings(world_coords=not instancing)
+    num_threads = num_threads or multiprocessing.cpu_count()
+    storeys = storey_names(model)
+
+    filters = {}
+    if include_types:
+        filters["include"] = [element for ifc_type in include_types for element in model.by_type(ifc_type)]
+    elif exclude_types:
+        filters["exclude"] = [element for ifc_type in exclude_types for element in model.by_type(ifc_type)]
+
+    iterator = ifcopenshell.geom.iterator(settings, model, num_threads, **filters)
+    if not iterator.initialize():
+        return
+
+    builder = _BatchBuilder(storeys, GeometryLibrary() if instancing else None)
+    done = 0
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        builder.add(iterator.get(), model)
+        if len(builder) >= batch_size:
+            done += len(builder)
+            yield builder.build()
+            if on_progress is not None:
+                on_progress(done, iterator.progress())
+        if not iterator.next():
+            break
+
+    if len(builder):
+        done += len(builder)
+        yield builder.build()
+    if on_progress is not None:
+        on_progress(done, 100)
+
+
+def import_ifc_file(file_path, on_batch=None, on_progress=None, cancel_event=None, **kwargs):
+    """
+    Импорт IFC-файла во внутреннюю структуру данных (BimModel).
+    on_batch(model, batch) вызывается для каждого готового пакета — здесь
+    удобно добавлять геометрию в сцену и элементы в дерево модели.
+    Параметры kwargs передаются в iter_ifc_batches.
+    """
+    model = BimModel(file_path)
+    for batch in iter_ifc_batches(file_path, cancel_event=cancel_event, on_progress=on_progress, **kwargs):
+        model.add_batch(batch)
+        if on_batch is not None:
+            on_batch(model, batch)
+    model.cancelled = cancel_event is not None and cancel_event.is_set()
+    return model
+
+
+def storey_names(model):
+    """Этаж каждого элемента: {id элемента: имя этажа} (с учётом вложенных частей)"""
+    storeys = {}
+    for rel in model.by_type("IfcRelContainedInSpatialStructure"):
+        structure = rel.RelatingStructure
+        name = structure.Name or structure.GlobalId
+        for element in rel.RelatedElements:
+            storeys[element.id()] = name
+    # Части составных элементов (лестницы, навесные фасады) наследуют этаж родителя
+    for rel in model.by_type("IfcRelAggregates"):
+        parent = storeys.get(rel.RelatingObject.id())
+        if parent is None:
+            continue
+        for element in rel.RelatedObjects:
+            storeys.setdefault(element.id(), parent)
+    return storeys
+
+
+class _BatchBuilder:
+    """Накопление элементов до пакета без промежуточных сеток PyVista"""
+
+    def __init__(self, storeys, library=None):
+        self.storeys = storeys
+        self.library = library
+        # Таблица материалов общая для всех пакетов: номера материалов в
+        # уникальных сетках не зависят от пакета, в котором сетка появилась
+        self.materials = []
+        self._material_index = {}
+        self._reset()
+
+    def __len__(self):
+        return len(self.step_ids)
+
+    def _reset(self):
+        self.step_ids = []
+        self.guids = []
+        self.types = []
+        self.names = []
+        self.element_storeys = []
+        self.representation_ids = []
+        self.vertices = []
+        self.faces = []
+        self.face_materials = []
+        self.geometry_ids = []
+        self.transforms = []
+        self.new_geometries = []
+
+    def add(self, shape, model):
+        step_id = shape.id
+        element = None
+        guid = getattr(shape, "guid", None)
+        ifc_type = getattr(shape, "type", None)
+        if guid is None or ifc_type is None:
+            element = model.by_id(step_id)
+            guid, ifc_type = element.GlobalId, element.is_a()
+        name = getattr(shape, "name", None)
+        if name is None:
+            name = (element or model.by_id(step_id)).Name
+
+        geometry = shape.geometry
+        vertices, faces, material_ids = triangulation_arrays(geometry)
+        local_materials = [self._material_id(material) for material in geometry.materials]
+        remap = np.array(local_materials + [NO_MATERIAL], dtype=np.int32)
+
+        self.step_ids.append(step_id)
+        self.guids.append(guid)
+        self.types.append(ifc_type)
+        self.names.append(name or "")
+        self.element_storeys.append(self.storeys.get(step_id, ""))
+        self.representation_ids.append(str(geometry.id))
+        if self.library is None:
+            self.vertices.append(vertices)
+            self.faces.append(faces)
+            self.face_materials.append(remap[material_ids])
+            return
+
+        index, is_new = self.library.add(vertices, faces, remap[material_ids], str(geometry.id))
+        if is_new:
+            self.new_geometries.append(self.library[index])
+        self.geometry_ids.append(index)
+        self.transforms.append(shape_matrix(shape))
+
+    def build(self):
+        vertex_counts = [len(v) for v in self.vertices]
+        face_counts = [len(f) for f in self.faces]
+        vertex_offsets = np.concatenate(([0], np.cumsum(vertex_counts))).astype(np.int64)
+        face_offsets = np.concatenate(([0], np.cumsum(face_counts))).astype(np.int64)
+
+        vertices = np.concatenate(self.vertices) if self.vertices else np.empty((0, 3))
+        faces = np.concatenate(self.faces) if self.faces else np.empty((0, 3), dtype=np.int32)
+        # Локальные индексы вершин элемента -> индексы в пакете
+        faces += np.repeat(vertex_offsets[:-1], face_counts).astype(faces.dtype)[:, np.newaxis]
+
+        batch = ElementBatch(
+            step_ids=self.step_ids,
+            guids=self.guids,
+            types=self.types,
+            names=self.names,
+            storeys=self.element_storeys,
+            vertices=vertices,
+            faces=faces,
+            vertex_offsets=vertex_offsets,
+            face_offsets=face_offsets,
+            face_materials=np.concatenate(self.face_materials) if self.face_materials
+            else np.empty(0, dtype=np.int32),
+            materials=list(self.materials),
+            representation_ids=self.representation_ids,
         )
-        mesh = convert_to_pyvista_mesh(geometry)  # Конвертация в формат PyVista
-        scene.add(mesh, color="brick")
+        if self.library is not None:
+            batch.vertex_offsets = np.zeros(len(self.step_ids) + 1, dtype=np.int64)
+            batch.face_offsets = np.zeros(len(self.step_ids) + 1, dtype=np.int64)
+            batch.geometry_ids = np.array(self.geometry_ids, dtype=np.int64)
+            batch.transforms = np.array(self.transforms, dtype=np.float64).reshape(-1, 4, 4)
+            batch.geometries = self.new_geometries
+        self._reset()
+        return batch
+
+    def _material_id(self, material):
+        key = (material.name, material_color(material))
+        index = self._material_index.get(key)
+        if index is None:
+            index = len(self.materials)
+            self.materials.append(key)
+            self._material_index[key] = index
+        return index
+
+
+def triangulation_arrays(geometry):
+    """Вершины (n, 3), треугольники (m, 3) и номера материалов граней (m,) одного элемента"""
+    if hasattr(geometry, "verts_buffer"):
+        vertices = np.frombuffer(geometry.verts_buffer, dtype=np.float64)
+        faces = np.frombuffer(geometry.faces_buffer, dtype=np.int32)
+    else:
+        vertices = np.asarray(geometry.verts, dtype=np.float64)
+        faces = np.asarray(geometry.faces, dtype=np.int32)
+    material_ids = np.asarray(geometry.material_ids, dtype=np.int32)
+    if len(material_ids) * 3 != len(faces):
+        material_ids = np.full(len(faces) // 3, NO_MATERIAL, dtype=np.int32)
+    # frombuffer даёт массив только для чтения, а индексы граней сдвигаются при сборке пакета
+    return vertices.reshape(-1, 3), faces.reshape(-1, 3).copy(), material_ids
+
+
+def shape_matrix(shape):
+    """Матрица размещения элемента 4x4 (единичная при триангуляции в мировых координатах)"""
+    values = shape.transformation.matrix
+    values = np.asarray(getattr(values, "data", values), dtype=np.float64)
+    if values.size == 12:
+        # ifcopenshell 0.7: матрица 3x4 по столбцам
+        matrix = np.eye(4)
+        matrix[:3, :] = values.reshape(4, 3).T
+        return matrix
+    return values.reshape(4, 4).T
+
 
-    # Извлечение материалов
-    materials = extract_materials(model)
-    return BimModel(geometries=meshes, materials=materials)
+def material_color(material):
+    """Цвет материала (r, g, b, a); ifcopenshell 0.8 хранит цвет объектом, 0.7 — кортежем"""
+    diffuse = getattr(material, "diffuse", None)
+    if diffuse is None:
+        return DEFAULT_COLOR
+    if hasattr(diffuse, "r"):
+        rgb = (diffuse.r(), diffuse.g(), diffuse.b())
+    else:
+        rgb = tuple(diffuse)[:3]
+    transparency = getattr(material, "transparency", 0.0)
+    if transparency is None or transparency != transparency:  # NaN — не задана
+        transparency = 0.0
+    return tuple(round(float(c), 4) for c in rgb) + (round(1.0 - float(transparency), 4),)
 
 
-# В интерфейсе:
-if user_clicked_import_ifc:
-    model = import_ifc_file("building.ifc")
-    gui.model_tree.populate(model)  # Заполнение дерева объектов
\ No newline at end of file
+def _require_ifcopenshell():
+    global ifcopenshell
+    if ifcopenshell is None:
+        try:
+            import ifcopenshell.geom
+        except ImportError:  # pragma: no cover - зависит от окружения
+            raise ImportError("Для импорта IFC требуется пакет ifcopenshell") from None
@@ -0,0 +1,175 @@
+# bim/instancing.py
+"""
+Дедупликация геометрии BIM-элементов.
+
+В IFC одна и та же форма (окно, колонна, типовой этаж) повторяется много
+раз с разным размещением. При триангуляции в локальных координатах
+элемента одинаковые представления дают одинаковые сетки, поэтому каждая
+уникальная сетка хранится один раз (GeometryLibrary), а элемент ссылается
+на неё номером и матрицей размещения 4x4.
+
+Совпадение определяется сначала по идентификатору представления
+ifcopenshell (общие IfcRepresentationMap), затем по хешу содержимого
+сетки — так находятся и одинаковые сетки разных представлений.
+"""
+import hashlib
+
+import numpy as np
+
+# Точность сравнения координат вершин при хешировании сеток
+HASH_DECIMALS = 6
+
+
+def geometry_hash(vertices, faces, face_materials):
+    """Хеш содержимого сетки: вершины (с округлением), треугольники и материалы граней"""
+    h = hashlib.blake2b(digest_size=16)
+    rounded = np.round(np.asarray(vertices, dtype=np.float64), HASH_DECIMALS) + 0.0
+    for array in (rounded, np.asarray(faces, dtype=np.int32), np.asarray(face_materials, dtype=np.int32)):
+        h.update(str(array.shape).encode())
+        h.update(np.ascontiguousarray(array).tobytes())
+    return h.hexdigest()
+
+
+class UniqueGeometry:
+    """Уникальная сетка в локальных координатах элемента"""
+
+    def __init__(self, index, vertices, faces, face_materials, key):
+        self.index = index
+        self.vertices = vertices
+        self.faces = faces
+        self.face_materials = face_materials
+        self.key = key
+
+    @property
+    def n_triangles(self):
+        return len(self.faces)
+
+    @property
+    def nbytes(self):
+        return self.vertices.nbytes + self.faces.nbytes + self.face_materials.nbytes
+
+    def to_polydata(self):
+        import pyvista as pv
+
+        return pv.PolyData(self.vertices, _vtk_triangles(self.faces))
+
+
+class GeometryLibrary:
+    """Хранилище уникальных сеток с поиском по представлению и по хешу"""
+
+    def __init__(self):
+        self.geometries = []
+        self._by_representation = {}
+        self._by_hash = {}
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def __getitem__(self, index):
+        return self.geometries[index]
+
+    @property
+    def nbytes(self):
+        return sum(geometry.nbytes for geometry in self.geometries)
+
+    def add(self, vertices, faces, face_materials, representation_id=None):
+        """
+        Регистрация сетки элемента. Возвращает (номер уникальной сетки, новая ли она).
+        Для повторов сетка не копируется и не хешируется повторно.
+        """
+        if representation_id is not None:
+            index = self._by_representation.get(representation_id)
+            if index is not None:
+                return index, False
+
+        key = geometry_hash(vertices, faces, face_materials)
+        index = self._by_hash.get(key)
+        is_new = index is None
+        if is_new:
+            index = len(self.geometries)
+            self.geometries.append(UniqueGeometry(index, vertices, faces, face_materials, key))
+            self._by_hash[key] = index
+        if representation_id is not None:
+            self._by_representation[representation_id] = index
+        return index, is_new
+
+
+def transform_points(vertices, matrix):
+    """Применение матрицы 4x4 к точкам (n, 3)"""
+    return vertices @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def instantiate(vertices, faces, transforms):
+    """
+    Размножение одной сетки по k матрицам размещения без циклов Python.
+    Возвращает точки (k * n, 3) и треугольники (k * m, 3).
+    """
+    transforms = np.asarray(transforms, dtype=np.float64).reshape(-1, 4, 4)
+    k, n = len(transforms), len(vertices)
+    points = np.einsum("kij,nj->kni", transforms[:, :3, :3], vertices) + transforms[:, np.newaxis, :3, 3]
+    shifted = faces[np.newaxis] + (np.arange(k) * n)[:, np.newaxis, np.newaxis]
+    return points.reshape(-1, 3), shifted.reshape(-1, 3)
+
+
+def rigid_decomposition(transforms, tolerance=1e-6):
+    """
+    Разложение матриц размещения M = T · R · S на перенос (k, 3),
+    поворот-кватернион (k, 4) в порядке (w, x, y, z) и масштабы по осям (k, 3).
+    Четвёртый результат — маска матриц, для которых разложение точное
+    (ортогональный поворот без зеркального отражения и сдвига).
+    """
+    transforms = np.asarray(transforms, dtype=np.float64).reshape(-1, 4, 4)
+    translations = transforms[:, :3, 3].copy()
+    linear = transforms[:, :3, :3]
+    scales = np.linalg.norm(linear, axis=1)
+    rotations = linear / np.where(scales > 0, scales, 1.0)[:, np.newaxis, :]
+
+    identity_error = np.abs(np.einsum("kji,kjl->kil", rotations, rotations) - np.eye(3)).max(axis=(1, 2))
+    exact = (identity_error < tolerance) & (np.linalg.det(rotations) > 0) & np.all(scales > 0, axis=1)
+    exact &= np.allclose(transforms[:, 3], [0, 0, 0, 1], atol=tolerance)
+    return translations, rotation_quaternions(rotations), scales, exact
+
+
+def rotation_quaternions(rotations):
+    """
+    Кватернионы (w, x, y, z) для матриц поворота (k, 3, 3) по методу
+    Шеппарда: для каждой матрицы выбирается наибольший из следа и
+    диагональных элементов, поэтому знаки верны и для поворотов на 180°.
+    """
+    r = np.asarray(rotations, dtype=np.float64).reshape(-1, 3, 3)
+    diagonal = np.stack((r[:, 0, 0] + r[:, 1, 1] + r[:, 2, 2], r[:, 0, 0], r[:, 1, 1], r[:, 2, 2]), axis=1)
+    branch = np.argmax(diagonal, axis=1)
+    # 4·q_i² для ведущей компоненты: 1 + след для w, 1 + 2·r_ii - след для x, y, z
+    lead = np.where(branch == 0, 1 + diagonal[:, 0], 1 + 2 * diagonal[np.arange(len(r)), branch] - diagonal[:, 0])
+    s = 2 * np.sqrt(np.maximum(lead, 1e-300))
+
+    # Комбинации элементов: 4·w·x, 4·w·y, 4·w·z, 4·x·y, 4·x·z, 4·y·z
+    wx, wy, wz = r[:, 2, 1] - r[:, 1, 2], r[:, 0, 2] - r[:, 2, 0], r[:, 1, 0] - r[:, 0, 1]
+    xy, xz, yz = r[:, 0, 1] + r[:, 1, 0], r[:, 0, 2] + r[:, 2, 0], r[:, 1, 2] + r[:, 2, 1]
+    candidates = np.stack((
+        np.column_stack((lead, wx, wy, wz)),
+        np.column_stack((wx, lead, xy, xz)),
+        np.column_stack((wy, xy, lead, yz)),
+        np.column_stack((wz, xz, yz, lead)),
+    ), axis=1) / s[:, np.newaxis, np.newaxis]
+    quaternions = candidates[np.arange(len(r)), branch]
+    # Один поворот задают q и -q: выбираем w >= 0
+    quaternions *= np.where(quaternions[:, :1] < 0, -1.0, 1.0)
+    return quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
+
+
+def dominant_material(geometry):
+    """Материал с наибольшей площадью граней (для цвета экземпляров)"""
+    if not len(geometry.faces):
+        return -1
+    triangles = geometry.vertices[geometry.faces]
+    areas = np.linalg.norm(np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]), axis=1)
+    materials, inverse = np.unique(geometry.face_materials, return_inverse=True)
+    return int(materials[np.argmax(np.bincount(inverse, weights=areas))])
+
+
+def _vtk_triangles(faces):
+    cells = np.empty((len(faces), 4), dtype=np.int64)
+    cells[:, 0] = 3
+    cells[:, 1:] = faces
+    return cells.ravel()
@@ -0,0 +1,183 @@
+# bim/tessellation_cache.py
+"""
+Дисковый кеш триангуляции IFC-файлов.
+
+Ключ — хеш содержимого IFC-файла, параметров триангуляции (фильтры типов,
+режим экземпляров) и версии ifcopenshell. Каждая запись — каталог:
+manifest.json со свойствами элементов и материалами пакетов плюс по
+одному .npy на массив пакета. При повторном открытии массивы
+отображаются в память (np.load(mmap_mode="r")), а ifcopenshell не
+вызывается вовсе. Размер кеша ограничен: при переполнении удаляются
+давно не использованные записи.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from core.result_cache import DEFAULT_DISK_LIMIT, cache_key, default_cache_dir, file_digest
+
+from .ifc_importer import ElementBatch
+from .instancing import UniqueGeometry
+
+# Версия формата записи: при изменении раскладки старые записи не читаются
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+_BATCH_ARRAYS = ("vertices", "faces", "vertex_offsets", "face_offsets", "face_materials")
+_INSTANCE_ARRAYS = ("geometry_ids", "transforms")
+_GEOMETRY_ARRAYS = ("vertices", "faces", "face_materials")
+_METADATA = ("step_ids", "guids", "types", "names", "storeys", "representation_ids")
+
+
+class TessellationCache:
+    """Каталог записей триангуляции (по умолчанию в кеше приложения)"""
+
+    def __init__(self, root=None, max_bytes=DEFAULT_DISK_LIMIT):
+        self.root = os.path.join(root or default_cache_dir(), "ifc_tessellation")
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def key(self, file_path, **options):
+        """Ключ записи: содержимое файла + параметры триангуляции + версии"""
+        try:
+            import ifcopenshell
+            version = getattr(ifcopenshell, "version", "")
+        except ImportError:
+            version = ""
+        return cache_key(FORMAT_VERSION, version, file_digest(file_path), options)
+
+    def __contains__(self, key):
+        return os.path.exists(os.path.join(self.root, key, MANIFEST))
+
+    def load(self, key):
+        """
+        Пакеты записи как генератор ElementBatch с массивами, отображёнными
+        в память, или None, если записи нет.
+        """
+        path = os.path.join(self.root, key)
+        try:
+            with open(os.path.join(path, MANIFEST), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("format") != FORMAT_VERSION:
+            return None
+        os.utime(path)
+        return (_load_batch(path, number, entry) for number, entry in enumerate(manifest["batches"]))
+
+    def writer(self, key):
+        """Запись новой записи по пакетам; видна другим только после commit()"""
+        return _CacheWriter(self, key)
+
+    def discard(self, key):
+        shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+
+    def clear(self):
+        for name in os.listdir(self.root):
+            shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+    def size(self):
+        return sum(size for _path, size, _mtime in self._entries())
+
+    def _evict(self, keep=None):
+        """Удаление записей с самым старым временем использования до 90 % лимита"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _path, size, _mtime in entries)
+        for path, size, _mtime in entries:
+            if total <= 0.9 * self.max_bytes:
+                break
+            if os.path.basename(path) != keep:
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith(".tmp_") or not os.path.isdir(path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+            entries.append((path, size, os.stat(path).st_mtime))
+        return entries
+
+
+class _CacheWriter:
+    """Запись пакетов во временный каталог с атомарной публикацией"""
+
+    def __init__(self, cache, key):
+        self.cache = cache
+        self.key = key
+        self.path = tempfile.mkdtemp(prefix=".tmp_", dir=cache.root)
+        self.batches = []
+
+    def add(self, batch):
+        """Сохранение пакета (до того, как BimModel.add_batch изменит номера материалов)"""
+        number = len(self.batches)
+        entry = {name: list(getattr(batch, name) or ()) for name in _METADATA}
+        entry["materials"] = [[name, list(color)] for name, color in batch.materials]
+        entry["instanced"] = batch.instanced
+        for name in _BATCH_ARRAYS:
+            self._save(number, name, getattr(batch, name))
+        if batch.instanced:
+            for name in _INSTANCE_ARRAYS:
+                self._save(number, name, getattr(batch, name))
+            entry["geometries"] = [[geometry.index, geometry.key] for geometry in batch.geometries]
+            for name in _GEOMETRY_ARRAYS:
+                arrays = [getattr(geometry, name) for geometry in batch.geometries]
+                self._save(number, f"geometry_{name}", _concatenate(arrays, name))
+                self._save(number, f"geometry_{name}_offsets", _offsets(arrays))
+        self.batches.append(entry)
+
+    def commit(self):
+        with open(os.path.join(self.path, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT_VERSION, "created": time.time(), "batches": self.batches}, f,
+                      ensure_ascii=False)
+        target = os.path.join(self.cache.root, self.key)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(self.path, target)
+        self.cache._evict(keep=self.key)
+
+    def abort(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _save(self, number, name, array):
+        np.save(os.path.join(self.path, f"b{number:05d}_{name}.npy"), np.ascontiguousarray(array),
+                allow_pickle=False)
+
+
+def _load_batch(path, number, entry):
+    def load(name):
+        return np.load(os.path.join(path, f"b{number:05d}_{name}.npy"), mmap_mode="r")
+
+    batch = ElementBatch(
+        materials=[(name, tuple(color)) for name, color in entry["materials"]],
+        **{name: entry[name] for name in _METADATA},
+        **{name: load(name) for name in _BATCH_ARRAYS},
+    )
+    if entry["instanced"]:
+        batch.geometry_ids = load("geometry_ids")
+        batch.transforms = load("transforms")
+        columns = {}
+        for name in _GEOMETRY_ARRAYS:
+            values, offsets = load(f"geometry_{name}"), load(f"geometry_{name}_offsets")
+            columns[name] = [values[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        batch.geometries = [UniqueGeometry(index, columns["vertices"][i], columns["faces"][i],
+                                           columns["face_materials"][i], key)
+                            for i, (index, key) in enumerate(entry["geometries"])]
+    return batch
+
+
+def _concatenate(arrays, name):
+    if arrays:
+        return np.concatenate(arrays)
+    if name == "vertices":
+        return np.empty((0, 3))
+    return np.empty((0, 3) if name == "faces" else 0, dtype=np.int32)
+
+
+def _offsets(arrays):
+    return np.concatenate(([0], np.cumsum([len(array) for array in arrays]))).astype(np.int64)
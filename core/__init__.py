@@ -1,2 +1,11 @@
 # core/__init__.py
-from .stress_calculator import calculate_stress
\ No newline at end of file
+# Скомпилированное ядро загружается при первом обращении к его функциям
+# (from core import calculate_stress), а не при импорте пакета
+_NATIVE = ("calculate_stress", "isotropic_stiffness", "set_num_threads", "get_num_threads")
+
+
+def __getattr__(name):
+    if name in _NATIVE:
+        from . import stress_calculator
+        return getattr(stress_calculator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,239 @@
+# core/aster_runner.py
+"""
+Асинхронный запуск расчётов Code_Aster с ограниченным пулом.
+
+Каждое задание получает уникальный номер и собственный временный рабочий
+каталог, поэтому параллельные расчёты не перезаписывают файлы друг друга.
+Поддерживаются тайм-аут, отмена и отчёт о состоянии всех заданий.
+Исполняемый файл задаётся параметром или переменной окружения
+ASTER_EXECUTABLE (например, заглушкой для проверки на Linux).
+"""
+import asyncio
+import itertools
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+# Состояния задания
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+TIMEOUT = "timeout"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (DONE, FAILED, TIMEOUT, CANCELLED)
+
+COMM_FILE = "analysis.comm"
+RESULT_FILE = "results.rmed"
+
+_job_numbers = itertools.count(1)
+
+
+class AsterJobError(RuntimeError):
+    """Задание Code_Aster завершилось не успешно"""
+
+    def __init__(self, job):
+        super().__init__(f"Задание {job.job_id}: {job.status} (код {job.returncode}): {job.error or ''}".strip())
+        self.job = job
+
+
+class AsterJob:
+    """Одно задание Code_Aster и его состояние"""
+
+    def __init__(self, comm_text, input_files=None, result_files=(RESULT_FILE,), timeout=None, label=None):
+        self.job_id = uuid.uuid4().hex
+        self.number = next(_job_numbers)  # для -num_job
+        self.label = label
+        self.comm_text = comm_text
+        self.input_files = dict(input_files or {})
+        self.result_names = tuple(result_files)
+        self.timeout = timeout
+
+        self.status = PENDING
+        self.workdir = None
+        self.returncode = None
+        self.stdout = b""
+        self.stderr = b""
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._task = None
+        self._process = None
+
+    @property
+    def done(self):
+        return self.status in FINISHED_STATES
+
+    @property
+    def result_files(self):
+        """Пути к файлам результатов, которые реально созданы расчётом"""
+        if self.workdir is None:
+            return {}
+        paths = {name: os.path.join(self.workdir, name) for name in self.result_names}
+        return {name: path for name, path in paths.items() if os.path.exists(path)}
+
+    def result_path(self, name=RESULT_FILE):
+        return self.result_files.get(name)
+
+    def cleanup(self):
+        """Удаление рабочего каталога задания"""
+        if self.workdir is not None:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+            self.workdir = None
+
+    def to_dict(self):
+        """Состояние задания для отчётов и интерфейса"""
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            "job_id": self.job_id,
+            "number": self.number,
+            "label": self.label,
+            "status": self.status,
+            "returncode": self.returncode,
+            "workdir": self.workdir,
+            "elapsed": elapsed,
+            "error": self.error,
+        }
+
+
+class AsterJobRunner:
+    """Пул асинхронных заданий Code_Aster"""
+
+    def __init__(self, max_workers=None, aster_executable=None, work_root=None, timeout=None,
+                 keep_failed_workdirs=False, on_status=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.aster_executable = aster_executable or os.environ.get("ASTER_EXECUTABLE", "aster")
+        self.work_root = work_root
+        self.timeout = timeout
+        self.keep_failed_workdirs = keep_failed_workdirs
+        self.on_status = on_status
+        self.jobs = {}
+        self._semaphore = None
+
+    def submit(self, comm_text, input_files=None, result_files=(RESULT_FILE,), timeout=None, label=None):
+        """
+        Постановка задания в очередь (внутри работающего цикла asyncio).
+        input_files — {имя в рабочем каталоге: путь к исходному файлу}.
+        """
+        job = AsterJob(comm_text, input_files, result_files,
+                       timeout if timeout is not None else self.timeout, label)
+        self.jobs[job.job_id] = job
+        job._task = asyncio.get_running_loop().create_task(self._run(job))
+        self._notify(job)
+        return job
+
+    async def run(self, comm_text, input_files=None, result_files=(RESULT_FILE,), timeout=None, label=None):
+        """Постановка задания и ожидание его завершения"""
+        job = self.submit(comm_text, input_files, result_files, timeout, label)
+        return await self.wait(job.job_id)
+
+    async def wait(self, job_id):
+        job = self.jobs[job_id]
+        try:
+            await job._task
+        except asyncio.CancelledError:
+            if not job.done:
+                raise
+        return job
+
+    async def wait_all(self):
+        jobs = list(self.jobs.values())
+        await asyncio.gather(*(job._task for job in jobs), return_exceptions=True)
+        return jobs
+
+    def cancel(self, job_id):
+        """Отмена задания: ожидающее снимается с очереди, выполняющееся — завершается"""
+        job = self.jobs[job_id]
+        if job.done:
+            return False
+        job._task.cancel()
+        return True
+
+    def cancel_all(self):
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+
+    def status(self):
+        """Сводка по всем заданиям"""
+        return [job.to_dict() for job in self.jobs.values()]
+
+    def forget(self, job_id, cleanup=True):
+        """Удаление завершённого задания из списка (и его рабочего каталога)"""
+        job = self.jobs.pop(job_id)
+        if cleanup:
+            job.cleanup()
+
+    async def _run(self, job):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        try:
+            async with self._semaphore:
+                await self._execute(job)
+        except asyncio.CancelledError:
+            await self._kill(job)
+            self._finish(job, CANCELLED)
+            raise
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, FAILED)
+
+    async def _execute(self, job):
+        job.workdir = tempfile.mkdtemp(prefix=f"aster_{job.number}_{job.job_id[:8]}_", dir=self.work_root)
+        with open(os.path.join(job.workdir, COMM_FILE), "w", encoding="utf-8") as f:
+            f.write(job.comm_text)
+        for name, source in job.input_files.items():
+            shutil.copyfile(source, os.path.join(job.workdir, name))
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        self._notify(job)
+
+        job._process = await asyncio.create_subprocess_exec(
+            self.aster_executable, "-commande", COMM_FILE, "-num_job", str(job.number),
+            cwd=job.workdir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            job.stdout, job.stderr = await asyncio.wait_for(job._process.communicate(), job.timeout)
+        except asyncio.TimeoutError:
+            await self._kill(job)
+            job.error = f"Превышено время ожидания {job.timeout} с"
+            self._finish(job, TIMEOUT)
+            return
+
+        job.returncode = job._process.returncode
+        missing = [name for name in job.result_names if name not in job.result_files]
+        if job.returncode != 0:
+            job.error = job.stderr.decode(errors="replace").strip()[-2000:] or None
+            self._finish(job, FAILED)
+        elif missing:
+            job.error = f"Нет файлов результатов: {', '.join(missing)}"
+            self._finish(job, FAILED)
+        else:
+            self._finish(job, DONE)
+
+    async def _kill(self, job):
+        process = job._process
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+            job.returncode = process.returncode
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished_at = time.time()
+        job._process = None
+        if status != DONE and not self.keep_failed_workdirs:
+            job.cleanup()
+        self._notify(job)
+
+    def _notify(self, job):
+        if self.on_status is not None:
+            self.on_status(job.to_dict())
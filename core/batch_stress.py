@@ -0,0 +1,380 @@
+# core/batch_stress.py
+"""
+Пакетный расчёт напряжений в фундаментах из командной строки, без Qt и
+без дисплея (ночные прогоны на сервере).
+
+Вход — CSV или YAML с колонками (ключами):
+  width, length, thickness — размеры, м;
+  load_value — нагрузка, Н (или load_kn — в кН);
+  load_type — название типа нагрузки (как в интерфейсе), его код 0..3
+              или uniform / point_center / point_corner / linear;
+  id, x, y, z — необязательные номер и центр фундамента.
+YAML — список таких записей или словарь с ключом foundations.
+
+Фундаменты делятся на шарды по --shard-size и считаются в пуле процессов;
+по каждому фундаменту в выход пишется строка с параметрами и статистикой
+напряжений в узлах сетки --grid. Результаты записываются по мере готовности
+шардов: в CSV — дописыванием в один файл, в Parquet — отдельным файлом на
+шард в каталоге вывода. Готовые шарды отмечаются в файле <вывод>.progress;
+с --resume прерванный прогон продолжается с того же места.
+
+Запуск: python -m core.batch_stress footings.csv -o stress.csv [--workers N] [--resume]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .result_cache import file_digest
+from .stress_engine import (LOAD_LINEAR, LOAD_POINT_CENTER, LOAD_POINT_CORNER, LOAD_TYPES, LOAD_UNIFORM,
+                            UNKNOWN_LOAD_CODE, batch_foundation_stress, load_type_codes)
+
+BATCH_VERSION = 1
+DEFAULT_SHARD_SIZE = 256
+DEFAULT_GRID = (5, 5, 3)
+
+# Латинские названия типов нагрузки для таблиц и конфигов
+LOAD_TYPE_ALIASES = {
+    "uniform": LOAD_UNIFORM,
+    "point_center": LOAD_POINT_CENTER,
+    "point_corner": LOAD_POINT_CORNER,
+    "linear": LOAD_LINEAR,
+}
+
+REQUIRED_COLUMNS = ("width", "length", "thickness", "load_type")
+OUTPUT_COLUMNS = ("id", "x", "y", "z", "width", "length", "thickness", "load_value", "load_type",
+                  "mean_pressure", "stress_min", "stress_max", "stress_mean")
+
+
+class BatchInputError(ValueError):
+    """Некорректный входной файл или несовместимый файл прогресса"""
+
+
+# --- Чтение входных данных ---
+
+def read_foundations(path):
+    """
+    Чтение фундаментов из CSV или YAML. Возвращает словарь колонок NumPy:
+    ids, positions (F, 3), dimensions (F, 3), load_values, load_types (коды).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".yaml", ".yml"):
+        import yaml
+
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or []
+        if isinstance(data, dict):
+            data = data.get("foundations", [])
+        if not isinstance(data, list) or not all(isinstance(record, dict) for record in data):
+            raise BatchInputError(f"{path}: ожидается список фундаментов")
+        columns = {name: [record.get(name) for record in data]
+                   for name in {key for record in data for key in record}}
+    elif extension == ".csv":
+        import pandas as pd
+
+        frame = pd.read_csv(path, skipinitialspace=True)
+        frame.columns = [str(name).strip().lower() for name in frame.columns]
+        columns = {name: frame[name].tolist() for name in frame.columns}
+    else:
+        raise BatchInputError(f"{path}: поддерживаются только CSV и YAML")
+    return _foundation_columns(columns, path)
+
+
+def _foundation_columns(columns, path):
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if "load_value" not in columns and "load_kn" not in columns:
+        missing.append("load_value")
+    if missing:
+        raise BatchInputError(f"{path}: нет колонок {', '.join(missing)}")
+
+    count = len(columns["width"])
+
+    def numbers(name, default=None):
+        if name not in columns:
+            return np.full(count, default, dtype=np.float64)
+        try:
+            return np.array([default if value is None else value for value in columns[name]], dtype=np.float64)
+        except (TypeError, ValueError):
+            raise BatchInputError(f"{path}: нечисловые значения в колонке {name}") from None
+
+    # Нагрузка записи — load_value в Н или, если он не задан, load_kn в кН
+    load_values = numbers("load_value", np.nan)
+    load_values = np.where(np.isnan(load_values), numbers("load_kn", np.nan) * 1e3, load_values)
+    dimensions = np.column_stack((numbers("width"), numbers("length"), numbers("thickness")))
+    if np.any(~np.isfinite(dimensions)) or np.any(dimensions <= 0) or np.any(~np.isfinite(load_values)):
+        raise BatchInputError(f"{path}: размеры должны быть положительными, нагрузки — заданы")
+    ids = numbers("id", np.nan)
+    ids = np.where(np.isnan(ids), np.arange(count), ids).astype(np.int64)
+    return {
+        "ids": ids,
+        "positions": np.column_stack((numbers("x", 0.0), numbers("y", 0.0), numbers("z", 0.0))),
+        "dimensions": dimensions,
+        "load_values": load_values,
+        "load_types": parse_load_types(columns["load_type"]),
+    }
+
+
+def parse_load_types(values):
+    """Коды типов нагрузки из названий, латинских псевдонимов или чисел"""
+    names = []
+    for value in values:
+        if isinstance(value, str):
+            value = value.strip()
+            if value.lstrip("-").isdigit():
+                value = int(value)
+            else:
+                value = LOAD_TYPE_ALIASES.get(value.lower(), value)
+        elif isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if isinstance(value, int) and not 0 <= value < len(LOAD_TYPES):
+            value = UNKNOWN_LOAD_CODE
+        names.append(value)
+    codes = load_type_codes(names)
+    if np.any(codes == UNKNOWN_LOAD_CODE):
+        unknown = sorted({str(value) for value, code in zip(values, codes) if code == UNKNOWN_LOAD_CODE})
+        raise BatchInputError(f"Неизвестные типы нагрузки: {', '.join(unknown)}")
+    return codes
+
+
+# --- Расчёт шарда (выполняется в рабочем процессе) ---
+
+def foundation_grid_points(dimensions, positions, grid=DEFAULT_GRID):
+    """Узлы регулярной сетки nx x ny x nz внутри каждого фундамента: (F, P, 3)"""
+    axes = [np.linspace(-0.5, 0.5, max(int(n), 2)) for n in grid]
+    unit = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    return positions[:, np.newaxis, :] + unit[np.newaxis] * dimensions[:, np.newaxis, :]
+
+
+def shard_stress(ids, positions, dimensions, load_values, load_types, grid=DEFAULT_GRID):
+    """Строки результата для шарда фундаментов: словарь колонок OUTPUT_COLUMNS"""
+    points = foundation_grid_points(dimensions, positions, grid)
+    stress = batch_foundation_stress(points, dimensions, positions, load_values, load_types)
+    return {
+        "id": ids,
+        "x": positions[:, 0],
+        "y": positions[:, 1],
+        "z": positions[:, 2],
+        "width": dimensions[:, 0],
+        "length": dimensions[:, 1],
+        "thickness": dimensions[:, 2],
+        "load_value": load_values,
+        "load_type": [LOAD_TYPES[code] for code in load_types.tolist()],
+        "mean_pressure": load_values / (dimensions[:, 0] * dimensions[:, 1]),
+        "stress_min": stress.min(axis=1),
+        "stress_max": stress.max(axis=1),
+        "stress_mean": stress.mean(axis=1),
+    }
+
+
+# --- Вывод и прогресс ---
+
+class _CsvOutput:
+    """Один CSV-файл, дописываемый по шардам; позиция конца — размер файла"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def reset(self, offset, resume=False):
+        """Обрезка до последней подтверждённой позиции (или удаление при 0)"""
+        if offset == 0:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        with open(self.path, "r+b") as f:
+            f.truncate(offset)
+
+    def write(self, shard, columns):
+        import pandas as pd
+
+        header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            pd.DataFrame(columns, columns=OUTPUT_COLUMNS).to_csv(f, header=header, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        return os.path.getsize(self.path)
+
+
+class _ParquetOutput:
+    """Каталог Parquet: по файлу part-<шард>.parquet на шард"""
+
+    def __init__(self, path):
+        _require_parquet()
+        self.path = path
+
+    def reset(self, offset, resume=False):
+        """
+        Недописанные .tmp удаляются всегда, а файлы шардов прежнего прогона —
+        при новом прогоне: иначе чтение каталога захватит их вместе с новыми.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        for name in os.listdir(self.path):
+            stale_part = not resume and name.startswith("part-") and name.endswith(".parquet")
+            if stale_part or name.endswith(".tmp"):
+                os.remove(os.path.join(self.path, name))
+
+    def write(self, shard, columns):
+        import pandas as pd
+
+        target = os.path.join(self.path, f"part-{shard:06d}.parquet")
+        temp_path = f"{target}.tmp"
+        pd.DataFrame(columns, columns=OUTPUT_COLUMNS).to_parquet(temp_path, index=False)
+        os.replace(temp_path, target)
+        return 0
+
+
+def _require_parquet():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        try:
+            import fastparquet  # noqa: F401
+        except ImportError:
+            raise ImportError("Для вывода в Parquet требуется пакет pyarrow или fastparquet") from None
+
+
+class BatchProgress:
+    """
+    Файл прогресса (строки JSON): заголовок с параметрами прогона, затем по
+    строке на записанный шард с позицией конца вывода. Запись в вывод
+    предшествует отметке, поэтому при обрыве вывод обрезается до последней
+    отметки, а шард считается заново.
+    """
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = header
+        self.done = set()
+        self.offset = 0
+
+    def load(self):
+        """Чтение отметок прежнего прогона; False, если файла нет"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        try:
+            header = json.loads(lines[0]) if lines else None
+            records = [json.loads(line) for line in lines[1:]]
+        except ValueError:
+            # Оборванная последняя строка — отметка не записана
+            header = json.loads(lines[0])
+            records = []
+            for line in lines[1:]:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+        if header != self.header:
+            raise BatchInputError(f"{self.path}: прогресс другого прогона (вход или параметры изменились)")
+        for record in records:
+            self.done.add(record["shard"])
+            self.offset = record["offset"]
+        return True
+
+    def start(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.header) + "\n")
+
+    def mark(self, shard, offset):
+        self.done.add(shard)
+        self.offset = offset
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"shard": shard, "offset": offset}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def output_format(path):
+    return "parquet" if path.lower().endswith(".parquet") else "csv"
+
+
+# --- Прогон ---
+
+def run_batch(input_path, output_path, shard_size=DEFAULT_SHARD_SIZE, max_workers=None, grid=DEFAULT_GRID,
+              resume=False, progress=print):
+    """
+    Расчёт всех фундаментов входного файла с записью результатов по мере
+    готовности шардов. max_workers=0 — расчёт в текущем процессе.
+    Возвращает число фундаментов, посчитанных в этом запуске.
+    """
+    foundations = read_foundations(input_path)
+    count = len(foundations["ids"])
+    shards = [(i, slice(start, min(start + shard_size, count)))
+              for i, start in enumerate(range(0, count, shard_size))]
+
+    output = _ParquetOutput(output_path) if output_format(output_path) == "parquet" else _CsvOutput(output_path)
+    state = BatchProgress(f"{output_path}.progress", {
+        "version": BATCH_VERSION, "input": file_digest(input_path), "shard_size": shard_size,
+        "grid": [int(n) for n in grid], "format": output_format(output_path),
+    })
+    if resume and state.load():
+        output.reset(state.offset, resume=True)
+        progress(f"Продолжение: готово шардов {len(state.done)} из {len(shards)}")
+    else:
+        output.reset(0)
+        state.start()
+    pending = [(i, rows) for i, rows in shards if i not in state.done]
+
+    def arguments(rows):
+        return (foundations["ids"][rows], foundations["positions"][rows], foundations["dimensions"][rows],
+                foundations["load_values"][rows], foundations["load_types"][rows], grid)
+
+    begin = time.perf_counter()
+    computed = 0
+
+    def record(shard, rows, columns):
+        nonlocal computed
+        state.mark(shard, output.write(shard, columns))
+        computed += rows.stop - rows.start
+        progress(f"Шардов {len(state.done)}/{len(shards)}, фундаментов в этом запуске {computed}, "
+                 f"{time.perf_counter() - begin:.1f} с")
+
+    if max_workers == 0:
+        for shard, rows in pending:
+            record(shard, rows, shard_stress(*arguments(rows)))
+        return computed
+
+    max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+    # В работе держится ограниченное число шардов: память не растёт с размером входа
+    with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        queue = iter(pending)
+        running = {}
+        while True:
+            while len(running) < 2 * max_workers:
+                item = next(queue, None)
+                if item is None:
+                    break
+                running[executor.submit(shard_stress, *arguments(item[1]))] = item
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                shard, rows = running.pop(future)
+                record(shard, rows, future.result())
+    return computed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный расчёт напряжений в фундаментах (CSV/YAML -> CSV/Parquet)")
+    parser.add_argument("input", help="CSV или YAML с фундаментами")
+    parser.add_argument("-o", "--output", required=True, help="файл .csv или каталог .parquet")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов (0 — без пула)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--grid", type=int, nargs=3, default=list(DEFAULT_GRID), metavar=("NX", "NY", "NZ"))
+    parser.add_argument("--resume", action="store_true", help="продолжить прерванный прогон")
+    args = parser.parse_args(argv)
+
+    try:
+        computed = run_batch(args.input, args.output, shard_size=args.shard_size, max_workers=args.workers,
+                             grid=tuple(args.grid), resume=args.resume)
+    except (BatchInputError, ImportError, OSError) as e:
+        parser.exit(2, f"Ошибка: {e}\n")
+    print(f"Готово: {computed} фундаментов -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,492 @@
+# core/elastic_solver.py
+"""
+Встроенный линейно-упругий МКЭ-решатель на тетраэдрах (SciPy sparse).
+
+Быстрая альтернатива Code_Aster для типовых задач «фундамент + грунт»:
+без внешнего процесса, файлов и установки. Матрица жёсткости собирается
+векторно: матрицы элементов K_e = V · Bᵀ D B считаются einsum по пачкам
+элементов, каждая пачка сворачивается из COO в CSR и прибавляется к
+общей матрице — память ограничена размером пачки, а не числом элементов.
+
+Закрепления по умолчанию — как у массива грунта: основание закреплено
+полностью, боковые грани — по нормали. Система решается методом
+сопряжённых градиентов с диагональным предобуславливателем или, для
+небольших сеток, прямым методом (разложение LU хранится и
+переиспользуется для новых нагрузок). Напряжения — постоянные по элементу, в нотации
+Фойгта (xx, yy, zz, yz, xz, xy), растяжение положительно.
+
+Нагрузка прикладывается к верху фундамента так же, как в интерфейсе:
+равномерная, точечная в центре, точечная в углу, линейная вдоль X
+(см. stress_engine.LOAD_TYPES); собственный вес не учитывается —
+результат соответствует приращению от нагрузки.
+"""
+import itertools
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .foundation_mesher import MATERIAL_FOUNDATION, MATERIAL_SOIL
+from .result_cache import cache_key
+from .stress_calculator import isotropic_stiffness
+from .stress_engine import (LOAD_LINEAR, LOAD_POINT_CENTER, LOAD_POINT_CORNER, LOAD_TYPES, LOAD_UNIFORM,
+                            load_type_codes)
+
+# Версия решателя: при изменении расчёта её нужно увеличить, чтобы сбросить кеш результатов
+SOLVER_VERSION = "elastic_solver/1"
+
+# Бетон фундамента по умолчанию (E, Па; nu)
+DEFAULT_FOUNDATION_PARAMS = {"E": 30e9, "nu": 0.2}
+
+# Элементов в одной пачке сборки: ~150 МБ временных массивов
+ASSEMBLY_CHUNK = 100_000
+
+# Наибольшее число неизвестных для прямого метода при method="auto".
+# SuperLU на трёхмерных сетках даёт большое заполнение: уже при ~25 тыс.
+# неизвестных разложение идёт десятки секунд, а CG сходится за доли секунды
+DIRECT_DOF_LIMIT = 5_000
+
+# Наименьшее число неизвестных для блочного CG на пачке нагрузок. На малых
+# сетках матрица помещается в кеш, умножение на блок почти не дешевле k
+# умножений на вектор, и плотные операции с блоком делают его медленнее
+BLOCK_CG_MIN_DOFS = 50_000
+
+DEFAULT_RTOL = 1e-8
+
+
+def structured_box_mesh(bounds, shape):
+    """
+    Тетраэдральная сетка бруска bounds = (x0, x1, y0, y1, z0, z1) из
+    решётки shape = (nx, ny, nz) шестигранников (см. grid_mesh).
+    """
+    return grid_mesh(*[np.linspace(bounds[2 * k], bounds[2 * k + 1], count + 1) for k, count in enumerate(shape)])
+
+
+def grid_mesh(xs, ys, zs):
+    """
+    Тетраэдральная сетка решётки с узлами xs x ys x zs (шаг может быть
+    переменным): каждый шестигранник делится на 6 тетраэдров вдоль главной
+    диагонали, сетка конформна. Для проверок и тестов производительности без Gmsh.
+    """
+    nx, ny, nz = len(xs) - 1, len(ys) - 1, len(zs) - 1
+    nodes = np.stack(np.meshgrid(xs, ys, zs, indexing="ij"), axis=-1).reshape(-1, 3).astype(np.float64)
+
+    strides = np.array([(ny + 1) * (nz + 1), nz + 1, 1])
+    origins = np.stack(np.meshgrid(np.arange(nx), np.arange(ny), np.arange(nz), indexing="ij"),
+                       axis=-1).reshape(-1, 3) @ strides
+
+    tetrahedra = []
+    for order in itertools.permutations(range(3)):
+        # Путь по рёбрам от угла (0, 0, 0) к (1, 1, 1)
+        corner = np.zeros(3, dtype=np.int64)
+        path = [0]
+        for axis in order:
+            corner[axis] = 1
+            path.append(int(corner @ strides))
+        tetrahedra.append(origins[:, np.newaxis] + np.array(path))
+    tetrahedra = np.concatenate(tetrahedra)
+    return nodes, _orient(nodes, tetrahedra)
+
+
+def tetra_gradients(nodes, tetrahedra):
+    """Градиенты функций формы (m, 4, 3) и объёмы (m,) линейных тетраэдров"""
+    corners = nodes[tetrahedra]
+    edges = corners[:, 1:] - corners[:, :1]
+    determinants = np.linalg.det(edges)
+    if np.any(determinants == 0):
+        raise ValueError(f"Вырожденные тетраэдры: {np.flatnonzero(determinants == 0)[:10].tolist()}")
+    gradients = np.empty((len(tetrahedra), 4, 3))
+    gradients[:, 1:] = np.linalg.inv(edges).transpose(0, 2, 1)
+    gradients[:, 0] = -gradients[:, 1:].sum(axis=1)
+    return gradients, np.abs(determinants) / 6
+
+
+def strain_displacement(gradients):
+    """Матрицы B (m, 6, 12): деформации Фойгта по перемещениям узлов (u, v, w)"""
+    gx, gy, gz = gradients[:, :, 0], gradients[:, :, 1], gradients[:, :, 2]
+    b = np.zeros((len(gradients), 6, 12))
+    b[:, 0, 0::3] = gx
+    b[:, 1, 1::3] = gy
+    b[:, 2, 2::3] = gz
+    b[:, 3, 1::3], b[:, 3, 2::3] = gz, gy
+    b[:, 4, 0::3], b[:, 4, 2::3] = gz, gx
+    b[:, 5, 0::3], b[:, 5, 1::3] = gy, gx
+    return b
+
+
+def element_dofs(tetrahedra):
+    """Номера степеней свободы элементов (m, 12)"""
+    return (3 * tetrahedra[:, :, np.newaxis] + np.arange(3)).reshape(-1, 12)
+
+
+def assemble_stiffness(nodes, tetrahedra, materials, elasticity, chunk_size=ASSEMBLY_CHUNK):
+    """
+    Глобальная матрица жёсткости CSR (3n, 3n).
+    materials — номер материала элемента, elasticity — матрицы D (k, 6, 6).
+    """
+    n_dofs = 3 * len(nodes)
+    index_type = np.int32 if n_dofs < 2 ** 31 else np.int64
+    elasticity = np.asarray(elasticity, dtype=np.float64).reshape(-1, 6, 6)
+    stiffness = sp.csr_matrix((n_dofs, n_dofs))
+    for begin in range(0, len(tetrahedra), chunk_size):
+        chunk = slice(begin, begin + chunk_size)
+        gradients, volumes = tetra_gradients(nodes, tetrahedra[chunk])
+        b = strain_displacement(gradients)
+        d = elasticity[materials[chunk]]
+        matrices = np.einsum("mia,mij,mjb->mab", b, d, b, optimize=True) * volumes[:, np.newaxis, np.newaxis]
+        dofs = element_dofs(tetrahedra[chunk]).astype(index_type)
+        rows = np.repeat(dofs, 12, axis=1).ravel()
+        cols = np.tile(dofs, (1, 12)).ravel()
+        stiffness = stiffness + sp.coo_matrix((matrices.ravel(), (rows, cols)), shape=(n_dofs, n_dofs)).tocsr()
+    return stiffness
+
+
+def box_constraints(nodes, tolerance=None):
+    """
+    Закрепления массива грунта (n, 3): основание — по всем направлениям,
+    боковые грани — по нормали (x или y).
+    """
+    low, high = nodes.min(axis=0), nodes.max(axis=0)
+    tolerance = tolerance if tolerance is not None else 1e-9 * np.max(high - low)
+    constrained = np.zeros(nodes.shape, dtype=bool)
+    constrained[np.abs(nodes[:, 2] - low[2]) <= tolerance] = True
+    for axis in (0, 1):
+        constrained[:, axis] |= (np.abs(nodes[:, axis] - low[axis]) <= tolerance) | \
+            (np.abs(nodes[:, axis] - high[axis]) <= tolerance)
+    return constrained
+
+
+def top_faces(nodes, tetrahedra, elements=None, tolerance=None):
+    """Треугольники (k, 3) верхней грани выбранных элементов (z = max z их узлов)"""
+    tetrahedra = tetrahedra if elements is None else tetrahedra[elements]
+    z = nodes[:, 2]
+    z_top = z[tetrahedra].max()
+    tolerance = tolerance if tolerance is not None else 1e-9 * np.ptp(z)
+    faces = tetrahedra[:, [[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]]].reshape(-1, 3)
+    return faces[np.all(np.abs(z[faces] - z_top) <= tolerance, axis=1)]
+
+
+def surface_forces(nodes, faces, pressures):
+    """
+    Узловые силы (n, 3) от давления на треугольники (вниз, по -z).
+    Давление постоянно по треугольнику и делится поровну между его узлами.
+    """
+    triangles = nodes[faces]
+    areas = np.linalg.norm(np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]),
+                           axis=1) / 2
+    forces = np.zeros(nodes.shape)
+    np.add.at(forces[:, 2], faces.ravel(), -np.repeat(areas * pressures / 3, 3))
+    return forces
+
+
+def foundation_loads(nodes, tetrahedra, materials, load_value, load_type):
+    """
+    Узловые силы (n, 3) от нагрузки load_value (Н) на верх фундамента
+    (или всей сетки, если фундамента нет) — по типу нагрузки интерфейса.
+    """
+    code = int(load_type_codes(load_type)[0])
+    loaded = materials == MATERIAL_FOUNDATION
+    faces = top_faces(nodes, tetrahedra, loaded if loaded.any() else None)
+    face_nodes = np.unique(faces)
+    low, high = nodes[face_nodes].min(axis=0), nodes[face_nodes].max(axis=0)
+    forces = np.zeros(nodes.shape)
+
+    if code in (LOAD_TYPES.index(LOAD_POINT_CENTER), LOAD_TYPES.index(LOAD_POINT_CORNER)):
+        target = (low + high) / 2 if code == LOAD_TYPES.index(LOAD_POINT_CENTER) else low
+        nearest = face_nodes[np.argmin(np.linalg.norm(nodes[face_nodes, :2] - target[:2], axis=1))]
+        forces[nearest, 2] = -load_value
+        return forces
+
+    if code == LOAD_TYPES.index(LOAD_UNIFORM):
+        pressures = np.ones(len(faces))
+    elif code == LOAD_TYPES.index(LOAD_LINEAR):
+        # Давление растёт линейно вдоль X от нуля до максимума
+        centers_x = nodes[faces, 0].mean(axis=1)
+        pressures = (centers_x - low[0]) / max(high[0] - low[0], 1e-12)
+    else:
+        return forces
+    forces = surface_forces(nodes, faces, pressures)
+    total = -forces[:, 2].sum()
+    return forces * (load_value / total) if total > 0 else forces
+
+
+def element_stresses(nodes, tetrahedra, materials, elasticity, displacements, chunk_size=ASSEMBLY_CHUNK):
+    """Напряжения Фойгта в элементах (m, 6) или (k, m, 6) по перемещениям (n, 3) или (k, n, 3)"""
+    displacements = np.asarray(displacements, dtype=np.float64)
+    stacked = displacements.ndim == 3
+    displacements = displacements.reshape(-1, len(nodes), 3)
+    stresses = np.empty((len(displacements), len(tetrahedra), 6))
+    for begin in range(0, len(tetrahedra), chunk_size):
+        chunk = slice(begin, begin + chunk_size)
+        gradients, _volumes = tetra_gradients(nodes, tetrahedra[chunk])
+        # Градиент перемещений H_ij = du_i / dx_j
+        h = np.einsum("kmai,maj->kmij", displacements[:, tetrahedra[chunk]], gradients)
+        strains = np.stack((h[..., 0, 0], h[..., 1, 1], h[..., 2, 2], h[..., 1, 2] + h[..., 2, 1],
+                            h[..., 0, 2] + h[..., 2, 0], h[..., 0, 1] + h[..., 1, 0]), axis=-1)
+        stresses[:, chunk] = np.einsum("mij,kmj->kmi", elasticity[materials[chunk]], strains)
+    return stresses if stacked else stresses[0]
+
+
+def von_mises(stresses):
+    """Эквивалентные напряжения по Мизесу для напряжений Фойгта (..., 6)"""
+    s = stresses
+    return np.sqrt(0.5 * ((s[..., 0] - s[..., 1]) ** 2 + (s[..., 1] - s[..., 2]) ** 2 + (s[..., 2] - s[..., 0]) ** 2)
+                   + 3 * (s[..., 3] ** 2 + s[..., 4] ** 2 + s[..., 5] ** 2))
+
+
+class ElasticSolver:
+    """
+    Собранная и подготовленная к решению задача: сетка, материалы и
+    закрепления. Разложение (или предобуславливатель) строится один раз,
+    solve() можно вызывать для любого числа нагрузок.
+    """
+
+    def __init__(self, nodes, tetrahedra, materials=None, elasticity=None, constrained=None, method="auto",
+                 rtol=DEFAULT_RTOL, maxiter=None):
+        self.nodes = np.asarray(nodes, dtype=np.float64)
+        self.tetrahedra = np.asarray(tetrahedra, dtype=np.int64)
+        self.materials = np.zeros(len(self.tetrahedra), dtype=np.int64) if materials is None \
+            else np.asarray(materials, dtype=np.int64)
+        if elasticity is None:
+            raise ValueError("Нужно задать матрицы упругости материалов")
+        self.elasticity = np.asarray(elasticity, dtype=np.float64).reshape(-1, 6, 6)
+        self.constrained = box_constraints(self.nodes) if constrained is None else np.asarray(constrained, bool)
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.iterations = []
+
+        # Хранится только матрица по свободным неизвестным: полная матрица после выборки не нужна
+        self.free = np.flatnonzero(~self.constrained.ravel())
+        stiffness = assemble_stiffness(self.nodes, self.tetrahedra, self.materials, self.elasticity)
+        self.stiffness = stiffness[self.free][:, self.free]
+        del stiffness
+
+        if method == "auto":
+            method = "direct" if len(self.free) <= DIRECT_DOF_LIMIT else "cg"
+        if method not in ("direct", "cg"):
+            raise ValueError(f"Неизвестный метод решения: {method}")
+        self.method = method
+        if method == "direct":
+            self._lu = spla.splu(self.stiffness.tocsc())
+        else:
+            self._inverse_diagonal = 1.0 / self.stiffness.diagonal()
+            self._preconditioner = sp.diags(self._inverse_diagonal)
+
+    @property
+    def n_dofs(self):
+        return len(self.free)
+
+    def solve(self, forces):
+        """
+        Перемещения узлов для узловых сил (n, 3) — результат (n, 3) — или
+        для пачки нагрузок (k, n, 3) — результат (k, n, 3).
+        Прямой метод решает пачку одним вызовом с сохранённым разложением LU.
+        Метод CG разложения не хранит и каждый вызов solve() итерирует с
+        нуля: пачка на сетках от BLOCK_CG_MIN_DOFS неизвестных решается
+        блочным CG (_block_cg), на меньших — по столбцам.
+        """
+        forces = np.asarray(forces, dtype=np.float64)
+        stacked = forces.ndim == 3
+        rhs = forces.reshape(-1, forces.shape[-2] * 3)[:, self.free].T  # (свободные, k)
+
+        if self.method == "direct":
+            solution = self._lu.solve(np.ascontiguousarray(rhs))
+        elif rhs.shape[1] > 1 and self.n_dofs >= BLOCK_CG_MIN_DOFS:
+            solution = self._block_cg(rhs)
+        else:
+            solution = np.empty_like(rhs)
+            for column in range(rhs.shape[1]):
+                iterations = [0]
+
+                def count(_x):
+                    iterations[0] += 1
+                solution[:, column], info = spla.cg(self.stiffness, rhs[:, column], M=self._preconditioner,
+                                                    rtol=self.rtol, maxiter=self.maxiter, callback=count)
+                if info > 0:
+                    raise RuntimeError(f"Метод сопряжённых градиентов не сошёлся за {info} итераций")
+                self.iterations.append(iterations[0])
+
+        displacements = np.zeros((rhs.shape[1], self.nodes.size))
+        displacements[:, self.free] = solution.T
+        displacements = displacements.reshape(-1, len(self.nodes), 3)
+        return displacements if stacked else displacements[0]
+
+    def _block_cg(self, rhs):
+        """
+        Блочный метод сопряжённых градиентов для правых частей (свободные, k):
+        все столбцы решаются вместе, за итерацию — одно умножение матрицы
+        на блок (k столбцов за один проход по матрице), а общее подпространство
+        поиска сокращает число итераций. Плотные операции с блоком растут
+        как k², поэтому выигрыш против k отдельных CG ограничен: на одном
+        ядре ~15% при 140 тыс. неизвестных и k = 5 (см. BLOCK_CG_MIN_DOFS).
+        Направления ортогонализуются с отбрасыванием линейно зависимых
+        (вариант без вырождения, Ji & Li), поэтому совпадающие или
+        пропорциональные нагрузки не ломают итерации.
+        """
+        maxiter = self.maxiter or 10 * rhs.shape[0]
+        tolerance = (self.rtol ** 2) * _column_norms2(rhs)
+        solution = np.zeros_like(rhs)
+        residual = rhs.copy()
+        if np.all(_column_norms2(residual) <= tolerance):
+            return solution
+        scale = self._inverse_diagonal[:, np.newaxis]
+        directions = _orthonormal_columns(scale * residual)
+        for iteration in range(1, maxiter + 1):
+            product = self.stiffness @ directions
+            gram = directions.T @ product
+            step = np.linalg.solve(gram, directions.T @ residual)
+            solution += directions @ step
+            residual -= product @ step
+            if np.all(_column_norms2(residual) <= tolerance):
+                self.iterations.append(iteration)
+                return solution
+            preconditioned = scale * residual
+            directions = _orthonormal_columns(preconditioned
+                                              - directions @ np.linalg.solve(gram, product.T @ preconditioned))
+            if directions.shape[1] == 0:
+                break
+        raise RuntimeError(f"Блочный метод сопряжённых градиентов не сошёлся за {maxiter} итераций")
+
+    def element_stresses(self, displacements):
+        """Напряжения в элементах (m, 6) или (k, m, 6) по перемещениям solve()"""
+        return element_stresses(self.nodes, self.tetrahedra, self.materials, self.elasticity, displacements)
+
+
+def _column_norms2(block):
+    """Квадраты норм столбцов блока (n, k)"""
+    return np.einsum("ij,ij->j", block, block)
+
+
+def _orthonormal_columns(block, rtol=1e-10):
+    """
+    Ортонормированный базис столбцов блока (n, k) без почти линейно
+    зависимых направлений: по собственным векторам матрицы Грама k x k,
+    без разложения самого высокого блока.
+    """
+    values, vectors = np.linalg.eigh(block.T @ block)
+    keep = values > rtol * max(values[-1], 0.0) if len(values) and values[-1] > 0 else np.zeros(len(values), bool)
+    return block @ (vectors[:, keep] / np.sqrt(values[keep]))
+
+
+class ElasticResult:
+    """Результат расчёта: перемещения узлов и напряжения элементов"""
+
+    def __init__(self, nodes, tetrahedra, materials, displacements, stresses, origin=(0.0, 0.0, 0.0)):
+        self.nodes = nodes
+        self.tetrahedra = tetrahedra
+        self.materials = materials
+        self.displacements = displacements
+        self.stresses = stresses
+        self.origin = np.asarray(origin, dtype=np.float64)
+
+    @property
+    def von_mises(self):
+        return von_mises(self.stresses)
+
+    def to_pyvista(self):
+        import pyvista as pv
+
+        cells = np.empty((len(self.tetrahedra), 5), dtype=np.int64)
+        cells[:, 0] = 4
+        cells[:, 1:] = self.tetrahedra
+        grid = pv.UnstructuredGrid(cells.ravel(), np.full(len(self.tetrahedra), pv.CellType.TETRA, dtype=np.uint8),
+                                   self.nodes + self.origin)
+        grid.point_data["displacement"] = self.displacements
+        grid.cell_data["stress"] = self.stresses
+        grid.cell_data["von_mises"] = self.von_mises
+        grid.cell_data["material"] = self.materials
+        return grid
+
+
+def material_elasticity(material_params, foundation_params=None):
+    """Матрицы D (2, 6, 6) для материалов MATERIAL_SOIL и MATERIAL_FOUNDATION"""
+    foundation_params = foundation_params or DEFAULT_FOUNDATION_PARAMS
+    elasticity = np.empty((2, 6, 6))
+    elasticity[MATERIAL_SOIL] = isotropic_stiffness(material_params["E"], material_params["nu"])
+    elasticity[MATERIAL_FOUNDATION] = isotropic_stiffness(foundation_params["E"], foundation_params["nu"])
+    return elasticity
+
+
+def elastic_cache_key(mesh, material_params, foundation_params, load_value, load_type):
+    mesh_part = mesh.key if getattr(mesh, "key", None) else (mesh.nodes, mesh.tetrahedra, mesh.materials)
+    return cache_key(SOLVER_VERSION, mesh_part, dict(material_params), dict(foundation_params or {}),
+                     float(load_value), int(load_type_codes(load_type)[0]))
+
+
+def run_elastic_analysis(mesh, material_params, load_value, load_type=LOAD_UNIFORM, foundation_params=None,
+                         method="auto", cache=None):
+    """
+    Встроенный расчёт сетки «фундамент + грунт» без Code_Aster
+    (параметры — как у fem_solver.run_geotech_analysis).
+    mesh — core.foundation_mesher.FoundationMesh (или объект с nodes,
+    tetrahedra, materials); material_params — {"E", "nu"} грунта;
+    foundation_params — то же для фундамента (по умолчанию бетон).
+    С cache (core.result_cache.ResultCache) перемещения повторного
+    расчёта берутся из кеша. Возвращает ElasticResult.
+    """
+    nodes = np.asarray(mesh.nodes, dtype=np.float64)
+    tetrahedra = np.asarray(mesh.tetrahedra, dtype=np.int64)
+    materials = np.asarray(mesh.materials, dtype=np.int64)
+    elasticity = material_elasticity(material_params, foundation_params)
+    origin = getattr(mesh, "origin", (0.0, 0.0, 0.0))
+
+    key = None
+    if cache is not None:
+        key = elastic_cache_key(mesh, material_params, foundation_params, load_value, load_type)
+        displacements = cache.get(key)
+        if displacements is not None:
+            stresses = element_stresses(nodes, tetrahedra, materials, elasticity, displacements)
+            return ElasticResult(nodes, tetrahedra, materials, displacements, stresses, origin)
+
+    solver = ElasticSolver(nodes, tetrahedra, materials, elasticity, method=method)
+    displacements = solver.solve(foundation_loads(nodes, tetrahedra, materials, load_value, load_type))
+    if cache is not None:
+        displacements = cache.put(key, displacements)
+    return ElasticResult(nodes, tetrahedra, materials, displacements, solver.element_stresses(displacements),
+                         origin)
+
+
+def run_elastic_load_cases(mesh, material_params, cases, foundation_params=None, method="auto", cache=None):
+    """
+    Пакет расчётных случаев (core.load_cases.LoadCases) на одной сетке:
+    матрица собирается один раз, нагрузки единичной величины всех типов
+    решаются вместе как матричная правая часть, а случаи получаются
+    умножением на величину (задача линейна). Прямой метод (до
+    DIRECT_DOF_LIMIT неизвестных при method="auto") переиспользует одно
+    разложение LU; с методом CG разложения нет, и пачка решается блочным
+    CG или по столбцам (см. ElasticSolver.solve).
+    Возвращает LoadCaseResults с полями displacement (k, n, 3),
+    stress (k, m, 6) и von_mises (k, m).
+    """
+    from .load_cases import LoadCaseResults
+
+    nodes = np.asarray(mesh.nodes, dtype=np.float64)
+    tetrahedra = np.asarray(mesh.tetrahedra, dtype=np.int64)
+    materials = np.asarray(mesh.materials, dtype=np.int64)
+    elasticity = material_elasticity(material_params, foundation_params)
+    types, inverse = cases.unit_types()
+
+    # Единичные решения кешируются по типу нагрузки: другой набор величин их не меняет
+    keys = [elastic_cache_key(mesh, material_params, foundation_params, 1.0, code) for code in types.tolist()] \
+        if cache is not None else [None] * len(types)
+    unit = [cache.get(key) if key is not None else None for key in keys]
+    missing = [i for i, displacements in enumerate(unit) if displacements is None]
+    if missing:
+        solver = ElasticSolver(nodes, tetrahedra, materials, elasticity, method=method)
+        forces = np.stack([foundation_loads(nodes, tetrahedra, materials, 1.0, int(types[i])) for i in missing])
+        for i, displacements in zip(missing, solver.solve(forces)):
+            unit[i] = cache.put(keys[i], displacements) if cache is not None else displacements
+
+    unit = np.stack(unit)
+    unit_stresses = element_stresses(nodes, tetrahedra, materials, elasticity, unit)
+    stresses = cases.scale(unit_stresses, inverse)
+    return LoadCaseResults(cases, {"displacement": cases.scale(unit, inverse), "stress": stresses,
+                                   "von_mises": von_mises(stresses)})
+
+
+def _orient(nodes, tetrahedra):
+    """Перестановка узлов тетраэдров с отрицательным объёмом"""
+    corners = nodes[tetrahedra]
+    negative = np.linalg.det(corners[:, 1:] - corners[:, :1]) < 0
+    tetrahedra[negative] = tetrahedra[negative][:, [0, 2, 1, 3]]
+    return tetrahedra
@@ -0,0 +1,163 @@
+# core/fem_solver.py
+import asyncio
+import os
+import shutil
+
+from .aster_runner import AsterJobRunner, AsterJobError, DONE, RESULT_FILE
+from .med_reader import MedResultReader
+from .result_cache import ResultCache, cache_key, file_digest
+
+# Имя сетки в рабочем каталоге задания: Code_Aster читает UNITE=20 из fort.20
+MESH_FILE = "fort.20"
+
+
+def build_comm_file(material_params):
+    """Командный файл Code_Aster для геотехнического расчёта"""
+    return f"""
+    DEBUT(LANG='RU')
+    MAIL = LIRE_MAILLAGE(FORMAT='MED', UNITE=20)
+    MAT = DEFI_MATERIAU(ELAS=_F(E={material_params['E']}, NU={material_params['nu']}))
+    ...
+    FIN()
+    """
+
+
+def aster_solver_version(aster_executable=None):
+    """
+    Версия решателя для кеша результатов: версия Code_Aster из ASTER_VERSION
+    и отпечаток исполняемого файла (путь, размер, время изменения).
+    После переустановки Code_Aster кеш результатов сбрасывается.
+    """
+    executable = aster_executable or os.environ.get("ASTER_EXECUTABLE", "aster")
+    path = shutil.which(executable) or executable
+    try:
+        stat = os.stat(path)
+        fingerprint = f"{os.path.abspath(path)}:{stat.st_size}:{int(stat.st_mtime)}"
+    except OSError:
+        fingerprint = executable
+    return f"{os.environ.get('ASTER_VERSION', '')}|{fingerprint}"
+
+
+def aster_result_cache(aster_executable=None, **kwargs):
+    """Дисковый кеш файлов результатов Code_Aster для текущей версии решателя"""
+    return ResultCache("aster_results", aster_solver_version(aster_executable), **kwargs)
+
+
+class StoredResult:
+    """Файлы результатов вне рабочего каталога задания: тот же интерфейс чтения, что у AsterJob"""
+
+    status = DONE
+
+    def __init__(self, job_id, result_files):
+        self.job_id = job_id
+        self.result_files = dict(result_files)
+
+    def result_path(self, name=RESULT_FILE):
+        return self.result_files.get(name)
+
+
+class CachedResult(StoredResult):
+    """Результат, взятый из кеша"""
+
+    def __init__(self, key, result_files):
+        super().__init__(f"cache:{key[:12]}", result_files)
+
+
+def save_results(job, output_dir, prefix):
+    """Копирование файлов результатов задания в output_dir под именами «prefix.имя»"""
+    os.makedirs(output_dir, exist_ok=True)
+    saved = {}
+    for name, path in job.result_files.items():
+        saved[name] = os.path.join(output_dir, f"{prefix}.{name}")
+        shutil.copyfile(path, saved[name])
+    return StoredResult(job.job_id, saved)
+
+
+async def run_geotech_analysis_async(geom_file, material_params, runner=None, timeout=None, label=None,
+                                     cache=None, output_dir=None):
+    """
+    Интеграция с Code_Aster (открытый МКЭ-решатель), асинхронный вариант.
+    Несколько расчётов можно запускать параллельно через общий runner;
+    тогда возвращается завершённое задание AsterJob (файл результатов —
+    job.result_path()), а его рабочий каталог удаляет вызывающий через
+    runner.forget(job.job_id).
+    Без runner расчёт идёт во временном runner: файлы результатов копируются
+    в output_dir (по умолчанию — каталог geom_file) под именами
+    «<имя сетки>.<имя файла>», рабочий каталог удаляется и возвращается
+    StoredResult с путями к копиям.
+    С cache (см. aster_result_cache) повторный расчёт той же сетки с теми же
+    параметрами материала не запускается: возвращается CachedResult.
+    """
+    if cache is not None:
+        comm_text = build_comm_file(material_params)
+        key = cache_key(file_digest(geom_file), comm_text, dict(material_params))
+        cached_path = cache.get_file(key, ".rmed")
+        if cached_path is not None:
+            return CachedResult(key, {RESULT_FILE: cached_path})
+
+    own_runner = runner is None
+    if own_runner:
+        runner = AsterJobRunner(max_workers=1)
+    try:
+        job = await runner.run(
+            build_comm_file(material_params),
+            input_files={MESH_FILE: geom_file},
+            result_files=(RESULT_FILE,),
+            timeout=timeout,
+            label=label or geom_file,
+        )
+        if job.status != DONE:
+            raise AsterJobError(job)
+        if cache is not None:
+            cache.put_file(key, job.result_path(), ".rmed")
+        if not own_runner:
+            return job
+        prefix = os.path.splitext(os.path.basename(geom_file))[0]
+        return save_results(job, output_dir or os.path.dirname(os.path.abspath(geom_file)), prefix)
+    finally:
+        if own_runner:
+            for job_id in list(runner.jobs):
+                runner.forget(job_id)
+
+
+def run_geotech_analysis(geom_file, material_params, timeout=None, cache=None, output_dir=None):
+    """
+    Интеграция с Code_Aster (открытый МКЭ-решатель). Результаты копируются
+    в output_dir (см. run_geotech_analysis_async), временных каталогов не остаётся.
+    """
+    return asyncio.run(run_geotech_analysis_async(geom_file, material_params, timeout=timeout, cache=cache,
+                                                  output_dir=output_dir))
+
+
+def open_results(job, name=RESULT_FILE):
+    """
+    Ленивое чтение результатов завершённого задания (MED/HDF5).
+    Данные не загружаются: поля и шаги читаются по запросу через MedResultReader.
+    """
+    path = job.result_path(name)
+    if path is None:
+        raise FileNotFoundError(f"Задание {job.job_id}: нет файла результатов {name}")
+    return MedResultReader(path)
+
+
+async def run_load_cases(geom_file, material_cases, max_workers=None, timeout=None, on_status=None):
+    """
+    Параллельный расчёт нескольких вариантов параметров на одной сетке.
+    Рабочие каталоги заданий остаются для чтения результатов: после
+    обработки их удаляет вызывающий (job.cleanup()).
+    """
+    runner = AsterJobRunner(max_workers=max_workers, timeout=timeout, on_status=on_status)
+    jobs = [runner.submit(build_comm_file(params), input_files={MESH_FILE: geom_file}, label=str(i))
+            for i, params in enumerate(material_cases)]
+    await runner.wait_all()
+    return jobs
+
+
+# В GUI: при нажатии кнопки "Рассчитать"
+if __name__ == "__main__":
+    job = run_geotech_analysis("foundation.med", {"E": 210e9, "nu": 0.3}, cache=aster_result_cache())
+    with open_results(job) as results:
+        for field in results.fields():
+            low, high = results.reduce(field["name"])
+            print(f"{field['name']}: {', '.join(field['components'])}, шагов {field['n_steps']}, "
+                  f"min {low.min():.3g}, max {high.max():.3g}")
@@ -0,0 +1,319 @@
+# core/foundation_mesher.py
+"""
+Построение тетраэдральных сеток «фундамент + грунт» через Gmsh.
+
+Фундамент (брус по размерам из FoundationTable) стоит на массиве грунта,
+выступающем за подошву на soil_margin её размеров в стороны и на
+soil_depth её ширины вниз. Объёмы сшиваются (fragment), поэтому сетка
+конформна на контакте. Размер элементов задаётся полем расстояния до
+рёбер и углов фундамента: size_near у рёбер, size_far вдали.
+
+Сетка строится в локальных координатах: подошва в плоскости z = 0,
+центр подошвы в начале координат (origin — положение в проекте). Поэтому
+одинаковые фундаменты в разных местах получают одну сетку из кеша, а
+совпадающие MED-файлы — и один результат Code_Aster (см. fem_solver).
+
+Gmsh не потокобезопасен и держит глобальное состояние, поэтому каждая
+сетка строится в отдельном процессе пула (FoundationMesher). Группы
+MED: объёмы SOIL, FOUNDATION; поверхности BOTTOM (основание массива),
+SIDES (боковые грани массива), TOP (верх фундамента под нагрузку).
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+
+from .result_cache import ResultCache, cache_key
+
+# Версия построения сеток: при изменении алгоритма её нужно увеличить, чтобы сбросить кеш
+MESHER_VERSION = "foundation_mesher/1"
+
+# Материалы ячеек
+MATERIAL_SOIL = 0
+MATERIAL_FOUNDATION = 1
+
+# Размеры массива грунта относительно фундамента
+DEFAULT_SOIL_MARGIN = 1.5   # в размерах подошвы с каждой стороны
+DEFAULT_SOIL_DEPTH = 2.0    # в ширинах подошвы вниз
+
+# Размеры элементов относительно меньшей стороны подошвы
+DEFAULT_SIZE_NEAR = 0.1
+DEFAULT_SIZE_FAR = 0.75
+
+MESH_OPTIONS = ("soil_margin", "soil_depth", "size_near", "size_far")
+
+# Тип элемента Gmsh: линейный тетраэдр
+_GMSH_TETRAHEDRON = 4
+
+
+class FoundationMesh:
+    """Тетраэдральная сетка фундамента с грунтом в локальных координатах"""
+
+    def __init__(self, key, nodes, tetrahedra, materials, med_file=None, origin=(0.0, 0.0, 0.0)):
+        self.key = key
+        self.nodes = nodes
+        self.tetrahedra = tetrahedra
+        self.materials = materials
+        self.med_file = med_file
+        self.origin = np.asarray(origin, dtype=np.float64)
+
+    @property
+    def n_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def n_elements(self):
+        return len(self.tetrahedra)
+
+    def world_nodes(self):
+        """Узлы в координатах проекта"""
+        return self.nodes + self.origin
+
+    def placed(self, origin):
+        """Та же сетка в другом месте проекта (массивы не копируются)"""
+        return FoundationMesh(self.key, self.nodes, self.tetrahedra, self.materials, self.med_file, origin)
+
+    def to_pyvista(self):
+        import pyvista as pv
+
+        cells = np.empty((self.n_elements, 5), dtype=np.int64)
+        cells[:, 0] = 4
+        cells[:, 1:] = self.tetrahedra
+        grid = pv.UnstructuredGrid(cells.ravel(), np.full(self.n_elements, pv.CellType.TETRA, dtype=np.uint8),
+                                   self.world_nodes())
+        grid.cell_data["material"] = self.materials
+        return grid
+
+
+def mesh_options(dimensions, **options):
+    """Параметры сетки с абсолютными размерами элементов (для ключа кеша и построения)"""
+    unknown = set(options) - set(MESH_OPTIONS)
+    if unknown:
+        raise TypeError(f"Неизвестные параметры сетки: {sorted(unknown)}")
+    footprint = min(dimensions[0], dimensions[1])
+    defaults = {
+        "soil_margin": DEFAULT_SOIL_MARGIN,
+        "soil_depth": DEFAULT_SOIL_DEPTH,
+        "size_near": DEFAULT_SIZE_NEAR * footprint,
+        "size_far": DEFAULT_SIZE_FAR * footprint,
+    }
+    # Явный 0 (например, soil_margin=0) — допустимое значение, по умолчанию берётся только None
+    return {name: float(defaults[name] if options.get(name) is None else options[name]) for name in MESH_OPTIONS}
+
+
+def mesh_key(dimensions, **options):
+    """Ключ сетки: размеры фундамента и параметры сетки (положение не входит)"""
+    dimensions = np.asarray(dimensions, dtype=np.float64)
+    return cache_key(MESHER_VERSION, dimensions, mesh_options(dimensions, **options))
+
+
+def build_foundation_mesh(dimensions, options, med_path=None):
+    """
+    Построение сетки в текущем процессе (вызывается в процессе пула).
+    Возвращает узлы (n, 3), тетраэдры (m, 4) и материалы ячеек (m,);
+    с med_path сетка с группами записывается в MED.
+    """
+    import gmsh
+
+    width, length, thickness = (float(value) for value in dimensions)
+    margin_x = options["soil_margin"] * width
+    margin_y = options["soil_margin"] * length
+    depth = options["soil_depth"] * width
+    eps = 1e-6 * max(width, length, depth)
+
+    gmsh.initialize(interruptible=False)
+    try:
+        gmsh.option.setNumber("General.Terminal", 0)
+        gmsh.model.add("foundation")
+        occ = gmsh.model.occ
+        soil = occ.addBox(-width / 2 - margin_x, -length / 2 - margin_y, -depth,
+                          width + 2 * margin_x, length + 2 * margin_y, depth)
+        foundation = occ.addBox(-width / 2, -length / 2, 0.0, width, length, thickness)
+        occ.fragment([(3, soil)], [(3, foundation)])
+        occ.synchronize()
+
+        # После сшивки номера объёмов могут измениться: фундамент — объём выше подошвы
+        soil_volumes, foundation_volumes = [], []
+        for _dim, tag in gmsh.model.getEntities(3):
+            center_z = occ.getCenterOfMass(3, tag)[2]
+            (foundation_volumes if center_z > 0 else soil_volumes).append(tag)
+        gmsh.model.addPhysicalGroup(3, soil_volumes, name="SOIL")
+        gmsh.model.addPhysicalGroup(3, foundation_volumes, name="FOUNDATION")
+
+        x_min, y_min = -width / 2 - margin_x, -length / 2 - margin_y
+        x_max, y_max = -x_min, -y_min
+        bottom = gmsh.model.getEntitiesInBoundingBox(x_min - eps, y_min - eps, -depth - eps,
+                                                     x_max + eps, y_max + eps, -depth + eps, 2)
+        top = gmsh.model.getEntitiesInBoundingBox(-width / 2 - eps, -length / 2 - eps, thickness - eps,
+                                                  width / 2 + eps, length / 2 + eps, thickness + eps, 2)
+        sides = []
+        for bounds in ((x_min, y_min, x_min, y_max), (x_max, y_min, x_max, y_max),
+                       (x_min, y_min, x_max, y_min), (x_min, y_max, x_max, y_max)):
+            sides += gmsh.model.getEntitiesInBoundingBox(bounds[0] - eps, bounds[1] - eps, -depth - eps,
+                                                         bounds[2] + eps, bounds[3] + eps, eps, 2)
+        gmsh.model.addPhysicalGroup(2, [tag for _dim, tag in bottom], name="BOTTOM")
+        gmsh.model.addPhysicalGroup(2, [tag for _dim, tag in sides], name="SIDES")
+        gmsh.model.addPhysicalGroup(2, [tag for _dim, tag in top], name="TOP")
+
+        # Сгущение у рёбер и углов фундамента
+        edges = gmsh.model.getEntitiesInBoundingBox(-width / 2 - eps, -length / 2 - eps, -eps,
+                                                    width / 2 + eps, length / 2 + eps, thickness + eps, 1)
+        corners = gmsh.model.getEntitiesInBoundingBox(-width / 2 - eps, -length / 2 - eps, -eps,
+                                                      width / 2 + eps, length / 2 + eps, thickness + eps, 0)
+        field = gmsh.model.mesh.field
+        distance = field.add("Distance")
+        field.setNumbers(distance, "CurvesList", [tag for _dim, tag in edges])
+        field.setNumbers(distance, "PointsList", [tag for _dim, tag in corners])
+        field.setNumber(distance, "Sampling", 100)
+        threshold = field.add("Threshold")
+        field.setNumber(threshold, "InField", distance)
+        field.setNumber(threshold, "SizeMin", options["size_near"])
+        field.setNumber(threshold, "SizeMax", options["size_far"])
+        field.setNumber(threshold, "DistMin", options["size_near"])
+        field.setNumber(threshold, "DistMax", max(width, length))
+        field.setAsBackgroundMesh(threshold)
+        gmsh.option.setNumber("Mesh.MeshSizeExtendFromBoundary", 0)
+        gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 0)
+        gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
+
+        gmsh.model.mesh.generate(3)
+
+        node_tags, coordinates, _ = gmsh.model.mesh.getNodes()
+        index_of = np.zeros(int(node_tags.max()) + 1, dtype=np.int64)
+        index_of[node_tags.astype(np.int64)] = np.arange(len(node_tags))
+        nodes = coordinates.reshape(-1, 3)
+
+        tetrahedra, materials = [], []
+        for material, volumes in ((MATERIAL_SOIL, soil_volumes), (MATERIAL_FOUNDATION, foundation_volumes)):
+            for volume in volumes:
+                _tags, element_nodes = gmsh.model.mesh.getElementsByType(_GMSH_TETRAHEDRON, volume)
+                elements = index_of[element_nodes.astype(np.int64)].reshape(-1, 4)
+                tetrahedra.append(elements)
+                materials.append(np.full(len(elements), material, dtype=np.int8))
+
+        if med_path is not None:
+            gmsh.option.setNumber("Mesh.SaveAll", 0)
+            gmsh.write(med_path)
+    finally:
+        gmsh.finalize()
+
+    return nodes, np.concatenate(tetrahedra), np.concatenate(materials)
+
+
+class FoundationMesher:
+    """
+    Пул процессов для построения сеток фундаментов с кешем по геометрии.
+    Одинаковые фундаменты (размеры и параметры сетки) строятся один раз,
+    даже если запрошены одновременно.
+    """
+
+    def __init__(self, max_workers=None, cache=None, export_med=True):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.cache = cache if cache is not None else mesh_cache()
+        self.export_med = export_med
+        self._executor = None
+        self._pending = {}  # ключ -> Future сетки в локальных координатах
+        self._workdir = tempfile.mkdtemp(prefix="foundation_meshes_")
+
+    def submit(self, position, dimensions, **options):
+        """Future с FoundationMesh в положении position"""
+        key = mesh_key(dimensions, **options)
+        origin = np.asarray(position, dtype=np.float64) - [0.0, 0.0, dimensions[2] / 2]
+        base = self._pending.get(key)
+        if base is None:
+            base = self._pending[key] = self._submit_key(key, dimensions, mesh_options(dimensions, **options))
+
+        placed = Future()
+
+        def place(future):
+            if future.exception() is not None:
+                placed.set_exception(future.exception())
+            else:
+                placed.set_result(future.result().placed(origin))
+        base.add_done_callback(place)
+        return placed
+
+    def mesh_many(self, positions, dimensions, **options):
+        """Сетки нескольких фундаментов (строятся параллельно); порядок сохраняется"""
+        futures = [self.submit(position, size, **options) for position, size in zip(positions, dimensions)]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True, keep_files=False):
+        """
+        Остановка пула. Без дискового кеша MED-файлы лежат во временном
+        каталоге пула и удаляются, если не задано keep_files.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+        if not keep_files:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+
+    def _submit_key(self, key, dimensions, options):
+        cached = self._load(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        if self._executor is None:
+            # spawn: в процесс пула не копируется состояние Qt и VTK основного процесса
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        med_path = os.path.join(self._workdir, f"{key}.med") if self.export_med else None
+        worker = self._executor.submit(build_foundation_mesh, tuple(float(value) for value in dimensions),
+                                       options, med_path)
+        result = Future()
+
+        def store(future):
+            if future.exception() is not None:
+                # Ошибка не кешируется: следующий запрос построит сетку заново
+                self._pending.pop(key, None)
+                result.set_exception(future.exception())
+                return
+            result.set_result(self._store(key, *future.result(), med_path))
+        worker.add_done_callback(store)
+        return result
+
+    def _load(self, key):
+        if self.cache is None:
+            return None
+        arrays = [self.cache.get(cache_key(key, name)) for name in ("nodes", "tetrahedra", "materials")]
+        if any(array is None for array in arrays):
+            return None
+        med_file = self.cache.get_file(key, ".med")
+        if self.export_med and med_file is None:
+            return None
+        return FoundationMesh(key, *arrays, med_file=med_file)
+
+    def _store(self, key, nodes, tetrahedra, materials, med_path):
+        med_file = med_path
+        if self.cache is not None:
+            nodes = self.cache.put(cache_key(key, "nodes"), nodes)
+            tetrahedra = self.cache.put(cache_key(key, "tetrahedra"), tetrahedra)
+            materials = self.cache.put(cache_key(key, "materials"), materials)
+            if med_path is not None and self.cache.disk_path is not None:
+                self.cache.put_file(key, med_path, ".med")
+                med_file = self.cache.get_file(key, ".med")
+        return FoundationMesh(key, nodes, tetrahedra, materials, med_file=med_file)
+
+
+def mesh_cache(**kwargs):
+    """Кеш сеток фундаментов (память + диск) для текущей версии построения"""
+    try:
+        return ResultCache("foundation_meshes", MESHER_VERSION, **kwargs)
+    except OSError as e:
+        print(f"Дисковый кеш сеток недоступен ({e}), используется только память")
+        return ResultCache("foundation_meshes", MESHER_VERSION, disk_dir=False)
+
+
+def mesh_foundations(table, max_workers=None, cache=None, **options):
+    """Сетки всех фундаментов FoundationTable: {номер фундамента: FoundationMesh}"""
+    mesher = FoundationMesher(max_workers=max_workers, cache=cache)
+    try:
+        meshes = mesher.mesh_many(table.positions, table.dimensions, **options)
+    finally:
+        mesher.shutdown(keep_files=mesher.cache is None or mesher.cache.disk_path is None)
+    return dict(zip(table.ids.tolist(), meshes))
@@ -0,0 +1,243 @@
+# core/foundation_store.py
+"""
+Табличное хранилище фундаментов на структурированном массиве NumPy.
+
+Параметры всех фундаментов лежат в одном массиве (по строке на фундамент),
+поэтому запросы по всему проекту — суммарная нагрузка, площади подошв,
+габариты — выполняются векторно. Поиск строки по номеру фундамента — O(1)
+через словарь, удаление — O(1) перестановкой последней строки на место удалённой.
+Сетки фундаментов таблица не копирует, а только хранит ссылки на них;
+с mesh_loader (например, core.project_file.ProjectFile.mesh) сетка
+читается при первом обращении.
+"""
+import numpy as np
+
+from .stress_engine import LOAD_TYPES, UNKNOWN_LOAD_CODE, load_type_codes
+
+FOUNDATION_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("position", np.float64, 3),    # центр фундамента, м
+    ("dimensions", np.float64, 3),  # ширина, длина, толщина, м
+    ("load_value", np.float64),     # величина нагрузки, Н
+    ("load_type", np.int8),         # код типа нагрузки (индекс в LOAD_TYPES)
+])
+
+
+class FoundationTable:
+    """Колоночная таблица фундаментов"""
+
+    def __init__(self, capacity=16):
+        self._data = np.zeros(max(capacity, 1), dtype=FOUNDATION_DTYPE)
+        self._size = 0
+        self._row_of = {}
+        self._meshes = {}
+        self._next_id = 0
+        self.mesh_loader = None  # функция id -> сетка для ленивой загрузки
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __contains__(self, foundation_id):
+        return foundation_id in self._row_of
+
+    def __iter__(self):
+        """Перебор номеров фундаментов в порядке строк"""
+        return iter(self.ids.tolist())
+
+    # --- Колонки (представления без копирования) ---
+
+    @property
+    def table(self):
+        return self._data[:self._size]
+
+    @property
+    def ids(self):
+        return self.table["id"]
+
+    @property
+    def positions(self):
+        return self.table["position"]
+
+    @property
+    def dimensions(self):
+        return self.table["dimensions"]
+
+    @property
+    def load_values(self):
+        return self.table["load_value"]
+
+    @property
+    def load_type_codes(self):
+        return self.table["load_type"]
+
+    # --- Добавление, удаление, поиск ---
+
+    def add(self, position, dimensions, load_value, load_type, mesh=None, foundation_id=None):
+        """Добавление фундамента; возвращает его номер"""
+        if foundation_id is None:
+            foundation_id = self._next_id
+        if foundation_id in self._row_of:
+            raise KeyError(f"Фундамент {foundation_id} уже есть в таблице")
+        self._next_id = max(self._next_id, foundation_id + 1)
+
+        self._reserve(self._size + 1)
+        row = self._size
+        self._data[row] = (foundation_id, position, dimensions, load_value, load_type_codes([load_type])[0])
+        self._row_of[foundation_id] = row
+        self._size += 1
+        if mesh is not None:
+            self._meshes[foundation_id] = mesh
+        return foundation_id
+
+    def add_many(self, positions, dimensions, load_values, load_types, meshes=None, ids=None):
+        """Массовое добавление; возвращает массив номеров новых фундаментов"""
+        n = len(load_values)
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + n, dtype=np.int64)
+        else:
+            ids = np.asarray(ids, dtype=np.int64)
+            if len(np.unique(ids)) != n or any(foundation_id in self._row_of for foundation_id in ids.tolist()):
+                raise KeyError("Номера фундаментов повторяются")
+        self._reserve(self._size + n)
+
+        rows = slice(self._size, self._size + n)
+        self._data["id"][rows] = ids
+        self._data["position"][rows] = positions
+        self._data["dimensions"][rows] = dimensions
+        self._data["load_value"][rows] = load_values
+        self._data["load_type"][rows] = load_type_codes(load_types)
+
+        self._row_of.update(zip(ids.tolist(), range(self._size, self._size + n)))
+        if meshes is not None:
+            self._meshes.update(zip(ids.tolist(), meshes))
+        self._size += n
+        self._next_id = max(self._next_id, int(ids.max()) + 1) if n else self._next_id
+        return ids
+
+    def remove(self, foundation_id):
+        """Удаление фундамента: последняя строка переносится на место удалённой"""
+        row = self._row_of.pop(foundation_id)
+        last = self._size - 1
+        if row != last:
+            self._data[row] = self._data[last]
+            self._row_of[int(self._data["id"][row])] = row
+        self._size -= 1
+        self._meshes.pop(foundation_id, None)
+
+    def clear(self):
+        self._size = 0
+        self._row_of.clear()
+        self._meshes.clear()
+
+    def row(self, foundation_id):
+        """Номер строки фундамента — O(1)"""
+        return self._row_of[foundation_id]
+
+    def rows(self, foundation_ids):
+        """Номера строк для набора фундаментов"""
+        return np.fromiter((self._row_of[fid] for fid in foundation_ids), dtype=np.intp)
+
+    def mesh(self, foundation_id):
+        """Сетка фундамента (по ссылке, без копирования) или None"""
+        mesh = self._meshes.get(foundation_id)
+        if mesh is None and self.mesh_loader is not None and foundation_id in self._row_of:
+            mesh = self._meshes[foundation_id] = self.mesh_loader(foundation_id)
+        return mesh
+
+    def set_mesh(self, foundation_id, mesh):
+        if foundation_id not in self._row_of:
+            raise KeyError(foundation_id)
+        self._meshes[foundation_id] = mesh
+
+    def load_type(self, foundation_id):
+        """Название типа нагрузки фундамента"""
+        code = int(self._data["load_type"][self._row_of[foundation_id]])
+        return LOAD_TYPES[code] if code != UNKNOWN_LOAD_CODE else None
+
+    def record(self, foundation_id):
+        """Параметры одного фундамента в виде словаря (для вывода и отладки)"""
+        data = self._data[self._row_of[foundation_id]]
+        return {
+            "id": foundation_id,
+            "position": tuple(data["position"]),
+            "dimensions": tuple(data["dimensions"]),
+            "load_value": float(data["load_value"]),
+            "load_type": self.load_type(foundation_id),
+            "geometry": self.mesh(foundation_id),
+        }
+
+    # --- Массовые обновления ---
+
+    def update(self, foundation_ids, **columns):
+        """
+        Массовое обновление колонок для набора фундаментов, например:
+        table.update(ids, load_value=200e3, load_type="Линейная")
+        """
+        self._assign(self.rows(np.atleast_1d(foundation_ids)), columns)
+
+    def set_all(self, **columns):
+        """Обновление колонок сразу у всех фундаментов"""
+        self._assign(slice(0, self._size), columns)
+
+    def _assign(self, rows, columns):
+        for name, values in columns.items():
+            if name not in FOUNDATION_DTYPE.names or name == "id":
+                raise KeyError(f"Нельзя обновить колонку {name}")
+            if name == "load_type":
+                values = load_type_codes([values] if np.isscalar(values) else values)
+            self._data[name][rows] = values
+
+    # --- Векторные запросы ---
+
+    def total_load(self):
+        """Суммарная нагрузка на все фундаменты, Н"""
+        return float(np.sum(self.load_values))
+
+    def footprint_areas(self):
+        """Площади подошв, м²"""
+        dims = self.dimensions
+        return dims[:, 0] * dims[:, 1]
+
+    def total_footprint_area(self):
+        return float(np.sum(self.footprint_areas()))
+
+    def mean_pressures(self):
+        """Среднее давление под подошвой каждого фундамента, Па"""
+        return self.load_values / self.footprint_areas()
+
+    def bounding_boxes(self):
+        """Габариты фундаментов: массив (n, 2, 3) из минимальных и максимальных углов"""
+        half = self.dimensions / 2
+        return np.stack((self.positions - half, self.positions + half), axis=1)
+
+    def bounds(self):
+        """Общие габариты всех фундаментов или None"""
+        if not self._size:
+            return None
+        boxes = self.bounding_boxes()
+        return boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0)
+
+    def select(self, load_type=None, min_load=None, max_load=None):
+        """Номера фундаментов, подходящих под условия"""
+        mask = np.ones(self._size, dtype=bool)
+        if load_type is not None:
+            mask &= self.load_type_codes == load_type_codes([load_type])[0]
+        if min_load is not None:
+            mask &= self.load_values >= min_load
+        if max_load is not None:
+            mask &= self.load_values <= max_load
+        return self.ids[mask]
+
+    def _reserve(self, size):
+        """Удвоение ёмкости при нехватке места"""
+        if size <= len(self._data):
+            return
+        capacity = len(self._data)
+        while capacity < size:
+            capacity *= 2
+        data = np.zeros(capacity, dtype=FOUNDATION_DTYPE)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
@@ -0,0 +1,44 @@
+# core/freecad_bridge.py
+"""
+Отложенная загрузка FreeCAD.
+
+Каталог FreeCAD проверяется и модули FreeCAD/Part импортируются только
+при первом обращении к геометрии FreeCAD, а не при запуске приложения.
+Путь берётся из переменной окружения FREECAD_PATH или из значения по
+умолчанию для Windows.
+"""
+import os
+import sys
+
+# Интеграция FreeCAD (адаптируйте путь или задайте переменную FREECAD_PATH)
+DEFAULT_FREECAD_PATH = r"C:\Program Files\FreeCAD 1.0\bin"
+
+_modules = None
+
+
+def freecad_path():
+    return os.environ.get("FREECAD_PATH", DEFAULT_FREECAD_PATH)
+
+
+def load_freecad():
+    """Модули (FreeCAD, Part) или None, если FreeCAD не найден; результат запоминается"""
+    global _modules
+    if _modules is None:
+        path = freecad_path()
+        try:
+            if os.path.exists(path) and path not in sys.path:
+                sys.path.append(path)
+            import FreeCAD
+            import Part
+            _modules = (FreeCAD, Part)
+        except ImportError:
+            print("⚠️ FreeCAD не найден! Геометрия будет упрощённой.")
+            _modules = ()
+    return _modules or None
+
+
+def require_freecad():
+    modules = load_freecad()
+    if modules is None:
+        raise ImportError(f"Для этой операции требуется FreeCAD (каталог {freecad_path()})")
+    return modules
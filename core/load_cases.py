@@ -0,0 +1,114 @@
+# core/load_cases.py
+"""
+Пакет расчётных случаев нагрузки: все сочетания величины и типа нагрузки
+считаются за один проход, результаты лежат «стопкой» по первой оси
+(случай, ...), огибающие min/max по случаям вычисляются один раз.
+
+Обе модели напряжений линейны по величине нагрузки, поэтому для пакета
+достаточно одного решения на каждый тип нагрузки при единичной величине —
+остальные случаи получаются умножением на величину (см.
+stress_engine.load_case_stress и elastic_solver.run_elastic_load_cases).
+"""
+import numpy as np
+
+from .stress_engine import LOAD_TYPES, load_type_codes
+
+# Величины нагрузки из интерфейса, Н
+DEFAULT_LOAD_VALUES = (50e3, 100e3, 200e3, 500e3, 1000e3)
+
+# Выбор огибающей вместо отдельного случая
+ENVELOPE_MIN = "min"
+ENVELOPE_MAX = "max"
+
+
+class LoadCases:
+    """
+    Список расчётных случаев: пары (величина, код типа нагрузки).
+    По умолчанию — все величины DEFAULT_LOAD_VALUES со всеми типами
+    LOAD_TYPES (величина — внешний цикл).
+    """
+
+    def __init__(self, load_values=DEFAULT_LOAD_VALUES, load_types=LOAD_TYPES, grid=True):
+        load_values = np.asarray(load_values, dtype=np.float64).ravel()
+        codes = load_type_codes(load_types)
+        if grid:
+            load_values, codes = np.repeat(load_values, len(codes)), np.tile(codes, len(load_values))
+        elif len(load_values) != len(codes):
+            raise ValueError("Число величин нагрузки не совпадает с числом типов")
+        self.load_values = load_values
+        self.load_types = codes
+
+    def __len__(self):
+        return len(self.load_values)
+
+    def index(self, load_value, load_type):
+        """Номер случая с заданными величиной и типом нагрузки (или None)"""
+        code = load_type_codes(load_type)[0]
+        found = np.flatnonzero(np.isclose(self.load_values, load_value) & (self.load_types == code))
+        return int(found[0]) if len(found) else None
+
+    def labels(self):
+        """Подписи случаев для интерфейса"""
+        return [f"{value / 1000:g} кН, {LOAD_TYPES[code]}"
+                for value, code in zip(self.load_values.tolist(), self.load_types.tolist())]
+
+    def unit_types(self):
+        """
+        Различные типы нагрузки пакета и для каждого случая — номер его
+        типа в этом списке (для сборки случаев из единичных решений).
+        """
+        return np.unique(self.load_types, return_inverse=True)
+
+    def scale(self, unit_results, inverse):
+        """
+        Результаты всех случаев из результатов при единичной нагрузке:
+        unit_results — (T, ...) по типам unit_types(); итог (k, ...).
+        """
+        unit_results = np.asarray(unit_results)
+        factors = self.load_values.reshape((-1,) + (1,) * (unit_results.ndim - 1))
+        return unit_results[inverse] * factors
+
+    def key(self):
+        """Часть ключа кеша, описывающая набор случаев"""
+        return self.load_values, self.load_types.astype(np.int64)
+
+
+class LoadCaseResults:
+    """
+    Результаты пакета случаев: поля-«стопки» {имя: массив (k, ...)}.
+    view() возвращает поле отдельного случая или огибающую без пересчёта.
+    """
+
+    def __init__(self, cases, fields):
+        self.cases = cases
+        self.fields = dict(fields)
+        self._envelopes = {}
+
+    def __len__(self):
+        return len(self.cases)
+
+    def __getitem__(self, name):
+        return self.fields[name]
+
+    def envelope(self, name, kind=ENVELOPE_MAX):
+        """Огибающая поля по всем случаям: поэлементный min или max"""
+        key = (name, kind)
+        if key not in self._envelopes:
+            if kind == ENVELOPE_MIN:
+                self._envelopes[key] = self.fields[name].min(axis=0)
+            elif kind == ENVELOPE_MAX:
+                self._envelopes[key] = self.fields[name].max(axis=0)
+            else:
+                raise ValueError(f"Неизвестная огибающая: {kind}")
+        return self._envelopes[key]
+
+    def governing_case(self, name, kind=ENVELOPE_MAX):
+        """Номер случая, дающего огибающую, в каждой точке поля"""
+        field = self.fields[name]
+        return field.argmin(axis=0) if kind == ENVELOPE_MIN else field.argmax(axis=0)
+
+    def view(self, name, selection):
+        """Поле случая selection (номер) или огибающая (ENVELOPE_MIN / ENVELOPE_MAX)"""
+        if isinstance(selection, str):
+            return self.envelope(name, selection)
+        return self.fields[name][selection]
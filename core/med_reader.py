@@ -0,0 +1,225 @@
+# core/med_reader.py
+"""
+Потоковое чтение результатов Code_Aster в формате MED (HDF5).
+
+Файл открывается лениво: список полей, шагов и компонент читается только
+из атрибутов и имён групп HDF5, без загрузки данных. Значения выбранного
+поля и шага отдаются либо как представление NumPy, отображённое в память
+(для непрерывных несжатых наборов данных), либо итератором по блокам
+фиксированного размера. Пиковая память не зависит от размера файла.
+
+Раскладка MED 3.x:
+  /ENS_MAA/<сетка>/<шаг>/NOE/COO        — координаты узлов (x..., y..., z...)
+  /CHA/<поле>/<шаг>/<сущность>/<профиль>/CO — значения (компонента за компонентой)
+"""
+import numpy as np
+
+try:
+    import h5py
+except ImportError:  # pragma: no cover - зависит от окружения
+    h5py = None
+
+NODES = "NOE"
+COMPONENT_NAME_SIZE = 16
+
+
+class MedFormatError(ValueError):
+    """Файл не соответствует ожидаемой структуре MED"""
+
+
+def _attr(obj, name, default=None):
+    value = obj.attrs.get(name, default)
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    if isinstance(value, np.ndarray) and value.shape == ():
+        return value.item()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _split_names(text, n):
+    text = text or ""
+    return [text[i * COMPONENT_NAME_SIZE:(i + 1) * COMPONENT_NAME_SIZE].strip() or f"C{i + 1}"
+            for i in range(n)]
+
+
+class MedResultReader:
+    """Ленивое чтение полей результатов из MED-файла"""
+
+    def __init__(self, path):
+        if h5py is None:
+            raise ImportError("Для чтения MED-файлов требуется пакет h5py")
+        self.path = path
+        self._file = h5py.File(path, "r")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Описание содержимого (без чтения данных) ---
+
+    def meshes(self):
+        return list(self._file.get("ENS_MAA", {}).keys())
+
+    def fields(self):
+        """Список полей: имя, компоненты, единицы, сетка, число шагов"""
+        result = []
+        for name, group in self._file.get("CHA", {}).items():
+            n_components = int(_attr(group, "NCO", 1))
+            result.append({
+                "name": name,
+                "components": _split_names(_attr(group, "NOM"), n_components),
+                "units": _split_names(_attr(group, "UNI"), n_components),
+                "mesh": _attr(group, "MAI"),
+                "n_steps": len(group),
+            })
+        return result
+
+    def fields_by_name(self):
+        return {info["name"]: info for info in self.fields()}
+
+    def steps(self, field):
+        """Шаги поля по возрастанию: список (номер шага, номер итерации, время)"""
+        steps = []
+        for key, group in self._field_group(field).items():
+            numdt = _attr(group, "NDT")
+            numo = _attr(group, "NOR")
+            if numdt is None or numo is None:
+                numdt, numo = int(key[:-20]), int(key[-20:])
+            steps.append((int(numdt), int(numo), float(_attr(group, "PDT", 0.0))))
+        return sorted(steps)
+
+    def entities(self, field, step=-1):
+        """Типы сущностей, на которых задано поле на шаге (NOE — узлы, MAI.* — ячейки)"""
+        return list(self._step_group(field, step).keys())
+
+    def shape(self, field, step=-1, entity=NODES):
+        """(число сущностей, число компонент) без чтения данных"""
+        dataset, n_components = self._values_dataset(field, step, entity)
+        return dataset.shape[0] // n_components, n_components
+
+    # --- Данные ---
+
+    def view(self, field, step=-1, entity=NODES, profile=None):
+        """
+        Значения поля формы (n, компоненты) как представление без копирования.
+        Непрерывные несжатые наборы отображаются в память (np.memmap);
+        иначе возвращается ленивый h5py.Dataset формы (n_компонент * n,),
+        который следует читать блоками (см. iter_chunks).
+        """
+        dataset, n_components = self._values_dataset(field, step, entity, profile)
+        mapped = self._memmap(dataset, (n_components, dataset.shape[0] // n_components))
+        if mapped is None:
+            return dataset
+        # В файле значения хранятся компонента за компонентой: транспонирование — тоже представление
+        return mapped.T
+
+    def read(self, field, step=-1, entity=NODES, components=None, profile=None):
+        """Чтение значений в память (только выбранные компоненты)"""
+        dataset, n_components = self._values_dataset(field, step, entity, profile)
+        n = dataset.shape[0] // n_components
+        selected = self._component_indices(field, components, n_components)
+        # Чтение компонент напрямую в строки буфера, результат — транспонированное представление
+        out = np.empty((len(selected), n), dtype=dataset.dtype)
+        for j, c in enumerate(selected):
+            dataset.read_direct(out[j], np.s_[c * n:(c + 1) * n])
+        return out.T
+
+    def iter_chunks(self, field, step=-1, entity=NODES, chunk_size=1_000_000, components=None, profile=None):
+        """
+        Итератор по блокам: (начальный индекс, массив (m, компоненты)).
+        В памяти одновременно находится не больше одного блока.
+        """
+        dataset, n_components = self._values_dataset(field, step, entity, profile)
+        n = dataset.shape[0] // n_components
+        selected = self._component_indices(field, components, n_components)
+        buffer = np.empty((min(chunk_size, n), len(selected)), dtype=dataset.dtype)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            block = buffer[:stop - start]
+            for j, c in enumerate(selected):
+                block[:, j] = dataset[c * n + start:c * n + stop]
+            yield start, block
+
+    def reduce(self, field, step=-1, entity=NODES, chunk_size=1_000_000):
+        """Минимум и максимум по каждой компоненте за один потоковый проход"""
+        low = high = None
+        for _start, block in self.iter_chunks(field, step, entity, chunk_size):
+            block_low, block_high = block.min(axis=0), block.max(axis=0)
+            low = block_low if low is None else np.minimum(low, block_low)
+            high = block_high if high is None else np.maximum(high, block_high)
+        return low, high
+
+    def node_coordinates(self, mesh=None, step=-1):
+        """Координаты узлов сетки (n, dim) как представление без копирования"""
+        meshes = self._file.get("ENS_MAA")
+        if not meshes:
+            raise MedFormatError("В файле нет сеток (ENS_MAA)")
+        group = meshes[mesh or next(iter(meshes))]
+        step_group = group[sorted(group.keys())[step]]
+        dataset = step_group[NODES]["COO"]
+        dim = int(_attr(group, "ESP", _attr(group, "DIM", 3)))
+        mapped = self._memmap(dataset, (dim, dataset.shape[0] // dim))
+        return mapped.T if mapped is not None else dataset
+
+    # --- Внутреннее ---
+
+    def _field_group(self, field):
+        try:
+            return self._file["CHA"][field]
+        except KeyError:
+            raise KeyError(f"Поле {field} не найдено в {self.path}") from None
+
+    def _step_group(self, field, step):
+        group = self._field_group(field)
+        keys = sorted(group.keys(), key=lambda k: self._step_key(group[k], k))
+        if isinstance(step, tuple):
+            for key in keys:
+                if self._step_key(group[key], key)[:2] == step[:2]:
+                    return group[key]
+            raise KeyError(f"Шаг {step} не найден в поле {field}")
+        return group[keys[step]]
+
+    @staticmethod
+    def _step_key(group, key):
+        numdt = _attr(group, "NDT")
+        numo = _attr(group, "NOR")
+        if numdt is None or numo is None:
+            return int(key[:-20]), int(key[-20:])
+        return int(numdt), int(numo)
+
+    def _values_dataset(self, field, step, entity, profile=None):
+        n_components = int(_attr(self._field_group(field), "NCO", 1))
+        step_group = self._step_group(field, step)
+        if entity not in step_group:
+            raise KeyError(f"Поле {field} не задано на сущностях {entity}")
+        entity_group = step_group[entity]
+        if profile is None:
+            profile = next(iter(entity_group))
+        dataset = entity_group[profile]["CO"]
+        if dataset.shape[0] % n_components:
+            raise MedFormatError(f"Размер набора {dataset.name} не кратен числу компонент {n_components}")
+        return dataset, n_components
+
+    def _component_indices(self, field, components, n_components):
+        if components is None:
+            return list(range(n_components))
+        names = self.fields_by_name()[field]["components"]
+        return [names.index(c) if isinstance(c, str) else int(c) for c in components]
+
+    def _memmap(self, dataset, shape):
+        """Отображение непрерывного несжатого набора данных в память или None"""
+        if dataset.chunks is not None or dataset.compression is not None:
+            return None
+        offset = dataset.id.get_offset()
+        if offset is None:
+            return None
+        return np.memmap(self.path, dtype=dataset.dtype, mode="r", offset=offset, shape=shape, order="C")
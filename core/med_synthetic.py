@@ -0,0 +1,57 @@
+# core/med_synthetic.py
+"""
+Синтетические MED-файлы результатов (одна сетка, одно узловое поле
+напряжений) для тестов и замеров core.med_reader без Code_Aster.
+Файл пишется блоками, поэтому размер не ограничен памятью.
+"""
+import numpy as np
+
+try:
+    import h5py
+except ImportError:  # pragma: no cover - зависит от окружения
+    h5py = None
+
+STRESS_COMPONENTS = ("SIXX", "SIYY", "SIZZ", "SIXY", "SIXZ", "SIYZ")
+STRESS_FIELD = "RESU____SIEF_NOEU"
+
+
+def _require_h5py():
+    if h5py is None:
+        raise ImportError("Для записи MED-файлов требуется пакет h5py")
+
+
+def write_synthetic_med(path, n_nodes, n_steps, field=STRESS_FIELD, components=STRESS_COMPONENTS,
+                        mesh="MAIL", chunk=1_000_000, compression=None):
+    """
+    Синтетический MED-файл с одной сеткой и одним узловым полем (запись блоками).
+    С compression значения пишутся сжатыми блоками HDF5 (без отображения в память).
+    """
+    _require_h5py()
+    rng = np.random.default_rng(0)
+    with h5py.File(path, "w") as f:
+        mesh_group = f.create_group(f"ENS_MAA/{mesh}")
+        mesh_group.attrs["ESP"] = 3
+        coords = mesh_group.create_dataset(f"{0:020d}{0:020d}/NOE/COO", (3 * n_nodes,), dtype="f8")
+        for start in range(0, n_nodes, chunk):
+            stop = min(start + chunk, n_nodes)
+            for d in range(3):
+                coords[d * n_nodes + start:d * n_nodes + stop] = rng.uniform(-10, 10, stop - start)
+
+        field_group = f.create_group(f"CHA/{field}")
+        field_group.attrs["NCO"] = len(components)
+        field_group.attrs["NOM"] = np.bytes_("".join(c.ljust(16) for c in components))
+        field_group.attrs["UNI"] = np.bytes_("".join("Pa".ljust(16) for _ in components))
+        field_group.attrs["MAI"] = np.bytes_(mesh)
+        for step in range(n_steps):
+            step_group = field_group.create_group(f"{step:020d}{0:020d}")
+            step_group.attrs["NDT"] = step
+            step_group.attrs["NOR"] = 0
+            step_group.attrs["PDT"] = float(step)
+            values = step_group.create_dataset("NOE/MED_NO_PROFILE_INTERNAL/CO",
+                                               (len(components) * n_nodes,), dtype="f8",
+                                               compression=compression)
+            for c in range(len(components)):
+                for start in range(0, n_nodes, chunk):
+                    stop = min(start + chunk, n_nodes)
+                    values[c * n_nodes + start:c * n_nodes + stop] = (step + 1) * rng.standard_normal(stop - start)
+    return path
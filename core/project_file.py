@@ -0,0 +1,290 @@
+# core/project_file.py
+"""
+Файл проекта (HDF5): параметры фундаментов, их сетки, поля результатов и
+вспомогательные линии.
+
+Раскладка:
+  /foundations/<колонка>  — столбцы FoundationTable (id, position, ...)
+  /meshes/points          — точки всех сеток подряд (N, 3)
+  /meshes/connectivity    — индексы вершин граней (глобальные, без счётчиков)
+  /meshes/cell_sizes      — число вершин каждой грани
+  /meshes/point_offsets, cell_offsets, connectivity_offsets — границы
+                            фундаментов (длины F + 1, в порядке строк таблицы)
+  /results/<поле>         — значения в точках (..., N): (N,) для одного поля,
+                            (k, N) для пакета случаев нагрузки
+  /load_cases/load_values, load_types — случаи пакета (если он сохранён)
+  /guides/segments        — отрезки вспомогательных линий (G, 2, 3)
+
+Большие массивы пишутся блоками (chunks) со сжатием lzf. При открытии
+читается только таблица параметров; сетки и поля результатов читаются по
+запросу — по одному фундаменту срезом или целиком одним чтением для сцены.
+"""
+import os
+
+import numpy as np
+
+try:
+    import h5py
+except ImportError:  # pragma: no cover - зависит от окружения
+    h5py = None
+
+from .foundation_store import FOUNDATION_DTYPE, FoundationTable
+
+FORMAT_NAME = "engineering_suite_project"
+FORMAT_VERSION = 1
+
+# Размер блока больших массивов (байт) и сжатие
+CHUNK_BYTES = 2 ** 18
+COMPRESSION = "lzf"
+
+
+class ProjectFormatError(ValueError):
+    """Файл не является проектом или записан несовместимой версией"""
+
+
+def _require_h5py():
+    if h5py is None:
+        raise ImportError("Для файлов проекта требуется пакет h5py")
+
+
+def _write_array(group, name, data, chunk_axis=0):
+    """Набор данных с блоками по оси chunk_axis (пустые и мелкие массивы — без блоков)"""
+    data = np.ascontiguousarray(data)
+    if data.nbytes < CHUNK_BYTES:
+        return group.create_dataset(name, data=data)
+    chunks = list(data.shape)
+    row_bytes = data.nbytes // data.shape[chunk_axis]
+    chunks[chunk_axis] = max(1, min(CHUNK_BYTES // row_bytes, data.shape[chunk_axis]))
+    return group.create_dataset(name, data=data, chunks=tuple(chunks), compression=COMPRESSION)
+
+
+def _offsets(counts):
+    return np.concatenate(([0], np.cumsum(counts, dtype=np.int64))).astype(np.int64)
+
+
+def _polygons(mesh):
+    """Индексы вершин и размеры граней PolyData (формат VTK [n, i0, ..., n, ...])"""
+    faces = np.asarray(mesh.faces, dtype=np.int64)
+    # Для типичных сеток все грани одного размера — разбор без цикла
+    if len(faces) and len(faces) % (faces[0] + 1) == 0 and np.all(faces[::faces[0] + 1] == faces[0]):
+        size = int(faces[0])
+        return faces.reshape(-1, size + 1)[:, 1:].ravel(), np.full(len(faces) // (size + 1), size, dtype=np.int64)
+    sizes = []
+    position = 0
+    while position < len(faces):
+        sizes.append(int(faces[position]))
+        position += faces[position] + 1
+    sizes = np.asarray(sizes, dtype=np.int64)
+    is_index = np.ones(len(faces), dtype=bool)
+    is_index[_offsets(sizes + 1)[:-1]] = False
+    return faces[is_index], sizes
+
+
+def vtk_faces(connectivity, cell_sizes):
+    """Сборка массива граней формата VTK из индексов вершин и размеров граней"""
+    connectivity = np.asarray(connectivity, dtype=np.int64)
+    cell_sizes = np.asarray(cell_sizes, dtype=np.int64)
+    faces = np.empty(len(connectivity) + len(cell_sizes), dtype=np.int64)
+    is_count = np.zeros(len(faces), dtype=bool)
+    is_count[_offsets(cell_sizes + 1)[:-1]] = True
+    faces[is_count] = cell_sizes
+    faces[~is_count] = connectivity
+    return faces
+
+
+def save_project(path, table, guide_segments=None, results=None, load_cases=None):
+    """
+    Запись проекта в path (через временный файл — прежний файл не портится
+    при ошибке). table — FoundationTable с сетками; results — {поле: {id:
+    массив (..., P_i)}}; load_cases — core.load_cases.LoadCases пакета,
+    если среди результатов есть стопки случаев.
+    """
+    _require_h5py()
+    ids = table.ids.tolist()
+    meshes = [table.mesh(foundation_id) for foundation_id in ids]
+    if any(mesh is None for mesh in meshes):
+        raise ValueError("У всех фундаментов должны быть сетки")
+
+    point_counts = np.array([mesh.n_points for mesh in meshes], dtype=np.int64)
+    point_offsets = _offsets(point_counts)
+    polygons = [_polygons(mesh) for mesh in meshes]
+    connectivity = np.concatenate([conn + start for (conn, _), start in zip(polygons, point_offsets[:-1])]) \
+        if meshes else np.empty(0, dtype=np.int64)
+    cell_sizes = np.concatenate([sizes for _, sizes in polygons]) if meshes else np.empty(0, dtype=np.int64)
+
+    temp_path = f"{path}.tmp"
+    try:
+        with h5py.File(temp_path, "w") as f:
+            f.attrs["format"] = FORMAT_NAME
+            f.attrs["version"] = FORMAT_VERSION
+
+            group = f.create_group("foundations")
+            for name in FOUNDATION_DTYPE.names:
+                group.create_dataset(name, data=np.ascontiguousarray(table.table[name]))
+
+            group = f.create_group("meshes")
+            # np.asarray снимает подкласс pyvista_ndarray: иначе склейка тысяч массивов в разы медленнее
+            _write_array(group, "points", np.concatenate([np.asarray(mesh.points, dtype=np.float64) for mesh in meshes])
+                         if meshes else np.empty((0, 3)))
+            _write_array(group, "connectivity", connectivity)
+            _write_array(group, "cell_sizes", cell_sizes.astype(np.uint8 if cell_sizes.size and cell_sizes.max() < 256
+                                                                else np.int64))
+            group.create_dataset("point_offsets", data=point_offsets)
+            group.create_dataset("cell_offsets", data=_offsets([len(sizes) for _, sizes in polygons]))
+            group.create_dataset("connectivity_offsets", data=_offsets([len(conn) for conn, _ in polygons]))
+
+            group = f.create_group("results")
+            for name, values in (results or {}).items():
+                if any(foundation_id not in values for foundation_id in ids):
+                    continue  # поле есть не у всех фундаментов — не сохраняется
+                stacked = np.concatenate([np.asarray(values[foundation_id]) for foundation_id in ids], axis=-1)
+                _write_array(group, name, stacked, chunk_axis=stacked.ndim - 1)
+
+            if load_cases is not None:
+                group = f.create_group("load_cases")
+                group.create_dataset("load_values", data=load_cases.load_values)
+                group.create_dataset("load_types", data=load_cases.load_types)
+
+            group = f.create_group("guides")
+            segments = np.asarray(guide_segments if guide_segments is not None and len(guide_segments)
+                                  else np.empty((0, 2, 3)), dtype=np.float64).reshape(-1, 2, 3)
+            group.create_dataset("segments", data=segments)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ProjectFile:
+    """
+    Открытый файл проекта. Таблица параметров читается сразу, сетки и
+    поля результатов — по запросу. Файл остаётся открытым до close().
+    """
+
+    def __init__(self, path):
+        _require_h5py()
+        self.path = path
+        self._file = h5py.File(path, "r")
+        if self._file.attrs.get("format") != FORMAT_NAME:
+            self.close()
+            raise ProjectFormatError(f"{path}: не файл проекта")
+        if int(self._file.attrs.get("version", 0)) > FORMAT_VERSION:
+            self.close()
+            raise ProjectFormatError(f"{path}: проект записан более новой версией программы")
+
+        group = self._file["meshes"]
+        self._point_offsets = group["point_offsets"][()]
+        self._cell_offsets = group["cell_offsets"][()]
+        self._connectivity_offsets = group["connectivity_offsets"][()]
+        self._arrays = {}
+        self._ids = self._file["foundations/id"][()]
+        self._row_of = {foundation_id: row for row, foundation_id in enumerate(self._ids.tolist())}
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._ids)
+
+    # --- Таблица и линии ---
+
+    def foundations(self):
+        """FoundationTable с параметрами; сетки подгружаются при первом обращении"""
+        group = self._file["foundations"]
+        table = FoundationTable(capacity=len(self._ids))
+        table.add_many(group["position"][()], group["dimensions"][()], group["load_value"][()],
+                       group["load_type"][()], ids=self._ids)
+        table.mesh_loader = self.mesh
+        return table
+
+    @property
+    def guide_segments(self):
+        return self._file["guides/segments"][()]
+
+    def load_cases(self):
+        """Пакет случаев нагрузки (core.load_cases.LoadCases) или None"""
+        if "load_cases" not in self._file:
+            return None
+        from .load_cases import LoadCases
+
+        group = self._file["load_cases"]
+        return LoadCases(group["load_values"][()], group["load_types"][()], grid=False)
+
+    # --- Сетки ---
+
+    def mesh_arrays(self):
+        """
+        Все сетки одним чтением: точки (N, 3), грани в формате VTK (с
+        глобальными индексами) и границы фундаментов по точкам и граням.
+        """
+        points = self._array("meshes/points")
+        faces = vtk_faces(self._array("meshes/connectivity"), self._array("meshes/cell_sizes"))
+        return {
+            "ids": self._ids,
+            "points": points,
+            "faces": faces,
+            "point_offsets": self._point_offsets,
+            "cell_offsets": self._cell_offsets,
+            "face_offsets": self._connectivity_offsets + self._cell_offsets,
+        }
+
+    def mesh(self, foundation_id):
+        """Сетка одного фундамента (pv.PolyData) — чтение только её диапазона"""
+        import pyvista as pv
+
+        row = self._row_of[foundation_id]
+        p0, p1 = self._point_offsets[row:row + 2]
+        c0, c1 = self._cell_offsets[row:row + 2]
+        k0, k1 = self._connectivity_offsets[row:row + 2]
+        points = self._slice("meshes/points", p0, p1)
+        connectivity = self._slice("meshes/connectivity", k0, k1) - p0
+        mesh = pv.PolyData(np.array(points, dtype=np.float64),
+                           vtk_faces(connectivity, self._slice("meshes/cell_sizes", c0, c1)))
+        for name in self.result_names():
+            if self._file["results"][name].ndim == 1:
+                mesh.point_data[name] = self.result(name, foundation_id)
+        return mesh
+
+    # --- Результаты ---
+
+    def result_names(self):
+        return list(self._file["results"].keys())
+
+    def result(self, name, foundation_id):
+        """Поле результата одного фундамента (..., P)"""
+        row = self._row_of[foundation_id]
+        p0, p1 = self._point_offsets[row:row + 2]
+        if name in self._arrays:
+            return self._arrays[name][..., p0:p1]
+        return self._file["results"][name][..., p0:p1]
+
+    def result_array(self, name):
+        """Поле результата всех фундаментов подряд (..., N) — одно чтение"""
+        return self._array(f"results/{name}", key=name)
+
+    def results(self, name):
+        """Поле результата всех фундаментов: {id: массив (..., P)} — одно чтение"""
+        values = self.result_array(name)
+        return {foundation_id: values[..., p0:p1] for foundation_id, p0, p1
+                in zip(self._ids.tolist(), self._point_offsets[:-1], self._point_offsets[1:])}
+
+    def _array(self, path, key=None):
+        """Набор данных целиком; прочитанное запоминается для последующих срезов"""
+        key = key or path
+        if key not in self._arrays:
+            self._arrays[key] = self._file[path][()]
+        return self._arrays[key]
+
+    def _slice(self, path, start, stop):
+        if path in self._arrays:
+            return self._arrays[path][start:stop]
+        return self._file[path][start:stop]
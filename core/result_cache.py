@@ -0,0 +1,307 @@
+# core/result_cache.py
+"""
+Двухуровневый кеш результатов расчётов.
+
+Уровень 1 — LRU в памяти, уровень 2 — каталог на диске (переживает
+перезапуск приложения). Ключ — хеш входных данных расчёта (размеры, тип и
+величина нагрузки, сетка, параметры материала), см. cache_key. Оба уровня
+ограничены по объёму: при переполнении вытесняются давно не использованные
+записи. Записи на диске лежат в подкаталоге версии решателя; при смене
+версии старые подкаталоги удаляются.
+
+Каталог по умолчанию задаётся переменной окружения ENGINEERING_SUITE_CACHE
+(иначе ~/.cache/engineering_suite).
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MEMORY_LIMIT = 256 * 2 ** 20
+DEFAULT_DISK_LIMIT = 2 * 2 ** 30
+
+# Точность, с которой сравниваются вещественные входные данные
+KEY_DECIMALS = 9
+
+
+def default_cache_dir():
+    return os.environ.get("ENGINEERING_SUITE_CACHE",
+                          os.path.join(os.path.expanduser("~"), ".cache", "engineering_suite"))
+
+
+def _update_hash(h, value):
+    """Каноническое представление значения в хеше (порядок ключей словаря не важен)"""
+    if isinstance(value, np.ndarray) or isinstance(value, (np.floating, np.integer)):
+        array = np.asarray(value)
+        if array.dtype.kind == "f":
+            array = np.round(array.astype(np.float64), KEY_DECIMALS) + 0.0  # -0.0 -> 0.0
+        array = np.ascontiguousarray(array)
+        h.update(f"a{array.dtype.str}{array.shape}".encode())
+        h.update(array.tobytes())
+    elif isinstance(value, float):
+        h.update(f"f{round(value, KEY_DECIMALS) + 0.0!r}".encode())
+    elif isinstance(value, (bool, int, str, bytes)) or value is None:
+        h.update(f"{type(value).__name__}{value!r}".encode())
+    elif isinstance(value, dict):
+        h.update(b"{")
+        for key in sorted(value, key=repr):
+            _update_hash(h, key)
+            _update_hash(h, value[key])
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(f"({len(value)}".encode())
+        for item in value:
+            _update_hash(h, item)
+        h.update(b")")
+    else:
+        raise TypeError(f"Значение типа {type(value).__name__} нельзя использовать в ключе кеша")
+
+
+def cache_key(*parts):
+    """Хеш входных данных расчёта: числа, строки, массивы NumPy, списки и словари"""
+    h = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        _update_hash(h, part)
+    return h.hexdigest()
+
+
+def file_digest(path, block_size=2 ** 20):
+    """Хеш содержимого файла (читается блоками)"""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    return 64
+
+
+class ResultCache:
+    """
+    Кеш результатов одного решателя.
+
+    name — имя подкаталога на диске, version — версия решателя (строка);
+    disk_dir=False отключает дисковый уровень. Значения — массивы NumPy
+    (хранятся только для чтения) или файлы (put_file/get_file).
+    """
+
+    def __init__(self, name, version, memory_limit=DEFAULT_MEMORY_LIMIT, disk_dir=None,
+                 disk_limit=DEFAULT_DISK_LIMIT):
+        self.name = name
+        self.version = str(version)
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()  # ключ -> (значение, размер)
+        self._memory_size = 0
+        self._lock = threading.RLock()
+
+        self.disk_path = None
+        self._disk_size = 0
+        if disk_dir is not False:
+            root = os.path.join(disk_dir or default_cache_dir(), name)
+            self.disk_path = os.path.join(root, cache_key(self.version)[:16])
+            self._drop_other_versions(root)
+            os.makedirs(self.disk_path, exist_ok=True)
+            self._disk_size = sum(size for _path, size, _atime in self._disk_entries())
+
+    def __len__(self):
+        return len(self._memory)
+
+    def __contains__(self, key):
+        return key in self._memory or self._disk_file(key, ".npy") is not None
+
+    # --- Массивы ---
+
+    def get(self, key, default=None):
+        """Значение из памяти, затем с диска (с подъёмом в память); иначе default"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            path = self._disk_file(key, ".npy")
+            if path is not None:
+                try:
+                    value = np.load(path)
+                except (OSError, ValueError):
+                    self._remove_file(path)
+                else:
+                    _touch(path)
+                    self.disk_hits += 1
+                    return self._remember(key, value)
+
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Сохранение массива на обоих уровнях; возвращает сохранённую копию"""
+        value = np.array(value, copy=True)
+        with self._lock:
+            value = self._remember(key, value)
+            if self.disk_path is not None:
+                self._write(key, ".npy", lambda f: np.save(f, value, allow_pickle=False))
+            return value
+
+    def get_or_compute(self, key, compute, *args):
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute(*args))
+        return value
+
+    # --- Файлы (например, результаты Code_Aster) ---
+
+    def get_file(self, key, suffix=""):
+        """Путь к сохранённому файлу или None (файлы хранятся только на диске)"""
+        with self._lock:
+            path = self._disk_file(key, suffix)
+            if path is None:
+                self.misses += 1
+                return None
+            _touch(path)
+            self.disk_hits += 1
+            return path
+
+    def put_file(self, key, source, suffix=""):
+        """Копирование файла в кеш; возвращает путь к копии"""
+        if self.disk_path is None:
+            raise RuntimeError("Дисковый уровень кеша отключён")
+        with self._lock:
+            return self._write(key, suffix, lambda f: _copy_into(source, f))
+
+    # --- Обслуживание ---
+
+    def discard(self, key):
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None:
+                self._memory_size -= entry[1]
+            if self.disk_path is not None:
+                for name in os.listdir(self.disk_path):
+                    if name.split(".", 1)[0] == key:
+                        self._remove_file(os.path.join(self.disk_path, name))
+
+    def clear(self, disk=True):
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            if disk and self.disk_path is not None:
+                shutil.rmtree(self.disk_path, ignore_errors=True)
+                os.makedirs(self.disk_path, exist_ok=True)
+                self._disk_size = 0
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "version": self.version,
+            "entries": len(self._memory),
+            "memory_bytes": self._memory_size,
+            "disk_bytes": self._disk_size,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    # --- Внутреннее ---
+
+    def _remember(self, key, value):
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        size = _nbytes(value)
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= old[1]
+        if size > self.memory_limit:
+            return value
+        self._memory[key] = (value, size)
+        self._memory_size += size
+        while self._memory_size > self.memory_limit:
+            _key, (_value, old_size) = self._memory.popitem(last=False)
+            self._memory_size -= old_size
+        return value
+
+    def _disk_file(self, key, suffix=""):
+        if self.disk_path is None:
+            return None
+        path = os.path.join(self.disk_path, key + suffix)
+        return path if os.path.exists(path) else None
+
+    def _write(self, key, suffix, writer):
+        """Атомарная запись (через временный файл) с последующим вытеснением"""
+        path = os.path.join(self.disk_path, key + suffix)
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        fd, tmp = tempfile.mkstemp(dir=self.disk_path, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._disk_size += os.path.getsize(path) - old_size
+        if self._disk_size > self.disk_limit:
+            self._evict_disk(keep=path)
+        return path
+
+    def _evict_disk(self, keep=None):
+        """Удаление файлов с самым старым временем доступа до 90 % лимита"""
+        target = 0.9 * self.disk_limit
+        for path, _size, _atime in sorted(self._disk_entries(), key=lambda entry: entry[2]):
+            if self._disk_size <= target:
+                break
+            if path != keep:
+                self._remove_file(path)
+
+    def _disk_entries(self):
+        entries = []
+        with os.scandir(self.disk_path) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.startswith(".tmp_"):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, max(stat.st_atime, stat.st_mtime)))
+        return entries
+
+    def _remove_file(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        self._disk_size -= size
+
+    def _drop_other_versions(self, root):
+        """Инвалидация: удаление записей других версий решателя"""
+        if not os.path.isdir(root):
+            return
+        current = os.path.basename(self.disk_path)
+        for name in os.listdir(root):
+            if name != current:
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def _touch(path):
+    """Отметка использования для вытеснения (atime часто не обновляется ФС)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _copy_into(source, f):
+    with open(source, "rb") as src:
+        shutil.copyfileobj(src, f, 2 ** 20)
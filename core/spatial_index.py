@@ -0,0 +1,140 @@
+# core/spatial_index.py
+"""
+Пространственный индекс на равномерной хеш-сетке (в плане, XY).
+
+Хранит два слоя объектов:
+  - прямоугольники (подошвы фундаментов) — для проверки пересечений
+    и поиска объекта под курсором;
+  - точки привязки (углы фундаментов, вершины вспомогательных линий) —
+    для поиска ближайшей точки привязки.
+Индекс обновляется инкрементно: вставка и удаление затрагивают только
+ячейки, которые покрывает объект, поэтому запросы на каждом движении мыши
+остаются быстрыми и при тысячах объектов.
+"""
+import math
+from collections import defaultdict
+
+
+class SpatialIndex:
+    """Хеш-сетка с ячейками размера cell_size"""
+
+    def __init__(self, cell_size=2.0):
+        if cell_size <= 0:
+            raise ValueError("Размер ячейки должен быть положительным")
+        self.cell_size = float(cell_size)
+        self._boxes = {}                    # ключ -> (xmin, ymin, xmax, ymax)
+        self._box_cells = defaultdict(set)  # ячейка -> ключи прямоугольников
+        self._points = {}                   # ключ -> (x, y)
+        self._point_cells = defaultdict(set)
+
+    def __len__(self):
+        return len(self._boxes) + len(self._points)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _cells_in(self, xmin, ymin, xmax, ymax):
+        ix0, iy0 = self._cell(xmin, ymin)
+        ix1, iy1 = self._cell(xmax, ymax)
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                yield ix, iy
+
+    # --- Прямоугольники ---
+
+    def insert_box(self, key, min_xy, max_xy):
+        """Добавление (или замена) прямоугольника с углами min_xy, max_xy"""
+        if key in self._boxes:
+            self.remove_box(key)
+        box = (float(min(min_xy[0], max_xy[0])), float(min(min_xy[1], max_xy[1])),
+               float(max(min_xy[0], max_xy[0])), float(max(min_xy[1], max_xy[1])))
+        self._boxes[key] = box
+        for cell in self._cells_in(*box):
+            self._box_cells[cell].add(key)
+
+    def remove_box(self, key):
+        box = self._boxes.pop(key)
+        for cell in self._cells_in(*box):
+            keys = self._box_cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._box_cells[cell]
+
+    def box(self, key):
+        return self._boxes[key]
+
+    def query_point(self, xy):
+        """Ключи прямоугольников, содержащих точку (что находится под курсором)"""
+        x, y = float(xy[0]), float(xy[1])
+        result = []
+        for key in self._box_cells.get(self._cell(x, y), ()):
+            xmin, ymin, xmax, ymax = self._boxes[key]
+            if xmin <= x <= xmax and ymin <= y <= ymax:
+                result.append(key)
+        return result
+
+    def query_box(self, min_xy, max_xy, touching=False):
+        """
+        Ключи прямоугольников, пересекающихся с заданным.
+        По умолчанию касание сторонами пересечением не считается.
+        """
+        qxmin, qymin = min(min_xy[0], max_xy[0]), min(min_xy[1], max_xy[1])
+        qxmax, qymax = max(min_xy[0], max_xy[0]), max(min_xy[1], max_xy[1])
+        found = set()
+        for cell in self._cells_in(qxmin, qymin, qxmax, qymax):
+            for key in self._box_cells.get(cell, ()):
+                if key in found:
+                    continue
+                xmin, ymin, xmax, ymax = self._boxes[key]
+                if touching:
+                    hit = xmin <= qxmax and qxmin <= xmax and ymin <= qymax and qymin <= ymax
+                else:
+                    hit = xmin < qxmax and qxmin < xmax and ymin < qymax and qymin < ymax
+                if hit:
+                    found.add(key)
+        return list(found)
+
+    # --- Точки привязки ---
+
+    def insert_point(self, key, xy):
+        if key in self._points:
+            self.remove_point(key)
+        point = (float(xy[0]), float(xy[1]))
+        self._points[key] = point
+        self._point_cells[self._cell(*point)].add(key)
+
+    def remove_point(self, key):
+        point = self._points.pop(key)
+        cell = self._cell(*point)
+        keys = self._point_cells[cell]
+        keys.discard(key)
+        if not keys:
+            del self._point_cells[cell]
+
+    def point(self, key):
+        return self._points[key]
+
+    def nearest_point(self, xy, max_distance):
+        """
+        Ближайшая точка привязки не дальше max_distance.
+        Возвращает (ключ, (x, y), расстояние) или None.
+        """
+        x, y = float(xy[0]), float(xy[1])
+        best = None
+        best_dist2 = max_distance * max_distance
+        for cell in self._cells_in(x - max_distance, y - max_distance, x + max_distance, y + max_distance):
+            for key in self._point_cells.get(cell, ()):
+                px, py = self._points[key]
+                dist2 = (px - x) ** 2 + (py - y) ** 2
+                if dist2 <= best_dist2:
+                    best = (key, (px, py))
+                    best_dist2 = dist2
+        if best is None:
+            return None
+        return best[0], best[1], math.sqrt(best_dist2)
+
+    def clear(self):
+        self._boxes.clear()
+        self._box_cells.clear()
+        self._points.clear()
+        self._point_cells.clear()
@@ -1,21 +1,108 @@
-# cython: language_level=3
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
 import numpy as np
+cimport openmp
 from cython.parallel import prange
 
+# Число потоков OpenMP по умолчанию (0 — решает среда выполнения, OMP_NUM_THREADS)
+cdef int _num_threads = 0
+
+
+def set_num_threads(int n):
+    """Установка числа потоков для расчёта (0 — значение OpenMP по умолчанию)"""
+    global _num_threads
+    if n < 0:
+        raise ValueError("Число потоков не может быть отрицательным")
+    _num_threads = n
+
+
+def get_num_threads():
+    """Фактическое число потоков, которое будет использовано при расчёте"""
+    return _resolve_threads(0)
+
+
+cdef int _resolve_threads(int requested):
+    if requested > 0:
+        return requested
+    if _num_threads > 0:
+        return _num_threads
+    return openmp.omp_get_max_threads()
+
+
+def isotropic_stiffness(double young_modulus, double poisson_ratio=0.0):
+    """
+    Матрица жёсткости 6x6 изотропного материала в нотации Фойгта
+    (порядок: xx, yy, zz, yz, xz, xy; сдвиги — инженерные деформации γ).
+    """
+    if not -1.0 < poisson_ratio < 0.5:
+        raise ValueError("Коэффициент Пуассона должен лежать в интервале (-1, 0.5)")
+    lam = young_modulus * poisson_ratio / ((1 + poisson_ratio) * (1 - 2 * poisson_ratio))
+    mu = young_modulus / (2 * (1 + poisson_ratio))
+
+    stiffness = np.zeros((6, 6))
+    stiffness[:3, :3] = lam
+    stiffness[[0, 1, 2], [0, 1, 2]] = lam + 2 * mu
+    stiffness[[3, 4, 5], [3, 4, 5]] = mu
+    return stiffness
+
+
 # Автоматически компилируется в C++ с оптимизациями
-def calculate_stress(double[:, :] strain_tensor, double young_modulus):
+def calculate_stress(double[:, :] strain_tensor, double young_modulus, double poisson_ratio=0.0,
+                     stiffness=None, out=None, int num_threads=0):
     """
     Расчёт тензора напряжений по закону Гука (3D).
-    Выполняется на C++ после компиляции.
+    Выполняется на C++ после компиляции, цикл распараллелен через OpenMP без GIL.
+
+    strain_tensor — (n, 6) деформации в нотации Фойгта (xx, yy, zz, yz, xz, xy)
+    или (n, 3) только нормальные деформации;
+    stiffness — необязательная анизотропная матрица жёсткости 6x6 (только для n x 6);
+    out — необязательный C-непрерывный буфер результата той же формы;
+    num_threads — число потоков для этого вызова (0 — см. set_num_threads).
     """
-    cdef int i, j
-    cdef int n = strain_tensor.shape[0]
-    cdef double[:, :] stress_tensor = np.zeros((n, 3))
+    cdef Py_ssize_t i, j, k
+    cdef Py_ssize_t n = strain_tensor.shape[0]
+    cdef Py_ssize_t m = strain_tensor.shape[1]
+    cdef int threads = _resolve_threads(num_threads)
+    cdef double lam, mu, trace
+    cdef double[:, ::1] c
+    cdef double[:, ::1] stress_tensor
+
+    if m != 3 and m != 6:
+        raise ValueError("Ожидается тензор деформаций формы (n, 3) или (n, 6)")
+
+    if out is None:
+        out = np.empty((n, m))
+    stress_tensor = out
+    if stress_tensor.shape[0] != n or stress_tensor.shape[1] != m:
+        raise ValueError("Форма буфера out не совпадает с формой тензора деформаций")
+
+    if stiffness is not None:
+        if m != 6:
+            raise ValueError("Анизотропная матрица жёсткости требует 6 компонент деформации")
+        c = np.ascontiguousarray(stiffness, dtype=np.float64)
+        if c.shape[0] != 6 or c.shape[1] != 6:
+            raise ValueError("Матрица жёсткости должна иметь форму (6, 6)")
+
+        # Параллельный цикл через OpenMP: σ = C · ε
+        for i in prange(n, nogil=True, num_threads=threads, schedule="static"):
+            for j in range(6):
+                stress_tensor[i, j] = (c[j, 0] * strain_tensor[i, 0] + c[j, 1] * strain_tensor[i, 1]
+                                       + c[j, 2] * strain_tensor[i, 2] + c[j, 3] * strain_tensor[i, 3]
+                                       + c[j, 4] * strain_tensor[i, 4] + c[j, 5] * strain_tensor[i, 5])
+        return np.asarray(out)
+
+    if not -1.0 < poisson_ratio < 0.5:
+        raise ValueError("Коэффициент Пуассона должен лежать в интервале (-1, 0.5)")
+    lam = young_modulus * poisson_ratio / ((1 + poisson_ratio) * (1 - 2 * poisson_ratio))
+    mu = young_modulus / (2 * (1 + poisson_ratio))
 
-    # Параллельный цикл через OpenMP
-    for i in prange(n, nogil=True):
-        stress_tensor[i, 0] = young_modulus * strain_tensor[i, 0]  # σ_x
-        stress_tensor[i, 1] = young_modulus * strain_tensor[i, 1]  # σ_y
-        stress_tensor[i, 2] = young_modulus * strain_tensor[i, 2]  # σ_z
+    # Параллельный цикл через OpenMP: σ = λ·tr(ε)·I + 2μ·ε
+    for i in prange(n, nogil=True, num_threads=threads, schedule="static"):
+        trace = strain_tensor[i, 0] + strain_tensor[i, 1] + strain_tensor[i, 2]
+        stress_tensor[i, 0] = lam * trace + 2 * mu * strain_tensor[i, 0]  # σ_x
+        stress_tensor[i, 1] = lam * trace + 2 * mu * strain_tensor[i, 1]  # σ_y
+        stress_tensor[i, 2] = lam * trace + 2 * mu * strain_tensor[i, 2]  # σ_z
+        if m == 6:
+            for k in range(3, 6):
+                stress_tensor[i, k] = mu * strain_tensor[i, k]  # τ_yz, τ_xz, τ_xy
 
-    return np.asarray(stress_tensor)
\ No newline at end of file
+    return np.asarray(out)
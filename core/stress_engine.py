@@ -0,0 +1,220 @@
+# core/stress_engine.py
+"""
+Векторизованный расчёт напряжений в фундаментах.
+
+Все функции работают над целыми массивами точек без циклов Python и
+повторяют формулы EngineeringSuiteApp.calculate_foundation_stress.
+Пакетные функции принимают сразу много фундаментов:
+  - «стопку» точек формы (F, P, 3) — у всех фундаментов одинаковое число точек;
+  - один сцеплённый массив (N, 3) плюс смещения offsets длины F + 1,
+    где точки фундамента i лежат в points[offsets[i]:offsets[i + 1]].
+"""
+import numpy as np
+
+from .result_cache import cache_key
+
+# Версия формул: при изменении расчёта её нужно увеличить, чтобы сбросить кеш результатов
+SOLVER_VERSION = "stress_engine/1"
+
+# Типы нагрузки в том виде, в каком они показаны в интерфейсе
+LOAD_UNIFORM = "Равномерная"
+LOAD_POINT_CENTER = "Точечная в центре"
+LOAD_POINT_CORNER = "Точечная в углу"
+LOAD_LINEAR = "Линейная"
+
+LOAD_TYPES = (LOAD_UNIFORM, LOAD_POINT_CENTER, LOAD_POINT_CORNER, LOAD_LINEAR)
+
+# Код для неизвестного типа нагрузки: напряжения остаются нулевыми
+UNKNOWN_LOAD_CODE = -1
+
+
+def load_type_codes(load_types):
+    """Преобразование названий типов нагрузки в целочисленные коды"""
+    if isinstance(load_types, (str, int, np.integer)):
+        load_types = [load_types]
+    codes = np.empty(len(load_types), dtype=np.int8)
+    for i, load_type in enumerate(load_types):
+        if isinstance(load_type, str):
+            codes[i] = LOAD_TYPES.index(load_type) if load_type in LOAD_TYPES else UNKNOWN_LOAD_CODE
+        else:
+            codes[i] = load_type
+    return codes
+
+
+def _expand(values, counts):
+    """Размножение параметров фундаментов на все их точки"""
+    return np.repeat(np.asarray(values, dtype=np.float64), counts, axis=0)
+
+
+def _flatten(points, offsets):
+    """Приведение входа к виду (N, 3) + число точек каждого фундамента"""
+    points = np.asarray(points, dtype=np.float64)
+    if offsets is None:
+        if points.ndim != 3 or points.shape[-1] != 3:
+            raise ValueError("Ожидается массив точек формы (F, P, 3) или offsets")
+        n_foundations, n_points = points.shape[:2]
+        counts = np.full(n_foundations, n_points, dtype=np.intp)
+        return points.reshape(-1, 3), counts, points.shape[:2]
+
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if points.ndim != 2 or points.shape[-1] != 3:
+        raise ValueError("Ожидается массив точек формы (N, 3)")
+    if offsets[0] != 0 or offsets[-1] != len(points) or np.any(np.diff(offsets) < 0):
+        raise ValueError("Некорректные смещения offsets")
+    return points, np.diff(offsets), (len(points),)
+
+
+def batch_initial_stress(points, positions, offsets=None):
+    """
+    Начальное поле напряжений для визуализации (как в create_foundation):
+    больше у краёв, меньше в центре.
+    """
+    flat, counts, shape = _flatten(points, offsets)
+    center = _expand(positions, counts)
+
+    dist = np.sqrt((flat[:, 0] - center[:, 0]) ** 2 + (flat[:, 1] - center[:, 1]) ** 2)
+    stress = 1e6 * (1 - np.exp(-dist / 2))
+    return stress.reshape(shape)
+
+
+def batch_foundation_stress(points, dimensions, positions, load_values, load_types, offsets=None):
+    """
+    Расчёт напряжений в точках сразу для многих фундаментов.
+
+    dimensions — (F, 3) ширина, длина, толщина;
+    positions — (F, 3) центры фундаментов;
+    load_values — (F,) величины нагрузки, Н;
+    load_types — F названий типов нагрузки или их кодов (см. load_type_codes).
+    """
+    flat, counts, shape = _flatten(points, offsets)
+    dims = np.asarray(dimensions, dtype=np.float64).reshape(-1, 3)
+    codes = load_type_codes(load_types)
+    if not (len(dims) == len(counts) == len(codes)):
+        raise ValueError("Число параметров не совпадает с числом фундаментов")
+
+    width = _expand(dims[:, 0], counts)
+    length = _expand(dims[:, 1], counts)
+    thickness = _expand(dims[:, 2], counts)
+    center = _expand(np.asarray(positions, dtype=np.float64).reshape(-1, 3), counts)
+    load = _expand(load_values, counts)
+    code = np.repeat(codes, counts)
+
+    x = flat[:, 0]
+    y = flat[:, 1]
+    z = flat[:, 2]
+    max_size = np.maximum(width, length)
+    stress = np.zeros(len(flat))
+
+    # Равномерное распределение по площади с небольшим снижением к краям
+    mask = code == 0
+    if mask.any():
+        dist = np.sqrt((x[mask] - center[mask, 0]) ** 2 + (y[mask] - center[mask, 1]) ** 2)
+        base_pressure = load[mask] / (width[mask] * length[mask])
+        stress[mask] = base_pressure * (1 - 0.1 * dist / max_size[mask])
+
+    # Сосредоточенная нагрузка: экспоненциальное снижение от центра или от угла
+    for point_code in (1, 2):
+        mask = code == point_code
+        if not mask.any():
+            continue
+        origin_x = center[mask, 0]
+        origin_y = center[mask, 1]
+        if point_code == 2:
+            origin_x = origin_x - width[mask] / 2
+            origin_y = origin_y - length[mask] / 2
+        dist = np.sqrt((x[mask] - origin_x) ** 2 + (y[mask] - origin_y) ** 2)
+        m = max_size[mask]
+        stress[mask] = load[mask] * np.exp(-2 * dist / m) / (np.pi * (m / 4) ** 2)
+
+    # Линейное распределение вдоль оси X
+    mask = code == 3
+    if mask.any():
+        norm_x = (x[mask] - center[mask, 0]) / (width[mask] / 2)
+        factor = 0.5 + 0.5 * norm_x
+        stress[mask] = (load[mask] / (width[mask] * length[mask])) * factor
+
+    # Учёт глубины: напряжения снижаются к верху фундамента
+    rel_height = (z - (center[:, 2] - thickness / 2)) / thickness
+    stress *= (1 - 0.3 * rel_height)
+
+    return stress.reshape(shape)
+
+
+def foundation_stress(points, dimensions, position, load_value, load_type):
+    """Расчёт напряжений в точках одного фундамента"""
+    points = np.asarray(points, dtype=np.float64)
+    return batch_foundation_stress(points[np.newaxis], [dimensions], [position],
+                                   [load_value], [load_type])[0]
+
+
+def initial_stress(points, position):
+    """Начальное поле напряжений одного фундамента"""
+    points = np.asarray(points, dtype=np.float64)
+    return batch_initial_stress(points[np.newaxis], [position])[0]
+
+
+def stress_cache_key(points, dimensions, position, load_value, load_type):
+    """
+    Ключ кеша результата одного фундамента. Напряжения зависят только от
+    положения точек относительно центра, поэтому в ключ входят сетка в
+    локальных координатах (её разрешение и форма), размеры и нагрузка —
+    одинаковые фундаменты в разных местах площадки делят один результат.
+    """
+    position = np.asarray(position, dtype=np.float64)
+    local_points = np.asarray(points, dtype=np.float64) - position
+    return cache_key(SOLVER_VERSION, local_points, np.asarray(dimensions, dtype=np.float64),
+                     float(load_value), int(load_type_codes([load_type])[0]))
+
+
+def load_case_stress(points, dimensions, position, cases):
+    """
+    Напряжения одного фундамента для всех случаев пакета cases
+    (core.load_cases.LoadCases): результат (k, P). Формулы линейны по
+    величине нагрузки — считается по одному полю на тип нагрузки.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    return foundation_group_load_cases([points], [dimensions], [position], cases)[0]
+
+
+def load_case_cache_key(points, dimensions, position, cases):
+    """Ключ кеша пакета случаев одного фундамента (как stress_cache_key)"""
+    position = np.asarray(position, dtype=np.float64)
+    local_points = np.asarray(points, dtype=np.float64) - position
+    return cache_key(SOLVER_VERSION, "load_cases", local_points, np.asarray(dimensions, dtype=np.float64),
+                     cases.key())
+
+
+def split_by_offsets(values, offsets):
+    """Разбиение сцеплённого результата обратно по фундаментам (без копирования)"""
+    offsets = np.asarray(offsets, dtype=np.intp)
+    return [values[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def foundation_group_stress(points_list, dimensions, positions, load_values, load_types):
+    """
+    Расчёт напряжений для группы фундаментов с разным числом точек.
+    Возвращает список массивов напряжений в порядке points_list.
+    """
+    counts = [len(points) for points in points_list]
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.intp)
+    points = np.concatenate(points_list) if points_list else np.empty((0, 3))
+    stress = batch_foundation_stress(points, dimensions, positions, load_values, load_types, offsets=offsets)
+    return split_by_offsets(stress, offsets)
+
+
+def foundation_group_load_cases(points_list, dimensions, positions, cases):
+    """
+    Пакет случаев для группы фундаментов: список массивов (k, P_i) в
+    порядке points_list. Все фундаменты считаются одним вызовом
+    batch_foundation_stress на каждый тип нагрузки.
+    """
+    counts = [len(points) for points in points_list]
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.intp)
+    points = np.concatenate(points_list) if points_list else np.empty((0, 3))
+    unit_load = np.ones(len(points_list))
+    types, inverse = cases.unit_types()
+    unit = np.stack([batch_foundation_stress(points, dimensions, positions, unit_load,
+                                             np.full(len(points_list), code, dtype=np.int8), offsets=offsets)
+                     for code in types.tolist()])
+    stress = cases.scale(unit, inverse)
+    return [stress[:, offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
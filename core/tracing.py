@@ -0,0 +1,302 @@
+# core/tracing.py
+"""
+Трассировка и метрики интерактивных обработчиков.
+
+Именованные интервалы (span) вокруг обработки мыши, пикинга, перестроения
+предпросмотра, расчёта напряжений и рендера:
+
+    with tracing.span("pick"):
+        picker.Pick(x, y, 0, renderer)
+
+По каждому имени собирается гистограмма длительностей, события
+сохраняются в кольцевой буфер и выгружаются в формат Chrome trace
+(chrome://tracing, Perfetto) или в JSON со сводкой гистограмм. Интервалы
+верхнего уровня GUI-потока вместе с вложенными складываются в «кадр»;
+кадр закрывается интервалом рендера и доступен как last_frame (для
+оверлея в сцене).
+
+Пока трассировка выключена, span() возвращает общий пустой объект —
+стоимость вызова сводится к проверке флага.
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+
+# Интервал, которым заканчивается кадр
+RENDER_SPAN = "render"
+
+# Подынтервалов гистограммы на октаву: относительная ошибка процентилей ~9 %
+_SUB_BUCKETS = 8
+# Записей кадра, ожидающих рендера (если рендера нет, старые отбрасываются)
+_MAX_PENDING = 256
+
+
+class Histogram:
+    """Логарифмическая гистограмма длительностей (секунды)"""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = {}
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > 0:
+            mantissa, exponent = math.frexp(value)
+            index = exponent * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+        else:
+            index = None
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    @staticmethod
+    def _upper_bound(index):
+        if index is None:
+            return 0.0
+        exponent, sub = divmod(index, _SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub + 1) / (2 * _SUB_BUCKETS), exponent)
+
+    def percentile(self, q):
+        """Оценка процентиля q (0..100) сверху — по границе подынтервала"""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index in sorted(self.buckets, key=lambda i: -math.inf if i is None else i):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(self._upper_bound(index), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class _NullSpan:
+    """Пустой интервал выключенной трассировки"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def annotate(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Интервал трассировки; используется как контекстный менеджер"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start", "depth")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+        self.depth = 0
+
+    def __enter__(self):
+        self.depth = self.tracer._push()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._finish(self, time.perf_counter_ns())
+        return False
+
+    def annotate(self, **args):
+        """Дополнительные поля события (видны в Chrome trace)"""
+        self.args.update(args)
+
+
+class Tracer:
+    """Сборщик интервалов, гистограмм и кадров"""
+
+    def __init__(self, max_events=200_000):
+        self.enabled = False
+        self.events = deque(maxlen=max_events)
+        self.histograms = {}
+        self.last_frame = None
+        self.frame_listeners = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+        self._pending = deque(maxlen=_MAX_PENDING)
+        self._rendered = False
+
+    # --- Включение ---
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Сброс собранных событий, гистограмм и кадров"""
+        with self._lock:
+            self.events.clear()
+            self.histograms = {}
+            self.last_frame = None
+            self._pending.clear()
+            self._rendered = False
+
+    # --- Запись ---
+
+    def span(self, name, category="app", **args):
+        """Интервал name; при выключенной трассировке — пустой объект"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args)
+
+    def traced(self, name=None, category="app"):
+        """Декоратор: вызов функции как интервал (имя по умолчанию — имя функции)"""
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, category, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def observe(self, name, value):
+        """Значение метрики name вне интервалов (например, размер очереди)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(value)
+
+    def histogram(self, name):
+        return self.histograms.get(name)
+
+    def _state(self):
+        local = self._local
+        if not hasattr(local, "depth"):
+            local.depth = 0
+            local.is_main = threading.current_thread() is threading.main_thread()
+            local.frame = []
+        return local
+
+    def _push(self):
+        local = self._state()
+        local.depth += 1
+        return local.depth - 1
+
+    def _finish(self, span, end):
+        local = self._state()
+        local.depth -= 1
+        duration = end - span.start
+        seconds = duration * 1e-9
+        with self._lock:
+            self.events.append((span.name, span.category, span.start, duration, threading.get_ident(), span.args))
+            histogram = self.histograms.get(span.name)
+            if histogram is None:
+                histogram = self.histograms[span.name] = Histogram()
+            histogram.add(seconds)
+
+        if not local.is_main:
+            return
+        local.frame.append((span.start, span.depth, span.name, seconds))
+        if span.name == RENDER_SPAN:
+            self._rendered = True
+        if span.depth == 0:
+            self._pending.extend(sorted(local.frame))
+            local.frame = []
+            if self._rendered:
+                self._publish_frame()
+
+    def _publish_frame(self):
+        frame = [(depth, name, seconds) for _start, depth, name, seconds in self._pending]
+        self._pending.clear()
+        self._rendered = False
+        self.last_frame = frame
+        for listener in list(self.frame_listeners):
+            listener(frame)
+
+    # --- Выгрузка ---
+
+    def summary(self):
+        """Сводка гистограмм {имя: {count, mean, p50, p95, ...}} в секундах"""
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def chrome_trace(self):
+        """События в формате Chrome trace (словарь для json.dump)"""
+        with self._lock:
+            events = list(self.events)
+        pid = os.getpid()
+        trace_events = []
+        for name, category, start, duration, tid, args in events:
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                     "ts": (start - self._origin) / 1e3, "dur": duration / 1e3}
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        main = threading.main_thread()
+        trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": main.ident,
+                             "args": {"name": "GUI"}})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms", "otherData": {"metrics": self.summary()}}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False, default=str)
+
+    def export_metrics(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"metrics": self.summary()}, f, ensure_ascii=False, indent=2)
+
+
+# Трассировщик приложения и функции-обёртки над ним
+tracer = Tracer()
+
+enable = tracer.enable
+disable = tracer.disable
+reset = tracer.reset
+span = tracer.span
+traced = tracer.traced
+observe = tracer.observe
+summary = tracer.summary
+export_chrome_trace = tracer.export_chrome_trace
+export_metrics = tracer.export_metrics
+
+
+def is_enabled():
+    return tracer.enabled
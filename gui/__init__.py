@@ -1,2 +1,10 @@
 # gui/__init__.py
-from .main_window import MainWindow
\ No newline at end of file
+# MainWindow подгружается при первом обращении: импорт gui.startup не должен
+# тянуть за собой NumPy и скомпилированное ядро
+
+
+def __getattr__(name):
+    if name == "MainWindow":
+        from .main_window import MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,8 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QGroupBox,
                              QSlider, QLabel, QCheckBox, QHBoxLayout)
 from PyQt5.QtCore import Qt
 
+from .model_tree import ModelTree
+
 
 class FoundationTools(QWidget):
     def __init__(self, parent=None):
@@ -53,6 +55,31 @@ class FoundationTools(QWidget):
         self.apply_btn.setEnabled(False)
         main_layout.addWidget(self.apply_btn)
 
+        # Сохранение и открытие проекта
+        project_group = QGroupBox("Проект")
+        project_layout = QHBoxLayout()
+
+        self.open_project_btn = QPushButton("Открыть...")
+        project_layout.addWidget(self.open_project_btn)
+        self.save_project_btn = QPushButton("Сохранить...")
+        project_layout.addWidget(self.save_project_btn)
+
+        project_group.setLayout(project_layout)
+        main_layout.addWidget(project_group)
+
+        # Группа для импорта BIM-моделей
+        bim_group = QGroupBox("BIM-модель")
+        bim_layout = QVBoxLayout()
+
+        self.import_ifc_btn = QPushButton("Импорт IFC...")
+        bim_layout.addWidget(self.import_ifc_btn)
+
+        self.model_tree = ModelTree()
+        bim_layout.addWidget(self.model_tree)
+
+        bim_group.setLayout(bim_layout)
+        main_layout.addWidget(bim_group)
+
         main_layout.addStretch()
         self.setLayout(main_layout)
 
@@ -0,0 +1,105 @@
+# gui/ifc_import.py
+"""
+Фоновый импорт IFC: генератор bim.ifc_importer.iter_ifc_batches работает
+в потоке пула, а готовые пакеты элементов приходят в GUI-поток сигналом
+batch_ready. Модель BimModel пополняется только в GUI-потоке, поэтому
+обработчики сигналов могут сразу обновлять сцену и дерево модели.
+"""
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from bim.ifc_importer import BimModel, iter_ifc_batches
+
+
+class _ImportSignals(QObject):
+    batch = pyqtSignal(object)
+    progress = pyqtSignal(int, float)
+    done = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class _ImportRunnable(QRunnable):
+    def __init__(self, file_path, options, cancel_event, signals):
+        super().__init__()
+        self.file_path = file_path
+        self.options = options
+        self.cancel_event = cancel_event
+        self.signals = signals
+
+    def run(self):
+        try:
+            for batch in iter_ifc_batches(self.file_path, cancel_event=self.cancel_event,
+                                          on_progress=self.signals.progress.emit, **self.options):
+                if self.cancel_event.is_set():
+                    return
+                self.signals.batch.emit(batch)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+            return
+        if not self.cancel_event.is_set():
+            self.signals.done.emit()
+
+
+class IfcImport(QObject):
+    """
+    Один фоновый импорт IFC-файла. Все сигналы испускаются в GUI-потоке.
+    options передаются в iter_ifc_batches (batch_size, include_types, ...).
+    """
+    batch_ready = pyqtSignal(object, object)  # модель, пакет
+    progress = pyqtSignal(int, int)           # элементов импортировано, процент
+    finished = pyqtSignal(object)             # модель
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path, pool=None, parent=None, **options):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.options = options
+        self.model = BimModel(file_path)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.cancel_event = threading.Event()
+        self._running = False
+
+        self._signals = _ImportSignals()
+        self._signals.batch.connect(self._on_batch)
+        self._signals.progress.connect(self._on_progress)
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    def start(self):
+        self._running = True
+        self.pool.start(_ImportRunnable(self.file_path, self.options, self.cancel_event, self._signals))
+
+    def is_running(self):
+        return self._running
+
+    def cancel(self):
+        """Отмена: пакеты, пришедшие после отмены, отбрасываются"""
+        if not self._running:
+            return
+        self._running = False
+        self.cancel_event.set()
+        self.model.cancelled = True
+        self.cancelled.emit()
+
+    def _on_batch(self, batch):
+        if not self._running:
+            return
+        self.model.add_batch(batch)
+        self.batch_ready.emit(self.model, batch)
+
+    def _on_progress(self, count, percent):
+        if self._running:
+            self.progress.emit(count, int(percent))
+
+    def _on_done(self):
+        if self._running:
+            self._running = False
+            self.finished.emit(self.model)
+
+    def _on_failed(self, message):
+        if self._running:
+            self._running = False
+            self.failed.emit(message)
@@ -1,6 +1,21 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QPushButton
+from PyQt5.QtWidgets import QApplication, QMainWindow, QPushButton, QShortcut
+from PyQt5.QtGui import QKeySequence
 import numpy as np
 from core import stress_calculator  # ← Вызывает скомпилированный C++ код!
+from gui.stress_jobs import JobScheduler
+
+# Размер расчёта и число строк в одном фоновом задании
+N_ROWS = 1000000
+ROWS_PER_JOB = 125000
+
+
+def _calculate_chunk(start, stop, young_modulus, stress_result):
+    """Генерация и расчёт одной части массива деформаций (в рабочем потоке)"""
+    rng = np.random.default_rng(start)
+    strain_data = rng.uniform(0.001, 0.01, (stop - start, 3))
+    # Запись прямо в общий буфер результата: части не пересекаются
+    stress_calculator.calculate_stress(strain_data, young_modulus, out=stress_result[start:stop])
+    return stop - start
 
 
 class MainWindow(QMainWindow):
@@ -11,19 +26,57 @@ class MainWindow(QMainWindow):
         self.button.clicked.connect(self.run_calculation)
         self.setCentralWidget(self.button)
 
+        self.job_scheduler = JobScheduler(parent=self)
+        self.batch = None
+        self.stress_result = None
+        QShortcut(QKeySequence("Escape"), self, activated=self.cancel_calculation)
+
     def run_calculation(self):
-        # Генерация данных на Python
-        strain_data = np.random.uniform(0.001, 0.01, (1000000, 3))
+        # Генерация данных и расчёт выполняются в пуле потоков по частям
         E = 210e9  # Модуль Юнга для стали
+        self.stress_result = np.empty((N_ROWS, 3))
+
+        jobs = [(start, _calculate_chunk, (start, min(start + ROWS_PER_JOB, N_ROWS), E, self.stress_result))
+                for start in range(0, N_ROWS, ROWS_PER_JOB)]
+        self.batch = self.job_scheduler.submit(jobs)
+        self.batch.progress.connect(self.on_progress)
+        self.batch.finished.connect(self.on_finished)
+        self.batch.cancelled.connect(self.on_cancelled)
+        self.batch.failed.connect(self.on_failed)
+
+        self.button.setEnabled(False)
+        self.statusBar().showMessage("Расчёт... (Esc — отмена)")
+
+    def cancel_calculation(self):
+        if self.batch is not None and self.batch.is_running():
+            self.batch.cancel()
+
+    def on_progress(self, done, total):
+        self.statusBar().showMessage(f"Расчёт: {done}/{total} (Esc — отмена)")
+
+    def on_finished(self, _results):
+        print(f"Расчёт завершён! Среднее напряжение: {np.mean(self.stress_result):.2e} Па")
+        self.statusBar().showMessage("Расчёт завершён", 3000)
+        self.button.setEnabled(True)
+
+    def on_cancelled(self):
+        print("Расчёт отменён")
+        self.statusBar().showMessage("Расчёт отменён", 3000)
+        self.button.setEnabled(True)
 
-        # Вызов C++ кода через Python API
-        stress_result = stress_calculator.calculate_stress(strain_data, E)
+    def on_failed(self, _key, message):
+        print(f"Ошибка расчёта:\n{message}")
+        self.statusBar().showMessage("Ошибка расчёта", 3000)
+        self.button.setEnabled(True)
 
-        print(f"Расчёт завершён! Среднее напряжение: {np.mean(stress_result):.2e} Па")
+    def closeEvent(self, event):
+        self.job_scheduler.cancel_all()
+        self.job_scheduler.wait()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
     app = QApplication([])
     window = MainWindow()
     window.show()
-    app.exec_()
\ No newline at end of file
+    app.exec_()
@@ -0,0 +1,82 @@
+# gui/model_tree.py
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem
+
+
+class ModelTree(QTreeWidget):
+    """
+    Дерево импортированной модели: этаж -> тип IFC (число элементов).
+    Заполняется по пакетам во время импорта; элементы отдельными строками
+    не создаются, номера элементов хранятся в узлах типов.
+    Флажки этажей управляют их видимостью в сцене (сигнал storeys_changed).
+    """
+    storeys_changed = pyqtSignal(object)  # множество отображаемых этажей (None — все)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHeaderLabels(["Элемент", "Кол-во"])
+        self._storeys = {}
+        self._types = {}     # (этаж, тип) -> узел
+        self.elements = {}   # (этаж, тип) -> номера элементов модели
+        self._checked = set()
+        self.itemChanged.connect(self._on_item_changed)
+
+    def clear(self):
+        super().clear()
+        self._storeys.clear()
+        self._types.clear()
+        self.elements.clear()
+        self._checked = set()
+
+    def visible_storeys(self):
+        """Этажи с установленным флажком"""
+        return {storey for storey, item in self._storeys.items() if item.checkState(0) == Qt.Checked}
+
+    def add_batch(self, batch):
+        """Добавление пакета ElementBatch: обновляются только затронутые узлы"""
+        touched = set()
+        for offset, (storey, ifc_type) in enumerate(zip(batch.storeys, batch.types)):
+            key = (storey, ifc_type)
+            self.elements.setdefault(key, []).append(batch.first_index + offset)
+            touched.add(key)
+
+        for key in touched:
+            storey, ifc_type = key
+            item = self._types.get(key)
+            if item is None:
+                parent = self._storey_item(storey)
+                item = QTreeWidgetItem(parent, [ifc_type, ""])
+                self._types[key] = item
+            item.setText(1, str(len(self.elements[key])))
+
+        for storey in {storey for storey, _ in touched}:
+            total = sum(len(ids) for (s, _), ids in self.elements.items() if s == storey)
+            self._storeys[storey].setText(1, str(total))
+
+    def element_indices(self, item):
+        """Номера элементов модели под выбранным узлом"""
+        for key, type_item in self._types.items():
+            if type_item is item:
+                return list(self.elements[key])
+        return [index for (storey, _), ids in self.elements.items()
+                if self._storeys.get(storey) is item for index in ids]
+
+    def _storey_item(self, storey):
+        item = self._storeys.get(storey)
+        if item is None:
+            item = QTreeWidgetItem(self, [storey or "Без этажа", ""])
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(0, Qt.Checked)
+            item.setExpanded(True)
+            self._storeys[storey] = item
+            self._checked.add(storey)
+        return item
+
+    def _on_item_changed(self, item, column):
+        # itemChanged приходит и при смене текста счётчиков — сигнал только при смене флажков
+        if column != 0 or item.parent() is not None:
+            return
+        checked = self.visible_storeys()
+        if checked != self._checked:
+            self._checked = checked
+            self.storeys_changed.emit(None if checked == set(self._storeys) else checked)
@@ -0,0 +1,62 @@
+# gui/startup.py
+"""
+Быстрый запуск приложения.
+
+Заставка показывается сразу после импорта PyQt5 — до загрузки pyvista,
+vtk и pyvistaqt, которые занимают большую часть времени старта. Этапы
+запуска отмечаются mark() и выводятся report(); время отсчитывается от
+импорта этого модуля (первая строка app.py), без запуска самого Python.
+
+С переменной окружения ENGINEERING_SUITE_STARTUP_PROBE процесс печатает
+время первой отрисовки и завершается — так его замеряет
+benchmarks/run_suite.py (случай first_paint).
+"""
+import os
+import sys
+import time
+
+PROCESS_START = time.perf_counter()
+
+from PyQt5.QtCore import Qt  # noqa: E402
+from PyQt5.QtGui import QColor, QPixmap  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QSplashScreen  # noqa: E402
+
+PROBE_ENV = "ENGINEERING_SUITE_STARTUP_PROBE"
+
+_marks = {}
+
+
+def mark(name):
+    """Отметка этапа запуска: секунды от начала"""
+    _marks[name] = time.perf_counter() - PROCESS_START
+    return _marks[name]
+
+
+def marks():
+    return dict(_marks)
+
+
+def show_splash(argv=None):
+    """QApplication и заставка, отрисованная до загрузки тяжёлых модулей"""
+    app = QApplication.instance() or QApplication(sys.argv if argv is None else argv)
+    pixmap = QPixmap(480, 160)
+    pixmap.fill(QColor("#2b2b2b"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Engineering Suite\nЗагрузка...", Qt.AlignCenter, QColor("white"))
+    splash.show()
+    app.processEvents()
+    elapsed = mark("first_paint")
+    if os.environ.get(PROBE_ENV):
+        print(f"STARTUP first_paint {elapsed:.6f}")
+        sys.exit(0)
+    return app, splash
+
+
+def report():
+    """Строка с этапами запуска (и запись их в метрики трассировки)"""
+    from core import tracing
+
+    for name, seconds in _marks.items():
+        tracing.observe(f"startup.{name}", seconds)
+    stages = ", ".join(f"{name} {seconds:.2f} с" for name, seconds in _marks.items())
+    print(f"Запуск: {stages}")
@@ -0,0 +1,147 @@
+# gui/stress_jobs.py
+"""
+Планировщик фоновых расчётов на QThreadPool.
+
+Тяжёлые расчёты (напряжения в фундаментах, закон Гука для больших массивов)
+выполняются в рабочих потоках пула. Прогресс и частичные результаты
+приходят обратно в GUI-поток через сигналы Qt, поэтому обработчики
+JobBatch можно смело использовать для обновления интерфейса.
+"""
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from core import tracing
+
+
+class _JobSignals(QObject):
+    """Сигналы, которые рабочие потоки посылают в GUI-поток"""
+    done = pyqtSignal(object, object)  # ключ задания, результат
+    failed = pyqtSignal(object, str)   # ключ задания, текст ошибки
+
+
+class _Job(QRunnable):
+    """Одно задание пула: вызов func(*args) в рабочем потоке"""
+
+    def __init__(self, key, func, args, cancel_event, signals):
+        super().__init__()
+        self.key = key
+        self.func = func
+        self.args = args
+        self.cancel_event = cancel_event
+        self.signals = signals
+
+    def run(self):
+        # Задания, которые не успели начаться до отмены, пропускаются
+        if self.cancel_event.is_set():
+            return
+        try:
+            with tracing.span(getattr(self.func, "__name__", "job"), category="job"):
+                result = self.func(*self.args)
+        except Exception:
+            self.signals.failed.emit(self.key, traceback.format_exc())
+            return
+        if not self.cancel_event.is_set():
+            self.signals.done.emit(self.key, result)
+
+
+class JobBatch(QObject):
+    """
+    Группа заданий, запущенных одним вызовом JobScheduler.submit.
+    Все сигналы испускаются в GUI-потоке.
+    """
+    progress = pyqtSignal(int, int)           # выполнено, всего
+    result_ready = pyqtSignal(object, object)  # ключ задания, результат
+    finished = pyqtSignal(object)             # словарь {ключ: результат}
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(object, str)          # ключ задания, текст ошибки
+
+    def __init__(self, total, parent=None):
+        super().__init__(parent)
+        self.total = total
+        self.results = {}
+        self.cancel_event = threading.Event()
+        self._running = True
+
+        self._signals = _JobSignals()
+        self._signals.done.connect(self._on_job_done)
+        self._signals.failed.connect(self._on_job_failed)
+
+    def is_running(self):
+        return self._running
+
+    def cancel(self):
+        """Отмена: начатые задания доработают, но их результаты будут отброшены"""
+        if not self._running:
+            return
+        self._running = False
+        self.cancel_event.set()
+        self.cancelled.emit()
+
+    def _on_job_done(self, key, result):
+        if not self._running:
+            return
+        self.results[key] = result
+        self.result_ready.emit(key, result)
+        self.progress.emit(len(self.results), self.total)
+        if len(self.results) == self.total:
+            self._finish()
+
+    def _on_job_failed(self, key, message):
+        if not self._running:
+            return
+        self._running = False
+        self.cancel_event.set()
+        self.failed.emit(key, message)
+
+    def _finish(self):
+        if self._running:
+            self._running = False
+            self.finished.emit(self.results)
+
+
+class JobScheduler(QObject):
+    """Запуск групп заданий в пуле рабочих потоков"""
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_workers:
+            self.pool.setMaxThreadCount(max_workers)
+        self.batches = []
+
+    def submit(self, jobs):
+        """
+        Запуск заданий. jobs — последовательность (ключ, функция, аргументы).
+        Функции выполняются в рабочих потоках и не должны трогать виджеты и актёры.
+        """
+        jobs = list(jobs)
+        batch = JobBatch(len(jobs), parent=self)
+        batch.finished.connect(lambda _results: self._forget(batch))
+        batch.cancelled.connect(lambda: self._forget(batch))
+        batch.failed.connect(lambda _key, _message: self._forget(batch))
+        self.batches.append(batch)
+
+        if not jobs:
+            # Пустая группа завершается сразу, но после подключения обработчиков
+            QTimer.singleShot(0, batch._finish)
+            return batch
+
+        batch._jobs = [_Job(key, func, args, batch.cancel_event, batch._signals) for key, func, args in jobs]
+        for job in batch._jobs:
+            self.pool.start(job)
+        return batch
+
+    def cancel_all(self):
+        """Отмена всех выполняющихся групп"""
+        for batch in list(self.batches):
+            batch.cancel()
+
+    def wait(self, msecs=-1):
+        """Ожидание завершения рабочих потоков (например, при закрытии окна)"""
+        return self.pool.waitForDone(msecs)
+
+    def _forget(self, batch):
+        if batch in self.batches:
+            self.batches.remove(batch)
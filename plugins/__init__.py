@@ -0,0 +1,110 @@
+# plugins/__init__.py
+"""
+Реестр плагинов.
+
+Плагин описывается записью: модуль, объект в нём и пакеты, без которых он
+не работает. Записи регистрируются без импорта самих модулей, наличие
+пакетов проверяется через importlib.util.find_spec (тоже без импорта),
+а модуль плагина загружается при первом load(). Поэтому тяжёлые
+зависимости (pyOCCT, ifcopenshell) не влияют на время запуска.
+
+Сторонние пакеты добавляют плагины через точки входа группы
+"engineering_suite.plugins" (значение — "модуль:объект"); они читаются
+из метаданных установленных пакетов при первом обращении к реестру.
+
+Пример:
+    import plugins
+    if plugins.available("structural.beam_array"):
+        BeamArray = plugins.load("structural.beam_array")
+"""
+import importlib
+import importlib.util
+
+ENTRY_POINT_GROUP = "engineering_suite.plugins"
+
+
+class PluginSpec:
+    """Запись реестра: name — ключ, module и attribute — что загружать"""
+
+    def __init__(self, name, module, attribute=None, title="", requires=()):
+        self.name = name
+        self.module = module
+        self.attribute = attribute
+        self.title = title or name
+        self.requires = tuple(requires)
+
+    def missing(self):
+        """Отсутствующие пакеты из requires (проверка без импорта)"""
+        return [package for package in self.requires if importlib.util.find_spec(package) is None]
+
+    def __repr__(self):
+        return f"PluginSpec({self.name!r}, {self.module!r}, {self.attribute!r})"
+
+
+_registry = {}
+_loaded = {}
+_entry_points_read = False
+
+
+def register(name, module, attribute=None, title="", requires=()):
+    """Регистрация плагина; модуль при этом не импортируется"""
+    _registry[name] = PluginSpec(name, module, attribute, title, requires)
+    _loaded.pop(name, None)
+    return _registry[name]
+
+
+def _read_entry_points():
+    global _entry_points_read
+    if _entry_points_read:
+        return
+    _entry_points_read = True
+    from importlib.metadata import entry_points
+
+    for entry in entry_points(group=ENTRY_POINT_GROUP):
+        if entry.name in _registry:
+            continue
+        module, _, attribute = entry.value.partition(":")
+        register(entry.name, module.strip(), attribute.strip() or None)
+
+
+def spec(name):
+    _read_entry_points()
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Плагин {name!r} не зарегистрирован") from None
+
+
+def names():
+    _read_entry_points()
+    return sorted(_registry)
+
+
+def available(name):
+    """Плагин зарегистрирован и все его пакеты установлены"""
+    _read_entry_points()
+    return name in _registry and not _registry[name].missing()
+
+
+def is_loaded(name):
+    return name in _loaded
+
+
+def load(name):
+    """Импорт модуля плагина (один раз) и возврат его объекта или модуля"""
+    if name in _loaded:
+        return _loaded[name]
+    plugin = spec(name)
+    missing = plugin.missing()
+    if missing:
+        raise ImportError(f"Для плагина «{plugin.title}» требуются пакеты: {', '.join(missing)}")
+    module = importlib.import_module(plugin.module)
+    _loaded[name] = getattr(module, plugin.attribute) if plugin.attribute else module
+    return _loaded[name]
+
+
+# Встроенные плагины
+register("structural.beam_array", "plugins.structural.beam", "BeamArray", "Каркас из балок")
+register("structural.beam_analysis", "plugins.structural.beam_analysis", "analyze_beams", "Расчёт балок")
+register("structural.occt_beam", "plugins.structural.beam", "Beam", "Балка OpenCASCADE", requires=("pyOCCT",))
+register("bim.ifc_import", "bim.ifc_importer", "iter_ifc_batches", "Импорт IFC", requires=("ifcopenshell",))
@@ -0,0 +1,24 @@
+# plugins/structural/__init__.py
+"""
+Строительные конструкции. Классы и функции подгружаются при первом
+обращении (from plugins.structural import BeamArray), чтобы импорт пакета
+не тянул за собой модули балок.
+"""
+import importlib
+
+_EXPORTS = {
+    "Beam": ".beam",
+    "BeamArray": ".beam",
+    "analyze_beams": ".beam_analysis",
+    "attach_beam_results": ".beam_analysis",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
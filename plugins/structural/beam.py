@@ -1,6 +1,47 @@
 # plugins/structural/beam.py
-from pyOCCT.BRepPrimAPI import BRepPrimAPI_MakeBox
-from pyOCCT.gp import gp_Pnt, gp_Dir, gp_Ax2
+"""
+Балки строительных конструкций.
+
+Beam — одиночная балка, 3D-модель строится через OpenCASCADE.
+
+BeamArray — пакет балок каркаса в столбцовом виде (начала, концы,
+сечения, поворот сечения вокруг оси). to_polydata() строит одну общую
+триангулированную сетку всех балок с номером балки у каждой грани
+(cell_data "beam_id"), поэтому каркас из тысяч балок — один актёр.
+Прямоугольные сечения по умолчанию строятся векторно без OCCT; с
+use_occt=True каждая уникальная пара сечение/длина триангулируется
+OCCT один раз (кеш), а балки получают её копии с матрицами размещения.
+
+Пример:
+    beams = BeamArray(starts, ends, sections=np.column_stack((widths, heights)))
+    plotter.add_mesh(beams.to_polydata())
+"""
+import numpy as np
+
+from bim.instancing import instantiate
+from core.result_cache import KEY_DECIMALS, ResultCache, cache_key
+
+# pyOCCT загружается при первом построении через OCCT (_require_occt)
+BRepPrimAPI_MakeBox = None
+gp_Pnt = gp_Dir = gp_Ax2 = None
+
+# Линейный допуск триангуляции OCCT, м
+DEFAULT_DEFLECTION = 0.01
+TESSELLATION_VERSION = "beam_tessellation/1"
+
+# Вершины единичного бруска (бит 0 — x, бит 1 — y, бит 2 — z) и его
+# треугольники с нормалями наружу
+_BOX_CORNERS = np.array([[(k >> axis) & 1 for axis in range(3)] for k in range(8)], dtype=np.float64)
+_BOX_FACES = np.array([
+    [0, 4, 6], [0, 6, 2],  # x = 0
+    [1, 3, 7], [1, 7, 5],  # x = 1
+    [0, 1, 5], [0, 5, 4],  # y = 0
+    [2, 6, 7], [2, 7, 3],  # y = 1
+    [0, 2, 3], [0, 3, 1],  # z = 0
+    [4, 5, 7], [4, 7, 6],  # z = 1
+], dtype=np.int64)
+
+_tessellation_cache = None
 
 
 class Beam:
@@ -11,6 +52,7 @@ class Beam:
 
     def create_3d_model(self):
         """Создаёт 3D-модель балки через OpenCASCADE"""
+        _require_occt()
         origin = gp_Pnt(0, 0, 0)
         axis = gp_Dir(0, 0, 1)
         plane = gp_Ax2(origin, axis)
@@ -18,7 +60,198 @@ class Beam:
         return box.Shape()  # Возвращает OpenCASCADE-объект
 
 
-# Использование в GUI:
-beam = Beam(length=5.0, width=0.3, height=0.5)
-shape = beam.create_3d_model()
-scene.add(shape)  # Передача в визуализацию
\ No newline at end of file
+class BeamArray:
+    """
+    Пакет балок. Ось балки i идёт из starts[i] в ends[i] (или на lengths[i]
+    вдоль directions[i], по умолчанию вдоль X); sections[i] — ширина и
+    высота прямоугольного сечения, rolls[i] — поворот сечения вокруг оси
+    балки, рад. Сечение центрировано на оси: ширина откладывается вдоль
+    локальной оси y, высота — вдоль z (для горизонтальной балки z —
+    вертикаль). ids — внешние номера балок (по умолчанию порядковые).
+    """
+
+    def __init__(self, starts, ends=None, sections=None, lengths=None, directions=None, rolls=None, ids=None):
+        self.starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        n = len(self.starts)
+        if ends is None:
+            if lengths is None:
+                raise ValueError("Нужно задать концы балок или их длины")
+            directions = np.tile([1.0, 0.0, 0.0], (n, 1)) if directions is None \
+                else np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+            directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+            ends = self.starts + directions * np.asarray(lengths, dtype=np.float64).reshape(-1, 1)
+        self.ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        if sections is None:
+            raise ValueError("Нужно задать сечения балок (ширина, высота)")
+        self.sections = np.broadcast_to(np.asarray(sections, dtype=np.float64), (n, 2)).copy()
+        self.rolls = np.zeros(n) if rolls is None else np.broadcast_to(np.asarray(rolls, dtype=np.float64), (n,))
+        self.ids = np.arange(n) if ids is None else np.asarray(ids)
+        if len(self.ends) != n or len(self.ids) != n:
+            raise ValueError("Размеры массивов балок не совпадают")
+
+        self.frames, self.lengths = beam_frames(self.starts, self.ends, self.rolls)
+
+    @classmethod
+    def from_beams(cls, beams, starts=None):
+        """Пакет из объектов Beam (ось вдоль X, как в Beam.create_3d_model)"""
+        starts = np.zeros((len(beams), 3)) if starts is None else starts
+        return cls(starts, lengths=[beam.length for beam in beams],
+                   sections=[(beam.width, beam.height) for beam in beams])
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def widths(self):
+        return self.sections[:, 0]
+
+    @property
+    def heights(self):
+        return self.sections[:, 1]
+
+    def transforms(self):
+        """Матрицы размещения (n, 4, 4) из локальных координат балки в мировые"""
+        transforms = np.tile(np.eye(4), (len(self), 1, 1))
+        transforms[:, :3, :3] = self.frames.transpose(0, 2, 1)
+        transforms[:, :3, 3] = self.starts
+        return transforms
+
+    def to_polydata(self, use_occt=False, cache=None, deflection=DEFAULT_DEFLECTION):
+        """
+        Общая сетка всех балок; у граней cell_data "beam_id" — номер балки
+        в пакете (внешний номер: ids[beam_id]).
+        use_occt=False — брусья строятся напрямую (12 треугольников на балку),
+        use_occt=True — триангуляция OCCT по уникальным парам сечение/длина
+        с кешем cache (core.result_cache.ResultCache, по умолчанию — в памяти).
+        """
+        import pyvista as pv
+
+        if use_occt:
+            points, faces, face_beams = self._occt_mesh(cache, deflection)
+        else:
+            points, faces = self._box_mesh()
+            face_beams = np.repeat(np.arange(len(self)), len(_BOX_FACES))
+
+        cells = np.empty((len(faces), 4), dtype=np.int64)
+        cells[:, 0] = 3
+        cells[:, 1:] = faces
+        mesh = pv.PolyData(points, cells.ravel(), n_faces=len(faces))
+        mesh.cell_data["beam_id"] = face_beams
+        return mesh
+
+    def _box_mesh(self):
+        # Локальные вершины (n, 8, 3): x от 0 до длины, сечение центрировано на оси
+        sizes = np.column_stack((self.lengths, self.sections))
+        local = _BOX_CORNERS[np.newaxis] * sizes[:, np.newaxis] - \
+            np.column_stack((np.zeros(len(self)), self.sections / 2))[:, np.newaxis]
+        points = np.einsum("nkj,nji->nki", local, self.frames) + self.starts[:, np.newaxis]
+        faces = _BOX_FACES[np.newaxis] + (np.arange(len(self)) * 8)[:, np.newaxis, np.newaxis]
+        return points.reshape(-1, 3), faces.reshape(-1, 3)
+
+    def _occt_mesh(self, cache, deflection):
+        cache = cache or default_tessellation_cache()
+        sizes = np.round(np.column_stack((self.lengths, self.sections)), KEY_DECIMALS)
+        unique_sizes, group_of = np.unique(sizes, axis=0, return_inverse=True)
+        group_of = group_of.ravel()
+        transforms = self.transforms()
+
+        points, faces, face_beams = [], [], []
+        n_points = 0
+        for group, (length, width, height) in enumerate(unique_sizes.tolist()):
+            key = cache_key("beam", length, width, height, deflection)
+            triangles = cache.get_or_compute(key, occt_tessellation, length, width, height, deflection)
+            members = np.flatnonzero(group_of == group)
+            local_faces = np.arange(3 * len(triangles)).reshape(-1, 3)
+            group_points, group_faces = instantiate(triangles.reshape(-1, 3), local_faces, transforms[members])
+            points.append(group_points)
+            faces.append(group_faces + n_points)
+            face_beams.append(np.repeat(members, len(triangles)))
+            n_points += len(group_points)
+
+        if not points:
+            return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), np.empty(0, dtype=np.int64)
+        faces, face_beams = np.concatenate(faces), np.concatenate(face_beams)
+        # Грани упорядочиваются по балкам, как и в сетке без OCCT
+        order = np.argsort(face_beams, kind="stable")
+        return np.concatenate(points), faces[order], face_beams[order]
+
+
+def beam_frames(starts, ends, rolls=None):
+    """
+    Локальные оси балок (n, 3, 3) — строки x (вдоль балки), y (ширина),
+    z (высота) — и длины (n,). Ось z направлена вверх, насколько позволяет
+    ось балки; у вертикальных балок ширина откладывается вдоль Y.
+    """
+    axis = np.asarray(ends, dtype=np.float64) - np.asarray(starts, dtype=np.float64)
+    lengths = np.linalg.norm(axis, axis=1)
+    if np.any(lengths <= 0):
+        raise ValueError(f"Балки нулевой длины: {np.flatnonzero(lengths <= 0)[:10].tolist()}")
+    x = axis / lengths[:, np.newaxis]
+    vertical = np.abs(x[:, 2]) > 1 - 1e-9
+    up = np.where(vertical[:, np.newaxis], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0])
+    y = np.cross(up, x)
+    y /= np.linalg.norm(y, axis=1, keepdims=True)
+    z = np.cross(x, y)
+    if rolls is not None and np.any(rolls):
+        cos, sin = np.cos(rolls)[:, np.newaxis], np.sin(rolls)[:, np.newaxis]
+        y, z = cos * y + sin * z, cos * z - sin * y
+    return np.stack((x, y, z), axis=1), lengths
+
+
+def occt_tessellation(length, width, height, deflection=DEFAULT_DEFLECTION):
+    """
+    Триангуляция бруска балки средствами OCCT в локальных координатах
+    BeamArray (сечение центрировано на оси). Треугольники (m, 3, 3).
+    """
+    _require_occt()
+    from pyOCCT.BRep import BRep_Tool
+    from pyOCCT.BRepMesh import BRepMesh_IncrementalMesh
+    from pyOCCT.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+    from pyOCCT.TopExp import TopExp_Explorer
+    from pyOCCT.TopLoc import TopLoc_Location
+    from pyOCCT.TopoDS import TopoDS
+
+    shape = Beam(length, width, height).create_3d_model()
+    BRepMesh_IncrementalMesh(shape, deflection)
+
+    triangles = []
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        face = TopoDS.Face_(explorer.Current())
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation_(face, location)
+        if triangulation is not None:
+            transformation = location.Transformation()
+            nodes = np.array([_xyz(triangulation.Node(i).Transformed(transformation))
+                              for i in range(1, triangulation.NbNodes() + 1)])
+            indices = np.array([triangulation.Triangle(i).Get() for i in range(1, triangulation.NbTriangles() + 1)],
+                               dtype=np.int64) - 1
+            if face.Orientation() == TopAbs_REVERSED:
+                indices = indices[:, ::-1]
+            triangles.append(nodes[indices])
+        explorer.Next()
+
+    triangles = np.concatenate(triangles) if triangles else np.empty((0, 3, 3))
+    return triangles - [0.0, width / 2, height / 2]
+
+
+def default_tessellation_cache():
+    """Кеш триангуляций OCCT в памяти процесса (общий для всех пакетов балок)"""
+    global _tessellation_cache
+    if _tessellation_cache is None:
+        _tessellation_cache = ResultCache("beam_tessellation", TESSELLATION_VERSION, disk_dir=False)
+    return _tessellation_cache
+
+
+def _xyz(point):
+    return point.X(), point.Y(), point.Z()
+
+
+def _require_occt():
+    global BRepPrimAPI_MakeBox, gp_Pnt, gp_Dir, gp_Ax2
+    if BRepPrimAPI_MakeBox is None:
+        try:
+            from pyOCCT.BRepPrimAPI import BRepPrimAPI_MakeBox
+            from pyOCCT.gp import gp_Pnt, gp_Dir, gp_Ax2
+        except ImportError:  # pragma: no cover - зависит от окружения
+            raise ImportError("Для построения модели через OpenCASCADE требуется пакет pyOCCT") from None
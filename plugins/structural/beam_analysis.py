@@ -0,0 +1,128 @@
+# plugins/structural/beam_analysis.py
+"""
+Векторизованный расчёт балок: геометрические характеристики
+прямоугольных сечений, изгибающие моменты, поперечные силы, нормальные
+и касательные напряжения и прогибы для типовых расчётных схем.
+
+Все функции работают над массивами балок без циклов Python (100 тыс.
+элементов — миллисекунды) и не требуют OCCT. Нагрузка действует в
+плоскости высоты сечения (локальная ось z BeamArray), изгиб — относительно
+сильной оси. Единицы согласованы: при длинах в м, нагрузках в Н и Н/м и
+модуле упругости в Па напряжения получаются в Па, прогибы — в м.
+"""
+import numpy as np
+
+# Расчётные схемы в том виде, в каком они показаны в интерфейсе
+CASE_SIMPLE_UNIFORM = "Шарнирная, равномерная"
+CASE_SIMPLE_POINT = "Шарнирная, сила в середине"
+CASE_CANTILEVER_UNIFORM = "Консоль, равномерная"
+CASE_CANTILEVER_POINT = "Консоль, сила на конце"
+CASE_FIXED_UNIFORM = "Защемлённая, равномерная"
+CASE_FIXED_POINT = "Защемлённая, сила в середине"
+
+LOAD_CASES = (CASE_SIMPLE_UNIFORM, CASE_SIMPLE_POINT, CASE_CANTILEVER_UNIFORM,
+              CASE_CANTILEVER_POINT, CASE_FIXED_UNIFORM, CASE_FIXED_POINT)
+
+# Код для неизвестной схемы: усилия и напряжения остаются нулевыми
+UNKNOWN_CASE_CODE = -1
+
+# Коэффициенты схем через равнодействующую F (q·L для равномерной нагрузки, P для силы):
+# M = k_M·F·L, V = k_V·F, f = k_f·F·L³ / (E·I)
+_UNIFORM = np.array([True, False, True, False, True, False])
+_MOMENT = np.array([1 / 8, 1 / 4, 1 / 2, 1.0, 1 / 12, 1 / 8])
+_SHEAR = np.array([1 / 2, 1 / 2, 1.0, 1.0, 1 / 2, 1 / 2])
+_DEFLECTION = np.array([5 / 384, 1 / 48, 1 / 8, 1 / 3, 1 / 384, 1 / 192])
+
+# Модуль упругости стали по умолчанию, Па
+DEFAULT_ELASTIC_MODULUS = 2.06e11
+
+
+def load_case_codes(load_cases, count=None):
+    """
+    Преобразование названий расчётных схем в целочисленные коды;
+    неизвестные названия и коды вне LOAD_CASES дают UNKNOWN_CASE_CODE.
+    """
+    if isinstance(load_cases, (str, int, np.integer)):
+        load_cases = [load_cases] * (count or 1)
+    codes = np.empty(len(load_cases), dtype=np.int8)
+    for i, load_case in enumerate(load_cases):
+        if isinstance(load_case, str):
+            codes[i] = LOAD_CASES.index(load_case) if load_case in LOAD_CASES else UNKNOWN_CASE_CODE
+        else:
+            load_case = int(load_case)
+            codes[i] = load_case if 0 <= load_case < len(LOAD_CASES) else UNKNOWN_CASE_CODE
+    return codes
+
+
+def section_properties(widths, heights):
+    """
+    Характеристики прямоугольных сечений b x h: площадь, моменты инерции
+    и моменты сопротивления относительно сильной (y) и слабой (z) осей.
+    """
+    b = np.asarray(widths, dtype=np.float64)
+    h = np.asarray(heights, dtype=np.float64)
+    area = b * h
+    return {
+        "area": area,
+        "inertia_y": b * h ** 3 / 12,
+        "inertia_z": h * b ** 3 / 12,
+        "modulus_y": b * h ** 2 / 6,
+        "modulus_z": h * b ** 2 / 6,
+    }
+
+
+def beam_stresses(lengths, widths, heights, load_values, load_cases, elastic_modulus=DEFAULT_ELASTIC_MODULUS):
+    """
+    Максимальные усилия, напряжения и прогибы балок.
+    load_values — q (Н/м) для равномерной нагрузки или P (Н) для силы,
+    load_cases — названия схем (LOAD_CASES) или их коды, по одной на балку
+    или одна на все. Возвращает словарь массивов (n,): moment, shear,
+    bending_stress (M / W), shear_stress (1.5·V / A для прямоугольника),
+    equivalent_stress (sqrt(σ² + 3τ²) — по максимумам, в запас),
+    deflection.
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    n = len(lengths)
+    codes = load_case_codes(load_cases, n)
+    if len(codes) == 1 and n != 1:
+        codes = np.repeat(codes, n)
+    known = codes != UNKNOWN_CASE_CODE
+    safe_codes = np.where(known, codes, 0)
+
+    values = np.broadcast_to(np.asarray(load_values, dtype=np.float64), (n,))
+    total = np.where(_UNIFORM[safe_codes], values * lengths, values) * known
+
+    properties = section_properties(widths, heights)
+    moment = _MOMENT[safe_codes] * total * lengths
+    shear = _SHEAR[safe_codes] * total
+    bending_stress = moment / properties["modulus_y"]
+    shear_stress = 1.5 * shear / properties["area"]
+    elastic_modulus = np.asarray(elastic_modulus, dtype=np.float64)
+    deflection = _DEFLECTION[safe_codes] * total * lengths ** 3 / (elastic_modulus * properties["inertia_y"])
+    return {
+        "moment": moment,
+        "shear": shear,
+        "bending_stress": bending_stress,
+        "shear_stress": shear_stress,
+        "equivalent_stress": np.sqrt(bending_stress ** 2 + 3 * shear_stress ** 2),
+        "deflection": deflection,
+    }
+
+
+def analyze_beams(beams, load_values, load_cases, elastic_modulus=DEFAULT_ELASTIC_MODULUS):
+    """Характеристики сечений и напряжения для пакета plugins.structural.beam.BeamArray"""
+    results = section_properties(beams.widths, beams.heights)
+    results.update(beam_stresses(beams.lengths, beams.widths, beams.heights, load_values, load_cases,
+                                 elastic_modulus))
+    return results
+
+
+def attach_beam_results(mesh, results, names=None):
+    """
+    Результаты по балкам как скаляры граней сетки BeamArray.to_polydata()
+    (по номеру балки в cell_data "beam_id"). Возвращает ту же сетку.
+    """
+    beam_ids = mesh.cell_data["beam_id"]
+    for name in names or results:
+        mesh.cell_data[name] = np.asarray(results[name])[beam_ids]
+    return mesh
@@ -15,13 +15,26 @@ packages = [
     'plugins.geotech'
 ]
 
+# Флаги OpenMP: без них prange в stress_calculator.pyx выполняется последовательно
+if sys.platform == "win32":
+    openmp_compile_args = ["/openmp"]
+    openmp_link_args = []
+elif sys.platform == "darwin":
+    # Apple clang не поставляет OpenMP: требуется libomp (brew install libomp)
+    openmp_compile_args = ["-Xpreprocessor", "-fopenmp"]
+    openmp_link_args = ["-lomp"]
+else:
+    openmp_compile_args = ["-fopenmp"]
+    openmp_link_args = ["-fopenmp"]
+
 extensions = [
     Extension(
         "core.stress_calculator",
         ["core/stress_calculator.pyx"],
         include_dirs=[np.get_include()],
         language="c++",
-        extra_compile_args=["-std=c++11"] if sys.platform != "win32" else []
+        extra_compile_args=(["-std=c++11"] if sys.platform != "win32" else []) + openmp_compile_args,
+        extra_link_args=openmp_link_args
     )
 ]
 
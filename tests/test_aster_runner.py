@@ -0,0 +1,179 @@
+# tests/test_aster_runner.py
+"""
+Проверка AsterJobRunner и fem_solver на заглушке исполняемого файла aster:
+скрипт читает режим из командного файла и ведёт себя как Code_Aster
+(пишет results.rmed, падает, зависает).
+"""
+import asyncio
+import os
+import stat
+import sys
+import tempfile
+import time
+
+import pytest
+
+from core import fem_solver
+from core.aster_runner import (AsterJobError, AsterJobRunner, CANCELLED, COMM_FILE, DONE, FAILED,
+                               RESULT_FILE, RUNNING, TIMEOUT)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="заглушка aster — скрипт с #!")
+
+STUB = f"""#!{sys.executable}
+import os, sys, time
+comm = open(sys.argv[sys.argv.index("-commande") + 1], encoding="utf-8").read()
+number = sys.argv[sys.argv.index("-num_job") + 1]
+if "MODE=fail" in comm:
+    sys.stderr.write("<F> ошибка расчёта")
+    sys.exit(1)
+if "MODE=hang" in comm:
+    time.sleep(60)
+if "MODE=slow" in comm:
+    time.sleep(0.3)
+if "MODE=noresult" not in comm:
+    mesh = open("fort.20").read() if os.path.exists("fort.20") else ""
+    listing = sorted(os.listdir("."))
+    with open("{RESULT_FILE}", "w") as f:
+        f.write(f"{{number}}|{{os.getcwd()}}|{{listing}}|{{mesh}}")
+"""
+
+
+@pytest.fixture
+def aster(tmp_path):
+    path = tmp_path / "aster"
+    path.write_text(STUB)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.fixture
+def work_root(tmp_path):
+    path = tmp_path / "work"
+    path.mkdir()
+    return str(path)
+
+
+def run_jobs(runner, comm_texts, **kwargs):
+    async def main():
+        jobs = [runner.submit(text, **kwargs) for text in comm_texts]
+        await runner.wait_all()
+        return jobs
+    return asyncio.run(main())
+
+
+def test_done_job_keeps_result_until_forget(aster, work_root):
+    runner = AsterJobRunner(max_workers=1, aster_executable=aster, work_root=work_root)
+    job, = run_jobs(runner, ["DEBUT()"])
+    assert job.status == DONE and job.returncode == 0
+    with open(job.result_path()) as f:
+        number, workdir, listing, _mesh = f.read().split("|")
+    assert number == str(job.number) and workdir == job.workdir
+    assert listing == str(sorted([COMM_FILE]))
+    assert runner.status()[0]["status"] == DONE
+
+    runner.forget(job.job_id)
+    assert os.listdir(work_root) == [] and not runner.jobs
+
+
+@pytest.mark.parametrize("comm, error", [("MODE=fail", "ошибка расчёта"), ("MODE=noresult", RESULT_FILE)])
+def test_failed_job_reports_error_and_cleans_workdir(aster, work_root, comm, error):
+    runner = AsterJobRunner(aster_executable=aster, work_root=work_root)
+    job, = run_jobs(runner, [comm])
+    assert job.status == FAILED and error in job.error
+    assert job.workdir is None and os.listdir(work_root) == []
+
+
+def test_failed_workdir_kept_on_request(aster, work_root):
+    runner = AsterJobRunner(aster_executable=aster, work_root=work_root, keep_failed_workdirs=True)
+    job, = run_jobs(runner, ["MODE=fail"])
+    assert job.status == FAILED and os.path.isdir(job.workdir)
+
+
+def test_timeout_kills_process(aster, work_root):
+    runner = AsterJobRunner(aster_executable=aster, work_root=work_root, timeout=0.5)
+    begin = time.perf_counter()
+    job, = run_jobs(runner, ["MODE=hang"])
+    assert time.perf_counter() - begin < 10
+    assert job.status == TIMEOUT and job.returncode is not None and job.returncode != 0
+    assert os.listdir(work_root) == []
+
+
+def test_cancel_running_and_pending_jobs(aster, work_root):
+    statuses = []
+    runner = AsterJobRunner(max_workers=1, aster_executable=aster, work_root=work_root,
+                            on_status=lambda state: statuses.append((state["number"], state["status"])))
+
+    async def main():
+        running = runner.submit("MODE=hang")
+        pending = runner.submit("MODE=hang")
+        while running.status != RUNNING:
+            await asyncio.sleep(0.01)
+        assert runner.cancel(pending.job_id) and runner.cancel(running.job_id)
+        await runner.wait_all()
+        return running, pending
+
+    running, pending = asyncio.run(main())
+    assert running.status == CANCELLED and pending.status == CANCELLED
+    assert pending.started_at is None
+    assert not runner.cancel(running.job_id)
+    assert (running.number, RUNNING) in statuses and (running.number, CANCELLED) in statuses
+    assert os.listdir(work_root) == []
+
+
+def test_parallel_jobs_use_isolated_workdirs(aster, work_root, tmp_path):
+    mesh = tmp_path / "mesh.med"
+    mesh.write_text("сетка")
+    runner = AsterJobRunner(max_workers=4, aster_executable=aster, work_root=work_root)
+    jobs = run_jobs(runner, ["MODE=slow"] * 4, input_files={fem_solver.MESH_FILE: str(mesh)})
+
+    assert [job.status for job in jobs] == [DONE] * 4
+    assert len({job.workdir for job in jobs}) == 4
+    for job in jobs:
+        with open(job.result_path()) as f:
+            number, workdir, listing, mesh_text = f.read().split("|")
+        assert (number, workdir, mesh_text) == (str(job.number), job.workdir, "сетка")
+        assert listing == str(sorted([COMM_FILE, fem_solver.MESH_FILE]))
+    # Все четыре задания выполнялись одновременно
+    assert max(job.started_at for job in jobs) < min(job.finished_at for job in jobs)
+
+
+def test_run_geotech_analysis_copies_results_and_leaves_no_workdir(aster, work_root, tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTER_EXECUTABLE", aster)
+    monkeypatch.setattr(tempfile, "tempdir", work_root)
+    mesh = tmp_path / "foundation.med"
+    mesh.write_text("сетка")
+
+    result = fem_solver.run_geotech_analysis(str(mesh), {"E": 210e9, "nu": 0.3})
+    assert result.status == DONE
+    assert result.result_path() == str(tmp_path / f"foundation.{RESULT_FILE}")
+    with open(result.result_path()) as f:
+        assert f.read().endswith("|сетка")
+    assert os.listdir(work_root) == []
+
+    output_dir = tmp_path / "out"
+    result = fem_solver.run_geotech_analysis(str(mesh), {"E": 1e9, "nu": 0.25}, output_dir=str(output_dir))
+    assert os.listdir(output_dir) == [f"foundation.{RESULT_FILE}"]
+    assert os.listdir(work_root) == []
+
+
+def test_run_geotech_analysis_failure_leaves_no_workdir(aster, work_root, tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTER_EXECUTABLE", aster)
+    monkeypatch.setattr(tempfile, "tempdir", work_root)
+    monkeypatch.setattr(fem_solver, "build_comm_file", lambda params: "MODE=fail")
+    mesh = tmp_path / "foundation.med"
+    mesh.write_text("сетка")
+
+    with pytest.raises(AsterJobError):
+        fem_solver.run_geotech_analysis(str(mesh), {"E": 210e9, "nu": 0.3})
+    assert os.listdir(work_root) == []
+
+
+def test_shared_runner_returns_job_owned_by_caller(aster, work_root, tmp_path):
+    mesh = tmp_path / "foundation.med"
+    mesh.write_text("сетка")
+    runner = AsterJobRunner(aster_executable=aster, work_root=work_root)
+
+    job = asyncio.run(fem_solver.run_geotech_analysis_async(str(mesh), {"E": 210e9, "nu": 0.3}, runner=runner))
+    assert job.status == DONE and os.path.exists(job.result_path())
+    runner.forget(job.job_id)
+    assert os.listdir(work_root) == []
@@ -0,0 +1,164 @@
+# tests/test_batch_stress.py
+"""
+Пакетный расчёт без пула процессов (max_workers=0): разбор CSV и YAML,
+псевдонимы типов нагрузки, продолжение после оборванной отметки прогресса.
+"""
+import json
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from core import batch_stress  # noqa: E402
+from core.batch_stress import BatchInputError, parse_load_types, read_foundations, run_batch  # noqa: E402
+from core.stress_engine import LOAD_TYPES, foundation_stress  # noqa: E402
+
+CSV_TEXT = """id, width, length, thickness, load_kn, load_type, x, y, z
+10, 2.0, 3.0, 0.5, 100, uniform, 1, 2, 0.25
+11, 1.5, 1.5, 0.4, 250, Точечная в центре, 0, 0, 0
+12, 3.0, 2.0, 0.6, 50, 2, 5, 5, 0
+13, 2.5, 2.5, 0.5, 80, LINEAR, -3, 1, 0
+"""
+
+
+def write_csv(path, rows=40):
+    """Входной CSV из rows фундаментов со всеми типами нагрузки"""
+    rng = np.random.default_rng(0)
+    aliases = list(batch_stress.LOAD_TYPE_ALIASES)
+    frame = pd.DataFrame({
+        "id": np.arange(rows) + 100,
+        "width": rng.uniform(1, 4, rows),
+        "length": rng.uniform(1, 4, rows),
+        "thickness": rng.uniform(0.3, 1.0, rows),
+        "load_value": rng.uniform(1e4, 1e6, rows),
+        "load_type": [aliases[i % len(aliases)] for i in range(rows)],
+        "x": rng.uniform(-50, 50, rows),
+        "y": rng.uniform(-50, 50, rows),
+    })
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_read_csv(tmp_path):
+    path = tmp_path / "footings.csv"
+    path.write_text(CSV_TEXT, encoding="utf-8")
+    foundations = read_foundations(str(path))
+    assert foundations["ids"].tolist() == [10, 11, 12, 13]
+    np.testing.assert_allclose(foundations["load_values"], [100e3, 250e3, 50e3, 80e3])
+    assert foundations["load_types"].tolist() == [0, 1, 2, 3]
+    np.testing.assert_allclose(foundations["positions"][0], [1, 2, 0.25])
+    np.testing.assert_allclose(foundations["dimensions"][2], [3.0, 2.0, 0.6])
+
+
+def test_read_yaml(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "footings.yaml"
+    path.write_text("""
+foundations:
+  - {width: 2, length: 3, thickness: 0.5, load_value: 120000, load_type: point_corner}
+  - {width: 1, length: 1, thickness: 0.3, load_kn: 40, load_type: Линейная, x: 4, id: 7}
+""", encoding="utf-8")
+    foundations = read_foundations(str(path))
+    assert foundations["ids"].tolist() == [0, 7]
+    np.testing.assert_allclose(foundations["load_values"], [120e3, 40e3])
+    assert foundations["load_types"].tolist() == [2, 3]
+    np.testing.assert_allclose(foundations["positions"], [[0, 0, 0], [4, 0, 0]])
+
+
+def test_invalid_input(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("width,length,thickness,load_type\n1,1,1,uniform\n", encoding="utf-8")
+    with pytest.raises(BatchInputError):
+        read_foundations(str(path))
+    path.write_text("width,length,thickness,load_value,load_type\n-1,1,1,10,uniform\n", encoding="utf-8")
+    with pytest.raises(BatchInputError):
+        read_foundations(str(path))
+    with pytest.raises(BatchInputError):
+        read_foundations(str(tmp_path / "footings.txt"))
+
+
+def test_load_type_aliases():
+    values = ["uniform", " Point_Center ", "point_corner", "linear", LOAD_TYPES[1], 3, 0.0, "2"]
+    assert parse_load_types(values).tolist() == [0, 1, 2, 3, 1, 3, 0, 2]
+    for unknown in (["сосредоточенная"], [9], ["-1"]):
+        with pytest.raises(BatchInputError):
+            parse_load_types(unknown)
+
+
+def test_run_batch_matches_stress_engine(tmp_path):
+    input_path = write_csv(tmp_path / "footings.csv", rows=10)
+    output_path = tmp_path / "stress.csv"
+    assert run_batch(str(input_path), str(output_path), shard_size=4, max_workers=0, progress=lambda _: None) == 10
+
+    result = pd.read_csv(output_path)
+    assert list(result.columns) == list(batch_stress.OUTPUT_COLUMNS)
+    foundations = read_foundations(str(input_path))
+    points = batch_stress.foundation_grid_points(foundations["dimensions"], foundations["positions"])
+    for i in range(10):
+        stress = foundation_stress(points[i], foundations["dimensions"][i], foundations["positions"][i],
+                                   foundations["load_values"][i], int(foundations["load_types"][i]))
+        assert result["id"][i] == foundations["ids"][i]
+        assert result["load_type"][i] == LOAD_TYPES[foundations["load_types"][i]]
+        np.testing.assert_allclose([result["stress_min"][i], result["stress_max"][i], result["stress_mean"][i]],
+                                   [stress.min(), stress.max(), stress.mean()], rtol=1e-12)
+
+
+def test_resume_after_torn_progress_line(tmp_path):
+    input_path = str(write_csv(tmp_path / "footings.csv", rows=40))
+    reference_path = str(tmp_path / "reference.csv")
+    run_batch(input_path, reference_path, shard_size=8, max_workers=0, progress=lambda _: None)
+    with open(reference_path, "rb") as f:
+        reference = f.read()
+
+    # Обрыв: третий шард записан в вывод, но его отметка оборвана на середине строки
+    output_path = str(tmp_path / "stress.csv")
+    run_batch(input_path, output_path, shard_size=8, max_workers=0, progress=lambda _: None)
+    with open(f"{output_path}.progress", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    header, marks = lines[0], [json.loads(line) for line in lines[1:]]
+    assert [mark["shard"] for mark in marks] == [0, 1, 2, 3, 4]
+    with open(f"{output_path}.progress", "w", encoding="utf-8") as f:
+        f.write("\n".join([header] + lines[1:3] + [lines[3][:10]]))
+    with open(output_path, "r+b") as f:
+        f.truncate(marks[2]["offset"] + 17)
+
+    computed = run_batch(input_path, output_path, shard_size=8, max_workers=0, resume=True,
+                         progress=lambda _: None)
+    assert computed == 24
+    with open(output_path, "rb") as f:
+        assert f.read() == reference
+
+
+def test_resume_rejects_other_run(tmp_path):
+    input_path = str(write_csv(tmp_path / "footings.csv", rows=10))
+    output_path = str(tmp_path / "stress.csv")
+    run_batch(input_path, output_path, shard_size=4, max_workers=0, progress=lambda _: None)
+    with pytest.raises(BatchInputError):
+        run_batch(input_path, output_path, shard_size=5, max_workers=0, resume=True, progress=lambda _: None)
+
+
+def test_parquet_fresh_run_removes_stale_parts(tmp_path, monkeypatch):
+    # Очистка каталога проверяется без pyarrow: запись шардов не нужна
+    monkeypatch.setattr(batch_stress, "_require_parquet", lambda: None)
+    directory = tmp_path / "stress.parquet"
+    directory.mkdir()
+    for name in ("part-000000.parquet", "part-000007.parquet", "part-000001.parquet.tmp", "notes.txt"):
+        (directory / name).write_text("x")
+
+    output = batch_stress._ParquetOutput(str(directory))
+    output.reset(0, resume=True)
+    assert sorted(p.name for p in directory.iterdir()) == ["notes.txt", "part-000000.parquet",
+                                                           "part-000007.parquet"]
+    output.reset(0)
+    assert [p.name for p in directory.iterdir()] == ["notes.txt"]
+
+
+def test_parquet_rerun_with_fewer_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    output_path = str(tmp_path / "stress.parquet")
+    run_batch(str(write_csv(tmp_path / "large.csv", rows=40)), output_path, shard_size=8, max_workers=0,
+              progress=lambda _: None)
+    run_batch(str(write_csv(tmp_path / "small.csv", rows=10)), output_path, shard_size=8, max_workers=0,
+              progress=lambda _: None)
+    assert len(pd.read_parquet(output_path)) == 10
@@ -0,0 +1,65 @@
+# tests/test_beam_analysis.py
+"""
+Расчёт балок: коэффициенты схем против формул сопромата, коды схем,
+перенос результатов на сетку BeamArray.
+"""
+import numpy as np
+import pytest
+
+from plugins.structural.beam_analysis import (
+    CASE_CANTILEVER_POINT, CASE_CANTILEVER_UNIFORM, CASE_FIXED_POINT, CASE_FIXED_UNIFORM, CASE_SIMPLE_POINT,
+    CASE_SIMPLE_UNIFORM, LOAD_CASES, UNKNOWN_CASE_CODE, analyze_beams, attach_beam_results, beam_stresses,
+    load_case_codes)
+
+L, B, H, E = 6.0, 0.2, 0.4, 3e10
+I = B * H ** 3 / 12
+Q = P = 12e3
+
+# Максимальные момент, поперечная сила и прогиб по справочным формулам
+CLOSED_FORMS = {
+    CASE_SIMPLE_UNIFORM: (Q * L ** 2 / 8, Q * L / 2, 5 * Q * L ** 4 / (384 * E * I)),
+    CASE_SIMPLE_POINT: (P * L / 4, P / 2, P * L ** 3 / (48 * E * I)),
+    CASE_CANTILEVER_UNIFORM: (Q * L ** 2 / 2, Q * L, Q * L ** 4 / (8 * E * I)),
+    CASE_CANTILEVER_POINT: (P * L, P, P * L ** 3 / (3 * E * I)),
+    CASE_FIXED_UNIFORM: (Q * L ** 2 / 12, Q * L / 2, Q * L ** 4 / (384 * E * I)),
+    CASE_FIXED_POINT: (P * L / 8, P / 2, P * L ** 3 / (192 * E * I)),
+}
+
+
+@pytest.mark.parametrize("load_case", LOAD_CASES)
+def test_load_case_matches_closed_form(load_case):
+    moment, shear, deflection = CLOSED_FORMS[load_case]
+    results = beam_stresses([L], [B], [H], Q, load_case, elastic_modulus=E)
+    np.testing.assert_allclose(results["moment"], moment, rtol=1e-12)
+    np.testing.assert_allclose(results["shear"], shear, rtol=1e-12)
+    np.testing.assert_allclose(results["deflection"], deflection, rtol=1e-12)
+    np.testing.assert_allclose(results["bending_stress"], moment / (B * H ** 2 / 6), rtol=1e-12)
+    np.testing.assert_allclose(results["shear_stress"], 1.5 * shear / (B * H), rtol=1e-12)
+
+
+def test_codes_names_and_unknown_cases():
+    names = list(LOAD_CASES) + ["Нет такой схемы"]
+    np.testing.assert_array_equal(load_case_codes(names), [0, 1, 2, 3, 4, 5, UNKNOWN_CASE_CODE])
+    np.testing.assert_array_equal(load_case_codes([9, -3, 6, np.int64(2), -1]),
+                                  [UNKNOWN_CASE_CODE, UNKNOWN_CASE_CODE, UNKNOWN_CASE_CODE, 2, UNKNOWN_CASE_CODE])
+    np.testing.assert_array_equal(load_case_codes(3, count=4), [3, 3, 3, 3])
+
+    # Неизвестная схема даёт нули, а не исключение
+    results = beam_stresses([L, L, L], B, H, Q, [0, 9, "Нет такой схемы"], elastic_modulus=E)
+    for values in results.values():
+        assert values[0] > 0 and values[1] == 0 and values[2] == 0
+
+
+def test_attach_beam_results_to_mesh():
+    pytest.importorskip("pyvista")
+    from plugins.structural.beam import BeamArray  # noqa: E402
+
+    beams = BeamArray(np.zeros((3, 3)), lengths=[4.0, 5.0, 6.0], sections=[(0.2, 0.3), (0.2, 0.4), (0.3, 0.5)])
+    results = analyze_beams(beams, Q, CASE_SIMPLE_UNIFORM, elastic_modulus=E)
+    mesh = attach_beam_results(beams.to_polydata(), results, names=["moment", "deflection"])
+
+    beam_ids = mesh.cell_data["beam_id"]
+    np.testing.assert_array_equal(np.bincount(beam_ids), [12, 12, 12])
+    np.testing.assert_allclose(mesh.cell_data["moment"], Q * beams.lengths[beam_ids] ** 2 / 8)
+    np.testing.assert_allclose(mesh.cell_data["deflection"], results["deflection"][beam_ids])
+    assert "shear" not in mesh.cell_data
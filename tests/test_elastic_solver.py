@@ -0,0 +1,104 @@
+# tests/test_elastic_solver.py
+"""
+Встроенный упругий решатель: аналитические решения (компрессионное
+сжатие — точно, Буссинеск — с допуском грубой сетки) и пачки нагрузок
+(блочный CG и CG по столбцам совпадают с прямым решением, в том числе
+для пропорциональных нагрузок).
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from core import elastic_solver  # noqa: E402
+from core.elastic_solver import ElasticSolver, foundation_loads, structured_box_mesh  # noqa: E402
+from core.stress_calculator import isotropic_stiffness  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def problem():
+    nodes, tetrahedra = structured_box_mesh((0, 4, 0, 4, -4, 0), (6, 6, 6))
+    materials = np.zeros(len(tetrahedra), dtype=np.int64)
+    forces = np.stack([foundation_loads(nodes, tetrahedra, materials, 1.0, code) for code in range(4)])
+    # Пропорциональная нагрузка: блок направлений становится вырожденным
+    forces = np.concatenate((forces, 2 * forces[:1]))
+    elasticity = isotropic_stiffness(50e6, 0.3)
+    direct = ElasticSolver(nodes, tetrahedra, elasticity=elasticity, method="direct").solve(forces)
+    return nodes, tetrahedra, elasticity, forces, direct
+
+
+@pytest.mark.parametrize("block_min_dofs", [0, 10 ** 9])
+def test_cg_batch_matches_direct(problem, monkeypatch, block_min_dofs):
+    nodes, tetrahedra, elasticity, forces, direct = problem
+    monkeypatch.setattr(elastic_solver, "BLOCK_CG_MIN_DOFS", block_min_dofs)
+    solver = ElasticSolver(nodes, tetrahedra, elasticity=elasticity, method="cg", rtol=1e-10)
+    displacements = solver.solve(forces)
+    assert displacements.shape == direct.shape
+    np.testing.assert_allclose(displacements, direct, atol=1e-8 * np.abs(direct).max())
+    np.testing.assert_allclose(displacements[4], 2 * displacements[0], atol=1e-8 * np.abs(direct).max())
+    # Блочный CG делает одну серию итераций на всю пачку
+    assert len(solver.iterations) == (1 if block_min_dofs == 0 else len(forces))
+
+
+def test_block_cg_zero_rhs(problem, monkeypatch):
+    nodes, tetrahedra, elasticity, forces, _direct = problem
+    monkeypatch.setattr(elastic_solver, "BLOCK_CG_MIN_DOFS", 0)
+    solver = ElasticSolver(nodes, tetrahedra, elasticity=elasticity, method="cg")
+    assert not solver.solve(np.zeros_like(forces)).any()
+
+
+# --- Аналитические решения ---
+
+E, NU = 50e6, 0.3
+PRESSURE = 100e3
+
+
+def newmark_corner(b, l, z):
+    """Коэффициент влияния σz / q под углом прямоугольной площадки b x l на глубине z"""
+    m, n = b / z, l / z
+    s = m ** 2 + n ** 2 + 1
+    return (2 * m * n * np.sqrt(s) / (s + m ** 2 * n ** 2) * (s + 1) / s
+            + np.arctan2(2 * m * n * np.sqrt(s), s - m ** 2 * n ** 2)) / (4 * np.pi)
+
+
+@pytest.mark.parametrize("method", ["direct", "cg"])
+def test_oedometer_is_exact(method):
+    # Давление на весь верх бруска, боковые грани закреплены по нормали: σzz = -q, осадка q·H / M
+    height = 4.0
+    nodes, tetrahedra = structured_box_mesh((0, 2, 0, 2, -height, 0), (4, 4, 8))
+    solver = ElasticSolver(nodes, tetrahedra, elasticity=isotropic_stiffness(E, NU), method=method, rtol=1e-12)
+    forces = foundation_loads(nodes, tetrahedra, np.zeros(len(tetrahedra), dtype=int), PRESSURE * 4,
+                              elastic_solver.LOAD_UNIFORM)
+    displacements = solver.solve(forces)
+    stresses = solver.element_stresses(displacements)
+
+    modulus = E * (1 - NU) / ((1 + NU) * (1 - 2 * NU))
+    np.testing.assert_allclose(stresses[:, 2], -PRESSURE, rtol=1e-8)
+    np.testing.assert_allclose(stresses[:, 3:], 0, atol=1e-8 * PRESSURE)
+    np.testing.assert_allclose(-displacements[:, 2].min(), PRESSURE * height / modulus, rtol=1e-8)
+    # Горизонтальные напряжения по коэффициенту бокового давления ν / (1 - ν)
+    np.testing.assert_allclose(stresses[:, :2], -PRESSURE * NU / (1 - NU), rtol=1e-8)
+
+
+def test_boussinesq_centre_line():
+    # Квадратная площадка 2 x 2 м на поверхности массива: σz под центром по Ньюмарку.
+    # Сетка как в benchmarks/bench_elastic_solver.py: ошибка от -8% до +6%
+    half_size, extent = 1.0, 12.0
+    g = np.geomspace(half_size, extent, 10)
+    plan = np.unique(np.concatenate((np.linspace(-half_size, half_size, 9), g, -g)))
+    depth = -np.unique(np.concatenate((np.linspace(0, 2 * half_size, 9), np.geomspace(2 * half_size, extent, 12))))
+    nodes, tetrahedra = elastic_solver.grid_mesh(plan, plan, depth[::-1])
+    solver = ElasticSolver(nodes, tetrahedra, elasticity=isotropic_stiffness(E, NU))
+
+    faces = elastic_solver.top_faces(nodes, tetrahedra)
+    centers = nodes[faces].mean(axis=1)
+    loaded = np.all(np.abs(centers[:, :2]) <= half_size, axis=1)
+    stresses = solver.element_stresses(solver.solve(elastic_solver.surface_forces(nodes, faces, PRESSURE * loaded)))
+
+    element_centers = nodes[tetrahedra].mean(axis=1)
+    for z in (0.5, 1.0, 2.0, 4.0):
+        near = (np.linalg.norm(element_centers[:, :2], axis=1) < 0.3 * half_size) & \
+            (np.abs(element_centers[:, 2] + z) < 0.15 * max(z, 1.0))
+        computed = -stresses[near, 2].mean()
+        exact = 4 * PRESSURE * newmark_corner(half_size, half_size, z)
+        assert computed == pytest.approx(exact, rel=0.15), f"z = {z}"
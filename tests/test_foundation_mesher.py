@@ -0,0 +1,30 @@
+# tests/test_foundation_mesher.py
+"""Параметры сеток фундаментов и ключи кеша (без построения через Gmsh)"""
+import pytest
+
+from core.foundation_mesher import (DEFAULT_SIZE_FAR, DEFAULT_SIZE_NEAR, DEFAULT_SOIL_DEPTH, DEFAULT_SOIL_MARGIN,
+                                    mesh_key, mesh_options)
+
+DIMENSIONS = (2.0, 3.0, 0.5)
+
+
+def test_defaults_scale_with_footprint():
+    assert mesh_options(DIMENSIONS) == {
+        "soil_margin": DEFAULT_SOIL_MARGIN,
+        "soil_depth": DEFAULT_SOIL_DEPTH,
+        "size_near": DEFAULT_SIZE_NEAR * 2.0,
+        "size_far": DEFAULT_SIZE_FAR * 2.0,
+    }
+    assert mesh_options(DIMENSIONS, soil_depth=None, size_near=None) == mesh_options(DIMENSIONS)
+
+
+def test_explicit_zero_is_kept():
+    options = mesh_options(DIMENSIONS, soil_margin=0, soil_depth=0.0)
+    assert options["soil_margin"] == 0.0 and options["soil_depth"] == 0.0
+    assert mesh_key(DIMENSIONS, soil_margin=0) != mesh_key(DIMENSIONS)
+    assert mesh_key(DIMENSIONS, soil_margin=DEFAULT_SOIL_MARGIN) == mesh_key(DIMENSIONS)
+
+
+def test_unknown_option():
+    with pytest.raises(TypeError):
+        mesh_options(DIMENSIONS, margin=1.0)
@@ -0,0 +1,130 @@
+# tests/test_foundation_scene.py
+"""
+Объединённая сцена фундаментов после добавлений и удалений должна
+совпадать со сцеплением сеток оставшихся фундаментов.
+"""
+import numpy as np
+import pytest
+
+pv = pytest.importorskip("pyvista")
+
+from core.foundation_store import FoundationTable  # noqa: E402
+from core.spatial_index import SpatialIndex  # noqa: E402
+from viz.foundation_scene import FoundationPlacementError, FoundationScene, create_foundation  # noqa: E402
+
+
+@pytest.fixture
+def plotter():
+    plotter = pv.Plotter(off_screen=True)
+    yield plotter
+    plotter.close()
+
+
+def make_geometry(i):
+    center = (3.0 * i, 0.0, 0.25)
+    if i % 2:
+        geometry = pv.Cube(center=center, x_length=1 + i % 3, y_length=2, z_length=0.5)
+    else:
+        geometry = pv.Sphere(center=center, radius=1, theta_resolution=5 + i % 4, phi_resolution=5)
+    geometry["stress"] = np.arange(geometry.n_points, dtype=np.float64) + 1000 * i
+    return geometry
+
+
+def expected_arrays(geometries, ids):
+    """Точки, грани в формате VTK, напряжения и номера фундаментов ячеек"""
+    points, faces, stress, cell_ids = [], [], [], []
+    offset = 0
+    for foundation_id in ids:
+        geometry = geometries[foundation_id]
+        cells = np.asarray(geometry.faces, dtype=np.int64).copy()
+        is_count = np.zeros(len(cells), dtype=bool)
+        position = 0
+        while position < len(cells):
+            is_count[position] = True
+            position += cells[position] + 1
+        cells[~is_count] += offset
+        points.append(geometry.points)
+        faces.append(cells)
+        stress.append(geometry["stress"])
+        cell_ids.append(np.full(geometry.n_cells, foundation_id))
+        offset += geometry.n_points
+    return (np.concatenate(points), np.concatenate(faces), np.concatenate(stress), np.concatenate(cell_ids))
+
+
+def assert_scene_matches(scene, geometries):
+    points, faces, stress, cell_ids = expected_arrays(geometries, scene.ids)
+    np.testing.assert_array_equal(scene.mesh.points, points)
+    np.testing.assert_array_equal(scene.mesh.faces, faces)
+    np.testing.assert_array_equal(scene.mesh.point_data["stress"], stress)
+    np.testing.assert_array_equal(scene.mesh.cell_data["foundation_id"], cell_ids)
+    for cell in (0, len(cell_ids) // 2, len(cell_ids) - 1):
+        assert scene.foundation_at_cell(cell) == cell_ids[cell]
+
+
+def test_add_and_remove_keep_merged_mesh_consistent(plotter):
+    scene = FoundationScene(plotter)
+    geometries = {i: make_geometry(i) for i in range(40)}
+    for foundation_id, geometry in geometries.items():
+        scene.add(foundation_id, geometry)
+    assert scene.actor.mapper.dataset is scene.mesh
+    assert_scene_matches(scene, geometries)
+
+    for foundation_id in (0, 39, 17, 18, 5):
+        scene.remove(foundation_id)
+    assert foundation_id not in scene
+    assert_scene_matches(scene, geometries)
+
+    geometries[100] = make_geometry(3)
+    scene.add(100, geometries[100])
+    scene.replace(7, geometries[7])
+    assert_scene_matches(scene, geometries)
+
+
+def test_stress_updates_in_place(plotter):
+    scene = FoundationScene(plotter)
+    geometries = {i: make_geometry(i) for i in range(3)}
+    for foundation_id, geometry in geometries.items():
+        scene.add(foundation_id, geometry)
+    scene.update_stresses({1: np.full(geometries[1].n_points, -5.0)})
+    assert scene.stress_range() == (-5.0, float(geometries[2]["stress"].max()))
+    np.testing.assert_array_equal(scene.mesh.point_data["stress"][scene.point_range(1)], -5.0)
+
+
+def test_load_matches_added_scene_and_clear(plotter):
+    geometries = {i: make_geometry(i) for i in range(6)}
+    ids = list(geometries)
+    points, faces, stress, _ = expected_arrays(geometries, ids)
+    point_offsets = np.concatenate(([0], np.cumsum([geometries[i].n_points for i in ids])))
+    cell_offsets = np.concatenate(([0], np.cumsum([geometries[i].n_cells for i in ids])))
+    face_offsets = np.concatenate(([0], np.cumsum([len(geometries[i].faces) for i in ids])))
+
+    scene = FoundationScene(plotter)
+    scene.load(ids, points, faces, point_offsets, face_offsets, cell_offsets, stress=stress)
+    assert_scene_matches(scene, geometries)
+    scene.remove(2)
+    assert_scene_matches(scene, geometries)
+
+    scene.clear()
+    assert len(scene) == 0 and scene.mesh.n_points == 0 and scene.mesh.n_cells == 0
+    assert not scene.actor.GetVisibility()
+    assert scene.stress_range() is None
+
+
+def test_create_foundation(plotter):
+    table, scene, index = FoundationTable(), FoundationScene(plotter), SpatialIndex(cell_size=2.0)
+    foundation_id = create_foundation(table, scene, index, (4.0, 3.0, 1.0), (0.0, 0.0, 1.0), 0.5, 100e3,
+                                      "Равномерная")
+    np.testing.assert_allclose(table.positions[table.row(foundation_id)], (2.0, 1.5, 1.25))
+    np.testing.assert_allclose(table.dimensions[table.row(foundation_id)], (4.0, 3.0, 0.5))
+    mesh = table.mesh(foundation_id)
+    np.testing.assert_allclose(mesh.bounds, (0.0, 4.0, 0.0, 3.0, 1.0, 1.5))
+    assert foundation_id in scene and scene.n_points == mesh.n_points
+    assert index.query_point((1.0, 1.0)) == [foundation_id]
+    assert index.nearest_point((4.1, 3.1), 0.5)[0] == ("foundation", foundation_id, 2)
+
+    with pytest.raises(FoundationPlacementError) as error:
+        create_foundation(table, scene, index, (3.0, 2.0, 0.0), (6.0, 5.0, 0.0), 0.5, 100e3, "Равномерная")
+    assert error.value.overlaps == [foundation_id]
+    with pytest.raises(FoundationPlacementError):
+        create_foundation(table, scene, index, (10.0, 10.0, 0.0), (10.05, 12.0, 0.0), 0.5, 100e3, "Равномерная")
+    assert len(table) == len(scene) == 1
@@ -0,0 +1,23 @@
+# tests/test_ground_grid.py
+import numpy as np
+import pytest
+
+pytest.importorskip("pyvista")
+
+from viz.ground_grid import grid_lines  # noqa: E402
+
+
+@pytest.mark.parametrize("extent, spacing", [(20, 0.5), (20, 0.3), (20, 0.7), (20, 50), (1000, 0.1)])
+def test_lines_stay_inside_site(extent, spacing):
+    points = grid_lines(extent, spacing).points
+    assert np.all(np.abs(points[:, :2]) <= extent / 2 + 1e-9)
+    coords = np.unique(np.round(points[:, 0], 9))
+    # Граница площадки нарисована, внутренние линии совпадают с узлами привязки
+    assert coords[0] == -extent / 2 and coords[-1] == extent / 2
+    inner = coords[1:-1]
+    np.testing.assert_allclose(inner, np.round(inner / spacing) * spacing, atol=1e-9)
+
+
+def test_multiple_extent_keeps_regular_grid():
+    coords = np.unique(np.round(grid_lines(20, 0.5).points[:, 0], 9))
+    np.testing.assert_allclose(coords, np.linspace(-10, 10, 41))
@@ -0,0 +1,75 @@
+# tests/test_instancing.py
+"""
+Разложение матриц размещения IFC: кватернионы поворота должны
+восстанавливать исходную матрицу, в том числе для поворотов на 180°.
+"""
+import itertools
+
+import numpy as np
+
+from bim.instancing import rigid_decomposition, rotation_quaternions
+
+
+def quaternion_matrices(quaternions):
+    """Матрицы поворота (k, 3, 3) из кватернионов (w, x, y, z)"""
+    w, x, y, z = np.asarray(quaternions).T
+    return np.stack((
+        np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+        np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+        np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+    ), axis=1)
+
+
+def random_rotations(rng, count):
+    q = rng.standard_normal((count, 4))
+    return quaternion_matrices(q / np.linalg.norm(q, axis=1, keepdims=True))
+
+
+def axis_aligned_rotations():
+    """Все 24 поворота, переводящие оси в оси (включая повороты на 180°)"""
+    result = []
+    for permutation in itertools.permutations(np.eye(3)):
+        for signs in itertools.product((1, -1), repeat=3):
+            matrix = np.array(permutation) * np.array(signs)[:, np.newaxis]
+            if np.linalg.det(matrix) > 0:
+                result.append(matrix)
+    return np.array(result)
+
+
+def test_random_rotations_round_trip():
+    rotations = random_rotations(np.random.default_rng(0), 1000)
+    np.testing.assert_allclose(quaternion_matrices(rotation_quaternions(rotations)), rotations, atol=1e-12)
+
+
+def test_axis_aligned_and_half_turn_rotations_round_trip():
+    rotations = axis_aligned_rotations()
+    assert len(rotations) == 24
+    np.testing.assert_allclose(quaternion_matrices(rotation_quaternions(rotations)), rotations, atol=1e-12)
+
+
+def test_half_turn_about_diagonal_axis():
+    # Axis (0, 0, -1), RefDirection (0, -1, 0)
+    rotation = np.array([[0.0, -1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, -1.0]])
+    quaternion = rotation_quaternions(rotation[np.newaxis])[0]
+    np.testing.assert_allclose(np.abs(quaternion), [0, np.sqrt(0.5), np.sqrt(0.5), 0], atol=1e-12)
+    assert quaternion[1] * quaternion[2] < 0
+    np.testing.assert_allclose(quaternion_matrices(quaternion[np.newaxis])[0], rotation, atol=1e-12)
+
+
+def test_rigid_decomposition_rebuilds_transforms():
+    rng = np.random.default_rng(1)
+    rotations = np.concatenate((random_rotations(rng, 50), axis_aligned_rotations()))
+    scales = rng.uniform(0.5, 2.0, size=(len(rotations), 3))
+    transforms = np.tile(np.eye(4), (len(rotations), 1, 1))
+    transforms[:, :3, :3] = rotations * scales[:, np.newaxis, :]
+    transforms[:, :3, 3] = rng.uniform(-10, 10, size=(len(rotations), 3))
+
+    translations, quaternions, decomposed_scales, exact = rigid_decomposition(transforms)
+    assert exact.all()
+    rebuilt = quaternion_matrices(quaternions) * decomposed_scales[:, np.newaxis, :]
+    np.testing.assert_allclose(rebuilt, transforms[:, :3, :3], atol=1e-12)
+    np.testing.assert_allclose(translations, transforms[:, :3, 3])
+
+    mirrored = transforms[:1].copy()
+    mirrored[0, :3, 0] *= -1
+    assert not rigid_decomposition(mirrored)[3][0]
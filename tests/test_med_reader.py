@@ -0,0 +1,109 @@
+# tests/test_med_reader.py
+"""
+Проверка core.med_reader.MedResultReader на синтетическом MED-файле,
+созданном локально (core.med_synthetic).
+"""
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from core.med_reader import MedResultReader  # noqa: E402
+from core.med_synthetic import STRESS_COMPONENTS, STRESS_FIELD, write_synthetic_med  # noqa: E402
+
+N_NODES = 1000
+N_STEPS = 3
+
+
+def expected_values(path, step):
+    """Значения шага (узлы, компоненты), прочитанные напрямую через h5py"""
+    with h5py.File(path, "r") as f:
+        flat = f[f"CHA/{STRESS_FIELD}/{step:020d}{0:020d}/NOE/MED_NO_PROFILE_INTERNAL/CO"][()]
+    return flat.reshape(len(STRESS_COMPONENTS), -1).T
+
+
+@pytest.fixture(scope="module")
+def med_file(tmp_path_factory):
+    return write_synthetic_med(str(tmp_path_factory.mktemp("med") / "synthetic.rmed"), N_NODES, N_STEPS, chunk=300)
+
+
+@pytest.fixture(scope="module")
+def compressed_med_file(tmp_path_factory):
+    return write_synthetic_med(str(tmp_path_factory.mktemp("med") / "compressed.rmed"), N_NODES, N_STEPS,
+                               compression="gzip")
+
+
+def test_fields_and_steps(med_file):
+    with MedResultReader(med_file) as reader:
+        field, = reader.fields()
+        assert field["name"] == STRESS_FIELD and field["mesh"] == "MAIL" and field["n_steps"] == N_STEPS
+        assert field["components"] == list(STRESS_COMPONENTS) and field["units"] == ["Pa"] * 6
+        assert reader.steps(STRESS_FIELD) == [(step, 0, float(step)) for step in range(N_STEPS)]
+        assert reader.shape(STRESS_FIELD) == (N_NODES, len(STRESS_COMPONENTS))
+        assert reader.node_coordinates().shape == (N_NODES, 3)
+        with pytest.raises(KeyError):
+            reader.read("НЕТ_ТАКОГО_ПОЛЯ")
+
+
+def test_memmap_view_matches_read(med_file):
+    with MedResultReader(med_file) as reader:
+        view = reader.view(STRESS_FIELD, step=-1)
+        assert isinstance(view, np.memmap)
+        assert view.shape == (N_NODES, len(STRESS_COMPONENTS))
+        np.testing.assert_array_equal(view, reader.read(STRESS_FIELD, step=-1))
+        np.testing.assert_array_equal(view, expected_values(med_file, N_STEPS - 1))
+
+
+@pytest.mark.parametrize("chunk_size", [N_NODES, 300, 7])
+def test_iter_chunks_cover_all_nodes(med_file, chunk_size):
+    with MedResultReader(med_file) as reader:
+        expected = reader.view(STRESS_FIELD, step=1)
+        starts, blocks = [], []
+        for start, block in reader.iter_chunks(STRESS_FIELD, step=1, chunk_size=chunk_size):
+            starts.append(start)
+            blocks.append(block.copy())
+    assert starts == list(range(0, N_NODES, chunk_size))
+    # Последний блок неполный, если число узлов не кратно размеру блока
+    assert len(blocks[-1]) == N_NODES - starts[-1]
+    np.testing.assert_array_equal(np.concatenate(blocks), expected)
+
+
+def test_component_selection(med_file):
+    with MedResultReader(med_file) as reader:
+        full = reader.read(STRESS_FIELD, step=0)
+        np.testing.assert_array_equal(reader.read(STRESS_FIELD, step=0, components=["SIZZ"]), full[:, [2]])
+        np.testing.assert_array_equal(reader.read(STRESS_FIELD, step=0, components=[5, "SIXX"]), full[:, [5, 0]])
+        blocks = [block.copy() for _start, block in
+                  reader.iter_chunks(STRESS_FIELD, step=0, chunk_size=300, components=["SIXY", 1])]
+        np.testing.assert_array_equal(np.concatenate(blocks), full[:, [3, 1]])
+
+
+def test_step_lookup(med_file):
+    with MedResultReader(med_file) as reader:
+        for step in range(N_STEPS):
+            expected = expected_values(med_file, step)
+            np.testing.assert_array_equal(reader.read(STRESS_FIELD, step=step), expected)
+            np.testing.assert_array_equal(reader.read(STRESS_FIELD, step=(step, 0)), expected)
+        np.testing.assert_array_equal(reader.read(STRESS_FIELD, step=-1),
+                                      reader.read(STRESS_FIELD, step=(N_STEPS - 1, 0)))
+        with pytest.raises(KeyError):
+            reader.read(STRESS_FIELD, step=(N_STEPS, 0))
+
+
+@pytest.mark.parametrize("chunk_size", [N_NODES, 7])
+def test_reduce_matches_full_min_max(med_file, chunk_size):
+    with MedResultReader(med_file) as reader:
+        full = reader.read(STRESS_FIELD, step=2)
+        low, high = reader.reduce(STRESS_FIELD, step=2, chunk_size=chunk_size)
+    np.testing.assert_array_equal(low, full.min(axis=0))
+    np.testing.assert_array_equal(high, full.max(axis=0))
+
+
+def test_compressed_dataset_falls_back_to_chunks(compressed_med_file):
+    with MedResultReader(compressed_med_file) as reader:
+        view = reader.view(STRESS_FIELD)
+        assert isinstance(view, h5py.Dataset)
+        expected = expected_values(compressed_med_file, N_STEPS - 1)
+        blocks = [block.copy() for _start, block in reader.iter_chunks(STRESS_FIELD, chunk_size=300)]
+        np.testing.assert_array_equal(np.concatenate(blocks), expected)
+        np.testing.assert_array_equal(reader.reduce(STRESS_FIELD, chunk_size=300)[1], expected.max(axis=0))
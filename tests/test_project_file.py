@@ -0,0 +1,121 @@
+# tests/test_project_file.py
+"""
+Файл проекта: запись и чтение таблицы, сеток, полей результатов, пакета
+случаев нагрузки и вспомогательных линий; откат при ошибке записи.
+"""
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("h5py")
+pv = pytest.importorskip("pyvista")
+
+from core.foundation_store import FoundationTable  # noqa: E402
+from core.load_cases import LoadCases  # noqa: E402
+from core.project_file import ProjectFile, save_project  # noqa: E402
+from core.stress_engine import LOAD_TYPES  # noqa: E402
+
+
+def mixed_mesh():
+    """Сетка с гранями разного размера (квадрат и треугольник)"""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]], dtype=np.float64)
+    return pv.PolyData(points, np.array([4, 0, 1, 2, 3, 3, 1, 4, 2]))
+
+
+def vtk_shifted(faces, offset):
+    """Грани VTK с индексами вершин, сдвинутыми на offset"""
+    faces = np.array(faces, dtype=np.int64)
+    position = 0
+    while position < len(faces):
+        size = faces[position]
+        faces[position + 1:position + 1 + size] += offset
+        position += size + 1
+    return faces
+
+
+def project():
+    meshes = [pv.Plane(i_resolution=3, j_resolution=2).triangulate(), mixed_mesh(),
+              pv.Box(level=1).translate((5.0, 0.0, 0.0), inplace=False)]
+    table = FoundationTable()
+    table.add_many(positions=[(0, 0, 0), (3, 0, 0), (5, 0, 0)], dimensions=[(1, 2, 0.5), (2, 2, 0.4), (1, 1, 1)],
+                   load_values=[100e3, 200e3, 50e3], load_types=[LOAD_TYPES[0], LOAD_TYPES[1], LOAD_TYPES[3]],
+                   meshes=meshes, ids=[7, 2, 11])
+    load_cases = LoadCases((50e3, 100e3), LOAD_TYPES[:2])
+    rng = np.random.default_rng(0)
+    stress = {foundation_id: rng.normal(size=mesh.n_points) for foundation_id, mesh in zip(table, meshes)}
+    case_stress = {foundation_id: rng.normal(size=(len(load_cases), mesh.n_points))
+                   for foundation_id, mesh in zip(table, meshes)}
+    partial = {7: np.zeros(meshes[0].n_points)}
+    guides = rng.normal(size=(4, 2, 3))
+    return table, {"stress": stress, "case_stress": case_stress, "partial": partial}, load_cases, guides
+
+
+def test_round_trip(tmp_path):
+    table, results, load_cases, guides = project()
+    path = str(tmp_path / "project.h5")
+    save_project(path, table, guides, results, load_cases)
+    assert os.listdir(tmp_path) == ["project.h5"]
+
+    with ProjectFile(path) as project_file:
+        assert len(project_file) == 3
+        loaded = project_file.foundations()
+        np.testing.assert_array_equal(loaded.table, table.table)
+        np.testing.assert_allclose(project_file.guide_segments, guides)
+        # Поле есть не у всех фундаментов — не сохраняется
+        assert sorted(project_file.result_names()) == ["case_stress", "stress"]
+
+        for foundation_id in table:
+            source, mesh = table.mesh(foundation_id), project_file.mesh(foundation_id)
+            np.testing.assert_allclose(mesh.points, source.points)
+            np.testing.assert_array_equal(mesh.faces, source.faces)
+            np.testing.assert_allclose(mesh.point_data["stress"], results["stress"][foundation_id])
+            assert "case_stress" not in mesh.point_data
+            assert loaded.mesh(foundation_id).n_points == source.n_points
+
+        arrays = project_file.mesh_arrays()
+        np.testing.assert_array_equal(arrays["ids"], [7, 2, 11])
+        scene = pv.PolyData(arrays["points"], arrays["faces"])
+        for row, foundation_id in enumerate(table):
+            source = table.mesh(foundation_id)
+            p0, p1 = arrays["point_offsets"][row:row + 2]
+            f0, f1 = arrays["face_offsets"][row:row + 2]
+            c0, c1 = arrays["cell_offsets"][row:row + 2]
+            np.testing.assert_allclose(arrays["points"][p0:p1], source.points)
+            np.testing.assert_array_equal(arrays["faces"][f0:f1], vtk_shifted(source.faces, p0))
+            assert c1 - c0 == source.n_cells
+        assert scene.n_cells == sum(table.mesh(foundation_id).n_cells for foundation_id in table)
+
+        for name in ("stress", "case_stress"):
+            loaded_results = project_file.results(name)
+            assert list(loaded_results) == [7, 2, 11]
+            for foundation_id, values in results[name].items():
+                np.testing.assert_allclose(loaded_results[foundation_id], values)
+                np.testing.assert_allclose(project_file.result(name, foundation_id), values)
+
+        cases = project_file.load_cases()
+        np.testing.assert_allclose(cases.load_values, load_cases.load_values)
+        np.testing.assert_array_equal(cases.load_types, load_cases.load_types)
+
+
+def test_without_load_cases_and_guides(tmp_path):
+    table, results, _, _ = project()
+    path = str(tmp_path / "project.h5")
+    save_project(path, table, results={"stress": results["stress"]})
+    with ProjectFile(path) as project_file:
+        assert project_file.load_cases() is None
+        assert project_file.guide_segments.shape == (0, 2, 3)
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    table, results, load_cases, guides = project()
+    path = str(tmp_path / "project.h5")
+    save_project(path, table, guides)
+    before = open(path, "rb").read()
+
+    broken = dict(results["stress"])
+    broken[2] = np.zeros((2, 2))  # размерность не совпадает с остальными фундаментами
+    with pytest.raises(ValueError):
+        save_project(path, table, guides, {"stress": broken}, load_cases)
+    assert os.listdir(tmp_path) == ["project.h5"]
+    assert open(path, "rb").read() == before
@@ -0,0 +1,154 @@
+# tests/test_result_cache.py
+"""
+Двухуровневый кеш результатов: ключи, LRU в памяти, запись и вытеснение
+на диске, инвалидация по версии решателя, файлы.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from core.result_cache import KEY_DECIMALS, ResultCache, cache_key, file_digest
+
+
+def array(kib, fill=0.0):
+    return np.full(kib * 128, fill)  # kib КиБ float64
+
+
+def test_cache_key_rounds_floats_and_ignores_dict_order():
+    tiny = 10.0 ** -(KEY_DECIMALS + 2)
+    assert cache_key(1.0) == cache_key(1.0 + tiny)
+    assert cache_key(0.0) == cache_key(-0.0)
+    assert cache_key(1.0) != cache_key(1.0 + 10.0 ** -(KEY_DECIMALS - 2))
+    assert cache_key(np.array([0.1, 0.2])) == cache_key(np.array([0.1 + tiny, 0.2 - tiny]))
+    assert cache_key(np.array([0.1, 0.2], dtype=np.float32)) == cache_key(np.array([0.1, 0.2], dtype=np.float32))
+    assert cache_key({"E": 1e6, "nu": 0.3}) == cache_key({"nu": 0.3, "E": 1e6})
+    # Типы и форма различаются: 1 и 1.0, [1, 2] и (1, 2)-массив другой формы
+    assert cache_key(1) != cache_key(1.0)
+    assert cache_key(np.zeros((2, 3))) != cache_key(np.zeros((3, 2)))
+    assert cache_key([1, 2], 3) != cache_key([1, 2, 3])
+    with pytest.raises(TypeError):
+        cache_key(object())
+
+
+def test_memory_lru_limit():
+    cache = ResultCache("test", "1", memory_limit=3 * 1024, disk_dir=False)
+    for key in "abc":
+        cache.put(key, array(1))
+    assert cache.get("a") is not None  # a становится самым свежим
+    cache.put("d", array(1))
+    assert len(cache) == 3 and "b" not in cache
+    assert cache.get("b") is None
+    assert cache.stats()["memory_bytes"] == 3 * 1024
+
+    # Значение больше лимита возвращается, но не хранится
+    value = cache.put("big", array(4))
+    assert value.shape == (512,) and "big" not in cache
+
+
+def test_values_are_read_only_copies(tmp_path):
+    cache = ResultCache("test", "1", disk_dir=str(tmp_path))
+    source = np.arange(5.0)
+    stored = cache.put("k", source)
+    source[0] = 100
+    assert stored[0] == 0 and not stored.flags.writeable
+    with pytest.raises(ValueError):
+        cache.get("k")[1] = 5
+
+
+def test_disk_level_survives_restart(tmp_path):
+    cache = ResultCache("test", "1", disk_dir=str(tmp_path))
+    cache.put("k", np.arange(4.0))
+    restarted = ResultCache("test", "1", disk_dir=str(tmp_path))
+    assert len(restarted) == 0 and "k" in restarted
+    np.testing.assert_array_equal(restarted.get("k"), np.arange(4.0))
+    assert restarted.disk_hits == 1 and len(restarted) == 1
+    restarted.get("k")
+    assert restarted.hits == 1
+    assert restarted.get("нет", "default") == "default" and restarted.misses == 1
+
+
+def test_corrupt_disk_entry_is_dropped(tmp_path):
+    cache = ResultCache("test", "1", disk_dir=str(tmp_path))
+    path = os.path.join(cache.disk_path, "k.npy")
+    with open(path, "wb") as f:
+        f.write(b"not an npy file")
+    assert cache.get("k") is None and not os.path.exists(path)
+
+
+def test_disk_eviction_removes_least_recently_used(tmp_path):
+    cache = ResultCache("test", "1", memory_limit=0, disk_dir=str(tmp_path), disk_limit=int(2.5 * 8 * 1024))
+    cache.put("old", array(8))
+    cache.put("recent", array(8))
+    paths = {key: os.path.join(cache.disk_path, f"{key}.npy") for key in ("old", "recent")}
+    os.utime(paths["old"], (1_000_000, 1_000_000))
+    os.utime(paths["recent"], (2_000_000, 2_000_000))
+
+    cache.put("new", array(8))
+    assert not os.path.exists(paths["old"])
+    assert os.path.exists(paths["recent"]) and "new" in cache
+    assert cache.stats()["disk_bytes"] == sum(os.path.getsize(os.path.join(cache.disk_path, name))
+                                              for name in os.listdir(cache.disk_path))
+    assert cache.stats()["disk_bytes"] <= cache.disk_limit
+
+
+def test_overwrite_keeps_disk_size(tmp_path):
+    cache = ResultCache("test", "1", disk_dir=str(tmp_path))
+    cache.put("k", array(2))
+    size = cache.stats()["disk_bytes"]
+    cache.put("k", array(2, fill=1.0))
+    assert cache.stats()["disk_bytes"] == size
+    assert cache.get("k")[0] == 1.0
+
+
+def test_version_change_invalidates_disk_entries(tmp_path):
+    ResultCache("test", "1", disk_dir=str(tmp_path)).put("k", np.arange(3.0))
+    other_solver = ResultCache("other", "1", disk_dir=str(tmp_path))
+    other_solver.put("k", np.arange(3.0))
+
+    cache = ResultCache("test", "2", disk_dir=str(tmp_path))
+    assert "k" not in cache
+    assert os.listdir(os.path.join(str(tmp_path), "test")) == [os.path.basename(cache.disk_path)]
+    # Кеш другого решателя не затронут
+    assert "k" in ResultCache("other", "1", disk_dir=str(tmp_path))
+
+
+def test_files(tmp_path):
+    source = tmp_path / "results.rmed"
+    source.write_bytes(b"med" * 1000)
+    cache = ResultCache("files", "1", disk_dir=str(tmp_path / "cache"))
+    assert cache.get_file("k", ".rmed") is None and cache.misses == 1
+
+    path = cache.put_file("k", str(source), ".rmed")
+    assert path.endswith("k.rmed") and file_digest(path) == file_digest(str(source))
+    assert cache.get_file("k", ".rmed") == path and cache.disk_hits == 1
+    assert cache.stats()["disk_bytes"] == 3000
+
+    cache.discard("k")
+    assert cache.get_file("k", ".rmed") is None and cache.stats()["disk_bytes"] == 0
+    with pytest.raises(RuntimeError):
+        ResultCache("files", "1", disk_dir=False).put_file("k", str(source))
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    cache = ResultCache("test", "1", disk_dir=str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        cache.put_file("k", str(tmp_path / "missing"))
+    assert os.listdir(cache.disk_path) == []
+
+
+def test_get_or_compute_and_clear(tmp_path):
+    cache = ResultCache("test", "1", disk_dir=str(tmp_path))
+    calls = []
+
+    def compute(x):
+        calls.append(x)
+        return np.full(3, x)
+
+    first = cache.get_or_compute("k", compute, 2.0)
+    second = cache.get_or_compute("k", compute, 2.0)
+    assert calls == [2.0] and second is first
+
+    cache.clear()
+    assert len(cache) == 0 and "k" not in cache and os.listdir(cache.disk_path) == []
+    assert cache.stats()["disk_bytes"] == 0
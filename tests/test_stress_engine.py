@@ -0,0 +1,146 @@
+# tests/test_stress_engine.py
+"""
+Сверка векторизованных ядер core/stress_engine.py с исходными циклами
+по точкам из EngineeringSuiteApp.calculate_foundation_stress и
+create_foundation.
+"""
+import numpy as np
+import pytest
+
+from core import stress_engine
+
+
+def reference_foundation_stress(points, dimensions, center, load_value, load_type):
+    """Исходный расчёт по точкам (до векторизации)"""
+    width, length, thickness = dimensions
+    stress = np.zeros(len(points))
+
+    if load_type == "Равномерная":
+        area = width * length
+        base_pressure = load_value / area
+        for j, point in enumerate(points):
+            dist = np.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
+            stress[j] = base_pressure * (1 - 0.1 * dist / max(width, length))
+
+    elif load_type == "Точечная в центре":
+        for j, point in enumerate(points):
+            dist = np.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
+            stress[j] = load_value * np.exp(-2 * dist / max(width, length)) / (
+                        np.pi * (max(width, length) / 4) ** 2)
+
+    elif load_type == "Точечная в углу":
+        corner = [center[0] - width / 2, center[1] - length / 2, center[2]]
+        for j, point in enumerate(points):
+            dist = np.sqrt((point[0] - corner[0]) ** 2 + (point[1] - corner[1]) ** 2)
+            stress[j] = load_value * np.exp(-2 * dist / max(width, length)) / (
+                        np.pi * (max(width, length) / 4) ** 2)
+
+    elif load_type == "Линейная":
+        for j, point in enumerate(points):
+            norm_x = (point[0] - center[0]) / (width / 2)
+            factor = 0.5 + 0.5 * norm_x
+            stress[j] = (load_value / (width * length)) * factor
+
+    for j, point in enumerate(points):
+        rel_height = (point[2] - (center[2] - thickness / 2)) / thickness
+        stress[j] *= (1 - 0.3 * rel_height)
+
+    return stress
+
+
+def reference_initial_stress(points, center):
+    """Исходное начальное поле из create_foundation"""
+    stress = np.zeros(len(points))
+    for i, point in enumerate(points):
+        dist = np.sqrt((point[0] - center[0]) ** 2 + (point[1] - center[1]) ** 2)
+        stress[i] = 1e6 * (1 - np.exp(-dist / 2))
+    return stress
+
+
+def random_foundations(rng, n_foundations, n_points=None):
+    """Случайные фундаменты: точки внутри бокса каждого фундамента"""
+    dimensions = rng.uniform([0.5, 0.5, 0.2], [6.0, 6.0, 1.5], size=(n_foundations, 3))
+    positions = rng.uniform([-50, -50, -1], [50, 50, 1], size=(n_foundations, 3))
+    load_values = rng.uniform(1e3, 1e6, size=n_foundations)
+    load_types = [stress_engine.LOAD_TYPES[i % len(stress_engine.LOAD_TYPES)] for i in range(n_foundations)]
+    points_list = []
+    for i in range(n_foundations):
+        count = n_points if n_points is not None else int(rng.integers(1, 40))
+        half = dimensions[i] / 2
+        points_list.append(positions[i] + rng.uniform(-half, half, size=(count, 3)))
+    return points_list, dimensions, positions, load_values, load_types
+
+
+def reference_batch(points_list, dimensions, positions, load_values, load_types):
+    return [reference_foundation_stress(points, dimensions[i], positions[i], load_values[i], load_types[i])
+            for i, points in enumerate(points_list)]
+
+
+@pytest.mark.parametrize("load_type", stress_engine.LOAD_TYPES)
+def test_single_foundation_matches_loops(load_type):
+    rng = np.random.default_rng(1)
+    points_list, dimensions, positions, load_values, _ = random_foundations(rng, 1, n_points=64)
+    expected = reference_foundation_stress(points_list[0], dimensions[0], positions[0], load_values[0], load_type)
+    actual = stress_engine.foundation_stress(points_list[0], dimensions[0], positions[0], load_values[0], load_type)
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=0)
+
+
+def test_stacked_batch_matches_loops():
+    rng = np.random.default_rng(2)
+    points_list, dimensions, positions, load_values, load_types = random_foundations(rng, 40, n_points=24)
+    actual = stress_engine.batch_foundation_stress(np.stack(points_list), dimensions, positions,
+                                                   load_values, load_types)
+    assert actual.shape == (40, 24)
+    expected = reference_batch(points_list, dimensions, positions, load_values, load_types)
+    np.testing.assert_allclose(actual, np.stack(expected), rtol=1e-12, atol=0)
+
+
+def test_offsets_batch_matches_loops():
+    rng = np.random.default_rng(3)
+    points_list, dimensions, positions, load_values, load_types = random_foundations(rng, 40)
+    offsets = np.concatenate(([0], np.cumsum([len(points) for points in points_list])))
+    actual = stress_engine.batch_foundation_stress(np.concatenate(points_list), dimensions, positions,
+                                                   load_values, load_types, offsets=offsets)
+    expected = reference_batch(points_list, dimensions, positions, load_values, load_types)
+    for part, reference in zip(stress_engine.split_by_offsets(actual, offsets), expected):
+        np.testing.assert_allclose(part, reference, rtol=1e-12, atol=0)
+
+
+def test_group_stress_matches_loops():
+    rng = np.random.default_rng(4)
+    points_list, dimensions, positions, load_values, load_types = random_foundations(rng, 12)
+    actual = stress_engine.foundation_group_stress(points_list, dimensions, positions, load_values, load_types)
+    expected = reference_batch(points_list, dimensions, positions, load_values, load_types)
+    for part, reference in zip(actual, expected):
+        np.testing.assert_allclose(part, reference, rtol=1e-12, atol=0)
+
+
+def test_unknown_load_type_gives_zero_stress():
+    rng = np.random.default_rng(5)
+    points_list, dimensions, positions, load_values, _ = random_foundations(rng, 1, n_points=8)
+    stress = stress_engine.foundation_stress(points_list[0], dimensions[0], positions[0], load_values[0], "Другая")
+    assert np.all(stress == 0)
+
+
+def test_initial_stress_stacked_and_offsets_match_loops():
+    rng = np.random.default_rng(6)
+    points_list, _, positions, _, _ = random_foundations(rng, 20, n_points=16)
+    expected = np.stack([reference_initial_stress(points, positions[i]) for i, points in enumerate(points_list)])
+
+    stacked = stress_engine.batch_initial_stress(np.stack(points_list), positions)
+    np.testing.assert_allclose(stacked, expected, rtol=1e-12, atol=0)
+
+    offsets = np.arange(0, 20 * 16 + 1, 16)
+    flat = stress_engine.batch_initial_stress(np.concatenate(points_list), positions, offsets=offsets)
+    np.testing.assert_allclose(flat.reshape(20, 16), expected, rtol=1e-12, atol=0)
+
+    single = stress_engine.initial_stress(points_list[0], positions[0])
+    np.testing.assert_allclose(single, expected[0], rtol=1e-12, atol=0)
+
+
+def test_invalid_offsets_rejected():
+    points = np.zeros((10, 3))
+    with pytest.raises(ValueError):
+        stress_engine.batch_initial_stress(points, np.zeros((2, 3)), offsets=[0, 4, 9])
+    with pytest.raises(ValueError):
+        stress_engine.batch_initial_stress(points, np.zeros((2, 3)))
@@ -0,0 +1,2 @@
+# viz/__init__.py
+from .foundation_scene import FoundationScene
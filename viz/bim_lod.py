@@ -0,0 +1,340 @@
+# viz/bim_lod.py
+"""
+Уровни детализации и отсечение для больших BIM-сцен.
+
+Элементы модели раскладываются по фрагментам (этаж x ячейка плана);
+каждый фрагмент — один актёр с несколькими уровнями детализации:
+  0 — полная сетка;
+  1, 2 — упрощённые кластеризацией вершин внутри каждого элемента
+        (число ячеек по наибольшему размеру элемента — LOD_CELLS).
+Упрощённые уровни строятся в рабочих потоках пула (JobScheduler), пока
+фрагмент показывается полной сеткой.
+
+При каждом изменении камеры для всех фрагментов сразу (векторно)
+вычисляются попадание ограничивающей сферы в пирамиду видимости и
+размер на экране в пикселях; по размеру выбирается уровень, слишком
+мелкие и невидимые фрагменты скрываются. Фрагменты и экземпляры
+скрытых этажей (фильтр этажей) не отображаются. Актёр меняет только
+видимость или входную сетку — без пересоздания.
+"""
+import math
+
+import numpy as np
+import pyvista as pv
+
+# Число ячеек кластеризации по наибольшему размеру элемента для уровней 1, 2
+LOD_CELLS = (12, 3)
+
+# Размер фрагмента на экране (пиксели), ниже которого включается уровень 1, 2
+LOD_PIXELS = (300.0, 60.0)
+
+
+def cluster_decimate(points, faces, face_elements, cells):
+    """
+    Упрощение сетки кластеризацией вершин отдельно для каждого элемента:
+    вершины элемента сводятся к центрам ячеек сетки cells^3 по его габариту.
+    Возвращает точки, треугольники и номера исходных граней (для данных граней).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    if not len(faces):
+        return points[:0], faces, np.empty(0, dtype=np.int64)
+
+    # Каждая вершина принадлежит одному элементу (сетки элементов не имеют общих вершин)
+    vertex_elements = np.full(len(points), -1, dtype=np.int64)
+    vertex_elements[faces.ravel()] = np.repeat(face_elements, 3)
+    used = vertex_elements >= 0
+    elements, vertex_group = np.unique(vertex_elements[used], return_inverse=True)
+    used_points = points[used]
+
+    low = np.full((len(elements), 3), np.inf)
+    high = np.full((len(elements), 3), -np.inf)
+    np.minimum.at(low, vertex_group, used_points)
+    np.maximum.at(high, vertex_group, used_points)
+    cell_size = np.maximum((high - low).max(axis=1) / cells, 1e-9)
+
+    grid = np.floor((used_points - low[vertex_group]) / cell_size[vertex_group, np.newaxis]).astype(np.int64)
+    grid = np.minimum(grid, cells - 1)
+    keys = ((vertex_group * cells + grid[:, 0]) * cells + grid[:, 1]) * cells + grid[:, 2]
+    _clusters, cluster_of_used = np.unique(keys, return_inverse=True)
+
+    n_clusters = cluster_of_used.max() + 1
+    counts = np.bincount(cluster_of_used, minlength=n_clusters)
+    new_points = np.column_stack([np.bincount(cluster_of_used, weights=used_points[:, k], minlength=n_clusters)
+                                  for k in range(3)]) / counts[:, np.newaxis]
+
+    cluster_of = np.full(len(points), -1, dtype=np.int64)
+    cluster_of[used] = cluster_of_used
+    new_faces = cluster_of[faces]
+    keep = (new_faces[:, 0] != new_faces[:, 1]) & (new_faces[:, 1] != new_faces[:, 2]) & \
+        (new_faces[:, 0] != new_faces[:, 2])
+    return new_points, new_faces[keep], np.flatnonzero(keep)
+
+
+def frustum_planes(camera, aspect):
+    """Боковые плоскости пирамиды видимости (4, 4), нормали направлены внутрь"""
+    planes = [0.0] * 24
+    camera.GetFrustumPlanes(aspect, planes)
+    # Ближняя и дальняя плоскости не используются: диапазон отсечения VTK
+    # пересчитывается только по видимым актёрам
+    return np.array(planes).reshape(6, 4)[:4]
+
+
+def spheres_in_frustum(centers, radii, planes):
+    """Маска сфер, хотя бы частично попадающих в пирамиду видимости"""
+    distances = centers @ planes[:, :3].T + planes[:, 3]
+    return np.all(distances >= -radii[:, np.newaxis], axis=1)
+
+
+def screen_sizes(centers, radii, camera, viewport_height):
+    """Диаметр сфер на экране, пиксели"""
+    if camera.GetParallelProjection():
+        return 2 * radii / (2 * camera.GetParallelScale()) * viewport_height
+    distance = np.linalg.norm(centers - np.array(camera.GetPosition()), axis=1)
+    view_height = 2 * np.maximum(distance - radii, 1e-6) * math.tan(math.radians(camera.GetViewAngle()) / 2)
+    return 2 * radii / view_height * viewport_height
+
+
+def build_lods(points, faces, face_elements, cells_per_level=LOD_CELLS):
+    """Упрощённые уровни фрагмента (выполняется в рабочем потоке): [(точки, грани, исходные грани)]"""
+    return [cluster_decimate(points, faces, face_elements, cells) for cells in cells_per_level]
+
+
+class _Chunk:
+    """Фрагмент сцены: элементы одного этажа в одной ячейке плана"""
+
+    def __init__(self, storey):
+        self.storey = storey
+        self.points = np.empty((0, 3))
+        self.faces = np.empty((0, 3), dtype=np.int64)
+        self.face_elements = np.empty(0, dtype=np.int64)
+        self.face_colors = np.empty((0, 3), dtype=np.uint8)
+        self.levels = []
+        self.actor = None
+        self.level = None
+        self.shown = None  # сетка, поданная на вход актёра
+        self.version = 0
+
+    def append(self, points, faces, face_elements, face_colors):
+        self.faces = np.concatenate((self.faces, faces + len(self.points)))
+        self.points = np.concatenate((self.points, points))
+        self.face_elements = np.concatenate((self.face_elements, face_elements))
+        self.face_colors = np.concatenate((self.face_colors, face_colors))
+        self.levels = [self._mesh(self.points, self.faces, np.arange(len(self.faces)))]
+        self.version += 1
+
+    def set_lods(self, lods):
+        self.levels = self.levels[:1] + [self._mesh(*lod) for lod in lods]
+
+    def bounding_sphere(self):
+        low, high = self.points.min(axis=0), self.points.max(axis=0)
+        return (low + high) / 2, float(np.linalg.norm(high - low) / 2)
+
+    def _mesh(self, points, faces, source_faces):
+        cells = np.empty((len(faces), 4), dtype=np.int64)
+        cells[:, 0] = 3
+        cells[:, 1:] = faces
+        # n_faces задано явно: pyvista не пересчитывает число ячеек по массиву
+        mesh = pv.PolyData(points, cells.ravel(), n_faces=len(faces))
+        mesh.cell_data["element_index"] = self.face_elements[source_faces]
+        mesh.cell_data["color"] = self.face_colors[source_faces]
+        return mesh
+
+
+class BimLodManager:
+    """
+    Фрагменты BIM-сцены с уровнями детализации, отсечением по пирамиде
+    видимости и фильтром этажей. scheduler — gui.stress_jobs.JobScheduler
+    для построения уровней в фоне (без него уровни строятся сразу).
+    """
+
+    def __init__(self, plotter, scheduler=None, chunk_size=20.0, min_pixels=2.0, lod_pixels=LOD_PIXELS,
+                 show_edges=False):
+        self.plotter = plotter
+        self.scheduler = scheduler
+        self.chunk_size = chunk_size
+        self.min_pixels = min_pixels
+        self.lod_pixels = lod_pixels
+        self.show_edges = show_edges
+        self.chunks = {}       # (этаж, ix, iy) -> _Chunk
+        self.glyph_sets = []
+        self.visible_storeys = None
+        self._centers = np.empty((0, 3))
+        self._radii = np.empty(0)
+        self._order = []
+        self._bounds_dirty = False
+        self._observer = None
+        self._lod_batches = []
+
+    def __len__(self):
+        return len(self.chunks)
+
+    # --- Наполнение ---
+
+    def add_mesh(self, mesh, storeys):
+        """
+        Раскладка сетки пакета (с cell_data "element_index" и "color") по фрагментам.
+        storeys — этаж каждого элемента модели (по номеру element_index).
+        """
+        face_elements = np.asarray(mesh.cell_data["element_index"], dtype=np.int64)
+        if not len(face_elements):
+            return
+        faces = mesh.faces.reshape(-1, 4)[:, 1:]
+        points = np.asarray(mesh.points)
+        colors = np.asarray(mesh.cell_data["color"])
+
+        # Фрагмент элемента определяется по центру его граней, элемент не делится
+        elements, face_group = np.unique(face_elements, return_inverse=True)
+        centroids = points[faces].mean(axis=1)
+        counts = np.bincount(face_group)
+        element_xy = np.column_stack([np.bincount(face_group, weights=centroids[:, k]) / counts for k in range(2)])
+        cells = np.floor(element_xy / self.chunk_size).astype(np.int64)
+
+        storey_codes = {}
+        element_storeys = np.array([storey_codes.setdefault(storeys[element], len(storey_codes))
+                                    for element in elements.tolist()])
+        storey_names = list(storey_codes)
+        chunk_keys, chunk_of_element = np.unique(np.column_stack((element_storeys, cells)), axis=0,
+                                                 return_inverse=True)
+
+        # Грани, отсортированные по фрагментам (порядок внутри фрагмента сохраняется)
+        face_chunks = chunk_of_element.ravel()[face_group]
+        order = np.argsort(face_chunks, kind="stable")
+        bounds = np.searchsorted(face_chunks[order], np.arange(len(chunk_keys) + 1))
+
+        keys = []
+        for i, (storey, ix, iy) in enumerate(chunk_keys.tolist()):
+            selected = order[bounds[i]:bounds[i + 1]]
+            used, local_faces = np.unique(faces[selected], return_inverse=True)
+            key = (storey_names[storey], ix, iy)
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                chunk = self.chunks[key] = _Chunk(key[0])
+            chunk.append(points[used], local_faces.reshape(-1, 3), face_elements[selected], colors[selected])
+            self._show_level(chunk, 0)
+            keys.append(key)
+        self._schedule_lods(keys)
+        self._bounds_dirty = True
+
+    def add_glyph_set(self, glyph_set):
+        """
+        Экземпляры с отсечением по этажам, пирамиде видимости и размеру (маска глифов).
+        У набора должны быть centers, radii, storeys и массив точек "visible".
+        """
+        self.glyph_sets.append(glyph_set)
+        glyph_set.mapper.SetMaskArray("visible")
+        glyph_set.mapper.MaskingOn()
+
+    def clear(self):
+        for batch in self._lod_batches:
+            batch.cancel()
+        self._lod_batches = []
+        for chunk in self.chunks.values():
+            if chunk.actor is not None:
+                self.plotter.remove_actor(chunk.actor, render=False)
+        self.chunks = {}
+        self.glyph_sets = []
+        self._bounds_dirty = True
+
+    # --- Управление отображением ---
+
+    def attach(self):
+        """Подписка на изменения камеры: уровни и отсечение обновляются при вращении"""
+        if self._observer is None:
+            self._observer = self.plotter.camera.AddObserver("ModifiedEvent", lambda *_: self.update())
+
+    def set_storey_filter(self, storeys):
+        """Отображать только указанные этажи (None — все)"""
+        self.visible_storeys = None if storeys is None else set(storeys)
+        self.update()
+
+    def update(self):
+        """Выбор уровня и видимости всех фрагментов и экземпляров по текущей камере"""
+        camera = self.plotter.camera
+        width, height = self.plotter.window_size
+        planes = frustum_planes(camera, width / max(height, 1))
+
+        if self._bounds_dirty:
+            self._refresh_bounds()
+        if self._order:
+            visible = spheres_in_frustum(self._centers, self._radii, planes)
+            pixels = screen_sizes(self._centers, self._radii, camera, height)
+            levels = np.searchsorted(-np.asarray(self.lod_pixels), -pixels, side="right")
+            visible &= pixels >= self.min_pixels
+            for key, shown, level in zip(self._order, visible, levels):
+                chunk = self.chunks[key]
+                if self.visible_storeys is not None and chunk.storey not in self.visible_storeys:
+                    shown = False
+                if shown:
+                    self._show_level(chunk, min(int(level), len(chunk.levels) - 1))
+                elif chunk.actor is not None and chunk.actor.GetVisibility():
+                    chunk.actor.SetVisibility(False)
+
+        for glyph_set in self.glyph_sets:
+            self._update_glyph_mask(glyph_set, planes, camera, height)
+
+    def rendered_triangles(self):
+        """Число треугольников видимых фрагментов на текущих уровнях"""
+        return sum(chunk.levels[chunk.level].n_cells for chunk in self.chunks.values()
+                   if chunk.actor is not None and chunk.actor.GetVisibility())
+
+    # --- Внутреннее ---
+
+    def _show_level(self, chunk, level):
+        mesh = chunk.levels[level]
+        if chunk.actor is None:
+            chunk.actor = self.plotter.add_mesh(mesh, scalars="color", rgb=True, show_edges=self.show_edges,
+                                                name=f"bim_chunk_{id(chunk)}", reset_camera=False)
+        elif chunk.shown is not mesh:
+            chunk.actor.mapper.SetInputData(mesh)
+        chunk.level = level
+        chunk.shown = mesh
+        if not chunk.actor.GetVisibility():
+            chunk.actor.SetVisibility(True)
+
+    def _schedule_lods(self, keys):
+        jobs = [((key, self.chunks[key].version), build_lods,
+                 (self.chunks[key].points, self.chunks[key].faces, self.chunks[key].face_elements))
+                for key in keys]
+        if self.scheduler is None:
+            for (key, _version), func, args in jobs:
+                self.chunks[key].set_lods(func(*args))
+            return
+        # Массивы фрагмента при добавлении элементов заменяются, а не изменяются,
+        # поэтому рабочие потоки читают их без блокировок
+        batch = self.scheduler.submit(jobs)
+        batch.result_ready.connect(self._on_lods_ready)
+        batch.finished.connect(lambda _results: self._forget_batch(batch))
+        self._lod_batches.append(batch)
+
+    def _forget_batch(self, batch):
+        if batch in self._lod_batches:
+            self._lod_batches.remove(batch)
+
+    def _on_lods_ready(self, job_key, lods):
+        key, version = job_key
+        chunk = self.chunks.get(key)
+        # Результат для устаревшей версии фрагмента (после добавления элементов) отбрасывается
+        if chunk is not None and chunk.version == version:
+            chunk.set_lods(lods)
+            if chunk.level:
+                self._show_level(chunk, min(chunk.level, len(chunk.levels) - 1))
+
+    def _refresh_bounds(self):
+        self._order = list(self.chunks)
+        spheres = [chunk.bounding_sphere() for chunk in self.chunks.values()]
+        self._centers = np.array([center for center, _radius in spheres]).reshape(-1, 3)
+        self._radii = np.array([radius for _center, radius in spheres])
+        self._bounds_dirty = False
+
+    def _update_glyph_mask(self, glyph_set, planes, camera, height):
+        if not len(glyph_set):
+            return
+        visible = spheres_in_frustum(glyph_set.centers, glyph_set.radii, planes)
+        visible &= screen_sizes(glyph_set.centers, glyph_set.radii, camera, height) >= self.min_pixels
+        if self.visible_storeys is not None:
+            visible &= np.isin(glyph_set.storeys, list(self.visible_storeys))
+        mask = glyph_set.points.point_data["visible"]
+        if not np.array_equal(mask, visible):
+            # Запись в массив сетки отмечает его изменённым — маппер перечитает маску
+            mask[:] = visible
@@ -0,0 +1,182 @@
+# viz/bim_scene.py
+"""
+Слой сцены с импортированной BIM-моделью.
+
+Каждый пакет импорта (bim.ifc_importer.ElementBatch) отображается одним
+актёром с цветами материалов по граням, поэтому число актёров растёт с
+числом пакетов, а не элементов. У каждой грани есть номер элемента
+модели в массиве "element_index" — для пикинга и фильтров.
+
+Пакеты с экземплярами (импорт с instancing=True) отображаются в одном из
+режимов:
+  - "glyph": повторы уникальной сетки рисуются через vtkGlyph3DMapper —
+    сетка загружается в видеопамять один раз, на экземпляр передаются
+    только перенос, поворот и масштаб. Первое вхождение каждой сетки и
+    экземпляры с зеркальным или косым размещением идут в сетку пакета;
+  - "merged": экземпляры размножаются матрицами в одну сетку пакета
+    (память на CPU по-прежнему хранит уникальные сетки один раз).
+
+С менеджером уровней детализации (viz.bim_lod.BimLodManager) сетки пакетов
+раскладываются по фрагментам с LOD и отсечением, а для экземпляров
+включается маска видимости глифов.
+"""
+import numpy as np
+
+from bim.ifc_importer import DEFAULT_COLOR
+from bim.instancing import dominant_material, rigid_decomposition
+
+INSTANCING_MODES = ("glyph", "merged")
+
+
+class BimScene:
+    """Актёры пакетов BIM-модели в plotter"""
+
+    def __init__(self, plotter, show_edges=False, instancing_mode="glyph", lod=None):
+        if instancing_mode not in INSTANCING_MODES:
+            raise ValueError(f"Неизвестный режим экземпляров: {instancing_mode}")
+        self.plotter = plotter
+        self.show_edges = show_edges
+        self.instancing_mode = instancing_mode
+        self.lod = lod
+        self.meshes = []
+        self.actors = []
+        self.glyphs = {}  # номер уникальной сетки -> _GlyphSet
+
+    def __len__(self):
+        return len(self.meshes) + len(self.glyphs)
+
+    def add_batch(self, model, batch):
+        if not batch.instanced:
+            return self._add_mesh(model, batch.to_polydata())
+        if self.instancing_mode == "merged":
+            return self._add_mesh(model, batch.to_polydata(model.geometries))
+
+        translations, quaternions, scales, exact = rigid_decomposition(batch.transforms)
+        # Первое вхождение новой сетки остаётся в сетке пакета: уникальные элементы
+        # (например, стены) не порождают отдельных актёров
+        merged = ~exact
+        for geometry in batch.geometries:
+            merged[np.argmax(batch.geometry_ids == geometry.index)] = True
+
+        actor = None
+        if merged.any():
+            actor = self._add_mesh(model, batch.to_polydata(model.geometries, elements=merged))
+
+        instances = np.flatnonzero(~merged)
+        colors = model.material_colors()
+        for geometry_id in np.unique(batch.geometry_ids[instances]):
+            members = instances[batch.geometry_ids[instances] == geometry_id]
+            geometry = model.geometries[geometry_id]
+            glyph_set = self.glyphs.get(geometry_id)
+            if glyph_set is None:
+                material = dominant_material(geometry)
+                color = colors[material][:3] if material >= 0 else DEFAULT_COLOR[:3]
+                glyph_set = _GlyphSet(self.plotter, geometry, color, f"bim_instances_{geometry_id}")
+                self.glyphs[geometry_id] = glyph_set
+                if self.lod is not None:
+                    self.lod.add_glyph_set(glyph_set)
+
+            # Ограничивающие сферы экземпляров для отсечения
+            low, high = geometry.vertices.min(axis=0), geometry.vertices.max(axis=0)
+            placements = batch.transforms[members]
+            centers = placements[:, :3, :3] @ ((low + high) / 2) + placements[:, :3, 3]
+            radii = np.linalg.norm(high - low) / 2 * scales[members].max(axis=1)
+            element_index = batch.first_index + members
+            glyph_set.append(translations[members], quaternions[members], scales[members], element_index,
+                             centers, radii, [model.storeys[i] for i in element_index])
+        return actor
+
+    def clear(self):
+        for actor in self.actors:
+            self.plotter.remove_actor(actor, render=False)
+        for glyph_set in self.glyphs.values():
+            self.plotter.remove_actor(glyph_set.actor, render=False)
+        if self.lod is not None:
+            self.lod.clear()
+        self.meshes = []
+        self.actors = []
+        self.glyphs = {}
+
+    def uploaded_triangles(self):
+        """Число треугольников, переданных в видеопамять (сетки пакетов + по одной на экземпляры)"""
+        return sum(mesh.n_cells for mesh in self.meshes) + \
+            sum(glyph_set.source.n_cells for glyph_set in self.glyphs.values())
+
+    def element_at_cell(self, mesh, cell_id):
+        """Номер элемента модели по ячейке сетки пакета (например, из пикера)"""
+        if cell_id is None or cell_id < 0 or cell_id >= mesh.n_cells:
+            return None
+        return int(mesh.cell_data["element_index"][cell_id])
+
+    def _add_mesh(self, model, mesh):
+        mesh.cell_data["color"] = face_colors(model.material_colors(), mesh.cell_data["material"])
+        if self.lod is not None:
+            self.lod.add_mesh(mesh, model.storeys)
+            self.meshes.append(mesh)
+            return None
+        actor = self.plotter.add_mesh(mesh, scalars="color", rgb=True, show_edges=self.show_edges,
+                                      name=f"bim_batch_{len(self.actors)}", reset_camera=False)
+        self.meshes.append(mesh)
+        self.actors.append(actor)
+        return actor
+
+
+class _GlyphSet:
+    """Экземпляры одной уникальной сетки: один vtkGlyph3DMapper и один актёр"""
+
+    def __init__(self, plotter, geometry, color, name):
+        import pyvista as pv
+        from vtkmodules.vtkRenderingCore import vtkActor, vtkGlyph3DMapper
+
+        self.source = geometry.to_polydata()
+        self.translations = np.empty((0, 3))
+        self.quaternions = np.empty((0, 4))
+        self.scales = np.empty((0, 3))
+        self.element_index = np.empty(0, dtype=np.int64)
+        self.centers = np.empty((0, 3))
+        self.radii = np.empty(0)
+        self.storeys = np.empty(0, dtype=object)
+        self.points = pv.PolyData()
+
+        self.mapper = vtkGlyph3DMapper()
+        self.mapper.SetSourceData(self.source)
+        self.mapper.SetInputData(self.points)
+        self.mapper.SetOrientationModeToQuaternion()
+        self.mapper.SetOrientationArray("orientation")
+        self.mapper.SetScaleModeToScaleByVectorComponents()
+        self.mapper.SetScaleArray("scale")
+        self.mapper.ScalarVisibilityOff()
+
+        self.actor = vtkActor()
+        self.actor.SetMapper(self.mapper)
+        self.actor.GetProperty().SetColor(*color)
+        plotter.add_actor(self.actor, name=name, reset_camera=False)
+
+    def __len__(self):
+        return len(self.element_index)
+
+    def append(self, translations, quaternions, scales, element_index, centers, radii, storeys):
+        import pyvista as pv
+
+        self.translations = np.concatenate((self.translations, translations))
+        self.quaternions = np.concatenate((self.quaternions, quaternions))
+        self.scales = np.concatenate((self.scales, scales))
+        self.element_index = np.concatenate((self.element_index, element_index))
+        self.centers = np.concatenate((self.centers, centers))
+        self.radii = np.concatenate((self.radii, radii))
+        self.storeys = np.concatenate((self.storeys, np.array(storeys, dtype=object)))
+
+        points = pv.PolyData(self.translations)
+        points.point_data["orientation"] = self.quaternions
+        points.point_data["scale"] = self.scales
+        points.point_data["element_index"] = self.element_index
+        points.point_data["visible"] = np.ones(len(self.translations), dtype=np.uint8)
+        self.points.copy_from(points, deep=False)
+
+
+def face_colors(material_colors, face_materials):
+    """Цвета граней (m, 3) uint8 по номерам материалов; без материала — цвет по умолчанию"""
+    palette = np.vstack((material_colors[:, :3], [DEFAULT_COLOR[:3]])) if len(material_colors) \
+        else np.array([DEFAULT_COLOR[:3]])
+    # NO_MATERIAL (-1) указывает на последний цвет палитры — цвет по умолчанию
+    return (palette[face_materials] * 255).round().astype(np.uint8)
@@ -0,0 +1,323 @@
+# viz/foundation_scene.py
+"""
+Слой сцены с фундаментами: все фундаменты хранятся в одном PolyData
+и отображаются одним актёром.
+
+Каждая ячейка несёт номер фундамента в массиве "foundation_id", поэтому
+пикинг по объединённому актёру однозначно определяет фундамент.
+Массивы VTK сетки (точки, связность и смещения граней, напряжения,
+номера фундаментов) служат буферами с запасом: при росте их ёмкость
+удваивается, поэтому добавление фундамента записывает только его
+диапазон в конец массивов. Удаление сдвигает только хвост за удалённым
+диапазоном, а пересчёт напряжений обновляет скаляры на месте.
+
+create_foundation — создание фундамента по рамке выделения без Qt
+(проверки, сетка, таблица, сцена, пространственный индекс): его вызывает
+окно приложения и замеряет benchmarks/run_suite.py.
+"""
+import numpy as np
+import pyvista as pv
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkDoubleArray, vtkPoints, vtkTypeInt64Array
+from vtkmodules.vtkCommonDataModel import vtkCellArray
+
+from core import stress_engine
+
+
+# Колонки таблицы диапазонов: начало и длина по точкам, связности граней и ячейкам
+RANGE_COLUMNS = ("point_start", "point_count", "conn_start", "conn_count", "cell_start", "cell_count")
+
+# Наименьшая ширина и длина подошвы, м
+MIN_FOUNDATION_SIZE = 0.1
+
+
+class FoundationPlacementError(ValueError):
+    """Фундамент нельзя создать: он слишком мал или пересекает существующие (overlaps)"""
+
+    def __init__(self, message, overlaps=()):
+        super().__init__(message)
+        self.overlaps = list(overlaps)
+
+
+class FoundationScene:
+    """Объединённая сетка фундаментов с одним актёром в plotter"""
+
+    def __init__(self, plotter, scalars="stress", cmap="coolwarm", show_edges=True):
+        self.plotter = plotter
+        self.scalars = scalars
+        self.cmap = cmap
+        self.show_edges = show_edges
+        self.actor = None
+
+        # Массивы сетки создаются один раз и дальше только дописываются и укорачиваются
+        self._point_array = vtkDoubleArray()
+        self._point_array.SetNumberOfComponents(3)
+        points = vtkPoints()
+        points.SetData(self._point_array)
+
+        self._offsets = vtkTypeInt64Array()         # границы граней в связности, длина C + 1
+        self._connectivity = vtkTypeInt64Array()    # глобальные индексы вершин граней
+        self._offsets.InsertNextValue(0)
+        self._polys = vtkCellArray()
+        self._polys.SetData(self._offsets, self._connectivity)
+
+        self._stress = vtkDoubleArray()
+        self._stress.SetName(scalars)
+        self._cell_ids = vtkTypeInt64Array()
+        self._cell_ids.SetName("foundation_id")
+
+        self.mesh = pv.PolyData()
+        self.mesh.SetPoints(points)
+        self.mesh.SetPolys(self._polys)
+        self.mesh.GetPointData().AddArray(self._stress)
+        self.mesh.GetPointData().SetActiveScalars(scalars)
+        self.mesh.GetCellData().AddArray(self._cell_ids)
+
+        # Диапазоны фундаментов в порядке хранения: строки первых len(ids) позиций
+        # буфера с колонками RANGE_COLUMNS (ёмкость тоже удваивается)
+        self.ids = []
+        self._index = {}
+        self._ranges = np.zeros((16, len(RANGE_COLUMNS)), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, foundation_id):
+        return foundation_id in self._index
+
+    @property
+    def n_points(self):
+        return self._point_array.GetNumberOfTuples()
+
+    def add(self, foundation_id, geometry, stress=None):
+        """Добавление фундамента (PolyData) в конец объединённой сетки"""
+        if foundation_id in self._index:
+            raise KeyError(f"Фундамент {foundation_id} уже есть в сцене")
+        if not isinstance(geometry, pv.PolyData):
+            geometry = geometry.extract_surface()
+
+        polys = geometry.GetPolys()
+        offsets = vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64)
+        connectivity = vtk_to_numpy(polys.GetConnectivityArray()).astype(np.int64)
+        n_cells = len(offsets) - 1
+        if stress is None:
+            stress = geometry.point_data[self.scalars] if self.scalars in geometry.point_data \
+                else np.zeros(geometry.n_points)
+
+        point_start = self.n_points
+        conn_start = self._connectivity.GetNumberOfTuples()
+        cell_start = self._cell_ids.GetNumberOfTuples()
+
+        row = len(self.ids)
+        if row == len(self._ranges):
+            self._ranges = np.concatenate((self._ranges, np.zeros_like(self._ranges)))
+        self._ranges[row] = (point_start, geometry.n_points, conn_start, len(connectivity), cell_start, n_cells)
+
+        # Локальные индексы вершин и смещения граней сдвигаются на конец объединённых массивов
+        _append(self._point_array, geometry.points)
+        _append(self._stress, np.asarray(stress, dtype=np.float64))
+        _append(self._connectivity, connectivity + point_start)
+        _append(self._offsets, offsets[1:] + conn_start)
+        _append(self._cell_ids, np.full(n_cells, foundation_id, dtype=np.int64))
+
+        self._index[foundation_id] = len(self.ids)
+        self.ids.append(foundation_id)
+        self._sync()
+
+    def load(self, ids, points, faces, point_offsets, face_offsets, cell_offsets, stress=None):
+        """
+        Замена содержимого сцены готовыми объединёнными массивами (например,
+        из core.project_file.ProjectFile.mesh_arrays): грани в формате VTK с
+        глобальными индексами, границы фундаментов — массивы длины F + 1.
+        """
+        ids = [int(foundation_id) for foundation_id in ids]
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        point_offsets = np.asarray(point_offsets, dtype=np.int64)
+        face_offsets = np.asarray(face_offsets, dtype=np.int64)
+        cell_offsets = np.asarray(cell_offsets, dtype=np.int64)
+
+        polys = pv.PolyData(points, np.asarray(faces, dtype=np.int64)).GetPolys() if len(faces) else vtkCellArray()
+        offsets = vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64) if polys.GetNumberOfCells() else None
+
+        for array in (self._point_array, self._stress, self._connectivity, self._cell_ids):
+            array.SetNumberOfTuples(0)
+        self._offsets.SetNumberOfTuples(1)
+        _append(self._point_array, points)
+        _append(self._stress, np.zeros(len(points)) if stress is None else np.asarray(stress, dtype=np.float64))
+        if offsets is not None:
+            _append(self._connectivity, vtk_to_numpy(polys.GetConnectivityArray()))
+            _append(self._offsets, offsets[1:])
+        _append(self._cell_ids, np.repeat(np.asarray(ids, dtype=np.int64), np.diff(cell_offsets)))
+
+        # В формате VTK перед каждой гранью стоит счётчик вершин: без них остаётся связность
+        conn_offsets = face_offsets - cell_offsets
+        self._ranges = np.zeros((max(16, 2 * len(ids)), len(RANGE_COLUMNS)), dtype=np.int64)
+        self._ranges[:len(ids)] = np.column_stack((point_offsets[:-1], np.diff(point_offsets),
+                                                   conn_offsets[:-1], np.diff(conn_offsets),
+                                                   cell_offsets[:-1], np.diff(cell_offsets)))
+        self.ids = ids
+        self._index = {foundation_id: i for i, foundation_id in enumerate(ids)}
+        self._sync()
+
+    def clear(self):
+        """Удаление всех фундаментов из сцены"""
+        self.load([], np.empty((0, 3)), np.empty(0, dtype=np.int64), [0], [0], [0])
+
+    def remove(self, foundation_id):
+        """Удаление фундамента: вырезаем его диапазон и сдвигаем индексы следующих"""
+        i = self._index.pop(foundation_id)
+        p0, pn, k0, kn, c0, cn = self._ranges[i].tolist()
+
+        _cut(self._point_array, p0, pn)
+        _cut(self._stress, p0, pn)
+        _cut(self._connectivity, k0, kn)
+        _cut(self._offsets, c0 + 1, cn)
+        _cut(self._cell_ids, c0, cn)
+
+        # Индексы вершин и смещения граней после удалённого диапазона уменьшаются на его размер
+        vtk_to_numpy(self._connectivity)[k0:] -= pn
+        vtk_to_numpy(self._offsets)[c0 + 1:] -= kn
+
+        n = len(self.ids)
+        self._ranges[i:n - 1] = self._ranges[i + 1:n]
+        self._ranges[i:n - 1, 0::2] -= (pn, kn, cn)
+
+        del self.ids[i]
+        for j, other_id in enumerate(self.ids[i:], start=i):
+            self._index[other_id] = j
+        self._sync()
+
+    def replace(self, foundation_id, geometry, stress=None):
+        """Замена геометрии фундамента"""
+        self.remove(foundation_id)
+        self.add(foundation_id, geometry, stress)
+
+    def point_range(self, foundation_id):
+        """Срез точек фундамента в объединённой сетке"""
+        start, count = self._ranges[self._index[foundation_id], :2].tolist()
+        return slice(start, start + count)
+
+    def update_stress(self, foundation_id, stress):
+        """Обновление напряжений одного фундамента на месте"""
+        vtk_to_numpy(self._stress)[self.point_range(foundation_id)] = stress
+        self._mark_scalars_modified()
+
+    def update_stresses(self, stresses):
+        """Обновление напряжений многих фундаментов: {id: массив}"""
+        values = vtk_to_numpy(self._stress)
+        for foundation_id, stress in stresses.items():
+            values[self.point_range(foundation_id)] = stress
+        self._mark_scalars_modified()
+
+    def stress_range(self):
+        """Общий диапазон напряжений по всем фундаментам"""
+        if not self._stress.GetNumberOfTuples():
+            return None
+        values = vtk_to_numpy(self._stress)
+        return float(np.min(values)), float(np.max(values))
+
+    def foundation_at_cell(self, cell_id):
+        """Номер фундамента по номеру ячейки объединённой сетки (например, из пикера)"""
+        if cell_id is None or cell_id < 0 or cell_id >= self._cell_ids.GetNumberOfTuples():
+            return None
+        return int(self._cell_ids.GetValue(cell_id))
+
+    def _mark_scalars_modified(self):
+        self._stress.Modified()
+        self.mesh.Modified()
+
+    def _sync(self):
+        """Отметка изменённых массивов сетки актёра (без пересоздания сетки и актёра)"""
+        for array in (self._point_array, self._offsets, self._connectivity, self._stress, self._cell_ids):
+            array.Modified()
+        self.mesh.GetPoints().Modified()
+        self._polys.Modified()
+        # Карта ячеек PolyData (для пикинга) строится заново при следующем обращении
+        self.mesh.DeleteCells()
+        self.mesh.Modified()
+
+        if not self.ids:
+            if self.actor is not None:
+                self.actor.SetVisibility(False)
+            return
+
+        if self.actor is None:
+            self.actor = self.plotter.add_mesh(
+                self.mesh,
+                scalars=self.scalars,
+                cmap=self.cmap,
+                show_edges=self.show_edges,
+                name="foundations"
+            )
+        else:
+            self.actor.SetVisibility(True)
+
+
+def create_foundation(table, scene, spatial_index, start_point, end_point, thickness, load_value, load_type):
+    """
+    Фундамент по противоположным углам рамки выделения: брус толщиной
+    thickness над нижней точкой с начальным полем напряжений. Фундамент
+    записывается в таблицу (core.foundation_store.FoundationTable), сцену
+    и пространственный индекс; возвращается его номер. Слишком маленькая
+    или пересекающая другие фундаменты рамка — FoundationPlacementError.
+    """
+    min_point = np.minimum(start_point, end_point)
+    max_point = np.maximum(start_point, end_point)
+    width = max_point[0] - min_point[0]
+    length = max_point[1] - min_point[1]
+    if width < MIN_FOUNDATION_SIZE or length < MIN_FOUNDATION_SIZE:
+        raise FoundationPlacementError("Размеры фундамента слишком малы. Попробуйте выбрать большую область.")
+
+    overlaps = spatial_index.query_box(min_point[:2], max_point[:2])
+    if overlaps:
+        raise FoundationPlacementError("Фундамент пересекается с уже созданными фундаментами.", overlaps)
+
+    center = np.array([(min_point[0] + max_point[0]) / 2,
+                       (min_point[1] + max_point[1]) / 2,
+                       min_point[2] + thickness / 2])
+    foundation = pv.Cube(center=center, x_length=width, y_length=length, z_length=thickness)
+    # Простая модель напряжений: больше у краёв, меньше в центре
+    foundation["stress"] = stress_engine.initial_stress(foundation.points, center)
+
+    # Таблица хранит сетку по ссылке, все фундаменты отображаются одним объединённым актёром
+    foundation_id = table.add(position=center, dimensions=(width, length, thickness), load_value=load_value,
+                              load_type=load_type, mesh=foundation)
+    scene.add(foundation_id, foundation)
+    index_foundation(spatial_index, foundation_id, min_point, max_point)
+    return foundation_id
+
+
+def index_foundation(spatial_index, foundation_id, low, high):
+    """Подошва фундамента и её углы в пространственном индексе (для привязки и проверок пересечений)"""
+    spatial_index.insert_box(foundation_id, low[:2], high[:2])
+    corners = [(low[0], low[1]), (high[0], low[1]), (high[0], high[1]), (low[0], high[1])]
+    for k, corner in enumerate(corners):
+        spatial_index.insert_point(("foundation", foundation_id, k), corner)
+
+
+def _append(array, values):
+    """
+    Дописывание значений в конец массива VTK. Ёмкость при нехватке растёт
+    не меньше чем вдвое (Resize сохраняет данные, а SetNumberOfTuples
+    при росте — нет), так что перевыделение случается за O(log N)
+    добавлений, а записывается только новый диапазон.
+    """
+    values = np.asarray(values)
+    count = len(values)
+    if not count:
+        return
+    start = array.GetNumberOfTuples()
+    capacity = array.GetSize() // array.GetNumberOfComponents()
+    if start + count > capacity:
+        array.Resize(max(2 * capacity, start + count))
+    array.SetNumberOfTuples(start + count)
+    vtk_to_numpy(array)[start:] = values
+
+
+def _cut(array, start, count):
+    """Вырезание диапазона из массива VTK: хвост сдвигается, ёмкость сохраняется"""
+    if not count:
+        return
+    values = vtk_to_numpy(array)
+    values[start:len(values) - count] = values[start + count:]
+    array.SetNumberOfTuples(len(values) - count)
@@ -0,0 +1,149 @@
+# viz/ground_grid.py
+"""
+Сетка привязки на поверхности земли.
+
+Все линии сетки строятся одним векторным PolyData (без отдельных pv.Line
+и MultiBlock), готовые сетки кешируются по (размер, шаг). При отдалении
+камеры шаг отображаемой сетки увеличивается (уровни детализации 1-2-5),
+поэтому даже площадка 1 км с шагом 0.1 м отображается без задержек.
+"""
+import math
+from collections import OrderedDict
+
+import numpy as np
+import pyvista as pv
+
+# Множители шага для уровней детализации: 1, 2, 5, 10, 20, 50, ...
+_LOD_STEPS = (1, 2, 5)
+
+_cache = OrderedDict()
+_CACHE_SIZE = 16
+
+
+def grid_lines(extent, spacing, z=0.01):
+    """
+    Квадратная сетка размера extent с шагом spacing и центром в начале координат.
+    Линии проходят через кратные spacing (как привязка snap_position) и по
+    границе площадки; за границу [-extent/2, extent/2] они не выходят, даже
+    если размер не кратен шагу. Возвращает один PolyData со всеми отрезками.
+    """
+    half = extent / 2
+    k_max = math.floor(half / spacing + 1e-9)
+    coords = spacing * np.arange(-k_max, k_max + 1)
+    if half - k_max * spacing > 1e-9 * spacing:
+        coords = np.concatenate(([-half], coords, [half]))
+    n = len(coords)
+
+    # Линии, параллельные оси Y (x = const), затем параллельные оси X (y = const)
+    starts = np.empty((2 * n, 3))
+    ends = np.empty((2 * n, 3))
+    starts[:n] = np.column_stack((coords, np.full(n, -half), np.full(n, z)))
+    ends[:n] = np.column_stack((coords, np.full(n, half), np.full(n, z)))
+    starts[n:] = np.column_stack((np.full(n, -half), coords, np.full(n, z)))
+    ends[n:] = np.column_stack((np.full(n, half), coords, np.full(n, z)))
+
+    points = np.empty((4 * n, 3))
+    points[0::2] = starts
+    points[1::2] = ends
+    index = np.arange(0, 4 * n, 2)
+    lines = np.column_stack((np.full(2 * n, 2), index, index + 1)).ravel()
+    return pv.PolyData(points, lines=lines)
+
+
+def cached_grid_lines(extent, spacing, z=0.01):
+    """grid_lines с кешем по (extent, spacing, z); результат нельзя изменять"""
+    key = (round(float(extent), 9), round(float(spacing), 9), round(float(z), 9))
+    mesh = _cache.get(key)
+    if mesh is None:
+        mesh = grid_lines(extent, spacing, z)
+        _cache[key] = mesh
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return mesh
+
+
+def lod_spacing(base_spacing, world_per_pixel, min_pixels=8.0, extent=None, max_lines=20000):
+    """
+    Шаг отображаемой сетки: наименьший из base_spacing · {1, 2, 5} · 10^k,
+    при котором соседние линии на экране не ближе min_pixels пикселей,
+    а число линий в одном направлении не превышает max_lines.
+    """
+    required = max(world_per_pixel * min_pixels, base_spacing)
+    if extent is not None:
+        required = max(required, extent / max_lines)
+    decade = 1
+    while True:
+        for step in _LOD_STEPS:
+            spacing = base_spacing * step * decade
+            if spacing >= required * (1 - 1e-9):
+                return spacing
+        decade *= 10
+
+
+class GroundGrid:
+    """Актёр сетки привязки с переключением уровня детализации по камере"""
+
+    def __init__(self, plotter, extent=20.0, spacing=0.5, z=0.01, min_pixels=8.0,
+                 color="gray", opacity=0.3, line_width=1):
+        self.plotter = plotter
+        self.extent = extent
+        self.spacing = spacing
+        self.z = z
+        self.min_pixels = min_pixels
+        self.style = dict(color=color, opacity=opacity, line_width=line_width)
+        self.actor = None
+        self.current_spacing = None
+        self._observer = None
+
+    def show(self):
+        if self.actor is None:
+            self.current_spacing = self._spacing_for_camera()
+            mesh = cached_grid_lines(self.extent, self.current_spacing, self.z)
+            self.actor = self.plotter.add_mesh(mesh, name="ground_grid", reset_camera=False, **self.style)
+            self._observer = self.plotter.camera.AddObserver("ModifiedEvent", self._on_camera_modified)
+        self.actor.SetVisibility(True)
+        self.update_lod()
+
+    def hide(self):
+        if self.actor is not None:
+            self.actor.SetVisibility(False)
+
+    def is_visible(self):
+        return self.actor is not None and bool(self.actor.GetVisibility())
+
+    def set_extent(self, extent, spacing=None):
+        """Изменение размера площадки и/или шага сетки"""
+        self.extent = extent
+        if spacing is not None:
+            self.spacing = spacing
+        self.current_spacing = None
+        self.update_lod()
+
+    def update_lod(self):
+        """Подбор шага по текущей камере; сетка меняется только при смене уровня"""
+        if self.actor is None or not self.actor.GetVisibility():
+            return
+        spacing = self._spacing_for_camera()
+        if spacing == self.current_spacing:
+            return
+        self.current_spacing = spacing
+        self.actor.mapper.SetInputData(cached_grid_lines(self.extent, spacing, self.z))
+
+    def _on_camera_modified(self, _camera, _event):
+        self.update_lod()
+
+    def _spacing_for_camera(self):
+        return lod_spacing(self.spacing, self._world_per_pixel(), self.min_pixels, self.extent)
+
+    def _world_per_pixel(self):
+        """Размер пикселя на плоскости фокуса камеры, в единицах сцены"""
+        camera = self.plotter.camera
+        height = max(self.plotter.window_size[1], 1)
+        if camera.GetParallelProjection():
+            view_height = 2 * camera.GetParallelScale()
+        else:
+            distance = camera.GetDistance()
+            view_height = 2 * distance * math.tan(math.radians(camera.GetViewAngle()) / 2)
+        return view_height / height
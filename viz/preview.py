@@ -0,0 +1,126 @@
+# viz/preview.py
+"""
+Предпросмотр при интерактивном рисовании фундаментов и вспомогательных линий.
+
+Для каждого режима создаётся один постоянный актёр; при движении мыши
+меняются только координаты его точек (без создания сеток и актёров).
+События движения мыши объединяются до частоты обновления экрана через
+FrameCoalescer: обрабатывается только последнее событие за кадр.
+"""
+import time
+
+import numpy as np
+import pyvista as pv
+
+# Порядок вершин совпадает с pv.Box: бит 0 — x, бит 1 — y, бит 2 — z
+_BOX_CORNERS = np.array([[(i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1] for i in range(8)], dtype=float)
+_BOX_FACES = np.array([
+    4, 0, 2, 3, 1,
+    4, 4, 5, 7, 6,
+    4, 0, 1, 5, 4,
+    4, 2, 6, 7, 3,
+    4, 0, 4, 6, 2,
+    4, 1, 3, 7, 5,
+])
+
+
+class InteractivePreview:
+    """Постоянные актёры предпросмотра с обновлением координат на месте"""
+
+    def __init__(self, plotter, color="yellow", overlap_color="red", line_color="cyan"):
+        self.plotter = plotter
+        self.color = color
+        self.overlap_color = overlap_color
+        self.line_color = line_color
+
+        self.box = pv.PolyData(np.zeros((8, 3)), _BOX_FACES)
+        self.line = pv.PolyData(np.zeros((2, 3)), lines=np.array([2, 0, 1]))
+        self.box_actor = None
+        self.line_actor = None
+        self._overlaps = False
+
+    def show_foundation(self, min_point, max_point, thickness, overlaps=False):
+        """Предпросмотр фундамента между углами min_point и max_point"""
+        if self.box_actor is None:
+            self.box_actor = self.plotter.add_mesh(self.box, color=self.color, opacity=0.7,
+                                                   show_edges=True, name="preview_foundation",
+                                                   reset_camera=False)
+
+        low = np.array([min_point[0], min_point[1], min_point[2]], dtype=float)
+        size = np.array([max_point[0] - min_point[0], max_point[1] - min_point[1], thickness])
+        # Запись в существующий массив точек: сетка и актёр не пересоздаются
+        self.box.points[:] = low + _BOX_CORNERS * size
+
+        if overlaps != self._overlaps:
+            self.box_actor.GetProperty().SetColor(pv.Color(self.overlap_color if overlaps else self.color).float_rgb)
+            self._overlaps = overlaps
+        self.box_actor.SetVisibility(True)
+        if self.line_actor is not None:
+            self.line_actor.SetVisibility(False)
+
+    def show_guide_segment(self, start_point, end_point):
+        """Предпросмотр текущего отрезка вспомогательной линии"""
+        if self.line_actor is None:
+            self.line_actor = self.plotter.add_mesh(self.line, color=self.line_color, line_width=2,
+                                                    style="wireframe", name="preview_guide",
+                                                    reset_camera=False)
+
+        self.line.points[0] = start_point
+        self.line.points[1] = end_point
+        self.line_actor.SetVisibility(True)
+        if self.box_actor is not None:
+            self.box_actor.SetVisibility(False)
+
+    def hide(self):
+        """Скрытие предпросмотра без удаления актёров"""
+        for actor in (self.box_actor, self.line_actor):
+            if actor is not None:
+                actor.SetVisibility(False)
+
+    def is_visible(self):
+        return any(actor is not None and actor.GetVisibility() for actor in (self.box_actor, self.line_actor))
+
+
+class FrameCoalescer:
+    """
+    Объединение частых событий до одного вызова callback за кадр.
+
+    request() можно вызывать на каждое событие движения мыши: callback
+    будет вызван не чаще одного раза за интервал кадра (по умолчанию —
+    по частоте обновления основного экрана).
+    """
+
+    def __init__(self, callback, refresh_rate=None):
+        from PyQt5.QtCore import QTimer
+
+        if refresh_rate is None:
+            refresh_rate = _screen_refresh_rate()
+        self.interval = 1.0 / refresh_rate
+        self.callback = callback
+        self._last_call = 0.0
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+    def request(self):
+        if self._timer.isActive():
+            return  # Событие будет обработано в уже запланированном кадре
+        delay = self.interval - (time.perf_counter() - self._last_call)
+        self._timer.start(max(0, int(delay * 1000)))
+
+    def cancel(self):
+        self._timer.stop()
+
+    def _fire(self):
+        self._last_call = time.perf_counter()
+        self.callback()
+
+
+def _screen_refresh_rate(default=60.0):
+    """Частота обновления основного экрана, Гц"""
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    screen = app.primaryScreen() if app is not None else None
+    rate = screen.refreshRate() if screen is not None else 0
+    return rate if rate and rate > 1 else default
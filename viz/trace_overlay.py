@@ -0,0 +1,105 @@
+# viz/trace_overlay.py
+"""
+Оверлей трассировки в 3D-сцене: разбивка времени последнего кадра по
+интервалам (core.tracing) и p95 интервалов верхнего уровня.
+
+Время рендера снимается наблюдателями StartEvent/EndEvent окна VTK,
+поэтому учитываются и отложенные перерисовки Qt, а не только явные
+вызовы plotter.render(). Текст обновляется по закрытию кадра и виден со
+следующей перерисовки.
+"""
+from core import tracing
+
+# Строк разбивки в оверлее (остальные интервалы кадра не показываются)
+MAX_LINES = 14
+
+
+def format_frame(frame, tracer=tracing.tracer, max_lines=MAX_LINES):
+    """Текст разбивки кадра: интервал, время, для верхнего уровня — p95"""
+    if not frame:
+        return "Трассировка: нет кадров"
+    total = sum(seconds for depth, _name, seconds in frame if depth == 0)
+    lines = [f"Кадр: {total * 1e3:.2f} мс"]
+    for depth, name, seconds in frame[:max_lines]:
+        line = f"{'  ' * (depth + 1)}{name}: {seconds * 1e3:.2f} мс"
+        histogram = tracer.histogram(name) if depth == 0 else None
+        if histogram is not None and histogram.count > 1:
+            line += f" (p95 {histogram.percentile(95) * 1e3:.2f})"
+        lines.append(line)
+    if len(frame) > max_lines:
+        lines.append(f"  ... ещё {len(frame) - max_lines}")
+    return "\n".join(lines)
+
+
+class RenderTimer:
+    """Интервал tracing.RENDER_SPAN на каждую отрисовку окна plotter"""
+
+    def __init__(self, plotter, tracer=tracing.tracer):
+        self.plotter = plotter
+        self.tracer = tracer
+        self._observers = []
+        self._span = None
+
+    def attach(self):
+        if self._observers:
+            return
+        window = self.plotter.render_window
+        self._observers = [window.AddObserver("StartEvent", self._on_start),
+                           window.AddObserver("EndEvent", self._on_end)]
+
+    def detach(self):
+        window = self.plotter.render_window
+        for observer in self._observers:
+            if window is not None:
+                window.RemoveObserver(observer)
+        self._observers = []
+        self._span = None
+
+    def _on_start(self, _window, _event):
+        self._span = self.tracer.span(tracing.RENDER_SPAN, category="render")
+        self._span.__enter__()
+
+    def _on_end(self, _window, _event):
+        if self._span is not None:
+            span, self._span = self._span, None
+            span.__exit__(None, None, None)
+
+
+class TraceOverlay:
+    """Текстовый актёр с разбивкой последнего кадра"""
+
+    def __init__(self, plotter, tracer=tracing.tracer, position=(10, 40), font_size=9, color="black"):
+        self.plotter = plotter
+        self.tracer = tracer
+        self.position = position
+        self.font_size = font_size
+        self.color = color
+        self.actor = None
+        self.render_timer = RenderTimer(plotter, tracer)
+
+    def show(self):
+        """Включение трассировки, замера рендера и оверлея"""
+        if self.actor is None:
+            self.actor = self.plotter.add_text("", position=self.position, font_size=self.font_size,
+                                               color=self.color, name="trace_overlay")
+        self.tracer.enable()
+        self.render_timer.attach()
+        if self.update not in self.tracer.frame_listeners:
+            self.tracer.frame_listeners.append(self.update)
+        self.update(self.tracer.last_frame)
+        self.actor.SetVisibility(True)
+
+    def hide(self):
+        """Скрытие оверлея и снятие замера рендера (трассировку выключает вызывающий)"""
+        if self.update in self.tracer.frame_listeners:
+            self.tracer.frame_listeners.remove(self.update)
+        self.render_timer.detach()
+        if self.actor is not None:
+            self.actor.SetVisibility(False)
+
+    def is_visible(self):
+        return self.actor is not None and bool(self.actor.GetVisibility())
+
+    def update(self, frame):
+        if self.actor is not None:
+            self.actor.SetInput(format_frame(frame, self.tracer))